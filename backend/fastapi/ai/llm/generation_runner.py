@@ -0,0 +1,272 @@
+import os
+import re
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+from dotenv import load_dotenv
+
+# ------------------------
+# 환경 변수 로드 및 실행 설정
+# ------------------------
+load_dotenv()
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+# 생성 백엔드 (gemini: Gemini API, stub: 네트워크 없이 고정 문장을 돌려주는 로컬 백엔드)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+DEFAULT_MODEL = os.getenv("LLM_MODEL", "gemini-2.0-flash")
+# 동시에 보내는 생성 요청 수
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+# 요청 한도 초과(429)/일시 오류 시 최대 재시도 횟수와 첫 대기 시간(초)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1.0"))
+# 생성 결과 캐시 폴더 (입력 프롬프트가 같으면 다시 생성하지 않음)
+LLM_CACHE_DIR = os.getenv(
+    "LLM_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_cache")
+)
+
+# 재시도할 HTTP 상태 코드 (요청 한도 초과, 서버 일시 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class GenerationRequest:
+    """생성 요청 하나 (key: 결과를 돌려받을 식별자)"""
+
+    def __init__(self, key, prompt, system_instruction=None, model=DEFAULT_MODEL):
+        self.key = key
+        self.prompt = prompt
+        self.system_instruction = system_instruction
+        self.model = model
+
+    @property
+    def cache_key(self):
+        """모델, 시스템 프롬프트, 본문 프롬프트의 해시 (입력이 같으면 같은 키)"""
+        payload = json.dumps([self.model, self.system_instruction, self.prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ------------------------
+# 생성 백엔드
+# ------------------------
+class GeminiBackend:
+    """Gemini API 비동기 클라이언트로 생성"""
+
+    def __init__(self):
+        from google import genai
+        from google.genai import types
+
+        self.client = genai.Client(api_key=GEMINI_API_KEY)
+        self.types = types
+
+    async def generate(self, request):
+        response = await self.client.aio.models.generate_content(
+            model=request.model,
+            config=self.types.GenerateContentConfig(system_instruction=request.system_instruction),
+            contents=request.prompt
+        )
+        return response.candidates[0].content.parts[0].text
+
+
+class StubBackend:
+    """네트워크 없이 지연 시간만 흉내 내는 로컬 백엔드 (벤치마크/테스트용)"""
+
+    def __init__(self, latency_ms=None, rate_limit_ratio=None, seed=42):
+        self.latency_ms = float(os.getenv("LLM_STUB_LATENCY_MS", "300")) if latency_ms is None else latency_ms
+        self.rate_limit_ratio = float(os.getenv("LLM_STUB_RATE_LIMIT_RATIO", "0")) if rate_limit_ratio is None else rate_limit_ratio
+        self.random = random.Random(seed)
+
+    async def generate(self, request):
+        await asyncio.sleep(self.latency_ms / 1000 * self.random.uniform(0.5, 1.5))
+        if self.random.random() < self.rate_limit_ratio:
+            raise RateLimitError("stub: 429 RESOURCE_EXHAUSTED")
+        # 템플릿 프롬프트의 자리 표시자({...})는 그대로 돌려줘 템플릿 채우기 단계까지 확인할 수 있도록 함
+        placeholders = dict.fromkeys(re.findall(r"\{[^{}\s]+\}", request.prompt))
+        return " ".join([f"[stub] {request.cache_key[:12]}", *placeholders])
+
+
+class RateLimitError(Exception):
+    """요청 한도 초과 (StubBackend 에서 사용)"""
+    code = 429
+
+
+def create_backend(name=None):
+    """이름에 맞는 생성 백엔드를 만듭니다. (기본값: LLM_BACKEND 환경 변수)"""
+    name = name or LLM_BACKEND
+    if name == "stub":
+        return StubBackend()
+    if name == "gemini":
+        return GeminiBackend()
+    raise ValueError(f"지원하지 않는 LLM 백엔드: {name}")
+
+
+# ------------------------
+# 생성 결과 캐시
+# ------------------------
+class PromptCache:
+    """프롬프트 해시별로 생성 결과를 파일 하나씩 저장하는 캐시"""
+
+    def __init__(self, cache_dir=LLM_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, cache_key):
+        return os.path.join(self.cache_dir, cache_key[:2], f"{cache_key}.json")
+
+    def get(self, cache_key):
+        try:
+            with open(self._path(cache_key), "r", encoding="utf-8") as f:
+                return json.load(f)["text"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def set(self, cache_key, text, model):
+        path = self._path(cache_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체해 중간에 중단되어도 깨진 캐시가 남지 않도록 함
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"model": model, "text": text, "created_at": time.time()}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+
+# ------------------------
+# 동시 실행 + 재시도
+# ------------------------
+def is_retryable(error):
+    """요청 한도 초과/일시 오류인지 판단합니다."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if code in RETRYABLE_STATUS_CODES:
+        return True
+    message = str(error)
+    return "RESOURCE_EXHAUSTED" in message or "429" in message or "UNAVAILABLE" in message
+
+
+class GenerationRunner:
+    """생성 요청들을 캐시 확인 후 동시 실행 수를 제한해 보내고, 한도 초과 시 지수 백오프로 재시도합니다."""
+
+    def __init__(self, backend=None, cache=None, concurrency=LLM_CONCURRENCY,
+                 max_retries=LLM_MAX_RETRIES, backoff_base=LLM_BACKOFF_BASE, use_cache=True):
+        self.backend = backend
+        self.cache = cache or PromptCache()
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.use_cache = use_cache
+        self.stats = {"requests": 0, "cache_hits": 0, "generated": 0, "retries": 0, "failed": 0, "elapsed_sec": 0.0}
+
+    async def _generate_one(self, semaphore, request):
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return await self.backend.generate(request)
+                except Exception as e:
+                    if attempt >= self.max_retries or not is_retryable(e):
+                        raise
+                    self.stats["retries"] += 1
+                    delay = self.backoff_base * (2 ** attempt) * random.uniform(0.8, 1.2)
+                    print(f"[재시도] {request.key}: {e} ({delay:.1f}초 후 {attempt + 1}번째 재시도)")
+                    await asyncio.sleep(delay)
+
+    async def run_async(self, requests):
+        """
+        생성 요청 목록을 처리합니다.
+
+        Returns:
+            dict: {요청 key: 생성된 문장 (실패 시 None)}
+        """
+        start = time.perf_counter()
+        results = {}
+        pending = {}  # cache_key -> 같은 프롬프트를 가진 요청 목록 (한 번만 생성)
+
+        for request in requests:
+            self.stats["requests"] += 1
+            cached = self.cache.get(request.cache_key) if self.use_cache else None
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                results[request.key] = cached
+            else:
+                pending.setdefault(request.cache_key, []).append(request)
+
+        if pending:
+            if self.backend is None:
+                self.backend = create_backend()
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            groups = list(pending.values())
+            outputs = await asyncio.gather(
+                *(self._generate_one(semaphore, group[0]) for group in groups),
+                return_exceptions=True
+            )
+
+            for group, output in zip(groups, outputs):
+                if isinstance(output, Exception):
+                    self.stats["failed"] += 1
+                    print(f"[생성 실패] {group[0].key}: {output}")
+                    output = None
+                else:
+                    self.stats["generated"] += 1
+                    if self.use_cache:
+                        self.cache.set(group[0].cache_key, output, group[0].model)
+                for request in group:
+                    results[request.key] = output
+
+        self.stats["elapsed_sec"] = round(self.stats["elapsed_sec"] + time.perf_counter() - start, 3)
+        return results
+
+    def run(self, requests):
+        """동기 코드에서 호출하는 run_async 래퍼"""
+        return asyncio.run(self.run_async(requests))
+
+
+def generate_all(requests, **runner_options):
+    """
+    생성 요청 목록을 한 번에 처리하는 간단한 진입점
+
+    Returns:
+        tuple: ({요청 key: 생성된 문장}, 실행 통계)
+    """
+    runner = GenerationRunner(**runner_options)
+    results = runner.run(requests)
+    return results, runner.stats
+
+
+# ------------------------
+# 벤치마크 (stub 백엔드)
+# ------------------------
+def main():
+    parser = argparse.ArgumentParser(description='LLM 생성 실행기 벤치마크 (기본: 로컬 stub 백엔드)')
+    parser.add_argument('--backend', type=str, default="stub", choices=["stub", "gemini"], help='생성 백엔드')
+    parser.add_argument('--requests', type=int, default=1000, help='생성 요청 수')
+    parser.add_argument('--unique', type=int, default=None, help='서로 다른 프롬프트 수 (기본값: 요청 수)')
+    parser.add_argument('--concurrency', type=int, default=LLM_CONCURRENCY, help='동시 요청 수')
+    parser.add_argument('--latency-ms', type=float, default=300, help='stub 백엔드 평균 지연(ms)')
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help='stub 백엔드 429 응답 비율 (0~1)')
+    parser.add_argument('--no-cache', action='store_true', help='캐시 사용 안 함')
+    args = parser.parse_args()
+
+    unique = args.unique or args.requests
+    requests = [
+        GenerationRequest(key=i, prompt=f"benchmark prompt {i % unique}")
+        for i in range(args.requests)
+    ]
+
+    if args.backend == "stub":
+        backend = StubBackend(latency_ms=args.latency_ms, rate_limit_ratio=args.rate_limit_ratio)
+    else:
+        backend = create_backend(args.backend)
+
+    _, stats = generate_all(
+        requests,
+        backend=backend,
+        concurrency=args.concurrency,
+        backoff_base=0.05 if args.backend == "stub" else LLM_BACKOFF_BASE,
+        use_cache=not args.no_cache
+    )
+    stats["requests_per_sec"] = round(stats["requests"] / stats["elapsed_sec"], 1) if stats["elapsed_sec"] else None
+    print(json.dumps(stats, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,35 @@
 import os
+import sys
 import json
 from datetime import date
 from dotenv import load_dotenv
-from google import genai
-from google.genai import types
+
+# 공용 LLM 실행기(ai/llm) import를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from llm.generation_runner import GenerationRequest, generate_all
 
 # ------------------------
-# 환경 변수 로드 및 Gemini API 설정
+# 환경 변수 로드
 # ------------------------
 load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-client = genai.Client(api_key=GEMINI_API_KEY)
+
+# 목표 금액 -> 목표 이름 매핑
+SAVING_GOAL_MAPPING = {
+    500000:  "유니폼 구매",
+    1000000: "다음 시즌 직관",
+    1500000: "시즌권 구매",
+    3000000: "스프링캠프"
+}
+
+# 템플릿 메시지를 같이 쓰는 최소 계좌 수 (이보다 작은 묶음은 계좌별로 생성)
+REMITTANCE_CLUSTER_MIN_SIZE = int(os.getenv("REMITTANCE_CLUSTER_MIN_SIZE", "3"))
+# 송금액 구간 상한 (원). 같은 구간의 계좌끼리 템플릿 메시지를 공유
+AMOUNT_BUCKETS = (0, 5000, 10000, 20000, 30000, 50000, 100000)
+
+# 템플릿 메시지에서 계좌별 값으로 채우는 자리 표시자
+SLOT_PLAYER = "{선수}"
+SLOT_AMOUNT = "{적금액}"
+SLOT_GOAL = "{목표}"
 
 # ------------------------
 # 계좌 정보에 뉴스 하이라이트 병합하는 함수
@@ -33,9 +52,9 @@ def merge_news_highlights(accounts_data, news_data):
 # ------------------------
 # LLM 기반 송금 메시지 생성 함수
 # ------------------------
-def generate_remittance_message(account_id, account, report_date):
+def build_remittance_request(account_id, account):
     """
-    각 데이터를 기반으로 LLM 프롬프트를 작성하여 송금 메시지를 생성하여 JSON 형태로 반환
+    계좌 데이터를 기반으로 송금 메시지 생성 요청(시스템 프롬프트 + 본문 프롬프트)을 구성
     """
     # 데이터 준비
     our_team = account["our_team"]
@@ -48,14 +67,7 @@ def generate_remittance_message(account_id, account, report_date):
     real_outcome = account["real_outcome"]
     news_highlights = account["news_highlights"]
 
-     # 목표 금액 -> 목표 이름 매핑
-    saving_goal_mapping = {
-        500000:  "유니폼 구매",
-        1000000: "다음 시즌 직관",
-        1500000: "시즌권 구매",
-        3000000: "스프링캠프"
-    }
-    saving_goal_name = saving_goal_mapping.get(saving_goal, "잘못된 목표 금액")
+    saving_goal_name = SAVING_GOAL_MAPPING.get(saving_goal, "잘못된 목표 금액")
 
     # 시스템 프롬프트 & 본문 프롬프트 구성
     system_instruction = (
@@ -106,23 +118,185 @@ def generate_remittance_message(account_id, account, report_date):
     두 번째 문장
     세 번째 문장"
     """
-        
-    # 생성 요청
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-        config=types.GenerateContentConfig(system_instruction=system_instruction),
-        contents=prompt
+
+    return GenerationRequest(key=account_id, prompt=prompt, system_instruction=system_instruction)
+
+# ------------------------
+# 템플릿 우선 생성 (비슷한 계좌끼리 메시지 공유)
+# ------------------------
+def classify_game_result(account):
+    """경기 결과 집계(game_results)에서 승리/패배/무승부를 판단 (해당 규칙이 없으면 '알 수 없음')"""
+    game_results = account.get("game_results") or {}
+    for result_name in ("승리", "패배", "무승부"):
+        if game_results.get(f"우리팀_{result_name}", 0) > 0:
+            return result_name
+    return "알 수 없음"
+
+def amount_bucket(amount):
+    """송금액이 속한 구간 (잔액부족 등 숫자가 아닌 값은 그대로)"""
+    if not isinstance(amount, (int, float)):
+        return str(amount)
+    for upper in AMOUNT_BUCKETS:
+        if amount <= upper:
+            return upper
+    return f"{AMOUNT_BUCKETS[-1]}+"
+
+def cluster_key(account):
+    """(응원팀, 상대팀, 경기 결과, 적립된 기록 종류, 송금액 구간) 묶음 키"""
+    triggered = tuple(sorted(
+        record for record, count in (account.get("game_results") or {}).items() if count
+    ))
+    return (
+        account.get("our_team"),
+        account.get("opposing_team"),
+        classify_game_result(account),
+        triggered,
+        amount_bucket(account.get("real_outcome")),
     )
 
-    # 결과 추출
-    remittance_message = response.candidates[0].content.parts[0].text
+def cluster_accounts(accounts):
+    """
+    계좌들을 묶음 키로 나눕니다.
 
-    # JSON 형태로 반환
-    return {
-        "account_id": account_id,
-        "date": report_date,
-        "text": remittance_message
+    Returns:
+        dict: {묶음 키: [계좌 ID 목록]}
+    """
+    clusters = {}
+    for account_id, account in accounts.items():
+        clusters.setdefault(cluster_key(account), []).append(account_id)
+    return clusters
+
+def format_amount(amount):
+    """송금액 표시 (숫자면 26,000원 형식)"""
+    if isinstance(amount, (int, float)):
+        return f"{int(amount):,}원"
+    return str(amount)
+
+def build_cluster_request(key, account):
+    """
+    묶음 대표 계좌로 템플릿 메시지 생성 요청을 구성 (선수 이름/적금액/목표는 자리 표시자로 남김)
+    """
+    our_team, opposing_team, game_result, triggered, bucket = key
+    # 팀 기록은 같은 경기라 묶음 안에서 동일, 선수 기록은 계좌마다 선수가 달라 종류만 전달
+    team_results = {
+        record: count for record, count in account["game_results"].items() if not record.startswith("선수_")
     }
+    player_records = [record for record in triggered if record.startswith("선수_")]
+
+    system_instruction = (
+        "너는 야구 적금 서비스의 송금 메시지를 작성하는 전문가야"
+        "어제의 경기 결과와 뉴스 하이라이트, 적금액을 입력받아서, 송금한 내용을 의미있게 요약해주는 역할을 할거야"
+        "같은 경기를 응원한 여러 고객에게 보낼 메시지라서 고객마다 다른 값은 자리 표시자로 남겨야 해"
+    )
+
+    prompt = f"""
+    다음 정보를 바탕으로 여러 고객에게 보낼 송금 메시지 템플릿을 작성해주세요.
+
+    [입력 데이터]
+    - 응원하는 팀 이름: {our_team}
+    - 상대 팀 이름: {opposing_team}
+    - 경기 결과 : {game_result}
+    - 팀 기록 : {team_results}
+    - 응원하는 선수가 기록한 항목 : {player_records if player_records else "없음"}
+    - 송금액 구간 : {bucket}
+    - 뉴스 하이라이트 : {account.get("news_highlights", [])}
+
+    [작성 조건]
+    - 첫 번째 문장: 오늘의 경기결과와 뉴스 하이라이트에서 우리 팀의 주요 성과를 요약하세요.
+    - 두 번째 문장: 응원하는 선수의 활약을 강조하고 적금액을 요약하세요. 선수 이름은 {SLOT_PLAYER}, 적금액은 {SLOT_AMOUNT} 로 그대로 적으세요.
+    - 세 번째 문장: 적금 목표를 {SLOT_GOAL} 로 적고 격려와 응원의 메세지를 작성하세요.
+    - 선수 이름, 금액, 목표를 직접 쓰지 말고 반드시 자리 표시자({SLOT_PLAYER}, {SLOT_AMOUNT}, {SLOT_GOAL})를 사용하세요.
+    - 전체 문장은 3문장으로 구성되어야 하며, 줄바꿈을 포함해 출력하세요.
+
+    [예시]
+    "LG가 8:5로 NC를 꺾으며 홈런 3개로 역전!
+    {SLOT_PLAYER}의 활약에 힘입어 오늘은 {SLOT_AMOUNT} 적립 성공!
+    {SLOT_GOAL}도 한 걸음 더 가까워졌어요!"
+    """
+
+    return GenerationRequest(key=("cluster", key), prompt=prompt, system_instruction=system_instruction)
+
+def fill_template(template, account):
+    """템플릿 메시지의 자리 표시자를 계좌별 값으로 채웁니다."""
+    return (
+        template
+        .replace(SLOT_PLAYER, account.get("favorite_player") or "우리 선수")
+        .replace(SLOT_AMOUNT, format_amount(account.get("real_outcome")))
+        .replace(SLOT_GOAL, SAVING_GOAL_MAPPING.get(account.get("saving_goal"), "적금 목표"))
+    )
+
+def generate_remittance_messages(accounts, report_date, use_templates=True,
+                                 min_cluster_size=REMITTANCE_CLUSTER_MIN_SIZE, **runner_options):
+    """
+    여러 계좌의 송금 메시지를 동시에 생성하여 JSON 형태 목록으로 반환
+    (입력이 같은 계좌는 캐시된 메시지를 재사용)
+
+    use_templates가 켜져 있으면 (응원팀, 상대팀, 경기 결과, 적립된 기록 종류, 송금액 구간)이 같은 계좌를 묶어
+    묶음마다 템플릿 메시지를 한 번만 생성하고 선수 이름/적금액/목표는 계좌별로 채웁니다.
+    min_cluster_size 보다 작은 묶음(특이 계좌)만 계좌별로 생성합니다.
+
+    Args:
+        accounts (dict): {계좌 ID: 계좌 데이터}
+        report_date (str): 기준 날짜
+        use_templates (bool): 템플릿 우선 생성 여부
+        min_cluster_size (int): 템플릿을 공유할 최소 계좌 수
+    """
+    template_clusters = {}   # 묶음 키 -> 계좌 ID 목록
+    single_account_ids = list(accounts.keys())
+
+    if use_templates:
+        single_account_ids = []
+        for key, account_ids in cluster_accounts(accounts).items():
+            if len(account_ids) >= min_cluster_size:
+                template_clusters[key] = account_ids
+            else:
+                single_account_ids.extend(account_ids)
+
+    requests = [build_cluster_request(key, accounts[account_ids[0]]) for key, account_ids in template_clusters.items()]
+    requests += [build_remittance_request(account_id, accounts[account_id]) for account_id in single_account_ids]
+    results, stats = generate_all(requests, **runner_options)
+
+    messages = {}
+    for key, account_ids in template_clusters.items():
+        template = results.get(("cluster", key))
+        if template is None or SLOT_AMOUNT not in template:
+            # 템플릿 생성 실패 또는 자리 표시자를 지키지 않은 경우 계좌별 생성으로 대체
+            single_account_ids.extend(account_ids)
+            continue
+        for account_id in account_ids:
+            messages[account_id] = fill_template(template, accounts[account_id])
+
+    fallback_ids = [account_id for account_id in single_account_ids if account_id not in results]
+    if fallback_ids:
+        fallback_results, fallback_stats = generate_all(
+            [build_remittance_request(account_id, accounts[account_id]) for account_id in fallback_ids],
+            **runner_options
+        )
+        results.update(fallback_results)
+        for stat_name in ("requests", "cache_hits", "generated", "retries", "failed", "elapsed_sec"):
+            stats[stat_name] += fallback_stats[stat_name]
+
+    for account_id in single_account_ids:
+        messages[account_id] = results.get(account_id)
+
+    print(f"[송금 메시지] 계좌 {len(accounts)}개, 템플릿 묶음 {len(template_clusters)}개, 계좌별 생성 {len(single_account_ids)}개 / "
+          f"요청 {stats['requests']}건, 캐시 {stats['cache_hits']}건, 생성 {stats['generated']}건, "
+          f"재시도 {stats['retries']}건, 실패 {stats['failed']}건, {stats['elapsed_sec']}초")
+
+    return [
+        {
+            "account_id": account_id,
+            "date": report_date,
+            "text": messages.get(account_id)
+        }
+        for account_id in accounts
+    ]
+
+def generate_remittance_message(account_id, account, report_date):
+    """
+    각 데이터를 기반으로 LLM 프롬프트를 작성하여 송금 메시지를 생성하여 JSON 형태로 반환
+    """
+    return generate_remittance_messages({account_id: account}, report_date, use_templates=False)[0]
 
 # ------------------------
 # 메인 실행부
@@ -206,12 +380,10 @@ def main():
     # 데이터 추출
     report_date = input_data['date']
 
-    # 결과 생성
-    remittance_message = []
-    for account_id, account in input_data['accounts'].items():
-        remittance_message_message_output = generate_remittance_message(account_id, account, report_date)
-        remittance_message.append(remittance_message_message_output)
-        # 결과 확인
+    # 결과 생성 (동시 실행)
+    remittance_message = generate_remittance_messages(input_data['accounts'], report_date)
+    # 결과 확인
+    for remittance_message_message_output in remittance_message:
         print(remittance_message_message_output)
 
     # 최종 JSON 저장
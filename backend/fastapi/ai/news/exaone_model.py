@@ -1,39 +1,142 @@
-# 기본 모델
-# EXAONE-3.5-2.4B-Instruct 모델을 로드합니다.
+# EXAONE-3.5-2.4B-Instruct 모델 로더
+# - import 시점에는 모델을 읽지 않고, 처음 사용할 때 프로세스당 한 번만 로드합니다.
+# - GPU: 양자화(AWQ) 모델을 float16으로 로드
+# - CPU: 기본 모델을 float32로 로드한 뒤 Linear 층을 int8 동적 양자화 (EXAONE_INT8=0 이면 끔)
+
+import os
+import time
+import threading
 
-'''
 import torch
 from transformers import AutoModelForCausalLM, AutoTokenizer
 
-model_name = "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct"
 device = "cuda" if torch.cuda.is_available() else "cpu"
 
-torch_dtype = torch.bfloat16 if device == "cuda" else torch.float32
-
-model = AutoModelForCausalLM.from_pretrained(
-    model_name,
-    torch_dtype=torch_dtype,
-    trust_remote_code=True,
-    device_map="auto" if device == "cuda" else None
+# 장치별 기본 모델 (AWQ 모델은 GPU 전용)
+model_name = os.getenv(
+    "EXAONE_MODEL_NAME",
+    "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct-AWQ" if device == "cuda" else "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct"
 )
+# CPU int8 동적 양자화 여부
+EXAONE_INT8 = os.getenv("EXAONE_INT8", "1") == "1"
+# CPU 추론 스레드 수 (0이면 torch 기본값)
+EXAONE_NUM_THREADS = int(os.getenv("EXAONE_NUM_THREADS", "0"))
 
-tokenizer = AutoTokenizer.from_pretrained(model_name)
-'''
+_lock = threading.Lock()
+_model = None
+_tokenizer = None
 
-# 양자화 모델
-# EXAONE-3.5-2.4B-Instruct-AWQ 모델을 로드합니다.
 
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+def load_model():
+    """모델과 토크나이저를 처음 호출할 때 로드하고, 이후에는 같은 객체를 반환합니다."""
+    global _model, _tokenizer
 
-model_name = "LGAI-EXAONE/EXAONE-3.5-2.4B-Instruct-AWQ"
-device = "cuda" if torch.cuda.is_available() else "cpu"
+    with _lock:
+        if _model is not None:
+            return _model, _tokenizer
 
-model = AutoModelForCausalLM.from_pretrained(
-    model_name,
-    torch_dtype=torch.float16,
-    trust_remote_code=True,
-    device_map="auto"
-)
+        start = time.perf_counter()
+
+        if device == "cpu" and EXAONE_NUM_THREADS > 0:
+            torch.set_num_threads(EXAONE_NUM_THREADS)
+
+        if device == "cuda":
+            model = AutoModelForCausalLM.from_pretrained(
+                model_name,
+                torch_dtype=torch.float16,
+                trust_remote_code=True,
+                device_map="auto"
+            )
+        else:
+            model = AutoModelForCausalLM.from_pretrained(
+                model_name,
+                torch_dtype=torch.float32,
+                trust_remote_code=True
+            )
+            if EXAONE_INT8:
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        model.eval()
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # 배치 생성 시 프롬프트 길이를 맞추기 위해 왼쪽 패딩
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+
+        _model, _tokenizer = model, tokenizer
+        print(f"[EXAONE] {model_name} 로드 완료 ({device}, int8={device == 'cpu' and EXAONE_INT8}, "
+              f"threads={torch.get_num_threads()}, {time.perf_counter() - start:.1f}초)")
+        return _model, _tokenizer
+
+
+def __getattr__(name):
+    # 기존 코드 호환: `from exaone_model import model, tokenizer` 시점에 로드
+    if name == "model":
+        return load_model()[0]
+    if name == "tokenizer":
+        return load_model()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _count_generated_tokens(sequence, eos_token_id, pad_token_id):
+    """생성된 토큰 중 첫 EOS까지의 개수 (뒤쪽 패딩 제외)"""
+    count = 0
+    for token_id in sequence.tolist():
+        count += 1
+        if token_id == eos_token_id:
+            break
+    else:
+        # EOS 없이 max_new_tokens에 도달한 경우에도 뒤쪽 패딩은 제외
+        while count and sequence[count - 1].item() == pad_token_id:
+            count -= 1
+    return count
+
+
+def generate_batch(conversations: list, max_new_tokens: int = 384):
+    """
+    여러 대화(메시지 목록)를 왼쪽 패딩으로 길이를 맞춰 한 번의 generate 호출로 생성합니다.
+
+    Args:
+        conversations (list): [[{"role": ..., "content": ...}, ...], ...]
+        max_new_tokens (int): 대화별 최대 생성 토큰 수
+
+    Returns:
+        tuple: (대화별 생성 결과 문자열 목록, {"generated_tokens", "elapsed_sec", "tokens_per_sec", "batch_size"})
+    """
+    if not conversations:
+        return [], {"generated_tokens": 0, "elapsed_sec": 0.0, "tokens_per_sec": 0.0, "batch_size": 0}
+
+    model, tokenizer = load_model()
+
+    prompts = [
+        tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+        for messages in conversations
+    ]
+    # 채팅 템플릿에 특수 토큰이 이미 들어 있으므로 다시 붙이지 않음
+    inputs = tokenizer(prompts, return_tensors="pt", padding=True, add_special_tokens=False).to(model.device)
+
+    start = time.perf_counter()
+    with torch.no_grad():
+        output = model.generate(
+            **inputs,
+            max_new_tokens=max_new_tokens,
+            do_sample=False,
+            eos_token_id=tokenizer.eos_token_id,
+            pad_token_id=tokenizer.pad_token_id
+        )
+    elapsed = time.perf_counter() - start
+
+    # 프롬프트 부분을 잘라내고 새로 생성된 토큰만 디코딩
+    generated = output[:, inputs["input_ids"].shape[1]:]
+    results = [tokenizer.decode(sequence, skip_special_tokens=True).strip() for sequence in generated]
 
-tokenizer = AutoTokenizer.from_pretrained(model_name)
\ No newline at end of file
+    generated_tokens = sum(
+        _count_generated_tokens(sequence, tokenizer.eos_token_id, tokenizer.pad_token_id) for sequence in generated
+    )
+    stats = {
+        "generated_tokens": generated_tokens,
+        "elapsed_sec": round(elapsed, 2),
+        "tokens_per_sec": round(generated_tokens / elapsed, 2) if elapsed > 0 else 0.0,
+        "batch_size": len(conversations),
+    }
+    return results, stats
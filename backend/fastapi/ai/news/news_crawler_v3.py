@@ -0,0 +1,410 @@
+# 비동기 HTTP 뉴스 크롤러
+# - 기사 목록은 네이버 스포츠 뉴스 목록 API(JSON), 기사 본문은 HTML을 비동기로 요청합니다.
+# - 호스트별 동시 요청 수와 최소 요청 간격을 지켜 서버에 부담을 주지 않습니다.
+# - JS 렌더링이 필요해 HTTP 응답만으로 목록/본문을 얻지 못한 페이지만 브라우저(Selenium)로 다시 읽습니다.
+#   (브라우저를 띄우지 못하거나 읽기에 실패하면 해당 기사/팀만 실패로 집계하고 나머지는 계속 크롤링합니다)
+# - 기사는 news_store.py 저장소에 기사별로 한 번만 저장하고, news_json/<date>/news_<date>_<team>.json 에는 기사 ID 참조를 저장합니다.
+#   (여러 팀에 함께 나온 기사와 이미 저장된 기사는 본문을 다시 요청하지 않고, 본문을 읽지 못한 기사는 저장하지 않아 다음 실행에서 다시 요청)
+
+import os
+import sys
+import time
+import asyncio
+import random
+import threading
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+
+from news_store import make_article_id, has_article, put_article, save_team_refs
+
+# 기사 목록 페이지 (브라우저 대체용)
+base_url = "https://m.sports.naver.com/kbaseball/news"
+# 기사 목록 API (목록 페이지가 내부적으로 호출하는 JSON API)
+NEWS_LIST_API_URL = os.getenv("NEWS_LIST_API_URL", "https://api-gw.sports.naver.com/news/articles/kbaseball")
+# 기사 페이지 주소
+NEWS_ARTICLE_URL = "https://m.sports.naver.com/kbaseball/article/{oid}/{aid}"
+# 서버에서 본문까지 렌더링해 주는 기사 페이지 주소 (먼저 시도)
+NEWS_ARTICLE_STATIC_URL = os.getenv("NEWS_ARTICLE_STATIC_URL", "https://n.news.naver.com/sports/kbaseball/article/{oid}/{aid}")
+
+# 팀당 최대 기사 수 (기존 크롤러의 1페이지 분량)
+MAX_ARTICLES_PER_TEAM = int(os.getenv("NEWS_MAX_ARTICLES_PER_TEAM", "60"))
+# 호스트별 동시 요청 수
+NEWS_PER_HOST_CONCURRENCY = int(os.getenv("NEWS_PER_HOST_CONCURRENCY", "4"))
+# 호스트별 최소 요청 간격(초)
+NEWS_MIN_REQUEST_INTERVAL = float(os.getenv("NEWS_MIN_REQUEST_INTERVAL", "0.2"))
+# 요청 제한 시간(초)과 재시도 횟수
+NEWS_REQUEST_TIMEOUT = float(os.getenv("NEWS_REQUEST_TIMEOUT", "10"))
+NEWS_MAX_RETRIES = int(os.getenv("NEWS_MAX_RETRIES", "3"))
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Linux; Android 13; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0 Mobile Safari/537.36",
+    "Referer": "https://m.sports.naver.com/kbaseball/news",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+# 본문이 들어 있는 영역 (기사 페이지 종류별)
+ARTICLE_CONTENT_SELECTORS = ["#comp_news_article > div", "#newsEndContents", "#dic_area", "#newsct_article"]
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+team_mapping = {
+    "HT": "KIA",
+    "SS": "삼성",
+    "OB": "두산",
+    "LT": "롯데",
+    "KT": "KT",
+    "SK": "SSG",
+    "HH": "한화",
+    "NC": "NC",
+    "WO": "키움",
+    "LG": "LG"
+}
+
+# 크롤링 통계
+stats = {"http_requests": 0, "retries": 0, "browser_lists": 0, "browser_articles": 0, "failed_lists": 0,
+         "failed_articles": 0, "team_articles": 0, "unique_articles": 0, "stored_articles": 0}
+
+
+# ------------------------
+# 호스트별 동시 요청 수/요청 간격 제한
+# ------------------------
+class HostLimiter:
+    """호스트마다 동시 요청 수를 제한하고, 요청 시작 간격을 최소 interval 초로 유지"""
+
+    def __init__(self, concurrency, interval):
+        self.concurrency = concurrency
+        self.interval = interval
+        self.semaphores = {}
+        self.locks = {}
+        self.next_start = {}
+
+    async def acquire(self, host):
+        semaphore = self.semaphores.setdefault(host, asyncio.Semaphore(self.concurrency))
+        await semaphore.acquire()
+
+        lock = self.locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            wait = self.next_start.get(host, now) - now
+            self.next_start[host] = max(now, self.next_start.get(host, now)) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def release(self, host):
+        self.semaphores[host].release()
+
+
+async def fetch(client, limiter, url, params=None):
+    """호스트별 제한을 지키며 GET 요청, 요청 한도 초과/서버 오류는 지수 백오프로 재시도"""
+    host = urlsplit(url).netloc
+    for attempt in range(NEWS_MAX_RETRIES + 1):
+        await limiter.acquire(host)
+        try:
+            stats["http_requests"] += 1
+            response = await client.get(url, params=params)
+        except httpx.HTTPError as e:
+            response = None
+            error = e
+        finally:
+            limiter.release(host)
+
+        if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+            response.raise_for_status()
+            return response
+
+        if attempt >= NEWS_MAX_RETRIES:
+            if response is not None:
+                response.raise_for_status()
+            raise error
+
+        stats["retries"] += 1
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        delay = float(retry_after) if retry_after and retry_after.isdigit() else (2 ** attempt) * random.uniform(0.8, 1.2)
+        await asyncio.sleep(delay)
+
+
+# ------------------------
+# 브라우저 대체 (JS 렌더링이 필요한 페이지만)
+# ------------------------
+_driver = None
+_driver_error = None
+_driver_lock = threading.Lock()
+
+
+def get_driver():
+    """
+    브라우저가 필요할 때 처음 한 번만 크롬 드라이버를 띄웁니다.
+    크롬이 없는 등으로 실패하면 같은 실행 중에는 다시 띄우지 않고 처음 오류를 다시 발생시킵니다.
+    """
+    global _driver, _driver_error
+    if _driver_error is not None:
+        raise _driver_error
+    if _driver is None:
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+            from selenium.webdriver.chrome.options import Options
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            chrome_options = Options()
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--log-level=3")
+            chrome_options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
+
+            service = Service(ChromeDriverManager().install())
+            _driver = webdriver.Chrome(service=service, options=chrome_options)
+        except Exception as e:
+            _driver_error = e
+            raise
+    return _driver
+
+
+def quit_driver():
+    global _driver
+    if _driver is not None:
+        _driver.quit()
+        _driver = None
+
+
+def _browser_wait(driver, css_selector, timeout=10):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css_selector)))
+    except Exception:
+        pass
+
+
+def browser_crawl_articles(date, team):
+    """
+    브라우저로 기사 목록 읽기 (news_crawler_v2.crawl_articles 와 동일한 선택자)
+    드라이버를 띄우지 못하거나 페이지를 읽지 못하면 예외를 그대로 올립니다.
+    """
+    articles = []
+    with _driver_lock:
+        from selenium.webdriver.common.by import By
+
+        driver = get_driver()
+        driver.get(base_url + f"?sectionId=kbo&team={team}&sort=latest&date={date}&isPhoto=N")
+        _browser_wait(driver, "#content > div > div.NewsList_comp_news_list__oXAbN > ul > li")
+
+        news_list = driver.find_elements(By.CSS_SELECTOR, "#content > div > div.NewsList_comp_news_list__oXAbN > ul > li")
+        for item in news_list:
+            title_element = item.find_element(By.CSS_SELECTOR, "a > div.NewsItem_info_area__Dj4oW > em")
+            article_url = item.find_element(By.CSS_SELECTOR, "a.NewsItem_link_news__tD7x3").get_attribute("href")
+            articles.append({
+                'news_title': title_element.text.strip(),
+                'article_url': article_url,
+                'static_url': None
+            })
+
+    return articles[:MAX_ARTICLES_PER_TEAM]
+
+
+def browser_get_article_content(article_url):
+    """
+    브라우저로 기사 본문 읽기 (news_crawler_v2.get_article_content 와 동일한 선택자)
+    드라이버를 띄우지 못하거나 본문을 읽지 못하면 빈 문자열을 반환합니다.
+    """
+    with _driver_lock:
+        try:
+            from selenium.webdriver.common.by import By
+
+            driver = get_driver()
+            driver.get(article_url)
+            _browser_wait(driver, "#comp_news_article > div")
+            paragraphs = driver.find_elements(By.CSS_SELECTOR, "#comp_news_article > div")
+            return " ".join([p.text.strip() for p in paragraphs if p.text.strip()])
+        except Exception as e:
+            print(f"기사 내용 추출 중 오류 발생: {article_url} ({e})")
+            return ""
+
+
+# ------------------------
+# HTTP 크롤링
+# ------------------------
+async def crawl_articles(client, limiter, date, team):
+    """
+    기사 목록 API로 팀의 기사 목록을 읽고, API 호출이 실패하면 브라우저로 목록 페이지를 읽습니다.
+    브라우저도 실패하면 예외를 올리므로, 호출한 쪽은 빈 목록(기사 없음)과 실패를 구분할 수 있습니다.
+    """
+    articles = []
+    page = 1
+    api_error = None
+    try:
+        while len(articles) < MAX_ARTICLES_PER_TEAM:
+            response = await fetch(client, limiter, NEWS_LIST_API_URL, params={
+                "sort": "latest", "date": date, "team": team, "isPhoto": "N",
+                "page": page, "pageSize": 20
+            })
+            news_list = (response.json().get("result") or {}).get("newsList") or []
+            for item in news_list:
+                oid, aid = item.get("oid"), item.get("aid")
+                if not oid or not aid:
+                    continue
+                articles.append({
+                    'news_title': (item.get("title") or "").strip(),
+                    'article_url': NEWS_ARTICLE_URL.format(oid=oid, aid=aid),
+                    'static_url': NEWS_ARTICLE_STATIC_URL.format(oid=oid, aid=aid)
+                })
+            if len(news_list) < 20:
+                break
+            page += 1
+    except Exception as e:
+        api_error = e
+        print(f"[{team}] 기사 목록 API 실패: {e}")
+
+    # API가 응답했으면 기사가 없어도 그대로 반환 (기사 없는 날에 브라우저를 띄우지 않음)
+    if api_error is None:
+        return articles[:MAX_ARTICLES_PER_TEAM]
+
+    # API 호출 자체가 실패한 경우에만 브라우저 사용
+    stats["browser_lists"] += 1
+    try:
+        return await asyncio.to_thread(browser_crawl_articles, date, team)
+    except Exception as e:
+        print(f"[{team}] 브라우저 기사 목록 읽기 실패: {e}")
+        raise RuntimeError(f"기사 목록 API와 브라우저 모두 실패 (API: {api_error}, 브라우저: {e})") from e
+
+
+def extract_article_content(html):
+    """기사 HTML에서 본문 텍스트를 추출합니다. (JS 렌더링이 필요한 페이지면 빈 문자열)"""
+    soup = BeautifulSoup(html, "html.parser")
+    for selector in ARTICLE_CONTENT_SELECTORS:
+        elements = soup.select(selector)
+        text = " ".join(element.get_text(" ", strip=True) for element in elements)
+        if text.strip():
+            return " ".join(text.split())
+    return ""
+
+
+async def get_article_content(client, limiter, article):
+    """기사 본문을 HTTP로 읽고, 본문이 비어 있으면(JS 렌더링 페이지) 브라우저로 다시 읽습니다."""
+    news_content = ""
+    for url in [article.get('static_url'), article['article_url']]:
+        if not url:
+            continue
+        try:
+            response = await fetch(client, limiter, url)
+            news_content = extract_article_content(response.text)
+        except Exception as e:
+            print(f"기사 요청 중 오류 발생: {url} ({e})")
+        if news_content:
+            break
+
+    if not news_content:
+        stats["browser_articles"] += 1
+        try:
+            news_content = await asyncio.to_thread(browser_get_article_content, article['article_url'])
+        except Exception as e:
+            print(f"기사 내용 추출 중 오류 발생: {article['article_url']} ({e})")
+
+    # 본문을 읽지 못한 기사는 저장하지 않고 다음 크롤링에서 다시 요청
+    if not news_content:
+        stats["failed_articles"] += 1
+
+    return {
+        'news_content': news_content
+    }
+
+
+async def crawl_article_lists(client, limiter, date: str, team: str) -> list:
+    published_date = date[:4] + "-" + date[4:6] + "-" + date[6:]
+    team_name = team_mapping.get(team, team)
+
+    print(f"날짜: {published_date}, 팀: {team_name},")
+
+    articles = await crawl_articles(client, limiter, date, team)
+    for article in articles:
+        article['published_date'] = published_date
+        article['article_id'] = make_article_id(article['article_url'])
+    return articles
+
+
+async def fetch_and_store_article(client, limiter, article):
+    """기사 본문을 읽어 저장소에 저장합니다. (본문을 읽지 못하면 저장하지 않음)"""
+    content = await get_article_content(client, limiter, article)
+    if not content['news_content']:
+        return
+    put_article({
+        'article_id': article['article_id'],
+        'article_url': article['article_url'],
+        'news_title': article['news_title'],
+        'news_content': content['news_content'],
+        'published_date': article['published_date']
+    })
+
+
+async def crawl_all_teams(date: str, teams=None):
+    """
+    전체 팀의 기사 목록을 동시에 읽고, 고유 기사 본문만 한 번씩 요청해 저장소에 저장한 뒤
+    팀별 파일에 기사 ID 참조를 저장합니다.
+    """
+    teams = teams or list(team_mapping.keys())
+    limiter = HostLimiter(NEWS_PER_HOST_CONCURRENCY, NEWS_MIN_REQUEST_INTERVAL)
+
+    async with httpx.AsyncClient(headers=HEADERS, timeout=NEWS_REQUEST_TIMEOUT, follow_redirects=True) as client:
+        # 한 팀의 목록을 읽지 못해도 나머지 팀은 계속 진행
+        results = await asyncio.gather(
+            *(crawl_article_lists(client, limiter, date, team) for team in teams), return_exceptions=True
+        )
+        team_articles = []
+        failed_teams = set()
+        for team, result in zip(teams, results):
+            if isinstance(result, Exception):
+                stats["failed_lists"] += 1
+                failed_teams.add(team)
+                print(f"[{team}] 기사 목록 크롤링 실패: {result}")
+                result = []
+            team_articles.append(result)
+
+        # 여러 팀에 나온 기사와 이미 저장된 기사는 제외하고 본문 요청
+        unique_articles = {}
+        for articles in team_articles:
+            for article in articles:
+                unique_articles.setdefault(article['article_id'], article)
+        new_articles = [article for article_id, article in unique_articles.items() if not has_article(article_id)]
+
+        stats["team_articles"] += sum(len(articles) for articles in team_articles)
+        stats["unique_articles"] += len(unique_articles)
+        stats["stored_articles"] += len(unique_articles) - len(new_articles)
+
+        results = await asyncio.gather(
+            *(fetch_and_store_article(client, limiter, article) for article in new_articles), return_exceptions=True
+        )
+        for article, result in zip(new_articles, results):
+            if isinstance(result, Exception):
+                stats["failed_articles"] += 1
+                print(f"기사 저장 중 오류 발생: {article['article_url']} ({result})")
+
+    for team, articles in zip(teams, team_articles):
+        # 목록을 읽지 못한 팀은 이전에 저장한 파일을 그대로 둠
+        if team in failed_teams:
+            continue
+        file_path = save_team_refs(date, team, [article['article_id'] for article in articles])
+        print(f"JSON 파일 저장 완료: {file_path}")
+        print(f"{date} {team} 크롤링 완료. 총 {len(articles)}개의 기사를 저장했습니다.")
+
+    return dict(zip(teams, team_articles))
+
+
+def main():
+    date = sys.argv[1] if len(sys.argv) > 1 else input("크롤링할 날짜를 입력하세요 (YYYYMMDD 형식): ")
+
+    start = time.perf_counter()
+    try:
+        asyncio.run(crawl_all_teams(date))
+    finally:
+        quit_driver()
+
+    print(f"크롤링 소요 시간: {time.perf_counter() - start:.1f}초, 통계: {stats}")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import re
 from dotenv import load_dotenv
 
 import google.generativeai as genai
+from news_store import load_team_news
 
 # 환경변수 로드 및 GEMINI_API_KEY 가져오기
 load_dotenv()
@@ -53,18 +54,14 @@ model = genai.GenerativeModel(
 def summarize_daily_news(date, team):
     """일일 뉴스 요약"""
     all_news = []
-    json_file_path = f"news_json/{date}/news_{date}_{team}.json"
-    if os.path.exists(json_file_path):
-        with open(json_file_path, "r", encoding="utf-8") as json_file:
-            data = json.load(json_file)
-            # 각 뉴스 항목에서 필요한 필드만 추출
-            for item in data:
-                extracted = {
-                    "news_title": item.get("news_title", ""),
-                    "news_summary": item.get("news_summary", ""),
-                    "published_date": item.get("published_date", "")
-                }
-                all_news.append(extracted)
+    for item in load_team_news(date, team):
+        # 각 뉴스 항목에서 필요한 필드만 추출
+        extracted = {
+            "news_title": item.get("news_title", ""),
+            "news_summary": item.get("news_summary", ""),
+            "published_date": item.get("published_date", "")
+        }
+        all_news.append(extracted)
 
     prompt = f"""
     ## 뉴스 내용:
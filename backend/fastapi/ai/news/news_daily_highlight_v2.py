@@ -1,9 +1,11 @@
 import os
 import json
 import re
-import torch
-import time
-from exaone_model import model, tokenizer
+from exaone_model import generate_batch
+from news_store import load_team_news
+
+# 한 번의 generate 호출에 넣을 팀 수 (기본값: 10개 팀 전체)
+HIGHLIGHT_BATCH_SIZE = int(os.getenv("HIGHLIGHT_BATCH_SIZE", "10"))
 
 # 뉴스 요약 인스트럭션 정의
 instruction = """
@@ -37,51 +39,46 @@ instruction = """
 }
 """
 
-def generate_content(all_news: list, max_new_tokens: int = 384) -> str:
-    messages = [
+def build_messages(all_news: list) -> list:
+    return [
         {"role": "system", "content": instruction},
         {"role": "user", "content": f"다음은 뉴스 요약 정보입니다:\n{json.dumps(all_news, ensure_ascii=False, indent=2)}\n요약 결과를 JSON 형식으로 반환해주세요."}
     ]
 
-    input_ids = tokenizer.apply_chat_template(
-        messages,
-        tokenize=True,
-        add_generation_prompt=True,
-        return_tensors="pt"
-    ).to(model.device)
-
-    with torch.no_grad():
-        output = model.generate(
-            input_ids=input_ids,
-            max_new_tokens=max_new_tokens,
-            do_sample=False,
-            eos_token_id=tokenizer.eos_token_id
-        )
-
-    result = tokenizer.decode(output[0], skip_special_tokens=True)
-    if "[|assistant|]" in result:
-        result = result.split("[|assistant|]")[-1].strip()
-    return result
+def generate_content(all_news: list, max_new_tokens: int = 384) -> str:
+    results, _ = generate_batch([build_messages(all_news)], max_new_tokens=max_new_tokens)
+    return results[0]
 
-def summarize_daily_news(date, team):
+def load_daily_news(date, team):
     all_news = []
-    json_file_path = f"news_json/{date}/news_{date}_{team}.json"
-
-    if os.path.exists(json_file_path):
-        with open(json_file_path, "r", encoding="utf-8") as json_file:
-            data = json.load(json_file)
-            for item in data:
-                all_news.append({
-                    "news_title": item.get("news_title", ""),
-                    "news_summary": item.get("news_summary", ""),
-                    "published_date": item.get("published_date", "")
-                })
+    for item in load_team_news(date, team):
+        all_news.append({
+            "news_title": item.get("news_title", ""),
+            "news_summary": item.get("news_summary", ""),
+            "published_date": item.get("published_date", "")
+        })
+
+    return all_news
+
+def summarize_daily_news(date, team):
+    all_news = load_daily_news(date, team)
 
     if not all_news:
         return ""
 
     return generate_content(all_news)
 
+def parse_highlights(raw_result):
+    json_regex = re.compile(r"(\{.*\})", re.DOTALL)
+    match = json_regex.search(raw_result)
+
+    if match:
+        try:
+            return json.loads(match.group(1)).get("news_highlight", [])
+        except json.JSONDecodeError:
+            return []
+    return []
+
 def generate_daily_summary_json(date):
     team_mapping = {
         "HT": "KIA 타이거즈", 
@@ -96,25 +93,25 @@ def generate_daily_summary_json(date):
         "LG": "LG 트윈스"
     }
 
-    all_team_highlights = {}
+    all_team_highlights = {team_name: [] for team_name in team_mapping.values()}
 
+    # 뉴스가 있는 팀의 프롬프트만 모아서 배치로 생성
+    batch_teams = []
+    batch_messages = []
     for team_code, team_name in team_mapping.items():
-        raw_result = summarize_daily_news(date, team_code)
-        json_regex = re.compile(r"(\{.*\})", re.DOTALL)
-        match = json_regex.search(raw_result)
-
-        if match:
-            try:
-                highlights = json.loads(match.group(1)).get("news_highlight", [])
-            except json.JSONDecodeError:
-                highlights = []
-        else:
-            highlights = []
-
-        all_team_highlights[team_name] = highlights
-        torch.cuda.empty_cache()
-        torch.cuda.ipc_collect()
-        time.sleep(1)
+        all_news = load_daily_news(date, team_code)
+        if all_news:
+            batch_teams.append(team_name)
+            batch_messages.append(build_messages(all_news))
+
+    batch_size = max(1, HIGHLIGHT_BATCH_SIZE)
+    for start in range(0, len(batch_messages), batch_size):
+        results, stats = generate_batch(batch_messages[start:start + batch_size])
+        print(f"[하이라이트 생성] {stats['batch_size']}개 팀, {stats['generated_tokens']}토큰, "
+              f"{stats['elapsed_sec']}초, {stats['tokens_per_sec']} tokens/sec")
+
+        for team_name, raw_result in zip(batch_teams[start:start + batch_size], results):
+            all_team_highlights[team_name] = parse_highlights(raw_result)
 
     return {"news_highlights": all_team_highlights}
 
@@ -1,9 +1,21 @@
 import os
-import json
+import sys
+import time
 import torch
-from exaone_model import model, tokenizer
-
-def summarize_news_item(news_title: str, news_content: str, max_new_tokens: int = 384) -> str:
+from exaone_model import generate_batch, model_name
+from news_store import (
+    migrate_date, date_article_ids, get_article, update_article,
+    get_cached_summary, put_cached_summary, is_missing_content
+)
+
+# 한 번의 generate 호출에 넣을 기사 수
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "8"))
+# 요약 프롬프트를 바꾸면 올려서 이전 요약 캐시를 쓰지 않도록 함
+SUMMARY_PROMPT_VERSION = "v1"
+# 요약 캐시 키에 쓰는 모델 버전 (모델 이름 + 프롬프트 버전)
+SUMMARY_MODEL_VERSION = f"{model_name}:{SUMMARY_PROMPT_VERSION}"
+
+def build_summary_messages(news_title: str, news_content: str) -> list:
     prompt = f"""
     다음 정보를 바탕으로 뉴스를 요약해서 정리해주세요.
 
@@ -18,36 +30,57 @@ def summarize_news_item(news_title: str, news_content: str, max_new_tokens: int
     - 5줄 이내로 핵심만 간결하게 요약해주세요.
     """
 
-    messages = [
+    return [
         {"role": "system", "content": "당신은 야구 뉴스를 요약해서 정리해주는 도우미입니다."},
         {"role": "user", "content": prompt}
     ]
 
-    input_ids = tokenizer.apply_chat_template(
-        messages,
-        tokenize=True,
-        add_generation_prompt=True,
-        return_tensors="pt"
-    )
-
-    output = model.generate(
-        input_ids.to("cuda"),
-        max_new_tokens=max_new_tokens,
-        do_sample=False,
-        eos_token_id=tokenizer.eos_token_id
-    )
-
-    # 캐시 정리
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()    
-        torch.cuda.ipc_collect()
-
-    result = tokenizer.decode(output[0], skip_special_tokens=True)
+def _clean_summary(result: str) -> str:
     if "[|assistant|]" in result:
-        result = result.split("[|assistant|]")[-1].strip()
-    return result
+        result = result.split("[|assistant|]")[-1]
+    return result.strip()
+
+def summarize_news_items(items: list, max_new_tokens: int = 384) -> tuple:
+    """
+    여러 기사를 SUMMARY_BATCH_SIZE 개씩 묶어 요약합니다.
+
+    Args:
+        items (list): [(news_title, news_content), ...]
+
+    Returns:
+        tuple: (기사별 요약 목록, 배치별 생성 통계 목록)
+    """
+    summaries = []
+    batch_stats = []
+    for start in range(0, len(items), SUMMARY_BATCH_SIZE):
+        batch = items[start:start + SUMMARY_BATCH_SIZE]
+        results, stats = generate_batch(
+            [build_summary_messages(title, content) for title, content in batch],
+            max_new_tokens=max_new_tokens
+        )
+        summaries.extend(_clean_summary(result) for result in results)
+        batch_stats.append(stats)
+
+        # 캐시 정리
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+            torch.cuda.ipc_collect()
+
+    return summaries, batch_stats
+
+def summarize_news_item(news_title: str, news_content: str, max_new_tokens: int = 384) -> str:
+    """기사 하나 요약 (기존 호출 호환용)"""
+    summaries, _ = summarize_news_items([(news_title, news_content)], max_new_tokens=max_new_tokens)
+    return summaries[0]
+
+def add_summaries_in_place(date: str, incremental: bool = True):
+    """
+    해당 날짜의 고유 기사마다 요약을 추가합니다.
 
-def add_summaries_in_place(date: str):
+    Args:
+        date (str): YYYYMMDD
+        incremental (bool): True면 같은 모델 버전으로 이미 요약한 기사는 건너뜀 (False면 전부 다시 요약)
+    """
     date_folder = os.path.join("news_json", date)
     if not os.path.isdir(date_folder):
         print(f"폴더가 존재하지 않습니다: {date_folder}")
@@ -55,35 +88,61 @@ def add_summaries_in_place(date: str):
 
     TEAM_CODES = ["HH", "HT", "KT", "LG", "LT", "NC", "OB", "SK", "SS", "WO"]
 
-    for team_code in TEAM_CODES:
-        json_path = os.path.join(date_folder, f"news_{date}_{team_code}.json")
-        if not os.path.exists(json_path):
+    # 기존 형식(기사 전체를 담은) 팀별 파일은 저장소 + 참조 형식으로 변환
+    migrate_date(date, TEAM_CODES)
+
+    # 여러 팀이 참조하는 같은 기사는 한 번만 요약
+    article_ids = date_article_ids(date, TEAM_CODES)
+    pending = []
+    cached = 0
+    for article_id in article_ids:
+        news_item = get_article(article_id)
+        if news_item is None:
             continue
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        title = news_item.get("news_title", "")
+        content = news_item.get("news_content", "")
+
+        if not title and not content:
+            continue
 
-        updated_data = []
-        for news_item in data:
-            title = news_item.get("news_title", "")
-            content = news_item.get("news_content", "")
+        # 본문 추출에 실패한 기사는 다시 크롤링한 뒤 요약
+        if content and is_missing_content(content):
+            continue
 
-            if not title and not content:
-                updated_data.append(news_item)
+        if incremental:
+            summary = get_cached_summary(article_id, SUMMARY_MODEL_VERSION)
+            if summary is not None:
+                cached += 1
+                if news_item.get("news_summary") != summary:
+                    update_article(article_id, news_summary=summary)
                 continue
 
-            summary = summarize_news_item(title, content)
-            news_item["news_summary"] = summary
-            updated_data.append(news_item)
+        pending.append((article_id, title, content))
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(updated_data, f, ensure_ascii=False, indent=4)
+    start = time.perf_counter()
+    generated_tokens = 0
+    # 배치 단위로 생성 후 바로 저장해 중간에 실패해도 다음 실행에서는 남은 기사만 요약
+    for batch_start in range(0, len(pending), SUMMARY_BATCH_SIZE):
+        batch = pending[batch_start:batch_start + SUMMARY_BATCH_SIZE]
+        summaries, batch_stats = summarize_news_items([(title, content) for _, title, content in batch])
+        for (article_id, _, _), summary in zip(batch, summaries):
+            put_cached_summary(article_id, SUMMARY_MODEL_VERSION, summary)
+            update_article(article_id, news_summary=summary)
+        generated_tokens += sum(stats["generated_tokens"] for stats in batch_stats)
+        print(f"[요약] {batch_start + len(batch)}/{len(pending)}건")
 
-        print(f"[완료] {json_path} 파일에 요약이 추가되었습니다.")
+    elapsed = time.perf_counter() - start
+    print(f"[완료] {date_folder}: 고유 기사 {len(article_ids)}건 (캐시 {cached}건, 새로 요약 {len(pending)}건, "
+          f"{generated_tokens}토큰, {elapsed:.1f}초)")
 
 def main():
-    date = input("요약할 날짜를 입력하세요 (YYYYMMDD): ")
-    add_summaries_in_place(date)
+    # 사용법: python news_daily_summarization.py [YYYYMMDD ...] [--full]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    incremental = "--full" not in sys.argv[1:]
+    dates = args or [input("요약할 날짜를 입력하세요 (YYYYMMDD): ")]
+    for date in dates:
+        add_summaries_in_place(date, incremental=incremental)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,210 @@
+# 내용 주소 기반 기사 저장소
+# - 기사마다 URL(없으면 제목+본문)의 해시를 ID로 하여 news_store/articles/<ID 앞 2자리>/<ID>.json 에 한 번만 저장합니다.
+# - 팀별 파일(news_json/<date>/news_<date>_<team>.json)에는 기사 ID 참조만 저장합니다. ([{"article_id": "..."}])
+# - 같은 기사가 여러 팀(같은 경기의 두 팀 등)에 나와도 본문 크롤링/저장/요약은 한 번만 합니다.
+
+import os
+import re
+import sys
+import json
+import hashlib
+
+NEWS_JSON_DIR = "news_json"
+ARTICLE_STORE_DIR = os.path.join("news_store", "articles")
+# 기사 요약 캐시 (모델/프롬프트 버전별로 따로 보관)
+SUMMARY_CACHE_DIR = os.path.join("news_store", "summaries")
+
+TEAM_CODES = ["HH", "HT", "KT", "LG", "LT", "NC", "OB", "SK", "SS", "WO"]
+
+# 이전 크롤러(v1/v2)가 본문을 읽지 못했을 때 저장한 문구. 본문이 없는 것으로 보고 다시 크롤링합니다.
+CONTENT_FAILED_PLACEHOLDER = "본문 추출 실패"
+
+# 네이버 기사 주소에서 언론사 ID/기사 ID 추출 (모바일/PC 주소가 달라도 같은 기사로 판단)
+NAVER_ARTICLE_PATTERN = re.compile(r"/article/(\d+)/(\d+)")
+NAVER_QUERY_PATTERN = re.compile(r"oid=(\d+).*?aid=(\d+)")
+
+
+def make_article_id(article_url=None, news_title="", news_content=""):
+    """기사 URL(없으면 제목+본문)의 해시로 기사 ID를 만듭니다."""
+    if article_url:
+        match = NAVER_ARTICLE_PATTERN.search(article_url) or NAVER_QUERY_PATTERN.search(article_url)
+        key = f"naver:{match.group(1)}:{match.group(2)}" if match else article_url.split("?")[0]
+    else:
+        key = f"{news_title.strip()}\n{news_content.strip()}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def _article_path(article_id):
+    return os.path.join(ARTICLE_STORE_DIR, article_id[:2], f"{article_id}.json")
+
+
+def write_json_atomic(path, data, indent=2):
+    """임시 파일에 쓴 뒤 교체해 중간에 중단되어도 깨진 파일이 남지 않도록 저장합니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(temp_path, path)
+
+
+def is_missing_content(news_content):
+    """본문이 비어 있거나 본문 추출 실패 문구이면 True"""
+    return not news_content or news_content.strip() == CONTENT_FAILED_PLACEHOLDER
+
+
+def has_article(article_id):
+    """본문까지 저장된 기사이면 True (본문 추출에 실패한 기사는 다시 크롤링하도록 False)"""
+    article = get_article(article_id)
+    return article is not None and not is_missing_content(article.get("news_content"))
+
+
+def get_article(article_id):
+    """저장된 기사를 읽습니다. 없으면 None"""
+    try:
+        with open(_article_path(article_id), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def put_article(article):
+    """
+    기사를 저장하고 기사 ID를 반환합니다. 이미 있는 기사는 새 필드만 합쳐서 저장합니다.
+    (저장된 본문이 본문 추출 실패 문구이면 빈 필드로 보고 새 본문으로 채움)
+
+    Args:
+        article (dict): news_title, news_content, published_date (article_url, news_summary 선택)
+    """
+    article_id = article.get("article_id") or make_article_id(
+        article.get("article_url"), article.get("news_title", ""), article.get("news_content", "")
+    )
+
+    stored = get_article(article_id)
+    if stored is not None:
+        merged = dict(stored)
+        if is_missing_content(merged.get("news_content")) and not is_missing_content(article.get("news_content")):
+            # 실패 문구로 만든 요약도 함께 버리고 새 본문으로 다시 요약
+            merged.pop("news_content", None)
+            merged.pop("news_summary", None)
+        merged.update({key: value for key, value in article.items() if value and not merged.get(key)})
+        if merged == stored:
+            return article_id
+        article = merged
+
+    write_json_atomic(_article_path(article_id), dict(article, article_id=article_id))
+    return article_id
+
+
+def update_article(article_id, **fields):
+    """저장된 기사의 필드(요약 등)를 갱신합니다."""
+    article = get_article(article_id)
+    if article is None:
+        raise KeyError(f"저장되지 않은 기사: {article_id}")
+    article.update(fields)
+    write_json_atomic(_article_path(article_id), article)
+
+
+def _summary_path(article_id, model_version):
+    version_key = hashlib.sha256(model_version.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(SUMMARY_CACHE_DIR, version_key, article_id[:2], f"{article_id}.json")
+
+
+def get_cached_summary(article_id, model_version):
+    """같은 모델 버전으로 만든 기사 요약이 있으면 반환합니다. 없으면 None"""
+    try:
+        with open(_summary_path(article_id, model_version), "r", encoding="utf-8") as f:
+            return json.load(f)["news_summary"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def put_cached_summary(article_id, model_version, summary):
+    """기사 요약을 (기사 ID, 모델 버전) 키로 저장합니다."""
+    write_json_atomic(
+        _summary_path(article_id, model_version),
+        {"article_id": article_id, "model_version": model_version, "news_summary": summary}
+    )
+
+
+def team_file_path(date, team):
+    return os.path.join(NEWS_JSON_DIR, date, f"news_{date}_{team}.json")
+
+
+def save_team_refs(date, team, article_ids):
+    """팀별 파일에 기사 ID 참조 목록을 저장합니다. (중복 ID는 한 번만)"""
+    refs = [{"article_id": article_id} for article_id in dict.fromkeys(article_ids)]
+    file_path = team_file_path(date, team)
+    write_json_atomic(file_path, refs)
+    return file_path
+
+
+def load_team_items(date, team):
+    """팀별 파일의 원본 항목 목록 (참조 또는 기존 형식의 기사 전체)"""
+    file_path = team_file_path(date, team)
+    if not os.path.exists(file_path):
+        return []
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_team_news(date, team):
+    """
+    팀별 기사 목록을 기사 내용까지 풀어서 반환합니다.
+    참조 형식과 기존 형식(기사 전체를 담은 파일)을 모두 읽습니다.
+    """
+    news = []
+    for item in load_team_items(date, team):
+        if "article_id" in item and "news_title" not in item:
+            article = get_article(item["article_id"])
+            if article is not None:
+                news.append(article)
+        else:
+            news.append(item)
+    return news
+
+
+def date_article_ids(date, teams=TEAM_CODES):
+    """해당 날짜의 모든 팀 파일에서 참조하는 기사 ID (중복 제거, 처음 나온 순서)"""
+    article_ids = {}
+    for team in teams:
+        for item in load_team_items(date, team):
+            if "article_id" in item:
+                article_ids.setdefault(item["article_id"], None)
+    return list(article_ids)
+
+
+def migrate_date(date, teams=TEAM_CODES):
+    """
+    기존 형식(기사 전체를 담은) 팀별 파일을 저장소 + 참조 형식으로 바꿉니다.
+
+    Returns:
+        tuple: (전체 기사 수, 고유 기사 수)
+    """
+    total = 0
+    unique_ids = set()
+    for team in teams:
+        items = load_team_items(date, team)
+        if not items or all("article_id" in item and "news_title" not in item for item in items):
+            continue
+
+        article_ids = []
+        for item in items:
+            article_id = item["article_id"] if "article_id" in item and "news_title" not in item else put_article(item)
+            article_ids.append(article_id)
+        save_team_refs(date, team, article_ids)
+
+        total += len(article_ids)
+        unique_ids.update(article_ids)
+        print(f"[변환] {team_file_path(date, team)}: {len(article_ids)}건")
+
+    return total, len(unique_ids)
+
+
+def main():
+    dates = sys.argv[1:] or [input("저장소 형식으로 바꿀 날짜를 입력하세요 (YYYYMMDD): ")]
+    for date in dates:
+        total, unique = migrate_date(date)
+        print(f"{date}: 팀별 기사 {total}건 → 고유 기사 {unique}건")
+
+if __name__ == "__main__":
+    main()
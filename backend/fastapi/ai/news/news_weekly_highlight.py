@@ -2,8 +2,10 @@ import os
 import json
 from dotenv import load_dotenv
 import datetime
+import hashlib
 
 import google.generativeai as genai
+from news_store import write_json_atomic
 
 # 환경변수 로드 및 GEMINI_API_KEY 가져오기
 load_dotenv()
@@ -19,15 +21,14 @@ instruction = """
 
 [작성 조건]
 - 생성되는 텍스트는 순수한 일반 텍스트 형식이어야 하며, 어떠한 마크다운 문법(예: **, ## 등)도 사용하지 말아주세요.
-- news_title, news_summary, published_date 정보를 포함한 JSON 형식의 데이터를 입력받아, 요약된 내용을 생성해주세요.
+- 날짜별 일일 하이라이트(date, highlights) 목록을 JSON 형식으로 입력받아, 요약된 내용을 생성해주세요.
 - 뉴스 중에서 중복되는 내용이 있는 경우에는 1개만 요약해야 합니다.
 - 주간 뉴스 중에서 가장 중요한 내용 5가지를 각각 한 줄로 요약해야 하고, 뉴스 제목과 같은 형태로 요약된 내용을 반환해야 합니다.
 
 [입력 데이터 형식]
 {
-    "news_title": "뉴스 제목",
-    "news_summary": "뉴스 요약 내용",
-    "published_date": "2025-03-22"
+    "date": "2025-03-22",
+    "highlights": ["일일 하이라이트 1", "일일 하이라이트 2", "일일 하이라이트 3"]
 }
 
 [출력 형식]
@@ -42,40 +43,89 @@ instruction = """
 """
 
 # Gemini 모델 인스턴스 생성
+MODEL_NAME = "models/gemini-2.0-flash"
 model = genai.GenerativeModel(
-    "models/gemini-2.0-flash", 
+    MODEL_NAME,
     system_instruction=instruction
 )
 
-def summarize_weekly_news(start_date, end_date, team):
-    """주간 뉴스 요약"""
-    all_news = []
+# 일일 하이라이트 폴더 (news_daily_highlight_v2.py 결과)
+DAILY_HIGHLIGHT_DIR = "news_daily_highlight"
+# 팀·주간별 요약 캐시 폴더 (입력 하이라이트가 같으면 다시 생성하지 않음)
+WEEKLY_CACHE_DIR = os.path.join("news_weekly_highlight", "cache")
+
+# 일일 하이라이트 파일의 팀 이름
+DAILY_TEAM_NAMES = {
+    "HT": "KIA 타이거즈",
+    "SS": "삼성 라이온즈",
+    "OB": "두산 베어스",
+    "LT": "롯데 자이언츠",
+    "KT": "KT 위즈",
+    "SK": "SSG 랜더스",
+    "HH": "한화 이글스",
+    "NC": "NC 다이노스",
+    "WO": "키움 히어로즈",
+    "LG": "LG 트윈스"
+}
+
+_daily_highlight_files = {}
+
+def load_daily_highlight_file(date_str):
+    """일일 하이라이트 파일을 읽습니다. (같은 실행 안에서는 날짜별로 한 번만 읽음, 없으면 None)"""
+    if date_str not in _daily_highlight_files:
+        file_path = os.path.join(DAILY_HIGHLIGHT_DIR, f"news_daily_highlight_{date_str}.json")
+        if os.path.exists(file_path):
+            with open(file_path, "r", encoding="utf-8") as json_file:
+                _daily_highlight_files[date_str] = json.load(json_file).get("news_highlights", {})
+        else:
+            print(f"일일 하이라이트 파일이 없습니다: {file_path}")
+            _daily_highlight_files[date_str] = None
+    return _daily_highlight_files[date_str]
+
+def load_weekly_digests(start_date, end_date, team):
+    """기간 내 팀의 일일 하이라이트 목록 [{"date": ..., "highlights": [...]}]"""
+    digests = []
     for current_date in range((end_date - start_date).days + 1):
         target_date = start_date + datetime.timedelta(days=current_date)
-        json_file_path = f"news_json/{target_date.strftime('%Y%m%d')}/news_{target_date.strftime('%Y%m%d')}_{team}.json"
-        if os.path.exists(json_file_path):
-            with open(json_file_path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-                # 각 뉴스 항목에서 필요한 필드만 추출
-                for item in data:
-                    extracted = {
-                        "news_title": item.get("news_title", ""),
-                        "news_summary": item.get("news_summary", ""),
-                        "published_date": item.get("published_date", "")
-                    }
-                    all_news.append(extracted)
+        highlights = load_daily_highlight_file(target_date.strftime('%Y%m%d'))
+        team_highlights = (highlights or {}).get(DAILY_TEAM_NAMES[team], [])
+        if team_highlights:
+            digests.append({
+                "date": target_date.strftime("%Y-%m-%d"),
+                "highlights": team_highlights
+            })
+    return digests
 
+def _weekly_cache_path(start_date, end_date, team):
+    week_key = f"{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}"
+    return os.path.join(WEEKLY_CACHE_DIR, week_key, f"{team}.json")
+
+def summarize_weekly_news(start_date, end_date, team):
+    """주간 뉴스 요약 (일일 하이라이트를 입력으로 사용, 팀·주간별 캐시)"""
+    all_news = load_weekly_digests(start_date, end_date, team)
     if not all_news:
         return None
 
+    # 일일 하이라이트가 다시 만들어진 경우에만 새로 생성
+    input_hash = hashlib.sha256(
+        json.dumps([MODEL_NAME, instruction, all_news], ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    cache_path = _weekly_cache_path(start_date, end_date, team)
+    if os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            cached = json.load(cache_file)
+        if cached.get("input_hash") == input_hash:
+            return cached["news_summation"]
+
     prompt = f"""
-    ## 뉴스 내용:
+    ## 일일 하이라이트:
     {all_news}
 
     **주간 뉴스 요약된 결과**
     """
 
     response = model.generate_content(prompt)
+    write_json_atomic(cache_path, {"input_hash": input_hash, "news_summation": response.text})
     return response.text
 
 def generate_weekly_summary_json(date, n_day=6):
@@ -1,15 +1,16 @@
 import os
+import sys
 import json
 from dotenv import load_dotenv
-from google import genai
-from google.genai import types
+
+# 공용 LLM 실행기(ai/llm) import를 위한 경로 설정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from llm.generation_runner import GenerationRequest, generate_all
 
 # ------------------------
-# 환경변수 로드 및 Gemini API 설정
+# 환경변수 로드
 # ------------------------
 load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-client = genai.Client(api_key=GEMINI_API_KEY)
 
 def compare_team_money(total_daily_saving, opponent_total_daily_saving):
     """
@@ -21,9 +22,9 @@ def compare_team_money(total_daily_saving, opponent_total_daily_saving):
         return "상대 팀 송금액 우세"
     return "송금액 동일"
 
-def generate_daily_message(team_data, report_date):
+def build_daily_request(team_data):
     """
-    LLM 프롬프트로 데일리 메시지를 생성 후 JSON 형식 반환
+    팀 데이터로 데일리 메시지 생성 요청(시스템 프롬프트 + 본문 프롬프트)을 구성
     """
     # 데이터 준비
     team_id = team_data["team_id"]
@@ -61,22 +62,32 @@ def generate_daily_message(team_data, report_date):
     5. 송금액을 숫자로 직접 언급하지 말고, 차이가 있다는 느낌만 전달하세요.
     """
     
-    # 생성 요청
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-        config=types.GenerateContentConfig(system_instruction=system_instruction),
-        contents=prompt
-    )
+    return GenerationRequest(key=team_id, prompt=prompt, system_instruction=system_instruction)
 
-    # 결과 추출
-    daily_text = response.candidates[0].content.parts[0].text
+def generate_daily_messages(teams_data, report_date, **runner_options):
+    """
+    여러 팀의 데일리 메시지를 동시에 생성 후 JSON 형식 목록 반환
+    (입력이 같은 팀은 캐시된 메시지를 재사용)
+    """
+    requests = [build_daily_request(team_data) for team_data in teams_data]
+    results, stats = generate_all(requests, **runner_options)
+    print(f"[데일리 메시지] 요청 {stats['requests']}건, 캐시 {stats['cache_hits']}건, 생성 {stats['generated']}건, "
+          f"실패 {stats['failed']}건, {stats['elapsed_sec']}초")
+
+    return [
+        {
+            "team_id": request.key,
+            "date": report_date,
+            "llm_context": results[request.key]
+        }
+        for request in requests
+    ]
 
-    # JSON 형태로 반환
-    return {
-        "team_id": team_id,
-        "date": report_date,
-        "llm_context": daily_text
-    }
+def generate_daily_message(team_data, report_date):
+    """
+    LLM 프롬프트로 데일리 메시지를 생성 후 JSON 형식 반환
+    """
+    return generate_daily_messages([team_data], report_date)[0]
 
 # ------------------------------------------------------------------
 def main():
@@ -176,11 +187,8 @@ def main():
         data_list = input_data["teams_data"]
         report_date = input_data["date"]   
 
-        reports = []
-        for account in data_list:
-            # 각 팀의 정보를 기반으로 데일리 메시지 생성
-            daily_message_output = generate_daily_message(account, report_date)
-            reports.append(daily_message_output)
+        # 각 팀의 정보를 기반으로 데일리 메시지 생성 (동시 실행)
+        reports = generate_daily_messages(data_list, report_date)
 
         output_json = {"reports": reports}
         with open("test_json/daily_message_output.json", "w", encoding="utf-8") as f:
@@ -0,0 +1,28 @@
+import sys
+import os
+
+# 현재 파일 (`DB/` 폴더)에 있으므로, 상위 디렉토리를 sys.path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+# 이력 조회 API의 (날짜, ID) 키셋 페이지 조회용 복합 인덱스 추가
+HISTORY_INDEXES = [
+    ("daily_saving", "ix_daily_saving_account_date", "ACCOUNT_ID, DATE, DAILY_SAVING_ID"),
+    ("daily_balances", "ix_daily_balances_account_date", "ACCOUNT_ID, DATE, DAILY_BALANCES_ID"),
+    ("player_record", "ix_player_record_player_date", "PLAYER_ID, DATE, PLAYER_RECORD_ID"),
+    ("transaction_message", "ix_transaction_message_account_date", "ACCOUNT_ID, TRANSACTION_DATE, TRANSACTION_ID"),
+    ("daily_transfer", "ix_daily_transfer_account_date", "ACCOUNT_ID, DATE, DAILY_TRANSFER_ID"),
+]
+
+inspector = inspect(engine)
+with engine.connect() as connection:
+    for table_name, index_name, columns in HISTORY_INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table_name)}
+        if index_name in existing:
+            print(f"{table_name}.{index_name} 이미 존재")
+            continue
+        connection.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({columns})"))
+        print(f"{table_name}.{index_name} 추가 성공")
+    connection.commit()
@@ -0,0 +1,40 @@
+import sys
+import os
+
+# 현재 파일 (`DB/` 폴더)에 있으므로, 상위 디렉토리를 sys.path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+# 배치 보고서 저장 API의 upsert (INSERT ... ON DUPLICATE KEY UPDATE) 용 유니크 인덱스 추가
+REPORT_INDEXES = [
+    ("weekly_report_personal", "ux_weekly_report_personal_account_date", "ACCOUNT_ID, DATE"),
+    ("daily_report", "ux_daily_report_team_date", "TEAM_ID, DATE"),
+]
+
+failed = False
+inspector = inspect(engine)
+with engine.connect() as connection:
+    for table_name, index_name, columns in REPORT_INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table_name)}
+        if index_name in existing:
+            print(f"{table_name}.{index_name} 이미 존재")
+            continue
+
+        # 같은 (키, 날짜) 보고서가 여러 건 있으면 유니크 인덱스를 만들 수 없으므로 먼저 확인
+        duplicates = connection.execute(text(
+            f"SELECT {columns}, COUNT(*) FROM {table_name} GROUP BY {columns} HAVING COUNT(*) > 1"
+        )).fetchall()
+        if duplicates:
+            print(f"{table_name}: 중복 보고서 {len(duplicates)}건이 있어 인덱스를 추가하지 않습니다. 정리 후 다시 실행하세요.")
+            for row in duplicates:
+                print(f"  {tuple(row[:-1])}: {row[-1]}건")
+            failed = True
+            continue
+
+        connection.execute(text(f"CREATE UNIQUE INDEX {index_name} ON {table_name} ({columns})"))
+        print(f"{table_name}.{index_name} 추가 성공")
+    connection.commit()
+
+sys.exit(1 if failed else 0)
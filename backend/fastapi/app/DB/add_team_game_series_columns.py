@@ -0,0 +1,32 @@
+import sys
+import os
+
+# 현재 파일 (`DB/` 폴더)에 있으므로, 상위 디렉토리를 sys.path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+# team_game_context 테이블에 시리즈 승/패/결과 칼럼 추가 (테이블이 없으면 서버 시작 시 칼럼까지 함께 생성됨)
+SERIES_COLUMNS = [
+    ("SERIES_WINS", "INT NOT NULL DEFAULT 0"),
+    ("SERIES_LOSSES", "INT NOT NULL DEFAULT 0"),
+    ("SERIES_OUTCOME", "VARCHAR(10) NULL"),
+]
+
+inspector = inspect(engine)
+if not inspector.has_table("team_game_context"):
+    print("team_game_context 테이블이 없습니다. 서버 시작 시 생성됩니다.")
+    sys.exit(0)
+
+existing = {column["name"] for column in inspector.get_columns("team_game_context")}
+with engine.connect() as connection:
+    for column_name, column_type in SERIES_COLUMNS:
+        if column_name in existing:
+            print(f"team_game_context.{column_name} 이미 존재")
+            continue
+        connection.execute(text(f"ALTER TABLE team_game_context ADD COLUMN {column_name} {column_type}"))
+        print(f"team_game_context.{column_name} 추가 성공")
+    connection.commit()
+
+print("시리즈 결과는 `python utils/game_context.py --start YYYY-MM-DD` 로 다시 계산하세요.")
@@ -0,0 +1,34 @@
+import sys
+import os
+
+# 현재 파일 (`DB/` 폴더)에 있으므로, 상위 디렉토리를 sys.path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+# 일일 순위 저장(utils/update_daily_rank.py)의 upsert (INSERT ... ON DUPLICATE KEY UPDATE) 용 유니크 인덱스 추가
+INDEX_NAME = "ux_team_rating_team_date"
+
+inspector = inspect(engine)
+existing = {index["name"] for index in inspector.get_indexes("team_rating")}
+
+if INDEX_NAME in existing:
+    print(f"team_rating.{INDEX_NAME} 이미 존재")
+    sys.exit(0)
+
+with engine.connect() as connection:
+    # 같은 (팀, 날짜) 순위가 여러 건 있으면 유니크 인덱스를 만들 수 없으므로 먼저 확인
+    duplicates = connection.execute(text(
+        "SELECT TEAM_ID, DATE, COUNT(*) FROM team_rating GROUP BY TEAM_ID, DATE HAVING COUNT(*) > 1"
+    )).fetchall()
+
+    if duplicates:
+        print(f"중복된 (팀, 날짜) 순위 {len(duplicates)}건이 있어 인덱스를 추가하지 않습니다. 정리 후 다시 실행하세요.")
+        for team_id, rank_date, count in duplicates:
+            print(f"  ({team_id}, {rank_date}): {count}건")
+        sys.exit(1)
+
+    connection.execute(text(f"CREATE UNIQUE INDEX {INDEX_NAME} ON team_rating (TEAM_ID, DATE)"))
+    connection.commit()
+    print(f"team_rating.{INDEX_NAME} 추가 성공")
@@ -0,0 +1,35 @@
+import sys
+import os
+
+# 현재 파일 (`DB/` 폴더)에 있으므로, 상위 디렉토리를 sys.path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+# 티켓 인증(OCR) 시 티켓 번호 조회/인증 UPDATE 용 유니크 인덱스 추가
+INDEX_NAME = "ux_ticket_number_ticket_number"
+
+inspector = inspect(engine)
+existing = {index["name"] for index in inspector.get_indexes("ticket_number")}
+
+if INDEX_NAME in existing:
+    print(f"ticket_number.{INDEX_NAME} 이미 존재")
+    sys.exit(0)
+
+with engine.connect() as connection:
+    # 중복된 티켓 번호가 있으면 유니크 인덱스를 만들 수 없으므로 먼저 확인
+    duplicates = connection.execute(text(
+        "SELECT TICKET_NUMBER, COUNT(*) FROM ticket_number "
+        "WHERE TICKET_NUMBER IS NOT NULL GROUP BY TICKET_NUMBER HAVING COUNT(*) > 1"
+    )).fetchall()
+
+    if duplicates:
+        print(f"중복된 티켓 번호 {len(duplicates)}건이 있어 인덱스를 추가하지 않습니다. 정리 후 다시 실행하세요.")
+        for ticket_number, count in duplicates:
+            print(f"  {ticket_number}: {count}건")
+        sys.exit(1)
+
+    connection.execute(text(f"CREATE UNIQUE INDEX {INDEX_NAME} ON ticket_number (TICKET_NUMBER)"))
+    connection.commit()
+    print(f"ticket_number.{INDEX_NAME} 추가 성공")
@@ -0,0 +1,36 @@
+import sys
+import os
+
+# 현재 파일 (`DB/` 폴더)에 있으므로, 상위 디렉토리를 sys.path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text
+from database import engine
+
+# daily_transfer 테이블에 이체 원장 칼럼 추가 (이체 상태, 멱등성 키, 시도 횟수, 은행 거래번호, 마지막 오류)
+with engine.connect() as connection:
+    # 같은 (계정, 날짜)가 여러 건이면 유니크 인덱스를 만들 수 없으므로 칼럼 추가 전에 먼저 확인 (DDL은 롤백되지 않음)
+    duplicates = connection.execute(text(
+        "SELECT ACCOUNT_ID, DATE, COUNT(*) FROM daily_transfer GROUP BY ACCOUNT_ID, DATE HAVING COUNT(*) > 1"
+    )).fetchall()
+    if duplicates:
+        print(f"중복된 (계정, 날짜) 이체 내역이 있어 중단합니다. 정리 후 다시 실행하세요: {duplicates}")
+        sys.exit(1)
+
+    connection.execute(text("ALTER TABLE daily_transfer ADD COLUMN STATUS VARCHAR(20) NOT NULL DEFAULT 'PENDING'"))
+    connection.execute(text("ALTER TABLE daily_transfer ADD COLUMN IDEMPOTENCY_KEY VARCHAR(20) NULL"))
+    connection.execute(text("ALTER TABLE daily_transfer ADD COLUMN ATTEMPTS INT NOT NULL DEFAULT 0"))
+    connection.execute(text("ALTER TABLE daily_transfer ADD COLUMN BANK_TRANSACTION_NO VARCHAR(50) NULL"))
+    connection.execute(text("ALTER TABLE daily_transfer ADD COLUMN LAST_ERROR VARCHAR(255) NULL"))
+    connection.execute(text("ALTER TABLE daily_transfer ADD COLUMN updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"))
+
+    # 기존 데이터: 이체가 끝난 건은 TEXT가 '출금예정!!'에서 메시지로 바뀌어 있음
+    connection.execute(text("UPDATE daily_transfer SET STATUS = 'SUCCEEDED' WHERE TEXT IS NULL OR TEXT <> '출금예정!!'"))
+    connection.execute(text(
+        "UPDATE daily_transfer SET IDEMPOTENCY_KEY = CONCAT(DATE_FORMAT(DATE, '%Y%m%d'), LPAD(ACCOUNT_ID, 12, '0'))"
+    ))
+
+    connection.execute(text("CREATE UNIQUE INDEX ix_daily_transfer_IDEMPOTENCY_KEY ON daily_transfer (IDEMPOTENCY_KEY)"))
+    connection.execute(text("CREATE INDEX ix_daily_transfer_STATUS ON daily_transfer (STATUS)"))
+    connection.commit()
+    print("daily_transfer 이체 원장 칼럼 추가 성공")
@@ -0,0 +1,600 @@
+# benchmark/fake_bank.py
+"""
+SSAFY 금융 API를 흉내 내는 로컬 가상 서버 (부하 테스트/벤치마크용)
+
+router/user/user_ssafy_api_utils.py 가 사용하는 API를 모두 지원합니다.
+    - /member, /member/search                      : 사용자 생성/조회
+    - createDemandDepositAccount                   : 계좌 개설
+    - inquireDemandDepositAccountHolderName        : 예금주 조회
+    - inquireDemandDepositAccountBalance           : 잔액 조회
+    - updateDemandDepositAccountDeposit            : 입금
+    - updateDemandDepositAccountTransfer           : 계좌 이체
+    - inquireTransactionHistoryList                : 거래 내역 조회
+
+응답 지연 분포, 오류율, 초당 요청 제한을 설정할 수 있고, 같은 seed 이면 같은 순서의 지연/오류가 재현됩니다.
+
+단독 실행:
+    python benchmark/fake_bank.py --port 8089 --latency normal --latency-mean-ms 80 --error-rate 0.01 --rate-limit 50
+    # 앱은 BANK_API_MODE=fake, FAKE_BANK_BASE_URL=http://127.0.0.1:8089/ssafy/api/v1 로 실행
+"""
+import json
+import math
+import time
+import random
+import logging
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/ssafy/api/v1"
+
+# 계좌 자동 개설 시 초기 잔액 (synthetic_data 로 만든 계좌는 가상 서버에 등록되어 있지 않음)
+DEFAULT_INITIAL_BALANCE = 1_000_000_000
+
+
+class LatencyProfile:
+    """
+    응답 지연 분포 설정
+
+    Args:
+        distribution (str): fixed, uniform, normal, lognormal 중 하나
+        mean_ms (float): 평균 지연(ms). uniform 은 [min_ms, max_ms] 구간을 사용
+        stddev_ms (float): 표준편차(ms) (normal, lognormal)
+        min_ms (float): 최소 지연(ms)
+        max_ms (float): 최대 지연(ms)
+    """
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, distribution="fixed", mean_ms=0.0, stddev_ms=0.0, min_ms=0.0, max_ms=None):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포: {distribution}")
+        self.distribution = distribution
+        self.mean_ms = mean_ms
+        self.stddev_ms = stddev_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+
+    def sample(self, rng):
+        """지연 시간(초)을 하나 뽑습니다."""
+        if self.distribution == "fixed":
+            value = self.mean_ms
+        elif self.distribution == "uniform":
+            value = rng.uniform(self.min_ms, self.max_ms if self.max_ms is not None else self.mean_ms * 2)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean_ms, self.stddev_ms)
+        else:
+            # 평균/표준편차가 mean_ms/stddev_ms 가 되도록 로그정규 분포의 mu, sigma 계산
+            if self.mean_ms <= 0:
+                value = 0.0
+            else:
+                variance = self.stddev_ms ** 2
+                sigma = math.sqrt(math.log(1 + variance / self.mean_ms ** 2))
+                mu = math.log(self.mean_ms) - sigma ** 2 / 2
+                value = rng.lognormvariate(mu, sigma)
+
+        value = max(self.min_ms, value)
+        if self.max_ms is not None:
+            value = min(self.max_ms, value)
+        return value / 1000
+
+
+class _TokenBucket:
+    """초당 요청 수 제한 (burst 만큼 순간 요청 허용)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class _BankState:
+    """가상 은행의 사용자/계좌/거래 내역 저장소"""
+
+    def __init__(self, auto_create_accounts=True, initial_balance=DEFAULT_INITIAL_BALANCE):
+        self.lock = threading.Lock()
+        self.auto_create_accounts = auto_create_accounts
+        self.initial_balance = initial_balance
+        self.users = {}            # userId -> 사용자 정보
+        self.accounts = {}         # accountNo -> {"userKey", "balance", "created", "history"}
+        self.transaction_seq = 0
+        self.account_seq = 0
+        # 이미 사용된 institutionTransactionUniqueNo (실제 금융 API처럼 같은 번호로 재요청하면 거절)
+        self.unique_nos = set()
+
+    def next_transaction_no(self):
+        self.transaction_seq += 1
+        return str(self.transaction_seq)
+
+    def get_account(self, account_no, user_key=None):
+        account = self.accounts.get(account_no)
+        if account is None and self.auto_create_accounts and account_no:
+            account = self.accounts[account_no] = {
+                "userKey": user_key,
+                "userName": f"가상예금주{account_no[-4:]}",
+                "balance": self.initial_balance,
+                "created": datetime.now().strftime("%Y%m%d"),
+                "history": []
+            }
+        return account
+
+
+class FakeBankError(Exception):
+    """가상 서버에서 금융 API 오류 응답을 돌려줄 때 사용"""
+
+    def __init__(self, status_code, response_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_code = response_code
+        self.message = message
+
+
+class _FakeBankHandler(BaseHTTPRequestHandler):
+    """금융 API 요청을 받아 가상 은행 상태를 갱신하고 실제 API와 같은 형식으로 응답하는 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        # 테스트 코드에서 호출 횟수를 확인하기 위한 통계
+        if self.path.rstrip("/") == "/__stats":
+            self._send(200, self.server.bank.stats())
+        else:
+            self._send(404, {"responseCode": "E4004", "responseMessage": "존재하지 않는 경로입니다."})
+
+    def do_POST(self):
+        bank = self.server.bank
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send(400, {"responseCode": "E4000", "responseMessage": "JSON 형식이 올바르지 않습니다."})
+            return
+
+        path = self.path.split("?")[0].rstrip("/")
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        api_name = path.split("/")[-1]
+
+        bank.count_request(api_name)
+
+        if not bank.allow_request():
+            bank.count_outcome("rate_limited")
+            self._send(429, self._error_payload(body, "Q1000", "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."))
+            return
+
+        delay, fail = bank.draw_fault(api_name)
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            bank.count_outcome("injected_error")
+            self._send(500, self._error_payload(body, "E9999", "가상 서버 오류 (주입된 오류)"))
+            return
+
+        try:
+            status_code, payload = bank.dispatch(path, api_name, body)
+            bank.count_outcome("ok")
+        except FakeBankError as e:
+            bank.count_outcome("api_error")
+            status_code, payload = e.status_code, self._error_payload(body, e.response_code, e.message)
+
+        self._send(status_code, payload)
+
+    def _error_payload(self, body, response_code, message):
+        # 회원 API는 최상위에, 계좌 API는 Header 안에 응답 코드가 있으므로 둘 다 채움
+        header = dict(body.get("Header") or {})
+        header.update({"responseCode": response_code, "responseMessage": message})
+        return {"responseCode": response_code, "responseMessage": message, "Header": header}
+
+    def _send(self, status_code, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # 요청마다 stderr 로그를 남기지 않음
+        pass
+
+
+class _FakeBank:
+    """장애 주입 설정과 API별 처리 로직"""
+
+    def __init__(self, latency, api_latency, error_rate, api_error_rate, rate_limit, rate_limit_burst,
+                 auto_create_accounts, seed):
+        self.latency = latency
+        self.api_latency = api_latency
+        self.error_rate = error_rate
+        self.api_error_rate = api_error_rate
+        self.bucket = _TokenBucket(rate_limit, rate_limit_burst) if rate_limit else None
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.state = _BankState(auto_create_accounts=auto_create_accounts)
+        self.stats_lock = threading.Lock()
+        self.request_counts = {}
+        self.outcome_counts = {}
+
+    # ----- 장애 주입 -----
+
+    def allow_request(self):
+        return self.bucket is None or self.bucket.acquire()
+
+    def draw_fault(self, api_name):
+        profile = self.api_latency.get(api_name, self.latency)
+        error_rate = self.api_error_rate.get(api_name, self.error_rate)
+        with self.rng_lock:
+            delay = profile.sample(self.rng)
+            fail = error_rate > 0 and self.rng.random() < error_rate
+        return delay, fail
+
+    def count_request(self, api_name):
+        with self.stats_lock:
+            self.request_counts[api_name] = self.request_counts.get(api_name, 0) + 1
+
+    def count_outcome(self, outcome):
+        with self.stats_lock:
+            self.outcome_counts[outcome] = self.outcome_counts.get(outcome, 0) + 1
+
+    def stats(self):
+        with self.stats_lock:
+            result = {"requests": dict(self.request_counts), "outcomes": dict(self.outcome_counts)}
+        with self.state.lock:
+            result["users"] = len(self.state.users)
+            result["accounts"] = len(self.state.accounts)
+            result["transactions"] = self.state.transaction_seq
+        return result
+
+    # ----- API 처리 -----
+
+    def dispatch(self, path, api_name, body):
+        if path == "/member":
+            return self._create_member(body)
+        if path == "/member/search":
+            return self._search_member(body)
+
+        handler = {
+            "createDemandDepositAccount": self._create_account,
+            "inquireDemandDepositAccountHolderName": self._holder_name,
+            "inquireDemandDepositAccountBalance": self._balance,
+            "updateDemandDepositAccountDeposit": self._deposit,
+            "updateDemandDepositAccountTransfer": self._transfer,
+            "inquireTransactionHistoryList": self._history,
+        }.get(api_name)
+        if handler is None:
+            raise FakeBankError(404, "E4004", f"지원하지 않는 API: {api_name}")
+
+        header = body.get("Header") or {}
+        unique_no = header.get("institutionTransactionUniqueNo")
+        if unique_no:
+            with self.state.lock:
+                if unique_no in self.state.unique_nos:
+                    raise FakeBankError(400, "H1008", "기관거래고유번호가 중복된 값입니다.")
+                self.state.unique_nos.add(unique_no)
+        return 200, {"Header": self._response_header(header), "REC": handler(header, body)}
+
+    def _response_header(self, header):
+        return {
+            "responseCode": "H0000",
+            "responseMessage": "정상처리 되었습니다.",
+            "apiName": header.get("apiName"),
+            "transmissionDate": header.get("transmissionDate"),
+            "transmissionTime": header.get("transmissionTime"),
+            "institutionCode": header.get("institutionCode"),
+            "fintechAppNo": header.get("fintechAppNo"),
+            "apiServiceCode": header.get("apiServiceCode"),
+            "institutionTransactionUniqueNo": header.get("institutionTransactionUniqueNo")
+        }
+
+    def _member_payload(self, user):
+        return {
+            "userId": user["userId"],
+            "userName": user["userName"],
+            "institutionCode": "00100",
+            "userKey": user["userKey"],
+            "created": user["created"],
+            "modified": user["created"]
+        }
+
+    def _create_member(self, body):
+        user_id = body.get("userId")
+        if not user_id:
+            raise FakeBankError(400, "E4001", "userId가 없습니다.")
+        state = self.state
+        with state.lock:
+            if user_id in state.users:
+                raise FakeBankError(400, "E4002", "이미 존재하는 ID입니다.")
+            user = state.users[user_id] = {
+                "userId": user_id,
+                "userName": user_id.split("@")[0],
+                "userKey": f"fake-user-key-{len(state.users) + 1:08d}",
+                "created": datetime.now().isoformat()
+            }
+        return 201, self._member_payload(user)
+
+    def _search_member(self, body):
+        with self.state.lock:
+            user = self.state.users.get(body.get("userId"))
+        if user is None:
+            raise FakeBankError(400, "E4003", "존재하지 않는 ID입니다.")
+        return 201, self._member_payload(user)
+
+    def _require_account(self, account_no, user_key=None):
+        account = self.state.get_account(account_no, user_key)
+        if account is None:
+            raise FakeBankError(400, "A1003", "계좌번호가 유효하지 않습니다.")
+        return account
+
+    def _create_account(self, header, body):
+        state = self.state
+        with state.lock:
+            state.account_seq += 1
+            account_no = f"999{state.account_seq:013d}"
+            state.accounts[account_no] = {
+                "userKey": header.get("userKey"),
+                "userName": self._user_name_by_key(header.get("userKey")),
+                "balance": 0,
+                "created": datetime.now().strftime("%Y%m%d"),
+                "history": []
+            }
+        return {
+            "bankCode": "999",
+            "accountNo": account_no,
+            "currency": {"currency": "KRW", "currencyName": "원화"}
+        }
+
+    def _user_name_by_key(self, user_key):
+        for user in self.state.users.values():
+            if user["userKey"] == user_key:
+                return user["userName"]
+        return "가상예금주"
+
+    def _holder_name(self, header, body):
+        with self.state.lock:
+            account = self._require_account(body.get("accountNo"), header.get("userKey"))
+            return {
+                "bankCode": "999",
+                "bankName": "가상은행",
+                "accountNo": body.get("accountNo"),
+                "userName": account["userName"]
+            }
+
+    def _balance(self, header, body):
+        with self.state.lock:
+            account = self._require_account(body.get("accountNo"), header.get("userKey"))
+            return {
+                "bankCode": "999",
+                "accountNo": body.get("accountNo"),
+                "accountBalance": str(account["balance"]),
+                "accountCreatedDate": account["created"],
+                "accountExpiryDate": "",
+                "lastTransactionDate": account["history"][-1]["transactionDate"] if account["history"] else "",
+                "currency": "KRW"
+            }
+
+    def _parse_amount(self, value):
+        try:
+            amount = int(value)
+        except (TypeError, ValueError):
+            raise FakeBankError(400, "A1011", "거래금액이 유효하지 않습니다.")
+        if amount <= 0:
+            raise FakeBankError(400, "A1011", "거래금액이 유효하지 않습니다.")
+        return amount
+
+    def _append_history(self, account, transaction_no, transaction_type, type_name, amount, summary, other_account=""):
+        now = datetime.now()
+        account["history"].append({
+            "transactionUniqueNo": transaction_no,
+            "transactionDate": now.strftime("%Y%m%d"),
+            "transactionTime": now.strftime("%H%M%S"),
+            "transactionType": transaction_type,
+            "transactionTypeName": type_name,
+            "transactionAccountNo": other_account,
+            "transactionBalance": str(amount),
+            "transactionAfterBalance": str(account["balance"]),
+            "transactionSummary": summary or "",
+            "transactionMemo": ""
+        })
+
+    def _deposit(self, header, body):
+        amount = self._parse_amount(body.get("transactionBalance"))
+        state = self.state
+        with state.lock:
+            account = self._require_account(body.get("accountNo"), header.get("userKey"))
+            transaction_no = state.next_transaction_no()
+            account["balance"] += amount
+            self._append_history(account, transaction_no, "1", "입금", amount, body.get("transactionSummary"))
+            return {"transactionUniqueNo": transaction_no, "transactionDate": account["history"][-1]["transactionDate"]}
+
+    def _transfer(self, header, body):
+        amount = self._parse_amount(body.get("transactionBalance"))
+        state = self.state
+        with state.lock:
+            withdrawal = self._require_account(body.get("withdrawalAccountNo"), header.get("userKey"))
+            deposit = self._require_account(body.get("depositAccountNo"), header.get("userKey"))
+            if withdrawal["balance"] < amount:
+                raise FakeBankError(400, "A1014", "계좌 잔액이 부족하여 거래가 실패했습니다.")
+
+            withdrawal_no = state.next_transaction_no()
+            deposit_no = state.next_transaction_no()
+            withdrawal["balance"] -= amount
+            deposit["balance"] += amount
+            self._append_history(withdrawal, withdrawal_no, "2", "출금(이체)", amount,
+                                 body.get("withdrawalTransactionSummary"), body.get("depositAccountNo"))
+            self._append_history(deposit, deposit_no, "1", "입금(이체)", amount,
+                                 body.get("depositTransactionSummary"), body.get("withdrawalAccountNo"))
+
+            rec = [
+                {
+                    "transactionUniqueNo": deposit_no,
+                    "accountNo": body.get("depositAccountNo"),
+                    "transactionDate": deposit["history"][-1]["transactionDate"],
+                    "transactionType": "1",
+                    "transactionTypeName": "입금(이체)",
+                    "transactionAccountNo": body.get("withdrawalAccountNo")
+                },
+                {
+                    "transactionUniqueNo": withdrawal_no,
+                    "accountNo": body.get("withdrawalAccountNo"),
+                    "transactionDate": withdrawal["history"][-1]["transactionDate"],
+                    "transactionType": "2",
+                    "transactionTypeName": "출금(이체)",
+                    "transactionAccountNo": body.get("depositAccountNo")
+                }
+            ]
+            return rec
+
+    def _history(self, header, body):
+        start_date = body.get("startDate") or "00000000"
+        end_date = body.get("endDate") or "99999999"
+        transaction_type = body.get("transactionType", "A")
+        with self.state.lock:
+            account = self._require_account(body.get("accountNo"), header.get("userKey"))
+            items = [
+                item for item in account["history"]
+                if start_date <= item["transactionDate"] <= end_date
+                and (transaction_type == "A"
+                     or (transaction_type == "M" and item["transactionType"] == "1")
+                     or (transaction_type == "D" and item["transactionType"] == "2"))
+            ]
+        if body.get("orderByType", "DESC") == "DESC":
+            items = list(reversed(items))
+        return {"totalCount": str(len(items)), "list": items}
+
+
+class FakeBankServer:
+    """
+    벤치마크/부하 테스트용 로컬 금융 API 서버
+
+    Args:
+        host (str, optional): 바인딩 주소. 기본값은 127.0.0.1.
+        port (int, optional): 포트 (0이면 빈 포트 자동 선택). 기본값은 0.
+        latency (LatencyProfile, optional): 기본 응답 지연 분포. 기본값은 지연 없음.
+        api_latency (dict, optional): API 이름별 지연 분포 (예: {"updateDemandDepositAccountTransfer": LatencyProfile(...)})
+        error_rate (float, optional): 주입할 서버 오류(500) 비율 (0~1). 기본값은 0.
+        api_error_rate (dict, optional): API 이름별 오류 비율
+        rate_limit (float, optional): 초당 허용 요청 수 (초과 시 429). 기본값은 제한 없음.
+        rate_limit_burst (int, optional): 순간 허용 요청 수. 기본값은 rate_limit 와 동일.
+        auto_create_accounts (bool, optional): 모르는 계좌번호를 자동으로 개설할지 여부. 기본값은 True.
+        seed (int, optional): 지연/오류 난수 시드. 기본값은 42.
+
+    사용 예:
+        with FakeBankServer(latency=LatencyProfile("normal", 80, 20), error_rate=0.01) as bank:
+            os.environ["SSAFY_API_BASE_URL"] = bank.base_url
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=None, api_latency=None, error_rate=0.0,
+                 api_error_rate=None, rate_limit=None, rate_limit_burst=None, auto_create_accounts=True, seed=42):
+        self.httpd = ThreadingHTTPServer((host, port), _FakeBankHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.bank = _FakeBank(
+            latency=latency or LatencyProfile(),
+            api_latency=api_latency or {},
+            error_rate=error_rate,
+            api_error_rate=api_error_rate or {},
+            rate_limit=rate_limit,
+            rate_limit_burst=rate_limit_burst,
+            auto_create_accounts=auto_create_accounts,
+            seed=seed
+        )
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    @property
+    def bank(self):
+        return self.httpd.bank
+
+    @property
+    def transfer_count(self):
+        return self.httpd.bank.stats()["requests"].get("updateDemandDepositAccountTransfer", 0)
+
+    def stats(self):
+        return self.httpd.bank.stats()
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"가상 금융 API 서버 시작: {self.base_url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def _parse_api_overrides(values, cast):
+    """'apiName=값' 형식의 CLI 인자 목록을 dict 로 변환합니다."""
+    result = {}
+    for value in values or []:
+        api_name, _, raw = value.partition("=")
+        result[api_name] = cast(raw)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 가상 금융 API 서버')
+    parser.add_argument('--host', type=str, default="127.0.0.1", help='바인딩 주소')
+    parser.add_argument('--port', type=int, default=8089, help='포트')
+    parser.add_argument('--latency', type=str, default="fixed", choices=LatencyProfile.DISTRIBUTIONS, help='응답 지연 분포')
+    parser.add_argument('--latency-mean-ms', type=float, default=0.0, help='평균 지연(ms)')
+    parser.add_argument('--latency-stddev-ms', type=float, default=0.0, help='지연 표준편차(ms)')
+    parser.add_argument('--latency-min-ms', type=float, default=0.0, help='최소 지연(ms)')
+    parser.add_argument('--latency-max-ms', type=float, default=None, help='최대 지연(ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='서버 오류(500) 주입 비율 (0~1)')
+    parser.add_argument('--api-error-rate', action='append', help='API별 오류 비율 (예: updateDemandDepositAccountTransfer=0.05)')
+    parser.add_argument('--rate-limit', type=float, default=None, help='초당 허용 요청 수 (초과 시 429)')
+    parser.add_argument('--rate-limit-burst', type=int, default=None, help='순간 허용 요청 수')
+    parser.add_argument('--no-auto-create', action='store_true', help='모르는 계좌번호를 오류로 처리')
+    parser.add_argument('--seed', type=int, default=42, help='지연/오류 난수 시드')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    server = FakeBankServer(
+        host=args.host,
+        port=args.port,
+        latency=LatencyProfile(args.latency, args.latency_mean_ms, args.latency_stddev_ms,
+                               args.latency_min_ms, args.latency_max_ms),
+        error_rate=args.error_rate,
+        api_error_rate=_parse_api_overrides(args.api_error_rate, float),
+        rate_limit=args.rate_limit,
+        rate_limit_burst=args.rate_limit_burst,
+        auto_create_accounts=not args.no_auto_create,
+        seed=args.seed
+    )
+    logger.info(f"가상 금융 API 서버 실행: {server.base_url} (앱 설정: BANK_API_MODE=fake, FAKE_BANK_BASE_URL={server.base_url})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# benchmark/ocr_benchmark.py
+"""
+티켓 사진 모음으로 QR/바코드 로컬 디코딩 성능을 측정합니다.
+기존 방식(원본 grayscale 1회 디코딩)과 전처리 단계별 디코딩을 비교해 로컬 인식률과 이미지당 지연 시간을 보고합니다.
+로컬에서 인식하지 못한 이미지는 실제 서비스에서 Clova OCR 외부 호출로 넘어갑니다.
+
+사용 예:
+    python benchmark/ocr_benchmark.py --image-dir ../ai/ocr/image --repeat 5 --output ocr_bench.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from collections import Counter
+from datetime import datetime
+
+# 프로젝트 루트 경로를 시스템 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+import cv2
+import pyzbar.pyzbar as pyzbar
+
+from utils.ticket_certificate import TICKET_NUMBER_PATTERN, decode_image_bytes, decode_ticket_cascade
+
+DEFAULT_IMAGE_DIR = os.path.join(os.path.dirname(project_root), "ai", "ocr", "image")
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def decode_baseline(image):
+    """기존 방식: 원본 이미지를 grayscale로 바꿔 한 번만 디코딩"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    results = [obj.data.decode("utf-8") for obj in pyzbar.decode(gray)]
+    return "\n".join(dict.fromkeys(results)) or None
+
+
+def _measure(decode, image_bytes, repeat):
+    """이미지 디코딩(바이트 → 이미지 포함)을 repeat 번 실행하고 (마지막 결과, 평균 지연 ms)를 반환합니다."""
+    result = None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = decode(decode_image_bytes(image_bytes))
+    return result, (time.perf_counter() - start) * 1000 / repeat
+
+
+def _summarize(rows, key):
+    latencies = sorted(row[key]["latency_ms"] for row in rows)
+    hits = sum(1 for row in rows if row[key]["hit"])
+    return {
+        "images": len(rows),
+        "local_hits": hits,
+        "local_hit_rate": round(hits / len(rows), 4) if rows else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50": round(_percentile(latencies, 50), 2),
+            "p95": round(_percentile(latencies, 95), 2),
+            "max": round(latencies[-1], 2) if latencies else 0.0,
+        }
+    }
+
+
+def run(image_dir, repeat):
+    """
+    폴더의 티켓 사진마다 기존 방식과 단계별 디코딩을 측정합니다.
+
+    Returns:
+        dict: 이미지별 결과와 요약 (인식률, 지연 시간, 성공 단계 분포)
+    """
+    file_names = sorted(name for name in os.listdir(image_dir) if name.lower().endswith(IMAGE_EXTENSIONS))
+
+    rows = []
+    for file_name in file_names:
+        with open(os.path.join(image_dir, file_name), "rb") as image_file:
+            image_bytes = image_file.read()
+
+        baseline_text, baseline_ms = _measure(decode_baseline, image_bytes, repeat)
+        (cascade_text, stage), cascade_ms = _measure(decode_ticket_cascade, image_bytes, repeat)
+
+        rows.append({
+            "image": file_name,
+            "baseline": {
+                "hit": bool(baseline_text and TICKET_NUMBER_PATTERN.search(baseline_text)),
+                "text": baseline_text,
+                "latency_ms": round(baseline_ms, 2),
+            },
+            "cascade": {
+                "hit": bool(cascade_text and TICKET_NUMBER_PATTERN.search(cascade_text)),
+                "text": cascade_text,
+                "stage": stage,
+                "latency_ms": round(cascade_ms, 2),
+            },
+        })
+        print(f"{file_name}: 기존 {rows[-1]['baseline']['hit']} ({baseline_ms:.1f}ms), "
+              f"단계별 {rows[-1]['cascade']['hit']} [{stage}] ({cascade_ms:.1f}ms)")
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "opencv": cv2.__version__,
+            "machine": platform.machine(),
+        },
+        "image_dir": os.path.abspath(image_dir),
+        "repeat": repeat,
+        "summary": {
+            "baseline": _summarize(rows, "baseline"),
+            "cascade": _summarize(rows, "cascade"),
+            "cascade_stages": dict(Counter(row["cascade"]["stage"] for row in rows if row["cascade"]["hit"])),
+        },
+        "images": rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='티켓 사진 QR/바코드 로컬 디코딩 인식률/지연 시간 측정')
+    parser.add_argument('--image-dir', type=str, default=DEFAULT_IMAGE_DIR,
+                        help='티켓 사진 폴더 (기본값: ai/ocr/image)')
+    parser.add_argument('--repeat', type=int, default=3, help='이미지당 반복 측정 횟수')
+    parser.add_argument('--output', type=str, default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    result = run(args.image_dir, max(1, args.repeat))
+
+    summary = result["summary"]
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+# benchmark/run_benchmark.py
+"""
+가상 시즌 데이터로 배치 파이프라인과 주요 조회 API의 성능을 측정합니다.
+
+사용 예:
+    python benchmark/run_benchmark.py --accounts 1000 --days 30 --output bench_before.json
+    python benchmark/run_benchmark.py --accounts 1000 --days 30 --output bench_after.json --compare bench_before.json
+"""
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import logging
+import argparse
+import platform
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 경로를 시스템 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.append(project_root)
+
+from benchmark.fake_bank import FakeBankServer, LatencyProfile
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("benchmark")
+
+DEFAULT_DB_PATH = os.path.join(current_dir, "benchmark.db")
+
+# 동시 부하를 걸 조회 API (method, path, 인증 필요 여부)
+LOAD_ENDPOINTS = [
+    ("GET", "/api/game/team/ranking", False),
+    ("GET", "/api/game/user-team-results", True),
+    ("GET", "/api/game/user-team-schedule/all", True),
+    ("GET", "/api/report/ranking", False),
+    ("GET", "/api/report/team-daily-savings", False),
+    ("GET", "/api/report/all-accounts-summary", False),
+    ("GET", "/api/report/summary/team/1", False),
+]
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _prepare_database(db_url, reset):
+    """벤치마크용 데이터베이스를 비우고 테이블을 새로 생성합니다."""
+    import models
+    from database import engine
+
+    if db_url.startswith("sqlite:///"):
+        db_path = db_url[len("sqlite:///"):]
+        if os.path.exists(db_path):
+            engine.dispose()
+            os.remove(db_path)
+    elif reset:
+        logger.warning(f"대상 데이터베이스의 모든 테이블을 삭제합니다: {engine.url}")
+        models.Base.metadata.drop_all(bind=engine)
+    else:
+        raise SystemExit("SQLite 외의 데이터베이스는 --reset 옵션을 명시해야 합니다. (모든 테이블이 삭제됩니다)")
+
+    models.Base.metadata.create_all(bind=engine)
+
+
+def _measure_stage(func, *args, **kwargs):
+    """
+    하나의 배치 단계를 실행하고 소요 시간, SQL 실행 수, DB 시간, 외부 HTTP 호출을 측정합니다.
+
+    Returns:
+        dict: 단계별 측정 결과
+    """
+    from utils.request_metrics import measure_block
+
+    with measure_block() as stats:
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            result = asyncio.run(result)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "seconds": round(elapsed, 4),
+        "sql_count": stats.sql_count,
+        "db_seconds": round(stats.db_time, 4),
+        "http_count": stats.http_count,
+        "http_seconds": round(stats.http_time, 4),
+        "result": result
+    }
+
+
+def run_batch_stages(game_dates):
+    """
+    경기일마다 적금 계산 → 실제 이체(잔액/이자 포함) → 잔액/이자 재계산 순서로 배치를 실행하고 측정합니다.
+
+    Args:
+        game_dates (list): 처리할 경기 날짜 목록 (오래된 날짜부터)
+
+    Returns:
+        dict: 단계별 측정 결과 목록과 합계
+    """
+    from database import SessionLocal
+    from utils.process_saving import process_savings_for_date
+    from utils.process_transfer import process_actual_transfers
+    from utils.update_daily_balances import update_daily_balances, calculate_daily_interest
+
+    async def _balances_and_interest(db, target_date):
+        balances = await update_daily_balances(db, target_date)
+        interest = await calculate_daily_interest(db, target_date)
+        return {"balances": balances, "interest": interest}
+
+    nights = []
+    for game_date in game_dates:
+        night = {"date": game_date}
+        logger.info(f"[{game_date}] 적금 계산 측정")
+        night["process_savings_for_date"] = _measure_stage(process_savings_for_date, game_date)
+
+        db = SessionLocal()
+        try:
+            logger.info(f"[{game_date}] 실제 이체 측정")
+            night["process_actual_transfers"] = _measure_stage(process_actual_transfers, db, game_date)
+
+            logger.info(f"[{game_date}] 잔액/이자 재계산 측정")
+            night["update_daily_balances_and_interest"] = _measure_stage(_balances_and_interest, db, game_date)
+        finally:
+            db.close()
+
+        nights.append(night)
+
+    totals = {}
+    for night in nights:
+        for stage, measured in night.items():
+            if stage == "date":
+                continue
+            total = totals.setdefault(stage, {"seconds": 0.0, "sql_count": 0, "db_seconds": 0.0, "http_count": 0})
+            total["seconds"] = round(total["seconds"] + measured["seconds"], 4)
+            total["sql_count"] += measured["sql_count"]
+            total["db_seconds"] = round(total["db_seconds"] + measured["db_seconds"], 4)
+            total["http_count"] += measured["http_count"]
+
+    return {"nights": nights, "totals": totals}
+
+
+def _start_api_server():
+    """FastAPI 앱을 별도 스레드의 uvicorn 서버로 실행합니다. (스케줄러는 실행하지 않음)"""
+    import uvicorn
+    from main import app
+
+    port = _free_port()
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, lifespan="off", log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.time() + 30
+    while not server.started:
+        if time.time() > deadline:
+            raise RuntimeError("벤치마크용 API 서버가 30초 안에 시작되지 않았습니다.")
+        time.sleep(0.05)
+
+    return server, thread, f"http://127.0.0.1:{port}"
+
+
+def run_http_load(user_emails, concurrency=16, requests_per_endpoint=200):
+    """
+    주요 게임/리포트 조회 API에 동시 요청을 보내 지연 시간 분포를 측정합니다.
+
+    Args:
+        user_emails (list): 인증이 필요한 API 호출에 사용할 사용자 이메일 목록
+        concurrency (int, optional): 동시 요청 수. 기본값은 16.
+        requests_per_endpoint (int, optional): 엔드포인트별 요청 수. 기본값은 200.
+
+    Returns:
+        dict: 로그인에 성공한 샘플 사용자 수, 엔드포인트별 지연 시간 백분위수, 처리량, 상태 코드 분포
+    """
+    import requests
+    from router.user.user_router import create_access_token
+    from utils.request_metrics import get_slow_endpoint_report, reset_metrics
+
+    tokens = [create_access_token({"sub": email}) for email in user_emails]
+    server, thread, base_url = _start_api_server()
+    reset_metrics()
+
+    results = {}
+    try:
+        with requests.Session() as http:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+            http.mount("http://", adapter)
+
+            # 로그인(토큰 인증)에 실패한 샘플 사용자는 401 응답이 측정값을 왜곡하므로 제외
+            verified = []
+            for email, token in zip(user_emails, tokens):
+                response = http.get(
+                    base_url + "/api/user/me", headers={"Authorization": f"Bearer {token}"}, timeout=60
+                )
+                if response.status_code == 200:
+                    verified.append(token)
+                else:
+                    logger.warning(f"샘플 사용자 로그인 실패로 제외: {email} (status {response.status_code})")
+            if not verified:
+                raise RuntimeError("로그인에 성공한 샘플 사용자가 없어 HTTP 부하 측정을 진행할 수 없습니다.")
+            tokens = verified
+
+            for method, path, needs_auth in LOAD_ENDPOINTS:
+                def _call(i):
+                    headers = {}
+                    if needs_auth:
+                        headers["Authorization"] = f"Bearer {tokens[i % len(tokens)]}"
+                    start = time.perf_counter()
+                    response = http.request(method, base_url + path, headers=headers, timeout=60)
+                    return time.perf_counter() - start, response.status_code
+
+                # 첫 요청은 워밍업으로 측정에서 제외
+                _call(0)
+
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    samples = list(executor.map(_call, range(requests_per_endpoint)))
+                wall = time.perf_counter() - started
+
+                latencies = sorted(sample[0] for sample in samples)
+                status_counts = {}
+                for _, status_code in samples:
+                    status_counts[str(status_code)] = status_counts.get(str(status_code), 0) + 1
+
+                results[f"{method} {path}"] = {
+                    "requests": len(samples),
+                    "rps": round(len(samples) / wall, 2) if wall > 0 else 0.0,
+                    "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+                    "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+                    "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+                    "max_ms": round(latencies[-1] * 1000, 2),
+                    "status_counts": status_counts
+                }
+                logger.info(f"{method} {path}: {results[f'{method} {path}']}")
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+    return {
+        "sample_users": len(tokens),
+        "endpoints": results,
+        "server_side": get_slow_endpoint_report(limit=len(LOAD_ENDPOINTS) * 2)
+    }
+
+
+def compare_results(current, previous):
+    """
+    이전 실행 결과와 비교해 단계/엔드포인트별 변화율을 출력합니다.
+
+    Args:
+        current (dict): 이번 실행 결과
+        previous (dict): 이전 실행 결과
+    """
+    def _delta(now, before):
+        if not before:
+            return "   n/a"
+        return f"{(now - before) / before * 100:+6.1f}%"
+
+    print("\n=== 배치 단계 비교 (합계) ===")
+    prev_totals = previous.get("batch", {}).get("totals", {})
+    for stage, total in current.get("batch", {}).get("totals", {}).items():
+        before = prev_totals.get(stage, {})
+        print(
+            f"{stage:40s} {total['seconds']:10.3f}s ({_delta(total['seconds'], before.get('seconds'))})  "
+            f"sql {total['sql_count']:8d} ({_delta(total['sql_count'], before.get('sql_count'))})"
+        )
+
+    print("\n=== API 부하 비교 (p95) ===")
+    prev_endpoints = previous.get("http", {}).get("endpoints", {})
+    for name, measured in current.get("http", {}).get("endpoints", {}).items():
+        before = prev_endpoints.get(name, {})
+        print(
+            f"{name:50s} p95 {measured['p95_ms']:9.2f}ms ({_delta(measured['p95_ms'], before.get('p95_ms'))})  "
+            f"rps {measured['rps']:8.2f} ({_delta(measured['rps'], before.get('rps'))})"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가상 시즌 데이터로 배치/API 성능 측정')
+    parser.add_argument('--db-url', type=str, default=f"sqlite:///{DEFAULT_DB_PATH}",
+                        help='벤치마크 데이터베이스 URL (기본값: benchmark/benchmark.db SQLite)')
+    parser.add_argument('--reset', action='store_true', help='SQLite 외 데이터베이스의 기존 테이블 삭제 허용')
+    parser.add_argument('--accounts', type=int, default=1000, help='생성할 계정 수')
+    parser.add_argument('--rules-per-account', type=int, default=5, help='계정당 적금 규칙 수')
+    parser.add_argument('--days', type=int, default=30, help='시즌 경기 일수')
+    parser.add_argument('--players-per-team', type=int, default=30, help='팀당 선수 수')
+    parser.add_argument('--seed', type=int, default=42, help='데이터 생성 난수 시드')
+    parser.add_argument('--nights', type=int, default=3, help='배치를 측정할 경기일 수 (시즌 마지막 날짜부터)')
+    parser.add_argument('--concurrency', type=int, default=16, help='API 부하 동시 요청 수')
+    parser.add_argument('--requests', type=int, default=200, help='엔드포인트별 요청 수')
+    parser.add_argument('--bank-latency', type=str, default="fixed", choices=LatencyProfile.DISTRIBUTIONS,
+                        help='가상 금융 API 응답 지연 분포')
+    parser.add_argument('--bank-latency-mean-ms', type=float, default=0.0, help='가상 금융 API 평균 지연(ms)')
+    parser.add_argument('--bank-latency-stddev-ms', type=float, default=0.0, help='가상 금융 API 지연 표준편차(ms)')
+    parser.add_argument('--bank-error-rate', type=float, default=0.0, help='가상 금융 API 오류 주입 비율 (0~1)')
+    parser.add_argument('--bank-rate-limit', type=float, default=None, help='가상 금융 API 초당 허용 요청 수')
+    parser.add_argument('--skip-http', action='store_true', help='API 부하 측정 생략')
+    parser.add_argument('--output', type=str, default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', type=str, default=None, help='비교할 이전 결과 JSON 경로')
+    args = parser.parse_args()
+
+    # database.py 와 user_ssafy_api_utils.py 는 import 시점에 환경 변수를 읽으므로 먼저 설정
+    os.environ["DATABASE_URL"] = args.db_url
+    bank = FakeBankServer(
+        latency=LatencyProfile(args.bank_latency, args.bank_latency_mean_ms, args.bank_latency_stddev_ms),
+        error_rate=args.bank_error_rate,
+        rate_limit=args.bank_rate_limit,
+        seed=args.seed
+    ).start()
+    os.environ["BANK_API_MODE"] = "fake"
+    os.environ["FAKE_BANK_BASE_URL"] = bank.base_url
+
+    try:
+        from database import engine, SessionLocal
+        from utils.request_metrics import instrument_engine
+        from benchmark.synthetic_data import generate_synthetic_season, BENCH_EMAIL_FORMAT
+
+        instrument_engine(engine)
+        _prepare_database(args.db_url, args.reset)
+
+        db = SessionLocal()
+        try:
+            dataset = generate_synthetic_season(
+                db,
+                accounts=args.accounts,
+                rules_per_account=args.rules_per_account,
+                days=args.days,
+                players_per_team=args.players_per_team,
+                seed=args.seed
+            )
+        finally:
+            db.close()
+
+        season_end = dataset["season_end"]
+        nights = max(1, min(args.nights, args.days))
+        game_dates = [season_end - timedelta(days=offset) for offset in range(nights - 1, -1, -1)]
+
+        result = {
+            "started_at": datetime.now(),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "database": engine.url.get_backend_name()
+            },
+            "options": vars(args),
+            "dataset": dataset,
+            "batch": run_batch_stages(game_dates)
+        }
+        result["fake_bank"] = bank.stats()
+
+        if not args.skip_http:
+            # 합성 데이터의 사용자는 bench1 ~ benchN
+            sample_emails = [BENCH_EMAIL_FORMAT.format(i) for i in range(1, min(args.accounts, 50) + 1)]
+            result["http"] = run_http_load(sample_emails, args.concurrency, args.requests)
+    finally:
+        bank.stop()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+        logger.info(f"벤치마크 결과 저장: {args.output}")
+
+    print(json.dumps(result["batch"]["totals"], ensure_ascii=False, indent=2))
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        compare_results(result, previous)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# benchmark/synthetic_data.py
+import random
+import logging
+from datetime import date, datetime, timedelta
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# 시즌 시작일 (2025 정규시즌 개막일)
+SEASON_START = date(2025, 3, 22)
+
+# 합성 사용자 이메일 (EmailStr 검증을 통과해야 하므로 .test 같은 특수 용도 도메인은 사용하지 않음)
+BENCH_EMAIL_FORMAT = "bench{}@example.com"
+
+TEAM_NAMES = [
+    "KIA 타이거즈", "삼성 라이온즈", "LG 트윈스", "두산 베어스",
+    "KT 위즈", "SSG 랜더스", "롯데 자이언츠", "한화 이글스",
+    "NC 다이노스", "키움 히어로즈"
+]
+
+PLAYER_TYPES = ["투수", "타자"]
+
+RECORD_TYPES = [
+    "승리", "패배", "무승부", "안타", "홈런", "득점", "스윕",
+    "삼진", "볼넷/몸맞공", "자책", "병살타", "실책", "도루"
+]
+
+SAVING_RULE_TYPES = ["기본 규칙", "투수", "타자", "상대팀"]
+
+# DB/init_setting/init_saving_rule_list.py 와 동일한 조합
+SAVING_RULE_LISTS = [
+    (1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 11), (1, 12), (1, 7),
+    (2, 8), (2, 9), (2, 10),
+    (3, 4), (3, 5), (3, 13),
+    (4, 4), (4, 5), (4, 11), (4, 12),
+]
+
+# DB/init_setting/init_saving_rule_detail.py 와 동일한 조합
+SAVING_RULE_DETAILS = [
+    (1, None, 1, "팀이 승리하는 경우"),
+    (1, None, 4, "팀이 안타를 친 경우"),
+    (1, None, 5, "팀이 홈런을 친 경우"),
+    (1, None, 6, "팀이 득점하는 경우"),
+    (1, None, 7, "팀이 병살타하는 경우"),
+    (1, None, 8, "팀이 실책하는 경우"),
+    (1, None, 9, "팀이 스윕하는 경우"),
+    (2, 1, 10, "이(가) 삼진을 잡는 경우"),
+    (2, 1, 11, "이(가) 볼넷을 던진 경우"),
+    (2, 1, 12, "이(가) 자책하는 경우"),
+    (3, 2, 13, "이(가) 안타를 친 경우"),
+    (3, 2, 14, "이(가) 홈런을 친 경우"),
+    (3, 2, 15, "이(가) 도루하는 경우"),
+    (4, None, 16, "상대팀이 안타를 친 경우"),
+    (4, None, 17, "상대팀이 홈런을 친 경우"),
+    (4, None, 18, "상대팀이 병살타하는 경우"),
+    (4, None, 19, "상대팀이 실책하는 경우"),
+]
+
+MISSIONS = [
+    ("응원팀 10승당 우대금리", 5, 0.1),
+    ("직관 인증시 우대금리", 5, 0.1),
+    ("정규시즌 응원팀의 순위를 맞춰라라", 1, 0.3),
+]
+
+# 팀 경기 기록 (기록 유형 ID -> 경기당 최대 값)
+TEAM_RECORD_RANGES = {4: 15, 5: 3, 6: 10, 8: 12, 9: 6, 11: 3, 12: 3, 13: 3}
+
+# 선수 기록 (선수 타입 ID -> 기록 유형 ID -> 최대 값)
+PLAYER_RECORD_RANGES = {
+    1: {8: 10, 9: 4, 10: 5},   # 투수: 삼진, 볼넷, 자책
+    2: {4: 3, 5: 1, 13: 1},    # 타자: 안타, 홈런, 도루
+}
+
+# 벤치마크 사용자 비밀번호 (bcrypt 해시 계산을 피하기 위한 더미 값)
+DUMMY_PASSWORD = "benchmark"
+
+
+def _seed_catalog(session):
+    """팀, 선수 타입, 기록 유형, 적금 규칙, 미션 등 기준 데이터를 생성합니다."""
+    session.bulk_insert_mappings(models.Team, [
+        {"TEAM_ID": i + 1, "TEAM_NAME": name, "TOTAL_WIN": 0, "TOTAL_LOSE": 0, "TOTAL_DRAW": 0}
+        for i, name in enumerate(TEAM_NAMES)
+    ])
+    session.bulk_insert_mappings(models.PlayerType, [
+        {"PLAYER_TYPE_ID": i + 1, "PLAYER_TYPE_NAME": name}
+        for i, name in enumerate(PLAYER_TYPES)
+    ])
+    session.bulk_insert_mappings(models.RecordType, [
+        {"RECORD_TYPE_ID": i + 1, "RECORD_NAME": name}
+        for i, name in enumerate(RECORD_TYPES)
+    ])
+    session.bulk_insert_mappings(models.SavingRuleType, [
+        {"SAVING_RULE_TYPE_ID": i + 1, "SAVING_RULE_TYPE_NAME": name}
+        for i, name in enumerate(SAVING_RULE_TYPES)
+    ])
+    session.bulk_insert_mappings(models.SavingRuleList, [
+        {"SAVING_RULE_ID": i + 1, "SAVING_RULE_TYPE_ID": rule_type_id, "RECORD_TYPE_ID": record_type_id}
+        for i, (rule_type_id, record_type_id) in enumerate(SAVING_RULE_LISTS)
+    ])
+    session.bulk_insert_mappings(models.SavingRuleDetail, [
+        {
+            "SAVING_RULE_DETAIL_ID": i + 1,
+            "SAVING_RULE_TYPE_ID": rule_type_id,
+            "PLAYER_TYPE_ID": player_type_id,
+            "SAVING_RULE_ID": saving_rule_id,
+            "RULE_DESCRIPTION": description
+        }
+        for i, (rule_type_id, player_type_id, saving_rule_id, description) in enumerate(SAVING_RULE_DETAILS)
+    ])
+    session.bulk_insert_mappings(models.Mission, [
+        {"MISSION_ID": i + 1, "MISSION_NAME": name, "MISSION_MAX_COUNT": max_count, "MISSION_RATE": rate}
+        for i, (name, max_count, rate) in enumerate(MISSIONS)
+    ])
+
+
+def _generate_players(session, players_per_team):
+    """팀별 선수를 생성하고 {team_id: {player_type_id: [player_id, ...]}} 형태로 반환합니다."""
+    rows = []
+    roster = {}
+    player_id = 1
+    for team_id in range(1, len(TEAM_NAMES) + 1):
+        roster[team_id] = {1: [], 2: []}
+        for n in range(players_per_team):
+            player_type_id = 1 if n % 2 == 0 else 2
+            rows.append({
+                "PLAYER_ID": player_id,
+                "TEAM_ID": team_id,
+                "PLAYER_NUM": str(n + 1),
+                "PLAYER_TYPE_ID": player_type_id,
+                "PLAYER_NAME": f"선수{team_id:02d}-{n + 1:02d}",
+                "LIKE_COUNT": 0
+            })
+            roster[team_id][player_type_id].append(player_id)
+            player_id += 1
+    session.bulk_insert_mappings(models.Player, rows)
+    return roster
+
+
+def _generate_accounts(session, rng, accounts, rules_per_account, roster):
+    """사용자, 계정, 사용자 적금 규칙, 미션 진행 정보를 생성합니다."""
+    users = []
+    account_rows = []
+    rule_rows = []
+    mission_rows = []
+
+    for i in range(1, accounts + 1):
+        team_id = rng.randint(1, len(TEAM_NAMES))
+        player_type_id = rng.choice([1, 2])
+        favorite_player_id = rng.choice(roster[team_id][player_type_id])
+        daily_limit = rng.choice([10000, 30000, 50000])
+
+        users.append({
+            "USER_ID": i,
+            "NAME": f"사용자{i}",
+            "USER_EMAIL": BENCH_EMAIL_FORMAT.format(i),
+            "PASSWORD": DUMMY_PASSWORD,
+            "USER_KEY": f"bench-user-key-{i:08d}",
+            "SOURCE_ACCOUNT": f"9990{i:012d}"
+        })
+        account_rows.append({
+            "ACCOUNT_ID": i,
+            "USER_ID": i,
+            "TEAM_ID": team_id,
+            "FAVORITE_PLAYER_ID": favorite_player_id,
+            "ACCOUNT_NUM": f"1110{i:012d}",
+            "INTEREST_RATE": 2.5,
+            "SAVING_GOAL": rng.choice([300000, 500000, 1000000]),
+            "DAILY_LIMIT": daily_limit,
+            "MONTH_LIMIT": daily_limit * 20,
+            "SOURCE_ACCOUNT": f"9990{i:012d}",
+            "TOTAL_AMOUNT": 0
+        })
+
+        # 계정별 규칙: 중복 없이 규칙 상세를 선택 (선수 규칙은 최애 선수 타입과 일치하는 것만)
+        candidates = [
+            detail_id for detail_id, (rule_type_id, detail_player_type_id, _, _) in enumerate(SAVING_RULE_DETAILS, 1)
+            if detail_player_type_id is None or detail_player_type_id == player_type_id
+        ]
+        for detail_id in rng.sample(candidates, min(rules_per_account, len(candidates))):
+            rule_type_id, detail_player_type_id, _, _ = SAVING_RULE_DETAILS[detail_id - 1]
+            rule_rows.append({
+                "ACCOUNT_ID": i,
+                "SAVING_RULE_TYPE_ID": rule_type_id,
+                "SAVING_RULE_DETAIL_ID": detail_id,
+                "PLAYER_TYPE_ID": detail_player_type_id,
+                "USER_SAVING_RULED_AMOUNT": rng.choice([100, 500, 1000, 3000]),
+                "PLAYER_ID": favorite_player_id if detail_player_type_id else None
+            })
+
+        for mission_id, (_, max_count, rate) in enumerate(MISSIONS, 1):
+            if rng.random() < 0.5:
+                mission_rows.append({
+                    "ACCOUNT_ID": i,
+                    "MISSION_ID": mission_id,
+                    "COUNT": rng.randint(0, max_count),
+                    "MAX_COUNT": max_count,
+                    "MISSION_RATE": rate
+                })
+
+    session.bulk_insert_mappings(models.User, users)
+    session.bulk_insert_mappings(models.Account, account_rows)
+    session.bulk_insert_mappings(models.UserSavingRule, rule_rows)
+    session.bulk_insert_mappings(models.UsedMission, mission_rows)
+    return {"users": len(users), "accounts": len(account_rows), "user_saving_rules": len(rule_rows), "used_missions": len(mission_rows)}
+
+
+def _generate_games(session, rng, days, roster):
+    """
+    3연전 단위 경기 일정과 팀/선수 경기 기록, 일일 순위를 생성합니다.
+    같은 3연전에서 한 팀이 모두 이기는 경우가 생기도록 승패를 정합니다.
+    """
+    schedule_rows = []
+    game_log_rows = []
+    player_record_rows = []
+    rating_rows = []
+    wins = {team_id: 0 for team_id in roster}
+    team_ids = list(roster.keys())
+
+    pairings = []
+    for day in range(days):
+        game_date = SEASON_START + timedelta(days=day)
+
+        # 3일마다 새 3연전 대진
+        if day % 3 == 0:
+            shuffled = team_ids[:]
+            rng.shuffle(shuffled)
+            pairings = [(shuffled[k], shuffled[k + 1], rng.random()) for k in range(0, len(shuffled), 2)]
+
+        for home_team_id, away_team_id, series_bias in pairings:
+            schedule_rows.append({"DATE": game_date, "HOME_TEAM_ID": home_team_id, "AWAY_TEAM_ID": away_team_id})
+
+            # series_bias가 극단적이면 스윕이 발생
+            home_wins = rng.random() < series_bias
+            results = {home_team_id: 1 if home_wins else 2, away_team_id: 2 if home_wins else 1}
+
+            for team_id in (home_team_id, away_team_id):
+                if results[team_id] == 1:
+                    wins[team_id] += 1
+                game_log_rows.append({"DATE": game_date, "TEAM_ID": team_id, "RECORD_TYPE_ID": results[team_id], "COUNT": 1})
+                for record_type_id, max_value in TEAM_RECORD_RANGES.items():
+                    count = rng.randint(0, max_value)
+                    if count:
+                        game_log_rows.append({"DATE": game_date, "TEAM_ID": team_id, "RECORD_TYPE_ID": record_type_id, "COUNT": count})
+
+                for player_type_id, record_ranges in PLAYER_RECORD_RANGES.items():
+                    for player_id in roster[team_id][player_type_id]:
+                        for record_type_id, max_value in record_ranges.items():
+                            count = rng.randint(0, max_value)
+                            if count:
+                                player_record_rows.append({
+                                    "DATE": game_date,
+                                    "TEAM_ID": team_id,
+                                    "PLAYER_ID": player_id,
+                                    "RECORD_TYPE_ID": record_type_id,
+                                    "COUNT": count
+                                })
+
+        ranking = sorted(team_ids, key=lambda team_id: -wins[team_id])
+        for rank, team_id in enumerate(ranking, 1):
+            rating_rows.append({"TEAM_ID": team_id, "DAILY_RANKING": rank, "DATE": game_date})
+
+    session.bulk_insert_mappings(models.GameSchedule, schedule_rows)
+    session.bulk_insert_mappings(models.GameLog, game_log_rows)
+    session.bulk_insert_mappings(models.PlayerRecord, player_record_rows)
+    session.bulk_insert_mappings(models.TeamRating, rating_rows)
+
+    for team in session.query(models.Team).all():
+        team.TOTAL_WIN = wins[team.TEAM_ID]
+
+    return {
+        "game_schedules": len(schedule_rows),
+        "game_logs": len(game_log_rows),
+        "player_records": len(player_record_rows),
+        "team_ratings": len(rating_rows)
+    }
+
+
+def generate_synthetic_season(session, accounts=1000, rules_per_account=5, days=30, players_per_team=30, seed=42):
+    """
+    벤치마크용 가상 시즌 데이터를 빈 데이터베이스에 생성합니다.
+
+    Args:
+        session (Session): 데이터베이스 세션 (테이블은 미리 생성되어 있어야 함)
+        accounts (int, optional): 생성할 계정 수. 기본값은 1000.
+        rules_per_account (int, optional): 계정당 적금 규칙 수. 기본값은 5.
+        days (int, optional): 시즌 경기 일수. 기본값은 30.
+        players_per_team (int, optional): 팀당 선수 수. 기본값은 30.
+        seed (int, optional): 난수 시드 (같은 값이면 같은 데이터). 기본값은 42.
+
+    Returns:
+        dict: 생성된 데이터 건수와 시즌 기간 정보
+    """
+    rng = random.Random(seed)
+    started = datetime.now()
+
+    _seed_catalog(session)
+    roster = _generate_players(session, players_per_team)
+    account_counts = _generate_accounts(session, rng, accounts, rules_per_account, roster)
+    game_counts = _generate_games(session, rng, days, roster)
+    session.commit()
+
+    summary = {
+        "season_start": SEASON_START,
+        "season_end": SEASON_START + timedelta(days=days - 1),
+        "players": players_per_team * len(TEAM_NAMES),
+        **account_counts,
+        **game_counts,
+        "generation_seconds": (datetime.now() - started).total_seconds()
+    }
+    logger.info(f"가상 시즌 데이터 생성 완료: {summary}")
+    return summary
@@ -12,22 +12,29 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-# DATABASE_URL 설정
-DATABASE_URL = f'{os.getenv("DATABASE_TYPE")}://{os.getenv("DATABASE_USER")}:{os.getenv("DATABASE_PASSWORD")}@{os.getenv("DATABASE_IP")}:{os.getenv("DATABASE_PORT")}/{os.getenv("DATABASE_DB")}?charset=utf8mb4'
+# DATABASE_URL 설정 (DATABASE_URL 환경 변수가 있으면 우선 사용 - 벤치마크용 SQLite 등)
+DATABASE_URL = os.getenv("DATABASE_URL") or f'{os.getenv("DATABASE_TYPE")}://{os.getenv("DATABASE_USER")}:{os.getenv("DATABASE_PASSWORD")}@{os.getenv("DATABASE_IP")}:{os.getenv("DATABASE_PORT")}/{os.getenv("DATABASE_DB")}?charset=utf8mb4'
 
 # 환경 변수 디버깅을 위해 DATABASE_URL 출력
 logger.info(f"Using DATABASE_URL: {DATABASE_URL}")
 
-# 엔진 생성 시 MariaDB 특화 옵션 설정
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=20,           # 연결 풀 크기 설정
-    max_overflow=30,        # 최대 초과 연결 수
-    pool_timeout=10,        # 풀에서 연결을 기다리는 시간(초)
-    pool_recycle=3600,      # MariaDB 연결 timeout 방지
-    pool_pre_ping=True,     # 연결이 유효한지 확인
-    connect_args={"connect_timeout": 60}  # 연결 타임아웃 설정
-)
+if DATABASE_URL.startswith("sqlite"):
+    # 로컬 SQLite (벤치마크/테스트용) - 여러 스레드에서 같은 연결 사용 허용
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False}
+    )
+else:
+    # 엔진 생성 시 MariaDB 특화 옵션 설정
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=20,           # 연결 풀 크기 설정
+        max_overflow=30,        # 최대 초과 연결 수
+        pool_timeout=10,        # 풀에서 연결을 기다리는 시간(초)
+        pool_recycle=3600,      # MariaDB 연결 timeout 방지
+        pool_pre_ping=True,     # 연결이 유효한지 확인
+        connect_args={"connect_timeout": 60}  # 연결 타임아웃 설정
+    )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
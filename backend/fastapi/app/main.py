@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import uvicorn
@@ -37,12 +37,18 @@ from router.saving_rule.saving_rule_router import router as saving_rule_router
 from router.report.report_router import router as report_router
 from router.game.game_router import router as game_router
 from utils.process_saving import process_savings_for_date
+from utils.ticket_ocr_pipeline import shutdown_ticket_ocr
+from router.mission.ticket_registry import warm_ticket_registry
+from utils.request_metrics import RequestMetricsMiddleware, instrument_engine, render_prometheus, get_slow_endpoint_report
 
 # 데이터베이스 초기화
-from database import engine
+from database import engine, SessionLocal
 import models
 models.Base.metadata.create_all(bind=engine)
 
+# 요청별 SQL 실행 수/DB 시간 측정
+instrument_engine(engine)
+
 # Job 실행 결과를 처리하는 리스너
 def job_listener(event):
     if event.exception:
@@ -63,6 +69,15 @@ async def lifespan(app: FastAPI):
         for job in scheduler.get_jobs():
             logger.info(f"등록된 작업: {job.name}, 다음 실행 시간: {job.next_run_time}")
         
+        # 티켓 번호 목록 미리 로드 (실패해도 첫 OCR 요청 때 다시 로드)
+        db = SessionLocal()
+        try:
+            warm_ticket_registry(db)
+        except Exception as e:
+            logger.error(f"티켓 번호 목록 로드 중 오류 발생: {str(e)}")
+        finally:
+            db.close()
+        
         yield  # 애플리케이션 실행 중
     except Exception as e:
         logger.critical(f"애플리케이션 시작 중 심각한 오류 발생: {str(e)}")
@@ -74,6 +89,11 @@ async def lifespan(app: FastAPI):
             logger.info("스케줄러 정상 종료됨")
         except Exception as e:
             logger.error(f"스케줄러 종료 중 오류 발생: {str(e)}")
+        try:
+            await shutdown_ticket_ocr()
+            logger.info("티켓 OCR 처리 풀 정상 종료됨")
+        except Exception as e:
+            logger.error(f"티켓 OCR 처리 풀 종료 중 오류 발생: {str(e)}")
 
 app = FastAPI(
     title="야금야금 서비스 API",
@@ -121,8 +141,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+# 요청 지표 수집 (라우트별 지연 시간, DB 시간, SQL 수, 외부 HTTP 시간)
+app.add_middleware(RequestMetricsMiddleware)
+
 # 라우터 등록 
 app.include_router(user_router, prefix="/api/user", tags=["사용자"])
 app.include_router(account_router, prefix="/api/account", tags=["계정"])
@@ -639,5 +663,15 @@ except Exception as e:
 async def root():
     return {"message": "야금야금 서비스 API에 오신 것을 환영합니다"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """라우트별 요청 지표 (Prometheus text 형식)"""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/metrics/slow-endpoints", include_in_schema=False)
+async def slow_endpoints(limit: int = 20):
+    """평균 지연 시간 기준 느린 엔드포인트 요약"""
+    return get_slow_endpoint_report(limit)
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="localhost", port=8000, reload=True)
\ No newline at end of file
@@ -1,8 +1,11 @@
-from sqlalchemy import Boolean, Column, Integer, String, Float, ForeignKey, Date, Text, DateTime, func
+from sqlalchemy import Boolean, Column, Integer, String, Float, ForeignKey, Date, Text, DateTime, Index, func
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property, Session
+from sqlalchemy import event, inspect, select
 from sqlalchemy.sql import func
 
+from utils.bulk_upsert import build_upsert
+
 Base = declarative_base()
 
 # 사용자 및 인증 테이블
@@ -26,7 +29,8 @@ class Account(Base):
 
     ACCOUNT_ID = Column(Integer, primary_key=True)
     USER_ID = Column(Integer, ForeignKey("user.USER_ID"), nullable=False)
-    TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), nullable=False)
+    # TEAM_ID, TOTAL_AMOUNT는 팀별 집계 갱신에 이전 값이 필요하므로 변경 시 이전 값을 함께 읽음 (active_history)
+    TEAM_ID = column_property(Column(Integer, ForeignKey("team.TEAM_ID"), nullable=False), active_history=True)
     FAVORITE_PLAYER_ID = Column(Integer,ForeignKey("player.PLAYER_ID"),nullable=True)
     ACCOUNT_NUM = Column(String(16), nullable=False)
     INTEREST_RATE = Column(Float)
@@ -34,7 +38,7 @@ class Account(Base):
     DAILY_LIMIT = Column(Integer)
     MONTH_LIMIT = Column(Integer)
     SOURCE_ACCOUNT = Column(String(16), nullable=False)
-    TOTAL_AMOUNT = Column(Integer)
+    TOTAL_AMOUNT = column_property(Column(Integer), active_history=True)
     created_at = Column(DateTime, server_default=func.now())
     
     # 관계 정의
@@ -48,6 +52,7 @@ class Account(Base):
     daily_balances = relationship("DailyBalances", back_populates="account")
     weekly_reports = relationship("WeeklyReportPersonal", back_populates="account")
     rank_predictions = relationship("TeamRankPrediction",back_populates="account")
+    interest_rate_snapshot = relationship("AccountInterestRate", back_populates="account", uselist=False, cascade="all, delete-orphan")
     transaction_messages = relationship("TransactionMessage", back_populates="account")
     daily_transfers = relationship("DailyTransfer", back_populates="account")
 
@@ -140,6 +145,23 @@ class UsedMission(Base):
     account = relationship("Account", back_populates="used_missions")
     mission = relationship("Mission", back_populates="used_missions")
 
+# 계정별 적용 이자율 스냅샷 테이블 (기본 금리 + 미션 우대 금리)
+# 미션 달성 정보나 기본 금리가 바뀌면 STALE로 표시되고, 다음 조회 때 한 번만 다시 계산됨
+class AccountInterestRate(Base):
+    __tablename__ = "account_interest_rate"
+
+    ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), primary_key=True)
+    BASE_INTEREST_RATE = Column(Float, nullable=False, default=0)
+    MISSION_INTEREST_RATE = Column(Float, nullable=False, default=0)
+    TOTAL_INTEREST_RATE = Column(Float, nullable=False, default=0)
+    MISSION_DETAILS = Column(Text)  # 미션별 적용 내역 (JSON 목록)
+    VERSION = Column(Integer, nullable=False, default=1, server_default="1")
+    STALE = Column(Boolean, nullable=False, default=False, server_default="0", index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    # 관계 정의
+    account = relationship("Account", back_populates="interest_rate_snapshot")
+
 # 적금 규칙 유형 테이블
 class SavingRuleType(Base):
     __tablename__ = "saving_rule_type"
@@ -218,24 +240,58 @@ class UserSavingRule(Base):
 # 일일 적금 테이블
 class DailySaving(Base):
     __tablename__ = "daily_saving"
+    __table_args__ = (
+        Index("ix_daily_saving_account_date", "ACCOUNT_ID", "DATE", "DAILY_SAVING_ID"),
+    )
 
     DAILY_SAVING_ID = Column(Integer, primary_key=True)
     ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=False)
-    DATE = Column(Date)
+    # DATE, DAILY_SAVING_AMOUNT는 팀별 적립 총액 갱신에 이전 값이 필요함 (active_history)
+    DATE = column_property(Column(Date), active_history=True)
     SAVING_RULED_DETAIL_ID = Column(Integer, ForeignKey("saving_rule_detail.SAVING_RULE_DETAIL_ID"), nullable=False)
     SAVING_RULED_TYPE_ID = Column(Integer, ForeignKey("saving_rule_type.SAVING_RULE_TYPE_ID"), nullable=False)
     COUNT = Column(Integer)
-    DAILY_SAVING_AMOUNT = Column(Integer)
+    DAILY_SAVING_AMOUNT = column_property(Column(Integer), active_history=True)
     created_at = Column(DateTime, server_default=func.now())
     
     # 관계 정의
     account = relationship("Account", back_populates="daily_savings")
     saving_rule_detail = relationship("SavingRuleDetail", back_populates="daily_savings")
     saving_rule_type = relationship("SavingRuleType", back_populates="daily_savings")
+    detail_view = relationship("DailySavingDetail", back_populates="daily_saving", uselist=False, cascade="all, delete-orphan")
+
+# 일일 적금 상세 조회용 테이블 (적립 시점에 규칙/기록/선수 이름을 함께 저장해 조회 시 조인 없이 사용)
+class DailySavingDetail(Base):
+    __tablename__ = "daily_saving_detail"
+    __table_args__ = (
+        Index("ix_daily_saving_detail_account_date", "ACCOUNT_ID", "DATE", "DAILY_SAVING_ID"),
+    )
+
+    DAILY_SAVING_DETAIL_ID = Column(Integer, primary_key=True)
+    DAILY_SAVING_ID = Column(Integer, ForeignKey("daily_saving.DAILY_SAVING_ID"), nullable=False, unique=True)
+    ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=False)
+    DATE = Column(Date)
+    SAVING_RULE_TYPE_ID = Column(Integer)
+    SAVING_RULE_DETAIL_ID = Column(Integer)
+    RULE_TYPE_NAME = Column(String(10))
+    RECORD_NAME = Column(String(20))
+    RULE_DESCRIPTION = Column(String(150))  # 선수 규칙은 선수 이름이 붙은 설명
+    PLAYER_ID = Column(Integer, nullable=True)
+    PLAYER_NAME = Column(String(20), nullable=True)
+    UNIT_AMOUNT = Column(Integer, nullable=True)
+    COUNT = Column(Integer)
+    DAILY_SAVING_AMOUNT = Column(Integer)
+    created_at = Column(DateTime, server_default=func.now())
+
+    # 관계 정의
+    daily_saving = relationship("DailySaving", back_populates="detail_view")
 
 # 티켓 번호 테이블
 class TicketNumber(Base):
     __tablename__ = "ticket_number"
+    __table_args__ = (
+        Index("ux_ticket_number_ticket_number", "TICKET_NUMBER", unique=True),
+    )
 
     TICKET_NUMBER_ID = Column(Integer, primary_key=True)
     ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=True)
@@ -251,6 +307,9 @@ class TicketNumber(Base):
 # 일일 잔액 테이블
 class DailyBalances(Base):
     __tablename__ = "daily_balances"
+    __table_args__ = (
+        Index("ix_daily_balances_account_date", "ACCOUNT_ID", "DATE", "DAILY_BALANCES_ID"),
+    )
 
     DAILY_BALANCES_ID = Column(Integer, primary_key=True)
     ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=False)
@@ -264,6 +323,10 @@ class DailyBalances(Base):
 # 주간 개인 보고서 테이블
 class WeeklyReportPersonal(Base):
     __tablename__ = "weekly_report_personal"
+    __table_args__ = (
+        # 배치 보고서 저장 시 (계정, 날짜) 기준 upsert
+        Index("ux_weekly_report_personal_account_date", "ACCOUNT_ID", "DATE", unique=True),
+    )
 
     WEEKLY_PERSONAL_ID = Column(Integer, primary_key=True)
     ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=False)
@@ -293,6 +356,10 @@ class WeeklyReportTeam(Base):
 # 팀 평가 테이블
 class TeamRating(Base):
     __tablename__ = "team_rating"
+    __table_args__ = (
+        # 순위 파일 저장 시 (팀, 날짜) 기준 upsert
+        Index("ux_team_rating_team_date", "TEAM_ID", "DATE", unique=True),
+    )
 
     TEAM_RATING_ID = Column(Integer, primary_key=True)
     TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), nullable=False)
@@ -302,9 +369,29 @@ class TeamRating(Base):
     # 관계 정의
     team = relationship("Team", back_populates="team_ratings")
 
+# 팀 순위표 테이블 (순위 저장 시 한 번 계산한 /api/game/team/ranking 응답, utils/team_ranking.py)
+class TeamRanking(Base):
+    __tablename__ = "team_ranking"
+
+    TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), primary_key=True)
+    RANK = Column(Integer, nullable=False, default=0, server_default="0")  # 순위 데이터가 없으면 0
+    BEFORE_RANK = Column(Integer)  # 직전 날짜 순위
+    RANK_CHANGE = Column(Integer)  # 직전 순위 - 현재 순위 (양수면 상승)
+    TOTAL_WIN = Column(Integer, nullable=False, default=0, server_default="0")
+    TOTAL_LOSE = Column(Integer, nullable=False, default=0, server_default="0")
+    TOTAL_DRAW = Column(Integer, nullable=False, default=0, server_default="0")
+    WIN_RATE = Column(Float, nullable=False, default=0, server_default="0")
+    RANK_DATE = Column(Date)  # 순위 기준 날짜
+    VERSION = Column(Integer, nullable=False, default=1, server_default="1")  # 다시 계산할 때마다 증가
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
 # 일일 보고서 테이블
 class DailyReport(Base):
     __tablename__ = "daily_report"
+    __table_args__ = (
+        # 배치 보고서 저장 시 (팀, 날짜) 기준 upsert
+        Index("ux_daily_report_team_date", "TEAM_ID", "DATE", unique=True),
+    )
 
     DAILY_REPORT_ID = Column(Integer, primary_key=True)
     TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), nullable=False)
@@ -315,6 +402,25 @@ class DailyReport(Base):
     # 관계 정의
     team = relationship("Team", back_populates="daily_reports")
 
+# 팀별 계정 집계 테이블 (계정 수, 총 적금액)
+# 계정 추가/삭제, TOTAL_AMOUNT 변경이 flush될 때 같은 트랜잭션에서 함께 갱신됨 (maintain_team_aggregates)
+class TeamAccountSummary(Base):
+    __tablename__ = "team_account_summary"
+
+    TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), primary_key=True)
+    ACCOUNT_COUNT = Column(Integer, nullable=False, default=0, server_default="0")
+    TOTAL_AMOUNT = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+# 팀별 일일 적립 총액 테이블 (daily_saving 합계)
+class TeamDailySavingTotal(Base):
+    __tablename__ = "team_daily_saving_total"
+
+    TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), primary_key=True)
+    DATE = Column(Date, primary_key=True)
+    SAVING_AMOUNT = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
 # 뉴스 테이블
 class News(Base):
     __tablename__ = "news"
@@ -366,6 +472,9 @@ class RunPlayer(Base):
 # 플레이어 기록 테이블
 class PlayerRecord(Base):
     __tablename__ = "player_record"
+    __table_args__ = (
+        Index("ix_player_record_player_date", "PLAYER_ID", "DATE", "PLAYER_RECORD_ID"),
+    )
 
     PLAYER_RECORD_ID = Column(Integer, primary_key=True)
     DATE = Column(Date)
@@ -406,6 +515,28 @@ class GameLog(Base):
     team = relationship("Team", back_populates="game_logs")
     record_type = relationship("RecordType", back_populates="game_logs")
 
+# 날짜별 팀 경기 정보 테이블 (game_schedule + game_log에서 하루 한 번 계산, utils/game_context.py)
+class TeamGameContext(Base):
+    __tablename__ = "team_game_context"
+    __table_args__ = (
+        Index("ix_team_game_context_team_date", "TEAM_ID", "DATE"),
+    )
+
+    DATE = Column(Date, primary_key=True)
+    TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), primary_key=True)
+    OPPONENT_TEAM_ID = Column(Integer, ForeignKey("team.TEAM_ID"), nullable=False)
+    GAME_SCHEDULE_KEY = Column(Integer, ForeignKey("game_schedule.GAME_SCHEDULE_KEY"))
+    IS_HOME = Column(Boolean, nullable=False)
+    RUNS = Column(Integer, nullable=False, default=0, server_default="0")
+    OPPONENT_RUNS = Column(Integer, nullable=False, default=0, server_default="0")
+    RESULT = Column(String(10), nullable=False)  # 승리, 패배, 무승부, 취소
+    SERIES_INDEX = Column(Integer, nullable=False, default=1, server_default="1")  # 같은 상대와의 시리즈(3연전) 중 몇 번째 경기인지
+    CANCELLED = Column(Boolean, nullable=False, default=False, server_default="0")
+    SERIES_WINS = Column(Integer, nullable=False, default=0, server_default="0")  # 이 경기까지 시리즈 승 수
+    SERIES_LOSSES = Column(Integer, nullable=False, default=0, server_default="0")  # 이 경기까지 시리즈 패 수
+    SERIES_OUTCOME = Column(String(10))  # 3연전 마지막 경기의 시리즈 결과 (스윕, 위닝시리즈, 루징시리즈, 스윕패, 동률)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
 # 팀 순위 예측 테이블
 class TeamRankPrediction(Base):
     __tablename__ = "team_rank_prediction"
@@ -438,6 +569,9 @@ class TicketInfo(Base):
 #일일 송금 메시지 테이블
 class TransactionMessage(Base):
     __tablename__ = "transaction_message"
+    __table_args__ = (
+        Index("ix_transaction_message_account_date", "ACCOUNT_ID", "TRANSACTION_DATE", "TRANSACTION_ID"),
+    )
 
     TRANSACTION_ID = Column(Integer, primary_key=True)
     ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=False)
@@ -451,13 +585,261 @@ class TransactionMessage(Base):
 # 일일 송금 내역 테이블
 class DailyTransfer(Base):
     __tablename__ = "daily_transfer"
+    __table_args__ = (
+        Index("ix_daily_transfer_account_date", "ACCOUNT_ID", "DATE", "DAILY_TRANSFER_ID"),
+    )
+
+    # 이체 상태 (PENDING: 이체 대기, IN_FLIGHT: 금융 API 호출 중, SUCCEEDED: 이체 완료, FAILED: 이체 실패)
+    STATUS_PENDING = "PENDING"
+    STATUS_IN_FLIGHT = "IN_FLIGHT"
+    STATUS_SUCCEEDED = "SUCCEEDED"
+    STATUS_FAILED = "FAILED"
 
     DAILY_TRANSFER_ID = Column(Integer, primary_key=True)
     ACCOUNT_ID = Column(Integer, ForeignKey("account.ACCOUNT_ID"), nullable=False)
     DATE = Column(Date)
     TEXT = Column(String(255))
     AMOUNT = Column(Integer)
+    STATUS = Column(String(20), nullable=False, default=STATUS_PENDING, server_default=STATUS_PENDING, index=True)
+    # (계정, 날짜)로 만든 멱등성 키. 금융 API의 기관거래고유번호로도 사용해 재시도 시 중복 출금을 막음
+    IDEMPOTENCY_KEY = Column(String(20), unique=True)
+    ATTEMPTS = Column(Integer, nullable=False, default=0, server_default="0")
+    BANK_TRANSACTION_NO = Column(String(50))
+    LAST_ERROR = Column(String(255))
     created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # 관계 정의
     account = relationship("Account", back_populates="daily_transfers")
+
+    @staticmethod
+    def make_idempotency_key(account_id, transfer_date):
+        """
+        (계정, 날짜)로 이체 멱등성 키를 만듭니다.
+        금융 API 기관거래고유번호 형식(YYYYMMDD + 12자리 숫자)과 같아 그대로 전달할 수 있습니다.
+        """
+        return f"{transfer_date.strftime('%Y%m%d')}{account_id:012d}"
+
+
+@event.listens_for(Session, "after_flush")
+def mark_interest_rate_snapshots_stale(session, flush_context):
+    """
+    UsedMission 추가/변경/삭제, Account.INTEREST_RATE 변경, Mission 금리/횟수 변경이 flush되면
+    해당 계정의 이자율 스냅샷을 STALE로 표시합니다. (실제 재계산은 다음 조회 시 일괄 수행)
+    """
+    account_ids = set()
+    mission_ids = set()
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, UsedMission):
+            if obj.ACCOUNT_ID is not None:
+                account_ids.add(obj.ACCOUNT_ID)
+        elif isinstance(obj, Account):
+            if obj not in session.new and inspect(obj).attrs.INTEREST_RATE.history.has_changes():
+                account_ids.add(obj.ACCOUNT_ID)
+        elif isinstance(obj, Mission):
+            state = inspect(obj)
+            if obj not in session.new and any(
+                state.attrs[key].history.has_changes()
+                for key in ("MISSION_NAME", "MISSION_MAX_COUNT", "MISSION_RATE")
+            ):
+                mission_ids.add(obj.MISSION_ID)
+
+    if not account_ids and not mission_ids:
+        return
+
+    snapshot_table = AccountInterestRate.__table__
+    connection = session.connection()
+    if account_ids:
+        connection.execute(
+            snapshot_table.update()
+            .where(snapshot_table.c.ACCOUNT_ID.in_(account_ids))
+            .values(STALE=True)
+        )
+    if mission_ids:
+        connection.execute(
+            snapshot_table.update()
+            .where(snapshot_table.c.ACCOUNT_ID.in_(
+                select(UsedMission.__table__.c.ACCOUNT_ID).where(UsedMission.__table__.c.MISSION_ID.in_(mission_ids))
+            ))
+            .values(STALE=True)
+        )
+
+
+def _flushed_values(obj, key):
+    """flush 직전 값과 flush 후 값 (삭제된 객체는 flush 직전 값만 의미가 있음)"""
+    history = inspect(obj).attrs[key].history
+    if history.deleted:
+        old = history.deleted[0]
+    elif history.unchanged:
+        old = history.unchanged[0]
+    else:
+        old = None
+    new = history.added[0] if history.added else old
+    return old, new
+
+
+@event.listens_for(Session, "before_flush")
+def load_team_aggregate_values(session, flush_context, instances):
+    """삭제할 Account/DailySaving의 집계용 값이 만료된 상태면 삭제 전에 읽어 둡니다."""
+    for obj in session.deleted:
+        if isinstance(obj, Account):
+            obj.TEAM_ID, obj.TOTAL_AMOUNT
+        elif isinstance(obj, DailySaving):
+            obj.ACCOUNT_ID, obj.DATE, obj.DAILY_SAVING_AMOUNT
+
+
+@event.listens_for(Session, "after_flush")
+def maintain_team_aggregates(session, flush_context):
+    """
+    Account 추가/삭제/TOTAL_AMOUNT·TEAM_ID 변경, DailySaving 추가/삭제/금액 변경이 flush되면
+    팀별 집계(team_account_summary, team_daily_saving_total)에 변화량만 더합니다.
+    집계 행이 아직 없으면 flush가 반영된 원본 테이블에서 한 번 계산해 만듭니다.
+    (다른 트랜잭션이 같은 행을 먼저 만든 경우 키 충돌로 flush가 실패하지 않도록 upsert로 변화량만 더함)
+    """
+    summary_deltas = {}   # TEAM_ID -> [계정 수 변화량, 총 적금액 변화량]
+    saving_deltas = {}    # (TEAM_ID, DATE) -> 적립 총액 변화량
+    saving_changes = []   # (ACCOUNT_ID, DATE, 변화량)
+    account_teams = {}    # ACCOUNT_ID -> TEAM_ID (flush 대상 계정)
+    moved_accounts = {}   # ACCOUNT_ID -> (이전 TEAM_ID, 새 TEAM_ID) (응원 팀을 바꾼 계정)
+
+    def add_summary(team_id, count, amount):
+        if team_id is None or (not count and not amount):
+            return
+        delta = summary_deltas.setdefault(team_id, [0, 0])
+        delta[0] += count
+        delta[1] += amount
+
+    for obj in session.new:
+        if isinstance(obj, Account):
+            account_teams[obj.ACCOUNT_ID] = obj.TEAM_ID
+            add_summary(obj.TEAM_ID, 1, obj.TOTAL_AMOUNT or 0)
+        elif isinstance(obj, DailySaving) and obj.DAILY_SAVING_AMOUNT:
+            saving_changes.append((obj.ACCOUNT_ID, obj.DATE, obj.DAILY_SAVING_AMOUNT))
+
+    for obj in session.deleted:
+        if isinstance(obj, Account):
+            old_team, _ = _flushed_values(obj, "TEAM_ID")
+            old_amount, _ = _flushed_values(obj, "TOTAL_AMOUNT")
+            account_teams[obj.ACCOUNT_ID] = old_team
+            add_summary(old_team, -1, -(old_amount or 0))
+        elif isinstance(obj, DailySaving):
+            old_amount, _ = _flushed_values(obj, "DAILY_SAVING_AMOUNT")
+            old_date, _ = _flushed_values(obj, "DATE")
+            if old_amount:
+                saving_changes.append((obj.ACCOUNT_ID, old_date, -old_amount))
+
+    for obj in session.dirty:
+        if obj in session.new or obj in session.deleted:
+            continue
+        if isinstance(obj, Account):
+            old_team, new_team = _flushed_values(obj, "TEAM_ID")
+            old_amount, new_amount = _flushed_values(obj, "TOTAL_AMOUNT")
+            account_teams[obj.ACCOUNT_ID] = new_team
+            if old_team != new_team:
+                add_summary(old_team, -1, -(old_amount or 0))
+                add_summary(new_team, 1, new_amount or 0)
+                moved_accounts[obj.ACCOUNT_ID] = (old_team, new_team)
+            else:
+                add_summary(new_team, 0, (new_amount or 0) - (old_amount or 0))
+        elif isinstance(obj, DailySaving):
+            old_amount, new_amount = _flushed_values(obj, "DAILY_SAVING_AMOUNT")
+            old_date, new_date = _flushed_values(obj, "DATE")
+            if old_amount:
+                saving_changes.append((obj.ACCOUNT_ID, old_date, -old_amount))
+            if new_amount:
+                saving_changes.append((obj.ACCOUNT_ID, new_date, new_amount))
+
+    if not summary_deltas and not saving_changes:
+        return
+
+    connection = session.connection()
+    account_table = Account.__table__
+    daily_saving_table = DailySaving.__table__
+
+    if moved_accounts:
+        # 팀을 바꾼 계정의 기존 적립 내역은 이전 팀 총액에서 새 팀 총액으로 옮김
+        # (이번 flush에서 바뀐 적립 내역은 아래에서 새 팀 기준으로 따로 반영되므로 제외)
+        flushed = {}
+        for account_id, saving_date, amount in saving_changes:
+            if account_id in moved_accounts:
+                flushed[(account_id, saving_date)] = flushed.get((account_id, saving_date), 0) + amount
+        rows = connection.execute(
+            select(
+                daily_saving_table.c.ACCOUNT_ID,
+                daily_saving_table.c.DATE,
+                func.sum(daily_saving_table.c.DAILY_SAVING_AMOUNT)
+            )
+            .where(daily_saving_table.c.ACCOUNT_ID.in_(moved_accounts), daily_saving_table.c.DATE.isnot(None))
+            .group_by(daily_saving_table.c.ACCOUNT_ID, daily_saving_table.c.DATE)
+        ).all()
+        for account_id, saving_date, amount in rows:
+            amount = (amount or 0) - flushed.get((account_id, saving_date), 0)
+            old_team, new_team = moved_accounts[account_id]
+            if old_team is not None:
+                saving_deltas[(old_team, saving_date)] = saving_deltas.get((old_team, saving_date), 0) - amount
+            if new_team is not None:
+                saving_deltas[(new_team, saving_date)] = saving_deltas.get((new_team, saving_date), 0) + amount
+
+    if saving_changes:
+        # flush 대상이 아닌 계정의 팀은 한 번에 조회
+        missing_ids = {account_id for account_id, _, _ in saving_changes if account_id not in account_teams}
+        if missing_ids:
+            account_teams.update(connection.execute(
+                select(account_table.c.ACCOUNT_ID, account_table.c.TEAM_ID)
+                .where(account_table.c.ACCOUNT_ID.in_(missing_ids))
+            ).all())
+        for account_id, saving_date, amount in saving_changes:
+            team_id = account_teams.get(account_id)
+            if team_id is not None and saving_date is not None:
+                saving_deltas[(team_id, saving_date)] = saving_deltas.get((team_id, saving_date), 0) + amount
+
+    summary_table = TeamAccountSummary.__table__
+    for team_id, (count, amount) in summary_deltas.items():
+        if not count and not amount:
+            continue
+        result = connection.execute(
+            summary_table.update()
+            .where(summary_table.c.TEAM_ID == team_id)
+            .values(
+                ACCOUNT_COUNT=summary_table.c.ACCOUNT_COUNT + count,
+                TOTAL_AMOUNT=summary_table.c.TOTAL_AMOUNT + amount
+            )
+        )
+        if result.rowcount == 0:
+            account_count, total_amount = connection.execute(
+                select(func.count(account_table.c.ACCOUNT_ID), func.coalesce(func.sum(account_table.c.TOTAL_AMOUNT), 0))
+                .where(account_table.c.TEAM_ID == team_id)
+            ).one()
+            connection.execute(build_upsert(
+                session, summary_table,
+                [{"TEAM_ID": team_id, "ACCOUNT_COUNT": account_count, "TOTAL_AMOUNT": total_amount}],
+                ["TEAM_ID"], [],
+                update_values={
+                    "ACCOUNT_COUNT": summary_table.c.ACCOUNT_COUNT + count,
+                    "TOTAL_AMOUNT": summary_table.c.TOTAL_AMOUNT + amount,
+                    "updated_at": func.now()
+                }
+            ))
+
+    saving_table = TeamDailySavingTotal.__table__
+    for (team_id, saving_date), amount in saving_deltas.items():
+        if not amount:
+            continue
+        result = connection.execute(
+            saving_table.update()
+            .where(saving_table.c.TEAM_ID == team_id, saving_table.c.DATE == saving_date)
+            .values(SAVING_AMOUNT=saving_table.c.SAVING_AMOUNT + amount)
+        )
+        if result.rowcount == 0:
+            saving_amount = connection.execute(
+                select(func.coalesce(func.sum(daily_saving_table.c.DAILY_SAVING_AMOUNT), 0))
+                .select_from(daily_saving_table.join(account_table, daily_saving_table.c.ACCOUNT_ID == account_table.c.ACCOUNT_ID))
+                .where(account_table.c.TEAM_ID == team_id, daily_saving_table.c.DATE == saving_date)
+            ).scalar()
+            connection.execute(build_upsert(
+                session, saving_table,
+                [{"TEAM_ID": team_id, "DATE": saving_date, "SAVING_AMOUNT": saving_amount}],
+                ["TEAM_ID", "DATE"], [],
+                update_values={"SAVING_AMOUNT": saving_table.c.SAVING_AMOUNT + amount, "updated_at": func.now()}
+            ))
@@ -4,6 +4,8 @@ from typing import Optional, List, Dict, Any
 import os
 
 import models
+from utils.pagination import keyset_paginate
+from utils.loader_profiles import apply_loader_profile
 from router.account.account_schema import AccountCreate, AccountUpdate, BalanceUpdate,TransactionMessageCreate,TransactionMessageUpdate
 
 def get_account_by_id(db: Session, account_id: int):
@@ -130,6 +132,24 @@ def get_account_daily_balances(db: Session, account_id: int, start_date=None, en
     
     return query.order_by(models.DailyBalances.DATE.desc()).all()
 
+def get_account_daily_balances_page(db: Session, account_id: int, cursor=None, limit=None, since=None, until=None):
+    """계정의 일일 잔액 내역을 최신순 (날짜, ID) 키셋 페이지로 조회"""
+    return keyset_paginate(
+        db.query(models.DailyBalances).filter(models.DailyBalances.ACCOUNT_ID == account_id),
+        models.DailyBalances.DATE,
+        models.DailyBalances.DAILY_BALANCES_ID,
+        cursor=cursor, limit=limit, since=since, until=until
+    )
+
+def get_account_saving_details_page(db: Session, account_id: int, cursor=None, limit=None, since=None, until=None):
+    """계정의 적금 상세 내역(daily_saving_detail)을 최신순 (날짜, ID) 키셋 페이지로 조회"""
+    return keyset_paginate(
+        db.query(models.DailySavingDetail).filter(models.DailySavingDetail.ACCOUNT_ID == account_id),
+        models.DailySavingDetail.DATE,
+        models.DailySavingDetail.DAILY_SAVING_ID,
+        cursor=cursor, limit=limit, since=since, until=until
+    )
+
 def get_account_savings(db: Session, account_id: int, start_date=None, end_date=None):
     """계정의 적금 내역 조회"""
     query = db.query(models.DailySaving).filter(models.DailySaving.ACCOUNT_ID == account_id)
@@ -141,9 +161,12 @@ def get_account_savings(db: Session, account_id: int, start_date=None, end_date=
     
     return query.order_by(models.DailySaving.DATE.desc()).all()
 
-def get_account_saving_rules(db: Session, account_id: int):
-    """계정의 적금 규칙 설정 조회"""
-    return db.query(models.UserSavingRule).filter(models.UserSavingRule.ACCOUNT_ID == account_id).all()
+def get_account_saving_rules(db: Session, account_id: int, loader_profile: Optional[str] = None):
+    """계정의 적금 규칙 설정 조회 (loader_profile을 주면 해당 관계를 함께 로딩)"""
+    query = db.query(models.UserSavingRule).filter(models.UserSavingRule.ACCOUNT_ID == account_id)
+    if loader_profile:
+        query = apply_loader_profile(query, loader_profile)
+    return query.order_by(models.UserSavingRule.USER_SAVING_RULED_ID).all()
 
 async def transfer_to_saving_account(db: Session, account_id: int, amount: int):
     """
@@ -206,6 +229,15 @@ def get_transaction_messages_by_account(db: Session, account_id: int, skip: int
         models.TransactionMessage.CREATED_AT.desc()
     ).offset(skip).limit(limit).all()
 
+def get_transaction_messages_page(db: Session, account_id: int, cursor=None, limit=100, since=None, until=None):
+    """계정의 트랜잭션 메시지를 최신순 (날짜, ID) 키셋 페이지로 조회"""
+    return keyset_paginate(
+        db.query(models.TransactionMessage).filter(models.TransactionMessage.ACCOUNT_ID == account_id),
+        models.TransactionMessage.TRANSACTION_DATE,
+        models.TransactionMessage.TRANSACTION_ID,
+        cursor=cursor, limit=limit, since=since, until=until
+    )
+
 def get_transaction_messages_by_date_range(db: Session, account_id: int, start_date: date, end_date: date):
     """계정 ID와 날짜 범위로 트랜잭션 메시지 조회"""
     return db.query(models.TransactionMessage).filter(
@@ -326,4 +358,13 @@ def get_account_transfers(db: Session, account_id: int, start_date=None, end_dat
     if end_date:
         query = query.filter(models.DailyTransfer.DATE <= end_date)
     
-    return query.order_by(models.DailyTransfer.DATE.desc()).all()
\ No newline at end of file
+    return query.order_by(models.DailyTransfer.DATE.desc()).all()
+
+def get_account_transfers_page(db: Session, account_id: int, cursor=None, limit=None, since=None, until=None):
+    """계정의 송금 내역을 최신순 (날짜, ID) 키셋 페이지로 조회"""
+    return keyset_paginate(
+        db.query(models.DailyTransfer).filter(models.DailyTransfer.ACCOUNT_ID == account_id),
+        models.DailyTransfer.DATE,
+        models.DailyTransfer.DAILY_TRANSFER_ID,
+        cursor=cursor, limit=limit, since=since, until=until
+    )
\ No newline at end of file
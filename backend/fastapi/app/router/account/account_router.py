@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import date
@@ -11,6 +11,7 @@ import models
 from router.account import account_schema, account_crud
 from router.user.user_router import get_current_user
 from router.player import player_schema
+from utils.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -257,10 +258,28 @@ async def create_account(
 
 @router.get("/transfers_log", response_model=List[account_schema.DailyTransferResponse])
 async def get_my_transfers(
+    response: Response,
     month: Optional[int] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    """
+    로그인한 사용자의 송금 내역을 최신순으로 조회합니다.
+    
+    Args:
+        month (int, optional): 조회할 월 (올해 기준)
+        since (date, optional): 조회 시작 날짜
+        until (date, optional): 조회 종료 날짜
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[DailyTransferResponse]: 송금 내역 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"로그인 사용자의 송금 내역 조회: 사용자 ID {current_user.USER_ID}")
         
@@ -296,8 +315,17 @@ async def get_my_transfers(
                 
             logger.info(f"{month}월 송금 내역 조회: {start_date} ~ {end_date}")
         
-        # 송금 내역 조회
-        transfers = account_crud.get_account_transfers(db, account_id, start_date, end_date)
+        # 월 범위와 since/until 범위가 모두 있으면 겹치는 구간만 조회
+        if start_date is not None:
+            since = max(since, start_date) if since else start_date
+            until = min(until, end_date) if until else end_date
+        
+        # 송금 내역 조회 ((날짜, ID) 키셋 페이지)
+        transfers, next_cursor = account_crud.get_account_transfers_page(
+            db, account_id, cursor=cursor, limit=limit, since=since, until=until
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return transfers
         
     except HTTPException:
@@ -339,68 +367,24 @@ async def get_my_daily_savings_detail(
         
         logger.info(f"사용자의 계정으로 상세 내역 조회: 계정 ID {account_id}")
         
-        # 해당 날짜의 적금 내역 조회
-        daily_savings = db.query(models.DailySaving).filter(
-            models.DailySaving.ACCOUNT_ID == account_id,
-            models.DailySaving.DATE == date
-        ).all()
+        # 해당 날짜의 적금 상세 내역 조회 (적립 시점에 규칙/기록/선수 이름이 함께 저장된 조회용 테이블)
+        saving_details = db.query(models.DailySavingDetail).filter(
+            models.DailySavingDetail.ACCOUNT_ID == account_id,
+            models.DailySavingDetail.DATE == date
+        ).order_by(models.DailySavingDetail.DAILY_SAVING_ID).all()
         
         # 결과 목록
         result = []
         
-        for saving in daily_savings:
-            # 적금 규칙 타입 조회
-            rule_type = db.query(models.SavingRuleType).filter(
-                models.SavingRuleType.SAVING_RULE_TYPE_ID == saving.SAVING_RULED_TYPE_ID
-            ).first()
-            
-            # 적금 규칙 상세 조회
-            rule_detail = db.query(models.SavingRuleDetail).filter(
-                models.SavingRuleDetail.SAVING_RULE_DETAIL_ID == saving.SAVING_RULED_DETAIL_ID
-            ).first()
-            
-            # 규칙 설명 가져오기
-            rule_description = rule_detail.RULE_DESCRIPTION if rule_detail else "알 수 없는 규칙"
-            
-            # 적금 규칙 조회
-            saving_rule = None
-            record_type = None
-            if rule_detail:
-                saving_rule = db.query(models.SavingRuleList).filter(
-                    models.SavingRuleList.SAVING_RULE_ID == rule_detail.SAVING_RULE_ID
-                ).first()
-                
-                if saving_rule:
-                    # 기록 타입 조회
-                    record_type = db.query(models.RecordType).filter(
-                        models.RecordType.RECORD_TYPE_ID == saving_rule.RECORD_TYPE_ID
-                    ).first()
-            
-            # 사용자 적금 규칙 조회 (적립 금액 단위 확인용)
-            user_rule = db.query(models.UserSavingRule).filter(
-                models.UserSavingRule.ACCOUNT_ID == account_id,
-                models.UserSavingRule.SAVING_RULE_DETAIL_ID == saving.SAVING_RULED_DETAIL_ID
-            ).first()
-            
-            # 선수 정보 (해당되는 경우)
-            player = None
-            if user_rule and user_rule.PLAYER_ID:
-                player = db.query(models.Player).filter(
-                    models.Player.PLAYER_ID == user_rule.PLAYER_ID
-                ).first()
-                
-                # 선수 이름을 규칙 설명에 포함
-                if player and "이(가)" in rule_description:
-                    rule_description = rule_description.replace("이(가)", f"{player.PLAYER_NAME}이(가)")
-            
+        for saving in saving_details:
             # 상세 정보 구성
             detail = {
                 "DATE": saving.DATE,
                 "COUNT": saving.COUNT,
-                "rule_type_name": rule_type.SAVING_RULE_TYPE_NAME if rule_type else None,
-                "record_name": record_type.RECORD_NAME if record_type else None,
-                "player_name": player.PLAYER_NAME if player else None,
-                "unit_amount": user_rule.USER_SAVING_RULED_AMOUNT if user_rule else None,
+                "rule_type_name": saving.RULE_TYPE_NAME,
+                "record_name": saving.RECORD_NAME,
+                "player_name": saving.PLAYER_NAME,
+                "unit_amount": saving.UNIT_AMOUNT,
                 "DAILY_SAVING_AMOUNT": saving.DAILY_SAVING_AMOUNT,
             }
             
@@ -429,35 +413,29 @@ async def read_account_detail(
         account = await get_user_account(db, current_user)
         account_id = account.ACCOUNT_ID
         
-        # 이자율 정보 계산
+        # 이자율 스냅샷 조회 (미션/기본 금리가 바뀐 경우에만 응답용으로 다시 계산, 저장은 쓰기 경로와 배치에서)
         from router.mission import mission_crud  # 순환 참조 방지를 위해 여기서 import
-        interest_details = mission_crud.calculate_account_interest_details(db, account_id)
+        snapshot = mission_crud.get_account_interest_snapshots(db, [account_id], persist=False)[account_id]
         
-        # 사용자의 미션 조회 (진행 중 또는 완료된 미션)
-        used_missions = db.query(models.UsedMission).filter(
-            models.UsedMission.ACCOUNT_ID == account_id
-        ).all()
-        
-        # 활성 미션 정보 구성
+        # 활성 미션 정보 구성 (진행 중 또는 완료된 미션)
         active_missions = []
-        for used_mission in used_missions:
-            mission = used_mission.mission
+        for mission in mission_crud.get_snapshot_mission_details(snapshot):
             active_missions.append({
-                "MISSION_ID": mission.MISSION_ID,
-                "MISSION_NAME": mission.MISSION_NAME,
-                "MISSION_MAX_COUNT": mission.MISSION_MAX_COUNT,
-                "MISSION_RATE": mission.MISSION_RATE,
-                "COUNT": used_mission.COUNT,
-                "CURRENT_COUNT": used_mission.COUNT,
-                "MAX_COUNT": used_mission.MAX_COUNT
+                "MISSION_ID": mission["MISSION_ID"],
+                "MISSION_NAME": mission["MISSION_NAME"],
+                "MISSION_MAX_COUNT": mission["MISSION_MAX_COUNT"],
+                "MISSION_RATE": mission["MISSION_RATE"],
+                "COUNT": mission["CURRENT_COUNT"],
+                "CURRENT_COUNT": mission["CURRENT_COUNT"],
+                "MAX_COUNT": mission["MAX_COUNT"]
             })
         
         # 계정 상세 정보 구성
         account_detail = {
             **account.__dict__,  # 기존 계정 정보 포함
-            "base_interest_rate": interest_details['base_interest_rate'],  # 기본 이자율
-            "mission_interest_rate": interest_details['mission_interest_rate'],  # 미션 이자율
-            "total_interest_rate": interest_details['total_interest_rate'],  # 총 이자율
+            "base_interest_rate": snapshot.BASE_INTEREST_RATE,  # 기본 이자율
+            "mission_interest_rate": snapshot.MISSION_INTEREST_RATE,  # 미션 이자율
+            "total_interest_rate": snapshot.TOTAL_INTEREST_RATE,  # 총 이자율
             "active_missions": active_missions,  # 활성 미션 목록
         }
         
@@ -484,35 +462,31 @@ async def get_account_interest_details(
         account = await get_user_account(db, current_user)
         account_id = account.ACCOUNT_ID
         
-        # 이자율 정보 계산
+        # 이자율 스냅샷 조회 (미션/기본 금리가 바뀐 경우에만 응답용으로 다시 계산, 저장은 쓰기 경로와 배치에서)
         from router.mission import mission_crud  # 순환 참조 방지를 위해 여기서 import
-        interest_details = mission_crud.calculate_account_interest_details(db, account_id)
+        snapshot = mission_crud.get_account_interest_snapshots(db, [account_id], persist=False)[account_id]
+        
+        # 미션 상세 정보
+        mission_details = []
+        for mission in mission_crud.get_snapshot_mission_details(snapshot):
+            mission_details.append({
+                "mission_id": mission["MISSION_ID"],
+                "mission_name": mission["MISSION_NAME"],
+                "mission_rate": mission["MISSION_RATE"],
+                "current_count": mission["CURRENT_COUNT"],
+                "max_count": mission["MAX_COUNT"],
+                "is_completed": mission["CURRENT_COUNT"] >= mission["MAX_COUNT"]
+            })
         
-        # 필수 필드가 없어서 발생하는 에러 해결을 위해 필드 추가
-        if 'total_mission_rate' not in interest_details:
+        interest_details = {
+            "base_interest_rate": snapshot.BASE_INTEREST_RATE,
+            "mission_interest_rate": snapshot.MISSION_INTEREST_RATE,
+            "total_interest_rate": snapshot.TOTAL_INTEREST_RATE,
             # total_mission_rate는 mission_interest_rate와 동일하게 처리
-            interest_details['total_mission_rate'] = interest_details.get('mission_interest_rate', 0)
-        
-        if 'mission_details' not in interest_details:
-            # 미션 상세 정보 조회
-            used_missions = db.query(models.UsedMission).filter(
-                models.UsedMission.ACCOUNT_ID == account_id
-            ).all()
-            
-            mission_details = []
-            for used_mission in used_missions:
-                mission = used_mission.mission
-                mission_detail = {
-                    "mission_id": mission.MISSION_ID,
-                    "mission_name": mission.MISSION_NAME,
-                    "mission_rate": mission.MISSION_RATE,
-                    "current_count": used_mission.COUNT,
-                    "max_count": used_mission.MAX_COUNT,
-                    "is_completed": used_mission.COUNT >= used_mission.MAX_COUNT
-                }
-                mission_details.append(mission_detail)
-            
-            interest_details['mission_details'] = mission_details
+            "total_mission_rate": snapshot.MISSION_INTEREST_RATE,
+            "rate_version": snapshot.VERSION,
+            "mission_details": mission_details
+        }
         
         return interest_details
         
@@ -570,11 +544,28 @@ async def setup_account(
 
 @router.get("/daily-balances", response_model=List[dict])
 async def get_daily_balances(
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
+    response: Response,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = Query(None, deprecated=True),
+    end_date: Optional[date] = Query(None, deprecated=True),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    """
+    로그인한 사용자의 일일 잔액 내역을 최신순으로 조회합니다.
+    
+    Args:
+        since (date, optional): 조회 시작 날짜 (start_date 대체)
+        until (date, optional): 조회 종료 날짜 (end_date 대체)
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[dict]: 일일 잔액 내역 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"계정 일일 잔액 내역 조회: 사용자 ID {current_user.USER_ID}")
         
@@ -582,8 +573,12 @@ async def get_daily_balances(
         account = await get_user_account(db, current_user)
         account_id = account.ACCOUNT_ID
         
-        # 일일 잔액 내역 조회
-        balances = account_crud.get_account_daily_balances(db, account_id, start_date, end_date)
+        # 일일 잔액 내역 조회 ((날짜, ID) 키셋 페이지)
+        balances, next_cursor = account_crud.get_account_daily_balances_page(
+            db, account_id, cursor=cursor, limit=limit, since=since or start_date, until=until or end_date
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         
         # ORM 모델을 딕셔너리로 변환
         result = []
@@ -617,53 +612,26 @@ async def get_saving_rules(
         account = await get_user_account(db, current_user)
         account_id = account.ACCOUNT_ID
         
-        # 적금 규칙 설정 조회
-        rules = account_crud.get_account_saving_rules(db, account_id)
+        # 적금 규칙 설정 조회 (규칙 타입/상세 규칙/기록 타입/선수 타입/선수를 함께 로딩)
+        rules = account_crud.get_account_saving_rules(db, account_id, loader_profile="user_saving_rule_detail")
         
         # ORM 모델을 딕셔너리로 변환하면서 관련 정보 포함
         result = []
         for rule in rules:
-            # 적금 규칙 타입 이름 조회
-            rule_type = db.query(models.SavingRuleType).filter(
-                models.SavingRuleType.SAVING_RULE_TYPE_ID == rule.SAVING_RULE_TYPE_ID
-            ).first()
-            rule_type_name = rule_type.SAVING_RULE_TYPE_NAME if rule_type else None
-            
-            # 적금 규칙 상세 조회
-            rule_detail = db.query(models.SavingRuleDetail).filter(
-                models.SavingRuleDetail.SAVING_RULE_DETAIL_ID == rule.SAVING_RULE_DETAIL_ID
-            ).first()
+            # 적금 규칙 타입 이름
+            rule_type_name = rule.saving_rule_type.SAVING_RULE_TYPE_NAME if rule.saving_rule_type else None
             
-            # 기록 유형 이름 조회
+            # 기록 유형 이름 (상세 규칙 → 적금 규칙 → 기록 유형)
             record_name = None
-            if rule_detail:
-                # 적금 규칙 조회
-                saving_rule = db.query(models.SavingRuleList).filter(
-                    models.SavingRuleList.SAVING_RULE_ID == rule_detail.SAVING_RULE_ID
-                ).first()
-                
-                if saving_rule:
-                    # 기록 유형 이름 조회
-                    record_type = db.query(models.RecordType).filter(
-                        models.RecordType.RECORD_TYPE_ID == saving_rule.RECORD_TYPE_ID
-                    ).first()
-                    record_name = record_type.RECORD_NAME if record_type else None
+            rule_detail = rule.saving_rule_detail
+            if rule_detail and rule_detail.saving_rule and rule_detail.saving_rule.record_type:
+                record_name = rule_detail.saving_rule.record_type.RECORD_NAME
             
-            # 선수 타입 이름 조회
-            player_type = None
-            if rule.PLAYER_TYPE_ID:
-                player_type_obj = db.query(models.PlayerType).filter(
-                    models.PlayerType.PLAYER_TYPE_ID == rule.PLAYER_TYPE_ID
-                ).first()
-                player_type = player_type_obj.PLAYER_TYPE_NAME if player_type_obj else None
+            # 선수 타입 이름
+            player_type = rule.player_type.PLAYER_TYPE_NAME if rule.player_type else None
             
-            # 선수 이름 조회
-            player_name = None
-            if rule.PLAYER_ID:
-                player = db.query(models.Player).filter(
-                    models.Player.PLAYER_ID == rule.PLAYER_ID
-                ).first()
-                player_name = player.PLAYER_NAME if player else None
+            # 선수 이름
+            player_name = rule.player.PLAYER_NAME if rule.player else None
             
             # 결과 딕셔너리 구성
             rule_dict = {
@@ -768,11 +736,27 @@ async def update_favorite_player(
 # 계정의 모든 송금 메시지 조회
 @router.get("/transactions", response_model=List[account_schema.TransactionMessageResponse])
 async def get_account_transactions(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    """
+    로그인한 사용자의 송금 메시지를 최신순으로 조회합니다.
+    OFFSET 대신 (날짜, ID) 커서로 다음 페이지를 조회합니다.
+    
+    Args:
+        since (date, optional): 조회 시작 날짜
+        until (date, optional): 조회 종료 날짜
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[TransactionMessageResponse]: 송금 메시지 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"계정 트랜잭션 메시지 조회: 사용자 ID {current_user.USER_ID}")
         
@@ -781,7 +765,11 @@ async def get_account_transactions(
         account_id = account.ACCOUNT_ID
         
         # 트랜잭션 메시지 조회
-        transactions = account_crud.get_transaction_messages_by_account(db, account_id, skip, limit)
+        transactions, next_cursor = account_crud.get_transaction_messages_page(
+            db, account_id, cursor=cursor, limit=limit, since=since, until=until
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return transactions
         
     except HTTPException:
@@ -898,11 +886,28 @@ async def create_transaction_messages_endpoint(
 
 @router.get("/savings", response_model=List[dict])
 async def get_savings(
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
+    response: Response,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = Query(None, deprecated=True),
+    end_date: Optional[date] = Query(None, deprecated=True),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    """
+    로그인한 사용자의 적금 내역을 최신순으로 조회합니다.
+    
+    Args:
+        since (date, optional): 조회 시작 날짜 (start_date 대체)
+        until (date, optional): 조회 종료 날짜 (end_date 대체)
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[dict]: 적금 내역 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"계정 적금 내역 조회: 사용자 ID {current_user.USER_ID}")
         
@@ -910,64 +915,24 @@ async def get_savings(
         account = await get_user_account(db, current_user)
         account_id = account.ACCOUNT_ID
         
-        # 적금 내역 조회
-        savings = account_crud.get_account_savings(db, account_id, start_date, end_date)
+        # 적금 내역 조회 (조회용 상세 테이블, (날짜, ID) 키셋 페이지)
+        savings, next_cursor = account_crud.get_account_saving_details_page(
+            db, account_id, cursor=cursor, limit=limit, since=since or start_date, until=until or end_date
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         
-        # ORM 모델을 딕셔너리로 변환하면서 필요한 정보만 포함
+        # 결과 딕셔너리 구성 - 간소화된 버전
         result = []
         for saving in savings:
-            # 적금 규칙 유형 이름 조회
-            rule_type = db.query(models.SavingRuleType).filter(
-                models.SavingRuleType.SAVING_RULE_TYPE_ID == saving.SAVING_RULED_TYPE_ID
-            ).first()
-            rule_type_name = rule_type.SAVING_RULE_TYPE_NAME if rule_type else None
-            
-            # 기록 유형 이름 조회
-            record_type_name = None
-            # 적금 규칙 상세 조회
-            rule_detail = db.query(models.SavingRuleDetail).filter(
-                models.SavingRuleDetail.SAVING_RULE_DETAIL_ID == saving.SAVING_RULED_DETAIL_ID
-            ).first()
-            
-            if rule_detail:
-                # 해당 적금 규칙 조회
-                saving_rule = db.query(models.SavingRuleList).filter(
-                    models.SavingRuleList.SAVING_RULE_ID == rule_detail.SAVING_RULE_ID
-                ).first()
-                
-                if saving_rule:
-                    # 기록 유형 이름 조회
-                    record_type = db.query(models.RecordType).filter(
-                        models.RecordType.RECORD_TYPE_ID == saving_rule.RECORD_TYPE_ID
-                    ).first()
-                    record_type_name = record_type.RECORD_NAME if record_type else None
-            
-            # 선수 이름 (해당되는 경우)
-            player_name = None
-            if rule_type and rule_type.SAVING_RULE_TYPE_NAME not in ["기본 규칙", "상대팀"]:
-                # 사용자 적금 규칙 조회
-                user_rule = db.query(models.UserSavingRule).filter(
-                    models.UserSavingRule.ACCOUNT_ID == account_id,
-                    models.UserSavingRule.SAVING_RULE_DETAIL_ID == saving.SAVING_RULED_DETAIL_ID
-                ).first()
-                
-                if user_rule and user_rule.PLAYER_ID:
-                    player = db.query(models.Player).filter(
-                        models.Player.PLAYER_ID == user_rule.PLAYER_ID
-                    ).first()
-                    
-                    if player:
-                        player_name = player.PLAYER_NAME
-            
-            # 결과 딕셔너리 구성 - 간소화된 버전
             saving_dict = {
                 "DAILY_SAVING_ID": saving.DAILY_SAVING_ID,
                 "DATE": saving.DATE,
                 "COUNT": saving.COUNT,
                 "DAILY_SAVING_AMOUNT": saving.DAILY_SAVING_AMOUNT,
-                "RULE_TYPE_NAME": rule_type_name,
-                "RECORD_TYPE_NAME": record_type_name,
-                "PLAYER_NAME": player_name
+                "RULE_TYPE_NAME": saving.RULE_TYPE_NAME,
+                "RECORD_TYPE_NAME": saving.RECORD_NAME,
+                "PLAYER_NAME": saving.PLAYER_NAME
             }
             
             result.append(saving_dict)
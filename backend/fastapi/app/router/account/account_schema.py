@@ -172,6 +172,7 @@ class AccountInterestDetailResponse(BaseModel):
     mission_interest_rate: float
     total_interest_rate: float
     total_mission_rate: float  # 추가된 필드
+    rate_version: Optional[int] = None  # 이자율 스냅샷 버전 (미션/기본 금리가 바뀔 때마다 증가)
     mission_details: List[MissionDetail]  # 추가된 필드
 
 
@@ -223,6 +224,7 @@ class DailyTransferResponse(BaseModel):
     DATE: date
     TEXT: Optional[str] = None
     AMOUNT: int
+    STATUS: Optional[str] = None
     created_at: datetime
     
     class Config:
@@ -1,9 +1,10 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from datetime import datetime, date, timedelta
+from sqlalchemy import and_, or_
+from datetime import date, timedelta
 from typing import Optional, List, Dict, Any
 
 import models
+from utils.team_ranking import get_team_ranking
 from router.game.game_schema import GameScheduleCreate, GameScheduleUpdate, GameLogCreate, GameLogUpdate, GameResultCreate
 
 def get_game_schedule_by_id(db: Session, game_schedule_key: int):
@@ -213,83 +214,5 @@ def get_team_record(db: Session, team_id: int):
     return result
 
 def get_all_team_records(db: Session, skip: int = 0, limit: int = 100):
-    """모든 팀 성적 조회 (team_rating 테이블 기준 순위 포함 및 직전 순위 추가)"""
-    teams = db.query(models.Team).offset(skip).limit(limit).all()
-    
-    # 현재 날짜 가져오기
-    current_date = datetime.now().date()
-    
-    # 가장 최근 날짜의 팀 순위 정보 조회
-    latest_date_query = db.query(func.max(models.TeamRating.DATE)).filter(
-        models.TeamRating.DATE <= current_date
-    )
-    latest_date = latest_date_query.scalar()
-    
-    if not latest_date:
-        # 순위 데이터가 없는 경우
-        results = []
-        for team in teams:
-            total_games = team.TOTAL_WIN + team.TOTAL_LOSE + team.TOTAL_DRAW
-            win_rate = team.TOTAL_WIN / total_games * 100 if total_games > 0 else 0
-            
-            results.append({
-                "TEAM_ID": team.TEAM_ID,
-                "TEAM_NAME": team.TEAM_NAME,
-                "TOTAL_WIN": team.TOTAL_WIN,
-                "TOTAL_LOSE": team.TOTAL_LOSE,
-                "TOTAL_DRAW": team.TOTAL_DRAW,
-                "WIN_RATE": round(win_rate, 2),
-                "RANK": 0,
-                "before_rank": None
-            })
-        return results
-    
-    # 최신 순위 정보 가져오기
-    latest_ratings = db.query(models.TeamRating).filter(
-        models.TeamRating.DATE == latest_date
-    ).all()
-    
-    # 팀별 최신 순위 정보 저장용 딕셔너리
-    team_rankings = {rating.TEAM_ID: rating.DAILY_RANKING for rating in latest_ratings}
-    
-    # 직전 날짜 찾기
-    before_date_query = db.query(func.max(models.TeamRating.DATE)).filter(
-        models.TeamRating.DATE < latest_date
-    )
-    before_date = before_date_query.scalar()
-    
-    # 직전 순위 정보 가져오기
-    before_rankings = {}
-    if before_date:
-        before_ratings = db.query(models.TeamRating).filter(
-            models.TeamRating.DATE == before_date
-        ).all()
-        before_rankings = {rating.TEAM_ID: rating.DAILY_RANKING for rating in before_ratings}
-    
-    # 팀 정보와 통계 구성
-    results = []
-    for team in teams:
-        total_games = team.TOTAL_WIN + team.TOTAL_LOSE + team.TOTAL_DRAW
-        win_rate = team.TOTAL_WIN / total_games * 100 if total_games > 0 else 0
-        
-        # 팀 순위 가져오기 (없을 경우 기본값 0으로 설정)
-        rank = team_rankings.get(team.TEAM_ID, 0)
-        
-        # 직전 순위 가져오기 (없을 경우 None으로 설정)
-        before_rank = before_rankings.get(team.TEAM_ID)
-        
-        results.append({
-            "TEAM_ID": team.TEAM_ID,
-            "TEAM_NAME": team.TEAM_NAME,
-            "TOTAL_WIN": team.TOTAL_WIN,
-            "TOTAL_LOSE": team.TOTAL_LOSE,
-            "TOTAL_DRAW": team.TOTAL_DRAW,
-            "WIN_RATE": round(win_rate, 2),
-            "RANK": rank,
-            "BEFORE_RANK": before_rank
-        })
-    
-    # team_rating 테이블 기준 순위로 정렬
-    results.sort(key=lambda x: x["RANK"])
-    
-    return results
\ No newline at end of file
+    """모든 팀 성적 조회 (순위 저장 시 미리 계산한 순위표: 순위, 직전 순위, 순위 변동 포함)"""
+    return get_team_ranking(db, skip, limit).records
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from typing import List, Optional
@@ -9,6 +9,9 @@ from database import get_db
 import models
 from router.game import game_schema, game_crud
 from router.user.user_router import get_current_user
+from utils.game_context import get_team_game_contexts
+from utils.team_ranking import get_team_ranking
+from router.saving_rule.saving_rule_cache import etag_matches
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -416,82 +419,33 @@ async def get_user_team_game_results(
         if end_date is None:
             end_date = datetime.now().date() - timedelta(days=1)
         
-         # 4. 모든 과거 경기 일정 조회 (start_date 제한 없음)
-        game_schedules = db.query(models.GameSchedule).filter(
-            ((models.GameSchedule.HOME_TEAM_ID == team_id) | 
-             (models.GameSchedule.AWAY_TEAM_ID == team_id)),
-            models.GameSchedule.DATE <= end_date
-        ).order_by(models.GameSchedule.DATE.desc()).all()
-
+        # 4. 모든 과거 경기 정보 조회 (start_date 제한 없음, 팀별 경기 정보)
+        team_games = get_team_game_contexts(db, team_id, end_date)
+        team_names = {t.TEAM_ID: t.TEAM_NAME for t in db.query(models.Team.TEAM_ID, models.Team.TEAM_NAME).all()}
         
-        # 5. 경기 결과 조회
+        # 5. 경기 결과 구성
         results = []
         
-        for schedule in game_schedules:
+        for team_game in team_games:
             # 경기 날짜
-            game_date = schedule.DATE
+            game_date = team_game.DATE
             
-            # 홈/원정 여부 (수정된 부분: 반대로 설정되어 있던 것을 수정)
-            # team_id가 HOME_TEAM_ID와 같으면 홈팀이 맞음
-            is_home = schedule.HOME_TEAM_ID == team_id
+            # 홈/원정 여부
+            is_home = team_game.IS_HOME
             
             # 상대팀 정보
-            opponent_team_id = schedule.AWAY_TEAM_ID if is_home else schedule.HOME_TEAM_ID
-            opponent_team = db.query(models.Team).filter(models.Team.TEAM_ID == opponent_team_id).first()
-            opponent_team_name = opponent_team.TEAM_NAME if opponent_team else f"Unknown Team ({opponent_team_id})"
-            
-            # 득점 기록 조회 (RECORD_TYPE_ID = 6은 득점을 의미)
-            team_score_log = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == team_id,
-                models.GameLog.RECORD_TYPE_ID == 6  # 득점
-            ).first()
-            
-            opponent_score_log = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == opponent_team_id,
-                models.GameLog.RECORD_TYPE_ID == 6  # 득점
-            ).first()
-            
-            # 승리 기록 조회 (RECORD_TYPE_ID = 1은 승리를 의미)
-            team_win_log = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == team_id,
-                models.GameLog.RECORD_TYPE_ID == 1  # 승리
-            ).first()
+            opponent_team_id = team_game.OPPONENT_TEAM_ID
+            opponent_team_name = team_names.get(opponent_team_id, f"Unknown Team ({opponent_team_id})")
             
-            # 경기 취소 여부 확인 (양 팀 모두 게임 로그가 없는 경우)
-            team_any_log = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == team_id
-            ).first()
-            
-            opponent_any_log = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == opponent_team_id
-            ).first()
+            # 승/패/무/취소 결과
+            game_result = team_game.RESULT
             
             # 게임 로그가 전혀 없으면 취소된 경기로 처리
-            if not team_any_log and not opponent_any_log:
-                game_result = "취소"
+            if team_game.CANCELLED:
                 score = "취소된 경기"
             else:
-                # 팀과 상대팀의 실제 점수
-                team_score = team_score_log.COUNT if team_score_log else 0
-                opponent_score = opponent_score_log.COUNT if opponent_score_log else 0
-                
-                # 승/패/무 결과 조회
-                if team_win_log:
-                    game_result = "승리"
-                elif team_score > opponent_score:
-                    game_result = "승리"
-                elif team_score < opponent_score:
-                    game_result = "패배"
-                else:
-                    game_result = "무승부"
-                
                 # 실제 점수 구성
-                score = f"{team_score}-{opponent_score}"
+                score = f"{team_game.RUNS}-{team_game.OPPONENT_RUNS}"
             
             # 경기 결과 추가
             results.append(game_schema.GameResultResponse(
@@ -555,14 +509,25 @@ async def get_team_record(
 async def get_team_rankings(
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
+    """
+    순위 저장 작업에서 미리 계산한 순위표(순위 변동 포함)를 조회합니다.
+    직렬화된 응답을 캐시하고 ETag로 재검증합니다. (X-Ranking-Version: 순위표 버전)
+    """
     try:
         logger.info(f"모든 팀 전적 조회 (순위표): skip={skip}, limit={limit}")
         
-        rankings = game_crud.get_all_team_records(db, skip, limit)
+        ranking = get_team_ranking(db, skip, limit)
+        
+        headers = {"ETag": ranking.etag, "Cache-Control": "no-cache", "X-Ranking-Version": str(ranking.version)}
+        if ranking.rank_date:
+            headers["X-Ranking-Date"] = ranking.rank_date.isoformat()
+        if etag_matches(if_none_match, ranking.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         
-        return rankings
+        return Response(content=ranking.body, media_type="application/json", headers=headers)
         
     except Exception as e:
         logger.error(f"팀 순위표 조회 중 오류: {str(e)}")
@@ -97,6 +97,7 @@ class GameResultResponse(GameResultBase):
 class TeamRecordResponse(BaseModel):
     RANK: int
     BEFORE_RANK: Optional[int] = None
+    RANK_CHANGE: Optional[int] = None  # 직전 순위 - 현재 순위 (양수면 상승)
     TEAM_ID: int
     TEAM_NAME: str
     TOTAL_WIN: int
@@ -1,10 +1,18 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
+import json
+import logging
 from typing import Optional, List, Dict, Any
 
 import models
 from router.mission.mission_schema import MissionCreate, MissionUpdate, UsedMissionCreate, UsedMissionUpdate
 
+logger = logging.getLogger(__name__)
+
+# 이자율 스냅샷 저장 시도 횟수 (동시 생성으로 충돌하면 저장된 스냅샷을 잠금 조회해 다시 저장)
+SNAPSHOT_WRITE_ATTEMPTS = 2
+
 def get_mission_by_id(db: Session, mission_id: int):
     """미션 ID로 미션 정보 조회"""
     return db.query(models.Mission).filter(models.Mission.MISSION_ID == mission_id).first()
@@ -226,50 +234,182 @@ def calculate_account_interest_rate(db: Session, account_id: int):
     
 #     return account
 
-def calculate_account_interest_details(db: Session, account_id: int):
+def _calculate_interest_rates(db: Session, account_ids):
     """
-    계정의 기본 이자율과 미션으로 인한 추가 이자율 계산
+    계정들의 기본 금리와 미션 우대 금리를 계산합니다 (저장하지 않음).
+    계정, 사용 미션(+미션) 정보를 각각 한 번의 쿼리로 읽습니다.
     
     Args:
         db (Session): 데이터베이스 세션
-        account_id (int): 계정 ID
+        account_ids (iterable): 계정 ID 목록
     
     Returns:
-        dict: 기본 이자율, 미션의 이자율 정보
+        dict: 계정 ID -> 스냅샷 칼럼 값 (존재하지 않는 계정은 제외)
     """
-    # 계정 정보 조회
-    account = db.query(models.Account).filter(models.Account.ACCOUNT_ID == account_id).first()
-    if not account:
-        return None
-    
-    # 모든 사용자 미션 조회 (진행 중 또는 완료된 미션)
-    used_missions = db.query(models.UsedMission).filter(
-        models.UsedMission.ACCOUNT_ID == account_id
-    ).all()
+    base_rates = dict(db.query(models.Account.ACCOUNT_ID, models.Account.INTEREST_RATE).filter(
+        models.Account.ACCOUNT_ID.in_(account_ids)
+    ).all())
     
     # 미션 이자율 계산 (count와 mission_rate를 곱한 값의 합)
-    mission_details = []
-    total_mission_rate = 0
-    
-    for used_mission in used_missions:
-        mission = used_mission.mission
-        
+    mission_details = {account_id: [] for account_id in base_rates}
+    rows = db.query(models.UsedMission, models.Mission).join(
+        models.Mission, models.Mission.MISSION_ID == models.UsedMission.MISSION_ID
+    ).filter(
+        models.UsedMission.ACCOUNT_ID.in_(base_rates.keys())
+    ).order_by(models.UsedMission.USED_MISSION_ID).all()
+    
+    for used_mission, mission in rows:
         # 실제 추가될 이자율 계산 (count * mission_rate)
         additional_rate = min(used_mission.COUNT, used_mission.MAX_COUNT) * mission.MISSION_RATE
-        
-        mission_details.append({
+        mission_details[used_mission.ACCOUNT_ID].append({
             "MISSION_ID": mission.MISSION_ID,
             "MISSION_NAME": mission.MISSION_NAME,
             "MISSION_MAX_COUNT": mission.MISSION_MAX_COUNT,
             "MISSION_RATE": mission.MISSION_RATE,
             "CURRENT_COUNT": used_mission.COUNT,
+            "MAX_COUNT": used_mission.MAX_COUNT,
             "ADDITIONAL_RATE": additional_rate
         })
-        
-        total_mission_rate += additional_rate
+    
+    rates = {}
+    for account_id, base_rate in base_rates.items():
+        base_rate = base_rate or 0
+        mission_rate = sum(detail["ADDITIONAL_RATE"] for detail in mission_details[account_id])
+        rates[account_id] = {
+            "BASE_INTEREST_RATE": base_rate,
+            "MISSION_INTEREST_RATE": mission_rate,
+            "TOTAL_INTEREST_RATE": base_rate + mission_rate,
+            "MISSION_DETAILS": json.dumps(mission_details[account_id], ensure_ascii=False)
+        }
+    return rates
+
+def refresh_account_interest_snapshots(db: Session, account_ids):
+    """
+    계정들의 이자율 스냅샷(기본 금리 + 미션 우대 금리)을 한 번에 다시 계산해 저장합니다.
+    savepoint 안에서 flush만 하므로 커밋(또는 롤백)은 호출한 쪽에서 합니다.
+    
+    Args:
+        db (Session): 데이터베이스 세션
+        account_ids (iterable): 계정 ID 목록
+    
+    Returns:
+        dict: 계정 ID -> AccountInterestRate
+    """
+    account_ids = set(account_ids)
+    if not account_ids:
+        return {}
+    
+    rates = _calculate_interest_rates(db, account_ids)
+    
+    def load_snapshots(for_update=False):
+        query = db.query(models.AccountInterestRate).filter(
+            models.AccountInterestRate.ACCOUNT_ID.in_(rates.keys())
+        )
+        # 재시도 시에는 다른 트랜잭션이 먼저 만든 스냅샷까지 보이도록 잠금 조회
+        if for_update:
+            query = query.with_for_update()
+        return {snapshot.ACCOUNT_ID: snapshot for snapshot in query.all()}
+    
+    # 호출한 쪽의 트랜잭션은 그대로 두고 savepoint 안에서만 저장 (커밋은 호출한 쪽에서)
+    for attempt in range(SNAPSHOT_WRITE_ATTEMPTS):
+        try:
+            with db.begin_nested():
+                snapshots = load_snapshots(for_update=attempt > 0)
+                
+                for account_id, values in rates.items():
+                    snapshot = snapshots.get(account_id)
+                    if snapshot is None:
+                        snapshot = models.AccountInterestRate(ACCOUNT_ID=account_id, VERSION=1)
+                        db.add(snapshot)
+                        snapshots[account_id] = snapshot
+                    else:
+                        snapshot.VERSION = (snapshot.VERSION or 0) + 1
+                    
+                    for column, value in values.items():
+                        setattr(snapshot, column, value)
+                    snapshot.STALE = False
+                
+                db.flush()
+            return snapshots
+        except IntegrityError:
+            # 다른 요청이 같은 계정의 스냅샷을 먼저 만든 경우: savepoint만 되돌리고 저장된 스냅샷을 갱신
+            logger.info(f"이자율 스냅샷 동시 생성 감지, 저장된 값으로 다시 시도: 계정 {sorted(rates.keys())}")
+    
+    # 재시도까지 실패하면 저장된 값을 사용
+    return load_snapshots(for_update=True)
+
+def get_account_interest_snapshots(db: Session, account_ids, persist=True):
+    """
+    계정들의 이자율 스냅샷을 한 번에 조회합니다.
+    스냅샷이 없거나 STALE로 표시된 계정만 모아서 다시 계산합니다.
+    다시 계산한 스냅샷은 호출한 쪽에서 커밋해야 저장됩니다.
+    
+    Args:
+        db (Session): 데이터베이스 세션
+        account_ids (iterable): 계정 ID 목록
+        persist (bool, optional): False면 다시 계산한 값을 세션에 넣지 않고 응답용 객체로만 반환
+            (조회 API용, 저장은 쓰기 경로와 배치에서). 기본값은 True.
+    
+    Returns:
+        dict: 계정 ID -> AccountInterestRate (존재하지 않는 계정은 제외)
+    """
+    account_ids = set(account_ids)
+    if not account_ids:
+        return {}
+    
+    def load_snapshots():
+        return {
+            snapshot.ACCOUNT_ID: snapshot
+            for snapshot in db.query(models.AccountInterestRate).filter(
+                models.AccountInterestRate.ACCOUNT_ID.in_(account_ids)
+            ).all()
+        }
+    
+    snapshots = load_snapshots()
+    
+    refresh_ids = [
+        account_id for account_id in account_ids
+        if account_id not in snapshots or snapshots[account_id].STALE
+    ]
+    if refresh_ids and persist:
+        snapshots.update(refresh_account_interest_snapshots(db, refresh_ids))
+    elif refresh_ids:
+        # 저장된 스냅샷은 건드리지 않고 세션에 속하지 않은 객체로 계산 결과만 반환
+        for account_id, values in _calculate_interest_rates(db, refresh_ids).items():
+            stored = snapshots.get(account_id)
+            snapshots[account_id] = models.AccountInterestRate(
+                ACCOUNT_ID=account_id,
+                VERSION=(stored.VERSION or 0) + 1 if stored else 1,
+                STALE=False,
+                **values
+            )
+    
+    return snapshots
+
+def get_snapshot_mission_details(snapshot):
+    """스냅샷에 저장된 미션별 적용 내역(JSON)을 목록으로 반환"""
+    if snapshot is None or not snapshot.MISSION_DETAILS:
+        return []
+    return json.loads(snapshot.MISSION_DETAILS)
+
+def calculate_account_interest_details(db: Session, account_id: int):
+    """
+    계정의 기본 이자율과 미션으로 인한 추가 이자율 계산
+    (이자율 스냅샷을 읽고, 미션/기본 금리가 바뀐 경우에만 다시 계산)
+    
+    Args:
+        db (Session): 데이터베이스 세션
+        account_id (int): 계정 ID
+    
+    Returns:
+        dict: 기본 이자율, 미션의 이자율 정보
+    """
+    snapshot = get_account_interest_snapshots(db, [account_id]).get(account_id)
+    if not snapshot:
+        return None
     
     return {
-        'base_interest_rate': account.INTEREST_RATE,
-        'mission_interest_rate': total_mission_rate,
-        'total_interest_rate': account.INTEREST_RATE+total_mission_rate,
+        'base_interest_rate': snapshot.BASE_INTEREST_RATE,
+        'mission_interest_rate': snapshot.MISSION_INTEREST_RATE,
+        'total_interest_rate': snapshot.TOTAL_INTEREST_RATE,
     }
@@ -7,16 +7,12 @@ import logging
 from database import get_db
 import models
 import os
-import io
-import tempfile
-from PIL import Image
-import utils.ticket_certificate as ticket_ocr
-from router.mission import mission_schema, mission_crud
+from router.mission import mission_schema, mission_crud, ticket_registry
 from router.user.user_router import get_current_user
 from datetime import datetime
 
 # OCR 모듈 import
-from utils.ticket_certificate import decode_qr_and_barcodes, clova_ocr
+from utils.ticket_ocr_pipeline import read_ticket_number
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -222,134 +218,122 @@ async def check_ocr(
                 content={"success": False, "error": f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}", "text": ""}
             )
         
-        # 임시 파일에 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-            temp_file_path = temp_file.name
-            contents = await file.read()
-            temp_file.write(contents)
+        contents = await file.read()
         
-        try:
-            # OCR 모듈을 이용해 티켓 번호 읽기
-            # 먼저 QR 코드/바코드 검사 시도
-            ticket_number = decode_qr_and_barcodes(temp_file_path)
-            
-            # QR/바코드 인식 실패 시 Clova OCR 시도
-            if not ticket_number:
-                ticket_number = clova_ocr(temp_file_path)
-            
-            # 티켓 번호를 찾지 못한 경우
-            if not ticket_number:
-                logger.warning("티켓 번호를 인식할 수 없음")
-                return mission_schema.OCRResponse(
-                    success=False,
-                    text="",
-                    error="티켓 번호를 인식할 수 없습니다."
-                )
-            
-            # DB에 있는 티켓인지 검증
-            ticket = db.query(models.TicketNumber).filter(
-                models.TicketNumber.TICKET_NUMBER == ticket_number
-            ).first()
-            
-            if not ticket:
-                logger.warning(f"유효하지 않은 티켓 번호: {ticket_number}")
-                return mission_schema.OCRResponse(
-                    success=False,
-                    text=ticket_number,
-                    error="유효하지 않은 티켓 번호입니다."
-                )
-            
-            # 이미 사용된 티켓인지 확인 (ACCOUNT_ID가 NULL이 아닌 경우)
-            if ticket.ACCOUNT_ID is not None:
-                logger.warning(f"이미 사용된 티켓: {ticket_number}")
-                return mission_schema.OCRResponse(
-                    success=False,
-                    text=ticket_number,
-                    error="이미 사용된 티켓입니다."
-                )
-            
-            # 사용자의 계정 정보 조회
-            account = db.query(models.Account).filter(
-                models.Account.USER_ID == current_user.USER_ID
-            ).first()
-            
-            if not account:
-                logger.warning(f"사용자에게 연결된 계정이 없음: 사용자 ID {current_user.USER_ID}")
-                return mission_schema.OCRResponse(
-                    success=False,
-                    text=ticket_number,
-                    error="계정 정보를 찾을 수 없습니다."
-                )
-            
-            # 티켓에 계정 연결
-            ticket.ACCOUNT_ID = account.ACCOUNT_ID
-            ticket.VERIFIED_STATUS = True
-            
-            # 입장권 인증 미션 찾기 (미션 이름 "직관 인증시 우대금리")
-            mission = db.query(models.Mission).filter(
-                models.Mission.MISSION_NAME == "직관 인증시 우대금리"
-            ).first()
-            
-            if not mission:
-                logger.warning("직관 인증 미션 정보를 찾을 수 없음")
-                db.commit()  # 티켓 상태는 업데이트
-                return mission_schema.OCRResponse(
-                    success=True,
-                    text=ticket_number,
-                    error="티켓은 인증되었으나, 해당 미션을 찾을 수 없습니다."
-                )
-            
-            # 이미 등록된 미션인지 확인
-            used_mission = mission_crud.get_used_mission(db, account.ACCOUNT_ID, mission.MISSION_ID)
-            
+        # OCR 모듈을 이용해 티켓 번호 읽기
+        # 임시 파일 없이 메모리에서 QR 코드/바코드 디코딩(프로세스 풀) 후, 실패 시 Clova OCR 비동기 호출
+        ticket_number = await read_ticket_number(contents, file_ext.lstrip("."))
+        
+        # 티켓 번호를 찾지 못한 경우
+        if not ticket_number:
+            logger.warning("티켓 번호를 인식할 수 없음")
+            return mission_schema.OCRResponse(
+                success=False,
+                text="",
+                error="티켓 번호를 인식할 수 없습니다."
+            )
+        
+        # 메모리의 티켓 번호 목록으로 이미 사용된 티켓만 DB 조회 없이 먼저 거름
+        # (목록에 없는 티켓은 목록을 읽은 뒤 추가됐을 수 있으므로 아래 claim_ticket에서 DB로 확인)
+        ticket_status = ticket_registry.lookup_ticket(db, ticket_number)
+        
+        # 이미 사용된 티켓인지 확인 (ACCOUNT_ID가 NULL이 아닌 경우)
+        if ticket_status == ticket_registry.TICKET_CLAIMED:
+            logger.warning(f"이미 사용된 티켓: {ticket_number}")
+            return mission_schema.OCRResponse(
+                success=False,
+                text=ticket_number,
+                error="이미 사용된 티켓입니다."
+            )
+        
+        # 사용자의 계정 정보 조회
+        account = db.query(models.Account).filter(
+            models.Account.USER_ID == current_user.USER_ID
+        ).first()
+        
+        if not account:
+            logger.warning(f"사용자에게 연결된 계정이 없음: 사용자 ID {current_user.USER_ID}")
+            return mission_schema.OCRResponse(
+                success=False,
+                text=ticket_number,
+                error="계정 정보를 찾을 수 없습니다."
+            )
+        
+        # 티켓에 계정 연결 (ACCOUNT_ID가 NULL인 경우에만 갱신하는 하나의 UPDATE 문으로 검증과 인증을 함께 처리)
+        claim_status = ticket_registry.claim_ticket(db, ticket_number, account.ACCOUNT_ID)
+        
+        if claim_status != ticket_registry.TICKET_AVAILABLE:
+            db.rollback()
+            logger.warning(f"티켓 인증 실패({claim_status}): {ticket_number}")
+            return mission_schema.OCRResponse(
+                success=False,
+                text=ticket_number,
+                error="이미 사용된 티켓입니다." if claim_status == ticket_registry.TICKET_CLAIMED else "유효하지 않은 티켓 번호입니다."
+            )
+        
+        # 입장권 인증 미션 찾기 (미션 이름 "직관 인증시 우대금리")
+        mission = db.query(models.Mission).filter(
+            models.Mission.MISSION_NAME == "직관 인증시 우대금리"
+        ).first()
+        
+        if not mission:
+            logger.warning("직관 인증 미션 정보를 찾을 수 없음")
+            db.commit()  # 티켓 상태는 업데이트
+            ticket_registry.mark_ticket_claimed(ticket_number)
+            return mission_schema.OCRResponse(
+                success=True,
+                text=ticket_number,
+                error="티켓은 인증되었으나, 해당 미션을 찾을 수 없습니다."
+            )
+        
+        # 이미 등록된 미션인지 확인
+        used_mission = mission_crud.get_used_mission(db, account.ACCOUNT_ID, mission.MISSION_ID)
+        
+        if not used_mission:
+            # 미션이 등록되어 있지 않으면 자동 등록
+            used_mission_data = mission_schema.UsedMissionCreate(
+                ACCOUNT_ID=account.ACCOUNT_ID,
+                MISSION_ID=mission.MISSION_ID,
+                COUNT=0
+            )
+            used_mission = mission_crud.create_used_mission(db, used_mission_data)
             if not used_mission:
-                # 미션이 등록되어 있지 않으면 자동 등록
-                used_mission_data = mission_schema.UsedMissionCreate(
-                    ACCOUNT_ID=account.ACCOUNT_ID,
-                    MISSION_ID=mission.MISSION_ID,
-                    COUNT=0
-                )
-                used_mission = mission_crud.create_used_mission(db, used_mission_data)
-                if not used_mission:
-                    logger.error("미션 등록 중 오류 발생")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="미션 등록 중 오류가 발생했습니다"
-                    )
-            
-            # 카운트가 최대치에 도달했는지 확인
-            if used_mission.COUNT >= used_mission.MAX_COUNT:
-                # 티켓 상태는 업데이트하지만 미션 카운트는 증가시키지 않음
-                db.commit()
-                logger.warning(f"미션 최대 횟수({used_mission.MAX_COUNT}) 도달: 계정 ID {account.ACCOUNT_ID}")
-                return mission_schema.OCRResponse(
-                    success=True,
-                    text=ticket_number,
-                    error=f"티켓은 인증되었으나, 미션 최대 적용 횟수({used_mission.MAX_COUNT}회)에 도달하여 금리가 추가 적용되지 않았습니다."
+                logger.error("미션 등록 중 오류 발생")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="미션 등록 중 오류가 발생했습니다"
                 )
-            
-            # 미션 카운트 증가
-            used_mission.COUNT += 1
-            
-            # 변경사항 커밋
+        
+        # 카운트가 최대치에 도달했는지 확인
+        if used_mission.COUNT >= used_mission.MAX_COUNT:
+            # 티켓 상태는 업데이트하지만 미션 카운트는 증가시키지 않음
             db.commit()
-            
-            # 이전에 호출하던 이자율 업데이트 함수 대신, 이자 재계산 함수 호출
-            from utils.interest_utils import recalculate_interest_history
-            await recalculate_interest_history(db,account.ACCOUNT_ID)
-            
-            # 성공 응답
-            logger.info(f"티켓 인증 및 미션 적용 성공: 계정 ID {account.ACCOUNT_ID}, 티켓 번호 {ticket_number}")
+            ticket_registry.mark_ticket_claimed(ticket_number)
+            logger.warning(f"미션 최대 횟수({used_mission.MAX_COUNT}) 도달: 계정 ID {account.ACCOUNT_ID}")
             return mission_schema.OCRResponse(
                 success=True,
                 text=ticket_number,
-                error=None
+                error=f"티켓은 인증되었으나, 미션 최대 적용 횟수({used_mission.MAX_COUNT}회)에 도달하여 금리가 추가 적용되지 않았습니다."
             )
-                
-        finally:
-            # 임시 파일 삭제
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        
+        # 미션 카운트 증가
+        used_mission.COUNT += 1
+        
+        # 변경사항 커밋
+        db.commit()
+        ticket_registry.mark_ticket_claimed(ticket_number)
+        
+        # 이전에 호출하던 이자율 업데이트 함수 대신, 이자 재계산 함수 호출
+        from utils.interest_utils import recalculate_interest_history
+        await recalculate_interest_history(db,account.ACCOUNT_ID)
+        
+        # 성공 응답
+        logger.info(f"티켓 인증 및 미션 적용 성공: 계정 ID {account.ACCOUNT_ID}, 티켓 번호 {ticket_number}")
+        return mission_schema.OCRResponse(
+            success=True,
+            text=ticket_number,
+            error=None
+        )
         
     except Exception as e:
         logger.error(f"OCR 처리 중 오류 발생: {str(e)}")
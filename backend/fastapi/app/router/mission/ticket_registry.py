@@ -0,0 +1,128 @@
+import os
+import time
+import logging
+import threading
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# 티켓 번호 목록 유지 시간(초). 다른 프로세스/스크립트에서 티켓을 추가하거나 인증한 경우를 위한 안전장치
+TICKET_REGISTRY_TTL = int(os.getenv("TICKET_REGISTRY_TTL", "300"))
+
+# 티켓 번호 조회 결과
+TICKET_UNKNOWN = "unknown"      # 등록되지 않은 티켓
+TICKET_CLAIMED = "claimed"      # 이미 인증(사용)된 티켓
+TICKET_AVAILABLE = "available"  # 인증 가능한 티켓
+
+_lock = threading.Lock()
+_known = set()      # 등록된 전체 티켓 번호
+_claimed = set()    # 이미 인증된 티켓 번호
+_loaded_at = None   # 마지막으로 DB에서 읽은 시각 (None이면 아직 읽지 않음)
+
+
+def warm_ticket_registry(db: Session):
+    """
+    티켓 번호와 인증 여부를 한 번에 읽어 메모리에 올립니다. (서버 시작 시, 유지 시간이 지난 뒤 첫 조회 시)
+
+    Returns:
+        int: 읽은 티켓 수
+    """
+    global _known, _claimed, _loaded_at
+
+    rows = db.query(models.TicketNumber.TICKET_NUMBER, models.TicketNumber.ACCOUNT_ID).filter(
+        models.TicketNumber.TICKET_NUMBER.isnot(None)
+    ).all()
+
+    known = {row.TICKET_NUMBER for row in rows}
+    claimed = {row.TICKET_NUMBER for row in rows if row.ACCOUNT_ID is not None}
+
+    with _lock:
+        _known, _claimed = known, claimed
+        _loaded_at = time.monotonic()
+
+    logger.info(f"티켓 번호 목록 로드: 전체 {len(known)}건, 인증 {len(claimed)}건")
+    return len(known)
+
+
+def invalidate_ticket_registry():
+    """티켓을 DB에 직접 추가/초기화한 뒤 호출하면 다음 조회 때 다시 읽습니다."""
+    global _loaded_at
+    with _lock:
+        _loaded_at = None
+
+
+def lookup_ticket(db: Session, ticket_number):
+    """
+    메모리의 티켓 번호 목록으로 티켓 상태를 확인합니다. DB 조회 없이 이미 인증된 티켓을 바로 거를 수 있습니다.
+    TICKET_UNKNOWN은 목록을 읽은 뒤 추가된 티켓일 수 있으므로 거절 근거로 쓰지 말고 claim_ticket으로 확인합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 (목록이 없거나 오래된 경우 다시 읽는 데 사용)
+        ticket_number (str): 티켓 번호
+
+    Returns:
+        str: TICKET_UNKNOWN, TICKET_CLAIMED, TICKET_AVAILABLE 중 하나
+    """
+    with _lock:
+        expired = _loaded_at is None or time.monotonic() - _loaded_at >= TICKET_REGISTRY_TTL
+
+    if expired:
+        warm_ticket_registry(db)
+
+    with _lock:
+        if ticket_number in _claimed:
+            return TICKET_CLAIMED
+        if ticket_number in _known:
+            return TICKET_AVAILABLE
+        return TICKET_UNKNOWN
+
+
+def claim_ticket(db: Session, ticket_number, account_id):
+    """
+    아직 인증되지 않은 티켓에 계정을 연결합니다. 검증과 인증 처리를 하나의 UPDATE 문으로 처리해
+    동시에 같은 티켓을 인증하더라도 한 요청만 성공합니다. (커밋은 호출하는 쪽에서)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        ticket_number (str): 티켓 번호
+        account_id (int): 인증하는 계정 ID
+
+    Returns:
+        str: 인증에 성공하면 TICKET_AVAILABLE, 실패하면 실패 원인(TICKET_UNKNOWN 또는 TICKET_CLAIMED)
+    """
+    result = db.execute(
+        update(models.TicketNumber)
+        .where(
+            models.TicketNumber.TICKET_NUMBER == ticket_number,
+            models.TicketNumber.ACCOUNT_ID.is_(None)
+        )
+        .values(ACCOUNT_ID=account_id, VERIFIED_STATUS=True)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 1:
+        return TICKET_AVAILABLE
+
+    # 실패한 경우에만 원인 확인 (다른 프로세스에서 먼저 인증했거나 목록에 늦게 반영된 티켓)
+    exists = db.query(models.TicketNumber.TICKET_NUMBER_ID).filter(
+        models.TicketNumber.TICKET_NUMBER == ticket_number
+    ).first() is not None
+
+    with _lock:
+        if exists:
+            _known.add(ticket_number)
+            _claimed.add(ticket_number)
+        else:
+            _known.discard(ticket_number)
+
+    return TICKET_CLAIMED if exists else TICKET_UNKNOWN
+
+
+def mark_ticket_claimed(ticket_number):
+    """인증 처리가 커밋된 티켓을 메모리 목록에 반영합니다."""
+    with _lock:
+        _known.add(ticket_number)
+        _claimed.add(ticket_number)
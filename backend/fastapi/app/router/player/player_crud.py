@@ -4,6 +4,8 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 
 import models
+from utils.pagination import keyset_paginate
+from utils.loader_profiles import apply_loader_profile
 from router.player.player_schema import PlayerCreate, PlayerUpdate, PlayerRecordCreate, DailyReportCreate
 
 def get_player_by_id(db: Session, player_id: int):
@@ -100,6 +102,18 @@ def get_player_records(db: Session, player_id: int, start_date: Optional[date] =
     
     return query.order_by(models.PlayerRecord.DATE.desc()).all()
 
+def get_player_records_page(db: Session, player_id: int, cursor=None, limit=None, since=None, until=None, loader_profile: Optional[str] = None):
+    """선수의 기록을 최신순 (날짜, ID) 키셋 페이지로 조회 (loader_profile을 주면 해당 관계를 함께 로딩)"""
+    query = db.query(models.PlayerRecord).filter(models.PlayerRecord.PLAYER_ID == player_id)
+    if loader_profile:
+        query = apply_loader_profile(query, loader_profile)
+    return keyset_paginate(
+        query,
+        models.PlayerRecord.DATE,
+        models.PlayerRecord.PLAYER_RECORD_ID,
+        cursor=cursor, limit=limit, since=since, until=until
+    )
+
 def get_player_records_by_team(db: Session, team_id: int, start_date: Optional[date] = None, end_date: Optional[date] = None):
     """팀 선수들의 기록 조회"""
     query = db.query(models.PlayerRecord).filter(models.PlayerRecord.TEAM_ID == team_id)
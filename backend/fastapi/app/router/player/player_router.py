@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime, timedelta
@@ -8,6 +8,7 @@ from database import get_db
 import models
 from router.player import player_schema, player_crud
 from router.user.user_router import get_current_user
+from utils.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -37,10 +38,28 @@ async def read_players(
 @router.get("/{player_id}/records", response_model=List[player_schema.PlayerRecordDetailResponse])
 async def read_player_records(
     player_id: int,
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
+    response: Response,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = Query(None, deprecated=True),
+    end_date: Optional[date] = Query(None, deprecated=True),
     db: Session = Depends(get_db)
 ):
+    """
+    선수 기록을 최신순으로 조회합니다.
+    
+    Args:
+        player_id (int): 선수 ID
+        since (date, optional): 조회 시작 날짜 (start_date 대체)
+        until (date, optional): 조회 종료 날짜 (end_date 대체)
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[PlayerRecordDetailResponse]: 선수 기록 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"선수 기록 조회: 선수 ID {player_id}")
         
@@ -53,13 +72,19 @@ async def read_player_records(
                 detail="존재하지 않는 선수입니다"
             )
             
-        records = player_crud.get_player_records(db, player_id, start_date, end_date)
+        # 팀, 기록 유형을 함께 로딩
+        records, next_cursor = player_crud.get_player_records_page(
+            db, player_id, cursor=cursor, limit=limit, since=since or start_date, until=until or end_date,
+            loader_profile="player_record_detail"
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         
         # 선수 이름, 팀 이름, 기록 유형 이름 추가
         result = []
         for record in records:
-            team = db.query(models.Team).filter(models.Team.TEAM_ID == record.TEAM_ID).first()
-            record_type = db.query(models.RecordType).filter(models.RecordType.RECORD_TYPE_ID == record.RECORD_TYPE_ID).first()
+            team = record.team
+            record_type = record.record_type
             
             record_dict = {
                 "PLAYER_RECORD_ID": record.PLAYER_RECORD_ID,
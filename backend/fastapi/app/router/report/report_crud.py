@@ -4,6 +4,8 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 
 import models
+from utils.pagination import keyset_paginate
+from utils.team_aggregate import get_team_account_summary
 from router.report.report_schema import (
     DailyReportCreate, WeeklyReportTeamCreate, 
     WeeklyReportPersonalCreate, NewsCreate
@@ -323,15 +325,8 @@ def get_team_report_summary(db: Session, team_id: int):
         models.WeeklyReportTeam.DATE.desc()
     ).all()
     
-    # 팀 소속 계정 수
-    account_count = db.query(func.count(models.Account.ACCOUNT_ID)).filter(
-        models.Account.TEAM_ID == team_id
-    ).scalar()
-    
-    # 팀 소속 계정 총 금액
-    total_amount = db.query(func.sum(models.Account.TOTAL_AMOUNT)).filter(
-        models.Account.TEAM_ID == team_id
-    ).scalar() or 0
+    # 팀 소속 계정 수, 총 금액 (팀별 집계 테이블)
+    account_count, total_amount = get_team_account_summary(db, team_id)
     
     # 팀 승률 계산
     total_games = team.TOTAL_WIN + team.TOTAL_LOSE + team.TOTAL_DRAW
@@ -368,6 +363,16 @@ def get_daily_balances_by_account(db: Session, account_id: int, start_date: Opti
     
     return query.order_by(models.DailyBalances.DATE).all()
 
+def get_daily_balances_page(db: Session, account_id: int, cursor=None, limit=None, since=None, until=None):
+    """계정의 일일 잔액 내역을 날짜순 (날짜, ID) 키셋 페이지로 조회"""
+    return keyset_paginate(
+        db.query(models.DailyBalances).filter(models.DailyBalances.ACCOUNT_ID == account_id),
+        models.DailyBalances.DATE,
+        models.DailyBalances.DAILY_BALANCES_ID,
+        cursor=cursor, limit=limit, since=since, until=until,
+        descending=False
+    )
+
 def calculate_interest_stats(db: Session, account_id: int):
     """계정의 이자 통계 계산"""
     # 일일 잔액 내역 조회
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Response
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional,Dict, Any
@@ -9,6 +9,11 @@ from database import get_db
 import models
 from router.report import report_schema, report_crud
 from router.user.user_router import get_current_user
+from utils.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from utils.loader_profiles import apply_loader_profile
+from utils.team_aggregate import get_team_account_summary
+from utils.bulk_upsert import chunked, upsert_rows
+from utils.game_context import get_game_context, count_team_results
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -799,11 +804,29 @@ async def get_team_report_summary(
 @router.get("/account/{account_id}/balances", response_model=List[report_schema.DailyBalancesResponse])
 async def get_account_daily_balances(
     account_id: int,
-    start_date: Optional[date] = None,
-    end_date: Optional[date] = None,
+    response: Response,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = Query(None, deprecated=True),
+    end_date: Optional[date] = Query(None, deprecated=True),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    """
+    계정의 일일 잔액 내역을 날짜순으로 조회합니다.
+    
+    Args:
+        account_id (int): 계정 ID
+        since (date, optional): 조회 시작 날짜 (start_date 대체)
+        until (date, optional): 조회 종료 날짜 (end_date 대체)
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[DailyBalancesResponse]: 일일 잔액 내역 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"계정 일일 잔액 내역 조회: 계정 ID {account_id}")
         
@@ -823,7 +846,11 @@ async def get_account_daily_balances(
                 detail="이 계정의 잔액 내역을 조회할 권한이 없습니다"
             )
             
-        balances = report_crud.get_daily_balances_by_account(db, account_id, start_date, end_date)
+        balances, next_cursor = report_crud.get_daily_balances_page(
+            db, account_id, cursor=cursor, limit=limit, since=since or start_date, until=until or end_date
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return balances
     except HTTPException:
         raise
@@ -936,34 +963,14 @@ async def update_news_summary(
             
             team_id = team.TEAM_ID
             
-            # 지난주의 팀 성적 계산
-            # 일반 기록(승/패/무)
-            team_win = db.query(func.count(models.GameLog.GAME_LOG_ID)).filter(
-                models.GameLog.TEAM_ID == team_id,
-                models.GameLog.RECORD_TYPE_ID == 1,  # 승리
-                models.GameLog.DATE >= last_week_monday,
-                models.GameLog.DATE <= last_week_sunday
-            ).scalar() or 0
-            
-            team_lose = db.query(func.count(models.GameLog.GAME_LOG_ID)).filter(
-                models.GameLog.TEAM_ID == team_id,
-                models.GameLog.RECORD_TYPE_ID == 2,  # 패배
-                models.GameLog.DATE >= last_week_monday,
-                models.GameLog.DATE <= last_week_sunday
-            ).scalar() or 0
-            
-            team_draw = db.query(func.count(models.GameLog.GAME_LOG_ID)).filter(
-                models.GameLog.TEAM_ID == team_id,
-                models.GameLog.RECORD_TYPE_ID == 3,  # 무승부
-                models.GameLog.DATE >= last_week_monday,
-                models.GameLog.DATE <= last_week_sunday
-            ).scalar() or 0
+            # 지난주의 팀 성적 계산 (팀별 경기 정보의 승/패/무)
+            team_results = count_team_results(db, team_id, last_week_monday, last_week_sunday)
+            team_win = team_results["승리"]
+            team_lose = team_results["패배"]
+            team_draw = team_results["무승부"]
             
-            # 팀 계정들의 총액 계산
-            team_amount = 0
-            accounts = db.query(models.Account).filter(models.Account.TEAM_ID == team_id).all()
-            if accounts:
-                team_amount = sum(account.TOTAL_AMOUNT for account in accounts)
+            # 팀 계정들의 총액 (팀별 집계 테이블)
+            _, team_amount = get_team_account_summary(db, team_id)
             
             # 해당 팀의 주간 보고서 조회 (없으면 생성)
             weekly_report = db.query(models.WeeklyReportTeam).filter(
@@ -1051,8 +1058,8 @@ async def get_all_system_accounts_summary(
         
         logger.info(f"시스템의 모든 계정에 대한 {game_date} 일일 요약 정보 조회 시작")
         
-        # 1. 시스템의 모든 계정 조회
-        accounts = db.query(models.Account).all()
+        # 1. 시스템의 모든 계정 조회 (사용자, 응원팀, 최애 선수, 적금 규칙을 함께 로딩)
+        accounts = apply_loader_profile(db.query(models.Account), "account_daily_summary").all()
         
         if not accounts:
             logger.warning("시스템에 계정이 없습니다.")
@@ -1061,27 +1068,32 @@ async def get_all_system_accounts_summary(
         # 2. 각 계정별 정보 구성
         result = {"accounts": {}}
         
+        # 해당 날짜의 팀별 경기 정보(상대팀)와 팀별 기록 (계정마다 조회하지 않도록 한 번만 조회)
+        game_context = get_game_context(db, game_date)
+        team_names = {t.TEAM_ID: t.TEAM_NAME for t in db.query(models.Team.TEAM_ID, models.Team.TEAM_NAME).all()}
+        team_logs = {}
+        for log in apply_loader_profile(db.query(models.GameLog), "game_log_with_record_type").filter(
+            models.GameLog.DATE == game_date
+        ).all():
+            team_logs.setdefault(log.TEAM_ID, []).append(log)
+        
         # 금융 API 유틸리티 import
         from router.user.user_ssafy_api_utils import get_account_balance
 
         for account in accounts:
             account_id = account.ACCOUNT_ID
             
-            # 팀 정보 조회
-            our_team = db.query(models.Team).filter(models.Team.TEAM_ID == account.TEAM_ID).first()
+            # 팀 정보
+            our_team = account.team
             if not our_team:
                 logger.warning(f"팀 ID {account.TEAM_ID}를 찾을 수 없습니다.")
                 continue
             
-            # 경기 일정 조회 (우리 팀이 참여한 경기)
-            game_schedule = db.query(models.GameSchedule).filter(
-                models.GameSchedule.DATE == game_date,
-                ((models.GameSchedule.HOME_TEAM_ID == account.TEAM_ID) | 
-                 (models.GameSchedule.AWAY_TEAM_ID == account.TEAM_ID))
-            ).first()
+            # 경기 정보 조회 (우리 팀이 참여한 경기)
+            team_game = game_context.get(account.TEAM_ID)
             
             # 경기가 없는 경우 처리
-            if not game_schedule:
+            if not team_game:
                 result["accounts"][str(account_id)] = {
                     "our_team": our_team.TEAM_NAME,
                     "opposing_team": None,
@@ -1094,49 +1106,35 @@ async def get_all_system_accounts_summary(
                 }
                 continue
             
-            # 상대팀 정보 조회
-            opposing_team_id = game_schedule.AWAY_TEAM_ID if game_schedule.HOME_TEAM_ID == account.TEAM_ID else game_schedule.HOME_TEAM_ID
-            opposing_team = db.query(models.Team).filter(models.Team.TEAM_ID == opposing_team_id).first()
+            # 상대팀 정보
+            opposing_team_id = team_game.OPPONENT_TEAM_ID
+            opposing_team_name = team_names.get(opposing_team_id)
             
-            # 최애 선수 정보 조회
-            favorite_player = None
-            if account.FAVORITE_PLAYER_ID:
-                favorite_player = db.query(models.Player).filter(models.Player.PLAYER_ID == account.FAVORITE_PLAYER_ID).first()
+            # 최애 선수 정보
+            favorite_player = account.favorite_player
             
-            # 적금 규칙 조회
-            user_saving_rules = db.query(models.UserSavingRule).filter(
-                models.UserSavingRule.ACCOUNT_ID == account_id
-            ).all()
+            # 적금 규칙
+            user_saving_rules = account.user_saving_rules
             
             # 적금 규칙 정보 구성 및 game_results 기본값 설정
             savings_rules = {}
             expected_records = {}  # 예상되는 기록 키 저장
             
             for rule in user_saving_rules:
-                # 규칙 유형 조회
-                rule_type = db.query(models.SavingRuleType).filter(
-                    models.SavingRuleType.SAVING_RULE_TYPE_ID == rule.SAVING_RULE_TYPE_ID
-                ).first()
-                
-                # 규칙 상세 조회
-                rule_detail = db.query(models.SavingRuleDetail).filter(
-                    models.SavingRuleDetail.SAVING_RULE_DETAIL_ID == rule.SAVING_RULE_DETAIL_ID
-                ).first()
+                # 규칙 유형, 규칙 상세
+                rule_type = rule.saving_rule_type
+                rule_detail = rule.saving_rule_detail
                 
                 if not rule_detail or not rule_type:
                     continue
                 
-                # 기록 유형 조회
-                saving_rule = db.query(models.SavingRuleList).filter(
-                    models.SavingRuleList.SAVING_RULE_ID == rule_detail.SAVING_RULE_ID
-                ).first()
+                # 기록 유형
+                saving_rule = rule_detail.saving_rule
                 
                 if not saving_rule:
                     continue
                     
-                record_type = db.query(models.RecordType).filter(
-                    models.RecordType.RECORD_TYPE_ID == saving_rule.RECORD_TYPE_ID
-                ).first()
+                record_type = saving_rule.record_type
                 
                 if not record_type:
                     continue
@@ -1150,8 +1148,8 @@ async def get_all_system_accounts_summary(
                     rule_name = f"상대팀_{record_type.RECORD_NAME}"
                     expected_records[rule_name] = 0  # 기본값 0으로 설정
                 elif rule.PLAYER_ID:
-                    # 선수 정보 조회
-                    player = db.query(models.Player).filter(models.Player.PLAYER_ID == rule.PLAYER_ID).first()
+                    # 선수 정보
+                    player = rule.player
                     if player and (favorite_player and player.PLAYER_ID == favorite_player.PLAYER_ID):
                         rule_name = f"선수_{record_type.RECORD_NAME}"
                         expected_records[rule_name] = 0  # 기본값 0으로 설정
@@ -1163,31 +1161,21 @@ async def get_all_system_accounts_summary(
             # 경기 결과 조회 (기본값은 이미 0으로 설정됨)
             game_results = expected_records.copy()
             
-            # 우리 팀 기록 조회
-            our_team_logs = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == account.TEAM_ID
-            ).all()
-            
-            # 상대 팀 기록 조회
-            opposing_team_logs = db.query(models.GameLog).filter(
-                models.GameLog.DATE == game_date,
-                models.GameLog.TEAM_ID == opposing_team_id
-            ).all()
+            # 우리 팀, 상대 팀 기록
+            our_team_logs = team_logs.get(account.TEAM_ID, [])
+            opposing_team_logs = team_logs.get(opposing_team_id, [])
             
-            # 최애 선수 기록 조회
+            # 최애 선수 기록 조회 (기록 유형 함께 로딩)
             favorite_player_records = []
             if favorite_player:
-                favorite_player_records = db.query(models.PlayerRecord).filter(
+                favorite_player_records = apply_loader_profile(db.query(models.PlayerRecord), "player_record_detail").filter(
                     models.PlayerRecord.DATE == game_date,
                     models.PlayerRecord.PLAYER_ID == favorite_player.PLAYER_ID
                 ).all()
             
             # 경기 결과 업데이트 (우리팀)
             for log in our_team_logs:
-                record_type = db.query(models.RecordType).filter(
-                    models.RecordType.RECORD_TYPE_ID == log.RECORD_TYPE_ID
-                ).first()
+                record_type = log.record_type
                 
                 if record_type:
                     key = f"우리팀_{record_type.RECORD_NAME}"
@@ -1196,9 +1184,7 @@ async def get_all_system_accounts_summary(
             
             # 경기 결과 업데이트 (상대팀)
             for log in opposing_team_logs:
-                record_type = db.query(models.RecordType).filter(
-                    models.RecordType.RECORD_TYPE_ID == log.RECORD_TYPE_ID
-                ).first()
+                record_type = log.record_type
                 
                 if record_type:
                     key = f"상대팀_{record_type.RECORD_NAME}"
@@ -1208,9 +1194,7 @@ async def get_all_system_accounts_summary(
             # 경기 결과 업데이트 (최애선수)
             if favorite_player:
                 for record in favorite_player_records:
-                    record_type = db.query(models.RecordType).filter(
-                        models.RecordType.RECORD_TYPE_ID == record.RECORD_TYPE_ID
-                    ).first()
+                    record_type = record.record_type
                     
                     if record_type:
                         key = f"선수_{record_type.RECORD_NAME}"
@@ -1271,7 +1255,7 @@ async def get_all_system_accounts_summary(
             # 계정별 정보 저장
             result["accounts"][str(account_id)] = {
                 "our_team": our_team.TEAM_NAME,
-                "opposing_team": opposing_team.TEAM_NAME if opposing_team else None,
+                "opposing_team": opposing_team_name,
                 "favorite_player": favorite_player.PLAYER_NAME if favorite_player else None,
                 "saving_goal":account.SAVING_GOAL,
                 "savings_rules": savings_rules,
@@ -1472,113 +1456,119 @@ async def create_weekly_personal_reports(
             "code": "NO_DATA"
         }])
     
-    successful_reports = []
+    reports = batch_report_data.reports
     error_reports = []
     
-    # 각 보고서 개별 처리 (각각 별도의 트랜잭션으로)
-    for i, report_data in enumerate(batch_report_data.reports):
-        # 새 트랜잭션 시작
+    # 1. 날짜 확인 및 변환 (보고서 날짜는 해당 주의 월요일로 조정)
+    parsed = []  # (index, account_id, 보고서 날짜, 보고서 내용)
+    for i, report_data in enumerate(reports):
         try:
-            logger.info(f"처리 중 {i+1}/{len(batch_report_data.reports)}: 계정 ID {report_data.account_id}")
-            
-            # 1. 계정 존재 확인
-            account = db.query(models.Account).filter(models.Account.ACCOUNT_ID == report_data.account_id).first()
-            if not account:
-                logger.warning(f"존재하지 않는 계정: {report_data.account_id}")
-                error_reports.append({
-                    "index": i,
-                    "account_id": report_data.account_id,
-                    "detail": "존재하지 않는 계정입니다",
-                    "code": "ACCOUNT_NOT_FOUND"
-                })
-                continue
-                
-            account_id = account.ACCOUNT_ID
-            
-            # 2. 보고서 날짜 확인 및 변환
-            try:
-                report_date = datetime.strptime(report_data.date, "%Y-%m-%d").date()
-            except ValueError as e:
-                logger.warning(f"날짜 형식 오류: {report_data.date}")
-                error_reports.append({
-                    "index": i,
-                    "account_id": report_data.account_id,
-                    "detail": f"날짜 형식 오류: {str(e)}",
-                    "code": "INVALID_DATE"
-                })
-                continue
-            
-            # 보고서 날짜가 월요일인지 확인하고, 월요일이 아니면 해당 주의 월요일로 조정
-            if report_date.weekday() != 0:  # 0은 월요일
-                # 해당 주의 월요일로 보고서 날짜 조정
-                report_date = report_date - timedelta(days=report_date.weekday())
-                logger.info(f"보고서 날짜를 해당 주의 월요일({report_date})로 조정")
-            
-            # 지난주의 월요일과 일요일 계산
-            previous_week_end = report_date - timedelta(days=1)  # 지난주 일요일
-            previous_week_start = previous_week_end - timedelta(days=6)  # 지난주 월요일
-            
-            logger.info(f"지난주 기간: {previous_week_start}(월) ~ {previous_week_end}(일)")
-            
-            # 3. 지난주의 송금 내역을 통한 weekly_amount 계산
-            weekly_amount = db.query(func.sum(models.DailyTransfer.AMOUNT)).filter(
-                models.DailyTransfer.ACCOUNT_ID == account_id,
-                models.DailyTransfer.DATE >= previous_week_start,
-                models.DailyTransfer.DATE <= previous_week_end
-            ).scalar() or 0
-            
-            logger.info(f"계정 ID {account_id}의 지난주 적금액: {weekly_amount}원")
-            
-            # 4. 이미 해당 날짜의 보고서가 있는지 확인
-            existing_report = db.query(models.WeeklyReportPersonal).filter(
-                models.WeeklyReportPersonal.ACCOUNT_ID == account_id,
-                models.WeeklyReportPersonal.DATE == report_date
-            ).first()
-            
-            # 개별 보고서에 대한 트랜잭션 시작
-            try:
-                if existing_report:
-                    # 이미 존재하는 보고서 업데이트
-                    existing_report.WEEKLY_AMOUNT = weekly_amount
-                    existing_report.LLM_CONTEXT = report_data.weekly_text
-                    db.commit()
-                    db.refresh(existing_report)
-                    
-                    logger.info(f"기존 주간 개인 보고서 업데이트: ID {existing_report.WEEKLY_PERSONAL_ID}, 지난주 적금액: {weekly_amount}원")
-                    successful_reports.append(existing_report)
-                else:
-                    # 새 보고서 생성
-                    new_report = models.WeeklyReportPersonal(
-                        ACCOUNT_ID=account_id,
-                        DATE=report_date,
-                        WEEKLY_AMOUNT=weekly_amount,
-                        LLM_CONTEXT=report_data.weekly_text
-                    )
-                    db.add(new_report)
-                    db.commit()
-                    db.refresh(new_report)
-                    
-                    logger.info(f"새 주간 개인 보고서 생성: ID {new_report.WEEKLY_PERSONAL_ID}, 지난주 적금액: {weekly_amount}원")
-                    successful_reports.append(new_report)
-            except Exception as tx_error:
-                # 개별 트랜잭션 오류 처리
-                db.rollback()
-                logger.error(f"DB 트랜잭션 오류 (계정 ID {report_data.account_id}): {str(tx_error)}")
+            report_date = datetime.strptime(report_data.date, "%Y-%m-%d").date()
+        except ValueError as e:
+            logger.warning(f"날짜 형식 오류: {report_data.date}")
+            error_reports.append({
+                "index": i,
+                "account_id": report_data.account_id,
+                "detail": f"날짜 형식 오류: {str(e)}",
+                "code": "INVALID_DATE"
+            })
+            continue
+        report_date = report_date - timedelta(days=report_date.weekday())
+        parsed.append((i, report_data.account_id, report_date, report_data.weekly_text))
+    
+    # 2. 계정 존재 확인 (한 번에 조회)
+    account_ids = list({account_id for _, account_id, _, _ in parsed})
+    existing_accounts = set()
+    for id_chunk in chunked(account_ids):
+        existing_accounts.update(
+            row.ACCOUNT_ID for row in db.query(models.Account.ACCOUNT_ID).filter(
+                models.Account.ACCOUNT_ID.in_(id_chunk)
+            ).all()
+        )
+    
+    valid = []
+    for i, account_id, report_date, weekly_text in parsed:
+        if account_id not in existing_accounts:
+            logger.warning(f"존재하지 않는 계정: {account_id}")
+            error_reports.append({
+                "index": i,
+                "account_id": account_id,
+                "detail": "존재하지 않는 계정입니다",
+                "code": "ACCOUNT_NOT_FOUND"
+            })
+            continue
+        valid.append((i, account_id, report_date, weekly_text))
+    
+    # 3. 지난주(보고서 날짜 전 월~일) 송금액을 (계정, 날짜)별 합계 한 번으로 조회
+    daily_amounts = {}
+    if valid:
+        range_start = min(report_date for _, _, report_date, _ in valid) - timedelta(days=7)
+        range_end = max(report_date for _, _, report_date, _ in valid) - timedelta(days=1)
+        valid_account_ids = list({account_id for _, account_id, _, _ in valid})
+        for id_chunk in chunked(valid_account_ids):
+            rows = db.query(
+                models.DailyTransfer.ACCOUNT_ID,
+                models.DailyTransfer.DATE,
+                func.sum(models.DailyTransfer.AMOUNT)
+            ).filter(
+                models.DailyTransfer.ACCOUNT_ID.in_(id_chunk),
+                models.DailyTransfer.DATE >= range_start,
+                models.DailyTransfer.DATE <= range_end
+            ).group_by(models.DailyTransfer.ACCOUNT_ID, models.DailyTransfer.DATE).all()
+            for account_id, transfer_date, amount in rows:
+                daily_amounts[(account_id, transfer_date)] = amount or 0
+    
+    def weekly_amount_for(account_id, report_date):
+        return sum(
+            daily_amounts.get((account_id, report_date - timedelta(days=offset)), 0)
+            for offset in range(1, 8)
+        )
+    
+    # 4. 청크마다 INSERT ... ON DUPLICATE KEY UPDATE 한 번 + 커밋 (실패한 청크의 보고서만 오류 처리)
+    table = models.WeeklyReportPersonal.__table__
+    saved = []
+    for chunk in chunked(valid):
+        rows = [
+            {
+                "ACCOUNT_ID": account_id,
+                "DATE": report_date,
+                "WEEKLY_AMOUNT": weekly_amount_for(account_id, report_date),
+                "LLM_CONTEXT": weekly_text
+            }
+            for _, account_id, report_date, weekly_text in chunk
+        ]
+        try:
+            upsert_rows(db, table, rows, ["ACCOUNT_ID", "DATE"], ["WEEKLY_AMOUNT", "LLM_CONTEXT"])
+            db.commit()
+            saved.extend(chunk)
+        except Exception as tx_error:
+            db.rollback()
+            logger.error(f"DB 트랜잭션 오류 (보고서 {len(chunk)}건): {str(tx_error)}")
+            for i, account_id, _, _ in chunk:
                 error_reports.append({
                     "index": i,
-                    "account_id": report_data.account_id,
+                    "account_id": account_id,
                     "detail": f"데이터베이스 처리 오류: {str(tx_error)}",
                     "code": "DB_ERROR"
                 })
-                
-        except Exception as e:
-            logger.error(f"처리 중 오류 (계정 ID {report_data.account_id}): {str(e)}")
-            error_reports.append({
-                "index": i,
-                "account_id": report_data.account_id,
-                "detail": f"처리 중 오류 발생: {str(e)}",
-                "code": "GENERAL_ERROR"
-            })
+    
+    # 5. 저장된 보고서를 (계정, 날짜)로 다시 읽어 요청 순서대로 응답 구성
+    stored_reports = {}
+    saved_dates = list({report_date for _, _, report_date, _ in saved})
+    for id_chunk in chunked(list({account_id for _, account_id, _, _ in saved})):
+        for report in db.query(models.WeeklyReportPersonal).filter(
+            models.WeeklyReportPersonal.ACCOUNT_ID.in_(id_chunk),
+            models.WeeklyReportPersonal.DATE.in_(saved_dates)
+        ).all():
+            stored_reports[(report.ACCOUNT_ID, report.DATE)] = report
+    
+    successful_reports = []
+    for _, account_id, report_date, _ in saved:
+        report = stored_reports.get((account_id, report_date))
+        if report:
+            successful_reports.append(report)
+    
+    error_reports.sort(key=lambda error: error["index"])
     
     # 결과 반환
     logger.info(f"처리 완료: {len(successful_reports)}개 성공, {len(error_reports)}개 실패")
@@ -1642,104 +1632,96 @@ async def create_daily_team_reports(
             "code": "NO_DATA"
         }])
     
-    successful_reports = []
+    reports = batch_report_data.reports
     error_reports = []
     
-    # 각 보고서 개별 처리 (각각 별도의 트랜잭션으로)
-    for i, report_data in enumerate(batch_report_data.reports):
+    # 1. 날짜 확인 및 변환
+    parsed = []  # (index, team_id, 보고서 날짜, 보고서 내용)
+    for i, report_data in enumerate(reports):
         try:
-            logger.info(f"처리 중 {i+1}/{len(batch_report_data.reports)}: 팀 ID {report_data.team_id}")
-            
-            # 1. 팀 존재 확인
-            team = db.query(models.Team).filter(models.Team.TEAM_ID == report_data.team_id).first()
-            if not team:
-                logger.warning(f"존재하지 않는 팀: {report_data.team_id}")
-                error_reports.append({
-                    "index": i,
-                    "team_id": report_data.team_id,
-                    "detail": "존재하지 않는 팀입니다",
-                    "code": "TEAM_NOT_FOUND"
-                })
-                continue
-                
-            team_id = team.TEAM_ID
-            
-            # 2. 보고서 날짜 확인 및 변환
-            try:
-                report_date = datetime.strptime(report_data.date, "%Y-%m-%d").date()
-            except ValueError as e:
-                logger.warning(f"날짜 형식 오류: {report_data.date}")
-                error_reports.append({
-                    "index": i,
-                    "team_id": report_data.team_id,
-                    "detail": f"날짜 형식 오류: {str(e)}",
-                    "code": "INVALID_DATE"
-                })
-                continue
-            
-            # 3. 해당 팀의 평균 적금액 계산
-            # 해당 팀에 속한 모든 계정의 총액 구하기
-            team_accounts = db.query(models.Account).filter(
-                models.Account.TEAM_ID == team_id
-            ).all()
-            
-            if team_accounts:
-                team_avg_amount = sum(account.TOTAL_AMOUNT for account in team_accounts) / len(team_accounts)
-            else:
-                team_avg_amount = 0
-                
-            logger.info(f"팀 ID {team_id}의 평균 적금액: {team_avg_amount}원")
-            
-            # 4. 이미 해당 날짜의 보고서가 있는지 확인
-            existing_report = db.query(models.DailyReport).filter(
-                models.DailyReport.TEAM_ID == team_id,
-                models.DailyReport.DATE == report_date
-            ).first()
-            
-            # 개별 보고서에 대한 트랜잭션 시작
-            try:
-                if existing_report:
-                    # 이미 존재하는 보고서 업데이트
-                    existing_report.TEAM_AVG_AMOUNT = team_avg_amount
-                    existing_report.LLM_CONTEXT = report_data.llm_context
-                    db.commit()
-                    db.refresh(existing_report)
-                    
-                    logger.info(f"기존 팀 일일 보고서 업데이트: ID {existing_report.DAILY_REPORT_ID}, 팀 평균 적금액: {team_avg_amount}원")
-                    successful_reports.append(existing_report)
-                else:
-                    # 새 보고서 생성
-                    new_report = models.DailyReport(
-                        TEAM_ID=team_id,
-                        DATE=report_date,
-                        TEAM_AVG_AMOUNT=team_avg_amount,
-                        LLM_CONTEXT=report_data.llm_context
-                    )
-                    db.add(new_report)
-                    db.commit()
-                    db.refresh(new_report)
-                    
-                    logger.info(f"새 팀 일일 보고서 생성: ID {new_report.DAILY_REPORT_ID}, 팀 평균 적금액: {team_avg_amount}원")
-                    successful_reports.append(new_report)
-            except Exception as tx_error:
-                # 개별 트랜잭션 오류 처리
-                db.rollback()
-                logger.error(f"DB 트랜잭션 오류 (팀 ID {report_data.team_id}): {str(tx_error)}")
+            report_date = datetime.strptime(report_data.date, "%Y-%m-%d").date()
+        except ValueError as e:
+            logger.warning(f"날짜 형식 오류: {report_data.date}")
+            error_reports.append({
+                "index": i,
+                "team_id": report_data.team_id,
+                "detail": f"날짜 형식 오류: {str(e)}",
+                "code": "INVALID_DATE"
+            })
+            continue
+        parsed.append((i, report_data.team_id, report_date, report_data.llm_context))
+    
+    # 2. 팀 존재 확인 (한 번에 조회)
+    team_ids = list({team_id for _, team_id, _, _ in parsed})
+    existing_teams = {
+        row.TEAM_ID for row in db.query(models.Team.TEAM_ID).filter(models.Team.TEAM_ID.in_(team_ids)).all()
+    } if team_ids else set()
+    
+    valid = []
+    for i, team_id, report_date, llm_context in parsed:
+        if team_id not in existing_teams:
+            logger.warning(f"존재하지 않는 팀: {team_id}")
+            error_reports.append({
+                "index": i,
+                "team_id": team_id,
+                "detail": "존재하지 않는 팀입니다",
+                "code": "TEAM_NOT_FOUND"
+            })
+            continue
+        valid.append((i, team_id, report_date, llm_context))
+    
+    # 3. 팀별 평균 적금액 (팀별 집계 테이블, 팀마다 한 번)
+    team_avg_amounts = {}
+    for team_id in {team_id for _, team_id, _, _ in valid}:
+        account_count, total_amount = get_team_account_summary(db, team_id)
+        team_avg_amounts[team_id] = round(total_amount / account_count) if account_count else 0
+        logger.info(f"팀 ID {team_id}의 평균 적금액: {team_avg_amounts[team_id]}원")
+    
+    # 4. 청크마다 INSERT ... ON DUPLICATE KEY UPDATE 한 번 + 커밋 (실패한 청크의 보고서만 오류 처리)
+    table = models.DailyReport.__table__
+    saved = []
+    for chunk in chunked(valid):
+        rows = [
+            {
+                "TEAM_ID": team_id,
+                "DATE": report_date,
+                "TEAM_AVG_AMOUNT": team_avg_amounts[team_id],
+                "LLM_CONTEXT": llm_context
+            }
+            for _, team_id, report_date, llm_context in chunk
+        ]
+        try:
+            upsert_rows(db, table, rows, ["TEAM_ID", "DATE"], ["TEAM_AVG_AMOUNT", "LLM_CONTEXT"])
+            db.commit()
+            saved.extend(chunk)
+        except Exception as tx_error:
+            db.rollback()
+            logger.error(f"DB 트랜잭션 오류 (보고서 {len(chunk)}건): {str(tx_error)}")
+            for i, team_id, _, _ in chunk:
                 error_reports.append({
                     "index": i,
-                    "team_id": report_data.team_id,
+                    "team_id": team_id,
                     "detail": f"데이터베이스 처리 오류: {str(tx_error)}",
                     "code": "DB_ERROR"
                 })
-                
-        except Exception as e:
-            logger.error(f"처리 중 오류 (팀 ID {report_data.team_id}): {str(e)}")
-            error_reports.append({
-                "index": i,
-                "team_id": report_data.team_id,
-                "detail": f"처리 중 오류 발생: {str(e)}",
-                "code": "GENERAL_ERROR"
-            })
+    
+    # 5. 저장된 보고서를 (팀, 날짜)로 다시 읽어 요청 순서대로 응답 구성
+    stored_reports = {}
+    if saved:
+        for report in db.query(models.DailyReport).filter(
+            models.DailyReport.TEAM_ID.in_(list({team_id for _, team_id, _, _ in saved})),
+            models.DailyReport.DATE.in_(list({report_date for _, _, report_date, _ in saved}))
+        ).all():
+            stored_reports[(report.TEAM_ID, report.DATE)] = report
+    
+    successful_reports = []
+    for _, team_id, report_date, _ in saved:
+        report = stored_reports.get((team_id, report_date))
+        if report:
+            successful_reports.append(report)
+    
+    error_reports.sort(key=lambda error: error["index"])
+    logger.info(f"처리 완료: {len(successful_reports)}개 성공, {len(error_reports)}개 실패")
     
     # 결과 반환
     serializable_reports = []
@@ -0,0 +1,209 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from sqlalchemy.orm import Session
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# 캐시 유지 시간(초). 다른 프로세스(초기화 스크립트 등)에서 규칙을 바꾼 경우를 위한 안전장치
+SAVING_RULE_CATALOG_TTL = int(os.getenv("SAVING_RULE_CATALOG_TTL", "600"))
+# 선수별 응답 최대 보관 수
+SAVING_RULE_CATALOG_MAX_ENTRIES = int(os.getenv("SAVING_RULE_CATALOG_MAX_ENTRIES", "1024"))
+
+# 선수 타입별로 보여줄 적금 규칙 타입 (투수: 기본/투수/상대팀, 타자: 기본/타자/상대팀)
+RULE_TYPES_BY_PLAYER_TYPE = {
+    1: [1, 2, 4],
+    2: [1, 3, 4],
+}
+# 선수 타입에 맞는 상세 규칙만 보여주는 규칙 타입 (투수, 타자)
+PLAYER_RULE_TYPE_IDS = [2, 3]
+
+
+class SavingRuleCatalogEntry:
+    """직렬화된 적금 규칙 목록 응답 (본문 바이트와 ETag)"""
+
+    def __init__(self, body, etag):
+        self.body = body
+        self.etag = etag
+        self.created = time.monotonic()
+
+
+class PlayerNotFoundError(Exception):
+    """카탈로그를 요청한 선수가 존재하지 않을 때 발생"""
+
+
+_lock = threading.Lock()
+_version = 0
+_base_rows = None          # 조인 쿼리 결과 (규칙 타입 → 상세 규칙 목록)
+_base_created = 0.0
+_entries = OrderedDict()   # player_id(None이면 전체) -> SavingRuleCatalogEntry
+
+
+def invalidate_saving_rule_catalog():
+    """적금 규칙 타입/규칙/상세 규칙이 바뀌면 호출해 캐시를 비웁니다."""
+    global _version, _base_rows
+    with _lock:
+        _version += 1
+        _base_rows = None
+        _entries.clear()
+    logger.info(f"적금 규칙 카탈로그 캐시 무효화 (버전 {_version})")
+
+
+def _load_base_rows(db: Session):
+    """
+    규칙 타입, 상세 규칙, 규칙, 기록 타입, 선수 타입을 한 번의 조인 쿼리로 읽어 규칙 타입별로 묶습니다.
+
+    Returns:
+        list: [{"SAVING_RULE_TYPE_ID", "SAVING_RULE_TYPE_NAME", "details": [...]}]
+    """
+    rows = db.query(
+        models.SavingRuleType.SAVING_RULE_TYPE_ID,
+        models.SavingRuleType.SAVING_RULE_TYPE_NAME,
+        models.SavingRuleDetail.SAVING_RULE_DETAIL_ID,
+        models.SavingRuleDetail.PLAYER_TYPE_ID,
+        models.PlayerType.PLAYER_TYPE_NAME,
+        models.SavingRuleDetail.SAVING_RULE_ID,
+        models.SavingRuleDetail.RULE_DESCRIPTION,
+        models.SavingRuleList.RECORD_TYPE_ID,
+        models.RecordType.RECORD_NAME
+    ).join(
+        models.SavingRuleDetail,
+        models.SavingRuleDetail.SAVING_RULE_TYPE_ID == models.SavingRuleType.SAVING_RULE_TYPE_ID
+    ).join(
+        models.SavingRuleList,
+        models.SavingRuleList.SAVING_RULE_ID == models.SavingRuleDetail.SAVING_RULE_ID
+    ).join(
+        models.RecordType,
+        models.RecordType.RECORD_TYPE_ID == models.SavingRuleList.RECORD_TYPE_ID
+    ).outerjoin(
+        models.PlayerType,
+        models.PlayerType.PLAYER_TYPE_ID == models.SavingRuleDetail.PLAYER_TYPE_ID
+    ).order_by(
+        models.SavingRuleType.SAVING_RULE_TYPE_ID,
+        models.SavingRuleDetail.SAVING_RULE_DETAIL_ID
+    ).all()
+
+    rule_types = OrderedDict()
+    for row in rows:
+        rule_type = rule_types.get(row.SAVING_RULE_TYPE_ID)
+        if rule_type is None:
+            rule_type = rule_types[row.SAVING_RULE_TYPE_ID] = {
+                "SAVING_RULE_TYPE_ID": row.SAVING_RULE_TYPE_ID,
+                "SAVING_RULE_TYPE_NAME": row.SAVING_RULE_TYPE_NAME,
+                "details": []
+            }
+        rule_type["details"].append({
+            "SAVING_RULE_DETAIL_ID": row.SAVING_RULE_DETAIL_ID,
+            "PLAYER_TYPE_ID": row.PLAYER_TYPE_ID,
+            "PLAYER_TYPE_NAME": row.PLAYER_TYPE_NAME,
+            "SAVING_RULE_ID": row.SAVING_RULE_ID,
+            "RULE_DESCRIPTION": row.RULE_DESCRIPTION,
+            "RECORD_TYPE_ID": row.RECORD_TYPE_ID,
+            "RECORD_NAME": row.RECORD_NAME
+        })
+
+    return list(rule_types.values())
+
+
+def _build_catalog(base_rows, player):
+    """기본 카탈로그에서 선수 타입에 맞는 규칙만 고르고, 선수 규칙 설명 앞에 선수 이름을 붙입니다."""
+    if player is None:
+        return base_rows
+
+    player_type_id = player.PLAYER_TYPE_ID
+    allowed_types = RULE_TYPES_BY_PLAYER_TYPE.get(player_type_id)
+
+    result = []
+    for rule_type in base_rows:
+        if allowed_types is not None and rule_type["SAVING_RULE_TYPE_ID"] not in allowed_types:
+            continue
+
+        details = []
+        for detail in rule_type["details"]:
+            if (rule_type["SAVING_RULE_TYPE_ID"] in PLAYER_RULE_TYPE_IDS
+                    and detail["PLAYER_TYPE_ID"] != player_type_id):
+                continue
+
+            rule_description = detail["RULE_DESCRIPTION"]
+            if detail["PLAYER_TYPE_ID"] == player_type_id and rule_description and rule_description.startswith("이(가)"):
+                detail = dict(detail, RULE_DESCRIPTION=f"{player.PLAYER_NAME} {rule_description}")
+            details.append(detail)
+
+        # 상세 정보가 있는 경우에만 결과에 추가
+        if details:
+            result.append(dict(rule_type, details=details))
+
+    return result
+
+
+def get_saving_rule_catalog(db: Session, player_id=None):
+    """
+    적금 규칙 목록을 캐시에서 가져오고, 없으면 한 번의 조인 쿼리로 만들어 직렬화한 뒤 캐시에 저장합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        player_id (int, optional): 선수 ID. 지정하면 선수 타입에 맞는 규칙만 반환
+
+    Returns:
+        SavingRuleCatalogEntry: 직렬화된 응답 본문과 ETag
+
+    Raises:
+        PlayerNotFoundError: player_id에 해당하는 선수가 없는 경우
+    """
+    global _base_rows, _base_created
+
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(player_id)
+        if entry is not None and now - entry.created < SAVING_RULE_CATALOG_TTL:
+            _entries.move_to_end(player_id)
+            return entry
+        version = _version
+        base_rows = _base_rows if _base_rows is not None and now - _base_created < SAVING_RULE_CATALOG_TTL else None
+
+    player = None
+    if player_id:
+        player = db.query(models.Player).filter(models.Player.PLAYER_ID == player_id).first()
+        if not player:
+            raise PlayerNotFoundError(player_id)
+
+    if base_rows is None:
+        base_rows = _load_base_rows(db)
+
+    catalog = _build_catalog(base_rows, player)
+    body = json.dumps(catalog, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # 버전 카운터는 프로세스마다 달라서 본문 해시만 사용 (워커가 달라도 같은 본문이면 같은 ETag)
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+    entry = SavingRuleCatalogEntry(body, etag)
+
+    with _lock:
+        # 만드는 동안 무효화되었으면 오래된 결과를 캐시에 넣지 않음
+        if version == _version:
+            if _base_rows is None or now - _base_created >= SAVING_RULE_CATALOG_TTL:
+                _base_rows = base_rows
+                _base_created = now
+            _entries[player_id] = entry
+            _entries.move_to_end(player_id)
+            while len(_entries) > SAVING_RULE_CATALOG_MAX_ENTRIES:
+                _entries.popitem(last=False)
+
+    return entry
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더 값에 현재 ETag가 포함되어 있는지 확인합니다."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # 약한 비교: W/ 접두사를 무시하고 비교
+    normalized = etag[2:] if etag.startswith("W/") else etag
+    return any((value[2:] if value.startswith("W/") else value) == normalized for value in candidates)
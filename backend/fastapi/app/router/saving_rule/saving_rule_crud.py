@@ -4,11 +4,14 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 
 import models
+from utils.pagination import keyset_paginate
 from router.saving_rule.saving_rule_schema import (
     SavingRuleTypeCreate, SavingRuleListCreate, SavingRuleDetailCreate,
     UserSavingRuleCreate, DailySavingCreate, SavingRuleTypeUpdate,
     SavingRuleListUpdate, SavingRuleDetailUpdate, UserSavingRuleUpdate
 )
+from router.saving_rule.saving_rule_cache import invalidate_saving_rule_catalog
+from utils.saving_detail import build_saving_details
 
 def get_saving_rule_type_by_id(db: Session, saving_rule_type_id: int):
     """적금 규칙 타입 ID로 조회"""
@@ -33,6 +36,7 @@ def create_saving_rule_type(db: Session, saving_rule_type: SavingRuleTypeCreate)
     )
     db.add(db_saving_rule_type)
     db.commit()
+    invalidate_saving_rule_catalog()
     db.refresh(db_saving_rule_type)
     return db_saving_rule_type
 
@@ -44,6 +48,7 @@ def update_saving_rule_type(db: Session, saving_rule_type_id: int, saving_rule_t
     
     db_saving_rule_type.SAVING_RULE_TYPE_NAME = saving_rule_type.SAVING_RULE_TYPE_NAME
     db.commit()
+    invalidate_saving_rule_catalog()
     db.refresh(db_saving_rule_type)
     return db_saving_rule_type
 
@@ -74,6 +79,7 @@ def delete_saving_rule_type(db: Session, saving_rule_type_id: int):
     
     db.delete(db_saving_rule_type)
     db.commit()
+    invalidate_saving_rule_catalog()
     return True
 
 def get_record_type_by_id(db: Session, record_type_id: int):
@@ -116,6 +122,7 @@ def create_saving_rule(db: Session, saving_rule: SavingRuleListCreate):
     )
     db.add(db_saving_rule)
     db.commit()
+    invalidate_saving_rule_catalog()
     db.refresh(db_saving_rule)
     return db_saving_rule
 
@@ -131,6 +138,7 @@ def update_saving_rule(db: Session, saving_rule_id: int, saving_rule: SavingRule
         setattr(db_saving_rule, key, value)
     
     db.commit()
+    invalidate_saving_rule_catalog()
     db.refresh(db_saving_rule)
     return db_saving_rule
 
@@ -152,6 +160,7 @@ def delete_saving_rule(db: Session, saving_rule_id: int):
     
     db.delete(db_saving_rule)
     db.commit()
+    invalidate_saving_rule_catalog()
     return True
 
 def get_saving_rule_detail_by_id(db: Session, saving_rule_detail_id: int):
@@ -192,6 +201,7 @@ def create_saving_rule_detail(db: Session, saving_rule_detail: SavingRuleDetailC
     )
     db.add(db_saving_rule_detail)
     db.commit()
+    invalidate_saving_rule_catalog()
     db.refresh(db_saving_rule_detail)
     return db_saving_rule_detail
 
@@ -207,6 +217,7 @@ def update_saving_rule_detail(db: Session, saving_rule_detail_id: int, saving_ru
         setattr(db_saving_rule_detail, key, value)
     
     db.commit()
+    invalidate_saving_rule_catalog()
     db.refresh(db_saving_rule_detail)
     return db_saving_rule_detail
 
@@ -231,6 +242,7 @@ def delete_saving_rule_detail(db: Session, saving_rule_detail_id: int):
     
     db.delete(db_saving_rule_detail)
     db.commit()
+    invalidate_saving_rule_catalog()
     return True
 
 def get_user_saving_rule_by_id(db: Session, user_saving_rule_id: int):
@@ -310,6 +322,15 @@ def get_daily_savings_by_account(db: Session, account_id: int, skip: int = 0, li
         models.DailySaving.ACCOUNT_ID == account_id
     ).order_by(models.DailySaving.DATE.desc()).offset(skip).limit(limit).all()
 
+def get_daily_saving_details_page(db: Session, account_id: int, cursor=None, limit=100, since=None, until=None):
+    """계정별 일일 적금 상세 내역(daily_saving_detail)을 최신순 (날짜, ID) 키셋 페이지로 조회"""
+    return keyset_paginate(
+        db.query(models.DailySavingDetail).filter(models.DailySavingDetail.ACCOUNT_ID == account_id),
+        models.DailySavingDetail.DATE,
+        models.DailySavingDetail.DAILY_SAVING_ID,
+        cursor=cursor, limit=limit, since=since, until=until
+    )
+
 def get_daily_savings_by_date(db: Session, saving_date: date, skip: int = 0, limit: int = 100):
     """날짜별 일일 적금 조회"""
     return db.query(models.DailySaving).filter(
@@ -331,8 +352,8 @@ def get_daily_savings_by_account_and_date_range(db: Session, account_id: int, st
         models.DailySaving.DATE <= end_date
     ).order_by(models.DailySaving.DATE).all()
 
-def create_daily_saving(db: Session, daily_saving: DailySavingCreate):
-    """일일 적금 생성"""
+def create_daily_saving(db: Session, daily_saving: DailySavingCreate, user_rule: Optional[models.UserSavingRule] = None):
+    """일일 적금 생성 (조회용 상세 행도 함께 생성)"""
     db_daily_saving = models.DailySaving(
         ACCOUNT_ID=daily_saving.ACCOUNT_ID,
         DATE=daily_saving.DATE,
@@ -343,6 +364,14 @@ def create_daily_saving(db: Session, daily_saving: DailySavingCreate):
         created_at=datetime.now()
     )
     db.add(db_daily_saving)
+    
+    # 적립한 사용자 규칙을 모르면 (계정, 상세 규칙)의 첫 번째 사용자 규칙 사용 (백필과 동일)
+    if user_rule is None:
+        user_rule = db.query(models.UserSavingRule).filter(
+            models.UserSavingRule.ACCOUNT_ID == daily_saving.ACCOUNT_ID,
+            models.UserSavingRule.SAVING_RULE_DETAIL_ID == daily_saving.SAVING_RULED_DETAIL_ID
+        ).order_by(models.UserSavingRule.USER_SAVING_RULED_ID).first()
+    build_saving_details(db, [(db_daily_saving, user_rule)])
     db.commit()
     db.refresh(db_daily_saving)
     
@@ -401,7 +430,7 @@ def calculate_daily_saving(db: Session, account_id: int, player_record: Dict):
     
     for rule in saving_rules:
         # 규칙 타입 확인
-        rule_type = saving_rule_crud.get_saving_rule_type_by_id(db, rule.SAVING_RULE_TYPE_ID)
+        rule_type = get_saving_rule_type_by_id(db, rule.SAVING_RULE_TYPE_ID)
         is_team_rule = rule_type and rule_type.SAVING_RULE_TYPE_NAME in ["기본 규칙", "상대팀"]
         
         # 해당 규칙의 상세 규칙 찾기
@@ -466,6 +495,14 @@ def calculate_daily_saving(db: Session, account_id: int, player_record: Dict):
             
             existing_saving.COUNT = count
             existing_saving.DAILY_SAVING_AMOUNT = saving_amount
+            
+            # 조회용 상세 행도 같은 값으로 갱신 (상세 행이 없던 기존 적립 내역은 새로 생성)
+            if existing_saving.detail_view is not None:
+                existing_saving.detail_view.UNIT_AMOUNT = user_rule.USER_SAVING_RULED_AMOUNT
+                existing_saving.detail_view.COUNT = count
+                existing_saving.detail_view.DAILY_SAVING_AMOUNT = saving_amount
+            else:
+                build_saving_details(db, [(existing_saving, user_rule)])
             db.commit()
             db.refresh(existing_saving)
             
@@ -486,7 +523,7 @@ def calculate_daily_saving(db: Session, account_id: int, player_record: Dict):
                 DAILY_SAVING_AMOUNT=saving_amount
             )
             
-            new_saving = create_daily_saving(db, daily_saving_data)
+            new_saving = create_daily_saving(db, daily_saving_data, user_rule)
             created_savings.append(new_saving)
         
         total_saving += saving_amount
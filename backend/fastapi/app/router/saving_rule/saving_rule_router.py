@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date, datetime, timedelta
@@ -6,8 +6,9 @@ import logging
 
 from database import get_db
 import models
-from router.saving_rule import saving_rule_schema, saving_rule_crud
+from router.saving_rule import saving_rule_schema, saving_rule_crud, saving_rule_cache
 from router.user.user_router import get_current_user
+from utils.pagination import NEXT_CURSOR_HEADER, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -55,115 +56,33 @@ async def read_record_types(
 @router.get("/rules", response_model=List[dict])
 async def read_saving_rules(
     player_id: Optional[int] = None,  # 추가된 파라미터
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
+    """
+    적금 규칙 타입별 상세 규칙 목록을 조회합니다.
+    모든 사용자에게 같은 목록이므로 player_id 별로 직렬화된 응답을 캐시하고 ETag로 재검증합니다.
+    (적금 규칙 타입/규칙/상세 규칙 CRUD 시 캐시 무효화)
+    """
     try:
-        logger.info("적금 규칙 타입별 목록 조회")
+        logger.info(f"적금 규칙 타입별 목록 조회: player_id={player_id}")
         
-        # 플레이어 타입 확인 (player_id가 제공된 경우)
-        player_type_id = None
-        if player_id:
-            player = db.query(models.Player).filter(models.Player.PLAYER_ID == player_id).first()
-            if not player:
-                logger.warning(f"존재하지 않는 선수 ID: {player_id}")
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="존재하지 않는 선수입니다"
-                )
-            player_type_id = player.PLAYER_TYPE_ID
-        
-        # 모든 적금 규칙 타입 조회
-        rule_types_query = db.query(models.SavingRuleType)
-        
-        # 플레이어 타입에 따라 필터링
-        if player_type_id is not None:
-            # 투수(1)인 경우: 기본 규칙(1), 투수(2), 상대팀(4)
-            if player_type_id == 1:
-                rule_types_query = rule_types_query.filter(
-                    models.SavingRuleType.SAVING_RULE_TYPE_ID.in_([1, 2, 4])
-                )
-            # 타자(2)인 경우: 기본 규칙(1), 타자(3), 상대팀(4)
-            elif player_type_id == 2:
-                rule_types_query = rule_types_query.filter(
-                    models.SavingRuleType.SAVING_RULE_TYPE_ID.in_([1, 3, 4])
-                )
-        
-        rule_types = rule_types_query.all()
-        
-        result = []
-        for rule_type in rule_types:
-            # 각 규칙 타입에 대한 상세 정보를 담을 딕셔너리
-            type_dict = {
-                "SAVING_RULE_TYPE_ID": rule_type.SAVING_RULE_TYPE_ID,
-                "SAVING_RULE_TYPE_NAME": rule_type.SAVING_RULE_TYPE_NAME,
-                "details": []
-            }
-            
-            # 이 규칙 타입과 관련된 모든 상세 규칙 조회
-            rule_details_query = db.query(models.SavingRuleDetail).filter(
-                models.SavingRuleDetail.SAVING_RULE_TYPE_ID == rule_type.SAVING_RULE_TYPE_ID
+        try:
+            catalog = saving_rule_cache.get_saving_rule_catalog(db, player_id)
+        except saving_rule_cache.PlayerNotFoundError:
+            logger.warning(f"존재하지 않는 선수 ID: {player_id}")
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="존재하지 않는 선수입니다"
             )
-            
-            # 선수 타입이 제공된 경우, 해당 선수 타입에 맞는 규칙만 조회
-            if player_type_id is not None and rule_type.SAVING_RULE_TYPE_ID in [2, 3]:  # 투수 또는 타자 규칙
-                rule_details_query = rule_details_query.filter(
-                    models.SavingRuleDetail.PLAYER_TYPE_ID == player_type_id
-                )
-            
-            rule_details = rule_details_query.all()
-            
-            for detail in rule_details:
-                # 선수 타입 정보 조회 (있는 경우)
-                player_type = None
-                if detail.PLAYER_TYPE_ID:
-                    player_type = db.query(models.PlayerType).filter(
-                        models.PlayerType.PLAYER_TYPE_ID == detail.PLAYER_TYPE_ID
-                    ).first()
-                
-                # 적금 규칙 정보 조회
-                saving_rule = db.query(models.SavingRuleList).filter(
-                    models.SavingRuleList.SAVING_RULE_ID == detail.SAVING_RULE_ID
-                ).first()
-                
-                if not saving_rule:
-                    continue
-                
-                # 기록 타입 정보 조회
-                record_type = db.query(models.RecordType).filter(
-                    models.RecordType.RECORD_TYPE_ID == saving_rule.RECORD_TYPE_ID
-                ).first()
-                
-                if not record_type:
-                    continue
-                
-                # 기본 룰 설명 가져오기
-                rule_description = detail.RULE_DESCRIPTION
-                
-                # player_type_id가 None이 아니고 player_id가 제공되었다면, 선수 이름을 룰 설명 앞에 붙이기
-                if detail.PLAYER_TYPE_ID is not None and player_id:
-                    # player_type_id가 선수의 타입과 일치하는지 확인
-                    if player.PLAYER_TYPE_ID == detail.PLAYER_TYPE_ID:
-                        # 선수 이름을 룰 설명 앞에 붙이기
-                        if rule_description.startswith("이(가)"):
-                            rule_description = f"{player.PLAYER_NAME} {rule_description}"
-                
-                detail_dict = {
-                    "SAVING_RULE_DETAIL_ID": detail.SAVING_RULE_DETAIL_ID,
-                    "PLAYER_TYPE_ID": detail.PLAYER_TYPE_ID,
-                    "PLAYER_TYPE_NAME": player_type.PLAYER_TYPE_NAME if player_type else None,
-                    "SAVING_RULE_ID": detail.SAVING_RULE_ID,
-                    "RULE_DESCRIPTION": rule_description,
-                    "RECORD_TYPE_ID": saving_rule.RECORD_TYPE_ID,
-                    "RECORD_NAME": record_type.RECORD_NAME
-                }
-                
-                type_dict["details"].append(detail_dict)
-            
-            # 상세 정보가 있는 경우에만 결과에 추가
-            if type_dict["details"]:
-                result.append(type_dict)
         
-        return result
+        headers = {"ETag": catalog.etag, "Cache-Control": "no-cache"}
+        if saving_rule_cache.etag_matches(if_none_match, catalog.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        return Response(content=catalog.body, media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"적금 규칙 목록 조회 중 오류: {str(e)}")
         raise HTTPException(
@@ -577,11 +496,28 @@ async def delete_user_saving_rule(
 @router.get("/daily-savings/account/{account_id}", response_model=List[saving_rule_schema.DailySavingDetailResponse])
 async def read_daily_savings_by_account(
     account_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
+    """
+    계정별 일일 적금 내역을 최신순으로 조회합니다.
+    OFFSET 대신 (날짜, ID) 커서로 다음 페이지를 조회합니다.
+    
+    Args:
+        account_id (int): 계정 ID
+        since (date, optional): 조회 시작 날짜
+        until (date, optional): 조회 종료 날짜
+        cursor (str, optional): 이전 응답의 X-Next-Cursor 헤더 값
+        limit (int, optional): 페이지 크기. 기본값은 100.
+        
+    Returns:
+        List[DailySavingDetailResponse]: 일일 적금 내역 목록 (다음 페이지가 있으면 X-Next-Cursor 헤더 포함)
+    """
     try:
         logger.info(f"계정별 일일 적금 내역 조회: 계정 ID {account_id}")
         
@@ -601,45 +537,27 @@ async def read_daily_savings_by_account(
                 detail="이 계정의 적금 내역을 조회할 권한이 없습니다"
             )
             
-        # 일일 적금 내역 조회
-        daily_savings = saving_rule_crud.get_daily_savings_by_account(db, account_id, skip, limit)
+        # 일일 적금 내역 조회 (규칙/기록/선수 이름이 함께 저장된 조회용 테이블, (날짜, ID) 키셋 페이지)
+        saving_details, next_cursor = saving_rule_crud.get_daily_saving_details_page(
+            db, account_id, cursor=cursor, limit=limit, since=since, until=until
+        )
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         
         # 응답 형식에 맞게 변환
         result = []
-        for saving in daily_savings:
-            # 적금 규칙 타입 조회
-            rule_type = saving_rule_crud.get_saving_rule_type_by_id(db, saving.SAVING_RULED_TYPE_ID)
-            
-            # 적금 규칙 상세 조회
-            rule_detail = saving_rule_crud.get_saving_rule_detail_by_id(db, saving.SAVING_RULED_DETAIL_ID)
-            
-            # 적금 규칙 조회
-            if rule_detail:
-                saving_rule = saving_rule_crud.get_saving_rule_by_id(db, rule_detail.SAVING_RULE_ID)
-            else:
-                saving_rule = None
-            
-            # 기록 타입 조회
-            if saving_rule:
-                record_type = saving_rule_crud.get_record_type_by_id(db, saving_rule.RECORD_TYPE_ID)
-                record_name = record_type.RECORD_NAME if record_type else None
-            else:
-                record_name = None
-            
-            # 결과 구성
+        for saving in saving_details:
             result.append({
                 "DAILY_SAVING_ID": saving.DAILY_SAVING_ID,
                 "ACCOUNT_ID": saving.ACCOUNT_ID,
                 "DATE": saving.DATE,
-                "SAVING_RULED_DETAIL_ID": saving.SAVING_RULED_DETAIL_ID,
-                "SAVING_RULED_TYPE_ID": saving.SAVING_RULED_TYPE_ID,
+                "SAVING_RULED_DETAIL_ID": saving.SAVING_RULE_DETAIL_ID,
+                "SAVING_RULED_TYPE_ID": saving.SAVING_RULE_TYPE_ID,
                 "COUNT": saving.COUNT,
                 "DAILY_SAVING_AMOUNT": saving.DAILY_SAVING_AMOUNT,
-                # "created_at": saving.created_at,
-                # "account_num": account.ACCOUNT_NUM,
-                "saving_rule_type_name": rule_type.SAVING_RULE_TYPE_NAME if rule_type else None,
-                "record_name": record_name,
-                "player_name": None  # 필요한 경우 선수 정보 조회 추가
+                "saving_rule_type_name": saving.RULE_TYPE_NAME,
+                "record_name": saving.RECORD_NAME,
+                "player_name": saving.PLAYER_NAME
             })
         
         return result
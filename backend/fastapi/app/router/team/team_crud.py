@@ -4,6 +4,7 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any
 
 import models
+from utils.team_aggregate import get_team_account_summary, get_team_daily_saving_total
 from router.team.team_schema import TeamCreate, TeamUpdate, TeamRatingCreate, NewsCreate, DailyReportCreate
 
 def get_team_by_id(db: Session, team_id: int):
@@ -347,10 +348,8 @@ def get_team_summary(db: Session, team_id: int):
     if not team:
         return None
     
-    # 계정 수 및 총 적금액
-    accounts = get_team_accounts(db, team_id)
-    account_count = len(accounts)
-    total_amount = sum(account.TOTAL_AMOUNT for account in accounts)
+    # 계정 수 및 총 적금액 (팀별 집계 테이블)
+    account_count, total_amount = get_team_account_summary(db, team_id)
     
     # 선수 수
     players = get_team_players(db, team_id)
@@ -369,12 +368,16 @@ def get_team_summary(db: Session, team_id: int):
     
     current_ranking = recent_rating.DAILY_RANKING if recent_rating else None
     
+    # 오늘 적립 총액 (팀별 집계 테이블)
+    today_saving_amount = get_team_daily_saving_total(db, team_id, today)
+    
     # 결과 구성
     result = {
         "team_id": team_id,
         "team_name": team.TEAM_NAME,
         "account_count": account_count,
         "total_amount": total_amount,
+        "today_saving_amount": today_saving_amount,
         "player_count": player_count,
         "total_games": total_games,
         "win_count": team.TOTAL_WIN,
@@ -427,21 +430,16 @@ def get_team_monthly_stats(db: Session, team_id: int, year: int, month: int):
                 record_stats[record_name] = 0
             record_stats[record_name] += record.COUNT
     
-    # 계정 적금 통계
-    accounts = get_team_accounts(db, team_id)
-    account_count = len(accounts)
-    
-    month_savings = []
-    for account in accounts:
-        account_savings = db.query(models.DailySaving).filter(
-            models.DailySaving.ACCOUNT_ID == account.ACCOUNT_ID,
-            models.DailySaving.DATE >= start_date,
-            models.DailySaving.DATE <= end_date
-        ).all()
-        
-        month_savings.extend(account_savings)
+    # 계정 적금 통계 (계정 수는 팀별 집계 테이블, 월간 적립액은 한 번의 합계 쿼리)
+    account_count, _ = get_team_account_summary(db, team_id)
     
-    total_saving = sum(saving.DAILY_SAVING_AMOUNT for saving in month_savings)
+    total_saving = db.query(func.coalesce(func.sum(models.DailySaving.DAILY_SAVING_AMOUNT), 0)).join(
+        models.Account, models.Account.ACCOUNT_ID == models.DailySaving.ACCOUNT_ID
+    ).filter(
+        models.Account.TEAM_ID == team_id,
+        models.DailySaving.DATE >= start_date,
+        models.DailySaving.DATE <= end_date
+    ).scalar()
     avg_daily_saving = total_saving / (end_date - start_date).days if (end_date - start_date).days > 0 else 0
     
     # 결과 구성
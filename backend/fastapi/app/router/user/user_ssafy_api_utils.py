@@ -4,17 +4,36 @@ import os
 from fastapi import HTTPException, status
 import logging
 
+from utils.request_metrics import track_http
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 금융 API 대상 선택: real(기본값, SSAFY 금융 API) / fake(로컬 가상 서버, benchmark/fake_bank.py)
+BANK_API_MODE = os.getenv("BANK_API_MODE", "real").lower()
+FAKE_BANK_BASE_URL = os.getenv("FAKE_BANK_BASE_URL", "http://127.0.0.1:8089/ssafy/api/v1")
+
 # 환경 변수에서 API 정보 가져오기
-SSAFY_API_BASE_URL = os.getenv("SSAFY_API_BASE_URL").rstrip("/")
+if BANK_API_MODE == "fake":
+    SSAFY_API_BASE_URL = FAKE_BANK_BASE_URL.rstrip("/")
+else:
+    SSAFY_API_BASE_URL = os.getenv("SSAFY_API_BASE_URL").rstrip("/")
 MEMBER_ENDPOINT = f"{SSAFY_API_BASE_URL}/member"
 MEMBER_SEARCH_ENDPOINT = f"{SSAFY_API_BASE_URL}/member/search"
 
 # API 키와 기관 코드 설정
 DEFAULT_API_KEY = os.getenv("SSAFY_API_KEY", "")
 
+# 이체 시 입금 계좌(적금 계좌) 거래 내역에 남는 요약 정보 (재시도 전 이체 여부 확인에도 사용)
+TRANSFER_DEPOSIT_SUMMARY = "야금야금 출금"
+
+def _post(url, **kwargs):
+    """
+    금융 API POST 요청 (외부 HTTP 소요 시간을 요청 지표에 기록)
+    """
+    with track_http():
+        return requests.post(url, **kwargs)
+
 async def check_user_exists(email: str, api_key: str = DEFAULT_API_KEY):
     """
     사용자 이메일로 등록된 userKey가 있는지 확인
@@ -30,7 +49,7 @@ async def check_user_exists(email: str, api_key: str = DEFAULT_API_KEY):
         logger.info(f"사용자 조회 요청 URL: {MEMBER_SEARCH_ENDPOINT}")
         logger.info(f"사용자 조회 요청 데이터: {json.dumps(request_data)}")
         
-        response = requests.post(
+        response = _post(
             MEMBER_SEARCH_ENDPOINT,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -100,7 +119,7 @@ async def register_user(email: str, username: str, api_key: str = DEFAULT_API_KE
         logger.info(f"사용자 등록 요청 URL: {MEMBER_ENDPOINT}")
         logger.info(f"사용자 등록 요청 데이터: {json.dumps(request_data)}")
         
-        response = requests.post(
+        response = _post(
             MEMBER_ENDPOINT,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -237,7 +256,7 @@ async def create_demand_deposit_account(user_key, account_type_unique_no="999-1-
         logger.info(f"입출금 계좌 개설 요청 데이터: {json.dumps(request_data)}")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -283,7 +302,7 @@ async def create_demand_deposit_account(user_key, account_type_unique_no="999-1-
         )
     
 
-async def transfer_money(user_key, withdrawal_account, deposit_account, amount, llm_text, api_key=None):
+async def transfer_money(user_key, withdrawal_account, deposit_account, amount, llm_text, api_key=None, transaction_unique_no=None):
     """
     금융 API를 통해 계좌 간 송금 처리
     
@@ -293,6 +312,8 @@ async def transfer_money(user_key, withdrawal_account, deposit_account, amount,
         deposit_account (str): 입금 계좌번호
         amount (int): 송금 금액
         api_key (str, optional): API 키
+        transaction_unique_no (str, optional): 기관거래고유번호. 금융 API는 이미 사용한 번호를 거절하므로
+            재시도할 때는 새 번호를 사용해야 합니다. 지정하지 않으면 무작위로 생성합니다.
     
     Returns:
         dict: 송금 결과 정보
@@ -311,7 +332,8 @@ async def transfer_money(user_key, withdrawal_account, deposit_account, amount,
         header = generate_api_header(
             api_name=api_name,
             user_key=user_key,
-            api_key=api_key
+            api_key=api_key,
+            institution_transaction_unique_no=transaction_unique_no
         )
         
         # 전체 요청 데이터 구성
@@ -320,7 +342,7 @@ async def transfer_money(user_key, withdrawal_account, deposit_account, amount,
             "depositAccountNo": deposit_account,  # 입금계좌번호
             "transactionBalance": str(amount),    # 거래금액 (문자열로 변환)
             "withdrawalAccountNo": withdrawal_account,  # 출금계좌번호
-            "depositTransactionSummary": "야금야금 출금",  # 거래 요약정보 (입금계좌)
+            "depositTransactionSummary": TRANSFER_DEPOSIT_SUMMARY,  # 거래 요약정보 (입금계좌)
             "withdrawalTransactionSummary": llm_text  # 거래 요약정보 (출금계좌)
         }
         
@@ -328,7 +350,7 @@ async def transfer_money(user_key, withdrawal_account, deposit_account, amount,
         logger.info(f"송금 요청 데이터: {json.dumps(request_data)}")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -399,7 +421,7 @@ async def get_account_balance(user_key, account_num, api_key=None):
         logger.info(f"계좌 잔액 조회 요청 데이터: {json.dumps(request_data)}")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -479,7 +501,7 @@ async def init_money(user_key, account_num,api_key=None):
         logger.info(f"계좌 입금 요청 데이터: {json.dumps(request_data)}")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -552,7 +574,7 @@ async def get_transaction_history(user_key, account_num, start_date, end_date, t
         logger.info(f"거래 내역 조회 요청: {account_num}, 기간 {start_date}~{end_date}")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -628,7 +650,7 @@ async def post_transfer_money(user_key, deposit_account_no, transaction_balance,
         logger.info(f"계좌 이체 요청: {withdrawal_account_no}에서 {deposit_account_no}로 {transaction_balance}원원")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
@@ -697,7 +719,7 @@ async def check_account_num(user_key,account_no):
         logger.info(f"{account_no}의 예금주 확인")
         
         # API 요청
-        response = requests.post(
+        response = _post(
             api_url,
             json=request_data,
             headers={"Content-Type": "application/json"}
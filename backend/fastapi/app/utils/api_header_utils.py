@@ -4,7 +4,7 @@ import hashlib
 import json
 
 
-def generate_api_header(api_name, user_key=None, api_key=None, institution_code="00100", fintech_app_no="001"):
+def generate_api_header(api_name, user_key=None, api_key=None, institution_code="00100", fintech_app_no="001", institution_transaction_unique_no=None):
     """
     API 요청에 필요한 공통 헤더를 자동으로 생성하는 함수
     
@@ -14,6 +14,8 @@ def generate_api_header(api_name, user_key=None, api_key=None, institution_code=
         api_key (str, optional): API KEY. 지정하지 않으면 무작위로 생성합니다.
         institution_code (str, optional): 기관코드. 기본값은 "00100"
         fintech_app_no (str, optional): 핀테크 앱 인증번호. 기본값은 "001"
+        institution_transaction_unique_no (str, optional): 기관거래고유번호. 지정하지 않으면 무작위로 생성합니다.
+            (금융 API는 같은 번호의 재요청을 거절하므로 요청마다 새 번호를 사용)
     
     Returns:
         dict: API 요청에 필요한 헤더 정보
@@ -24,8 +26,9 @@ def generate_api_header(api_name, user_key=None, api_key=None, institution_code=
     transmission_time = now.strftime("%H%M%S")
     
     # Institution Transaction Unique No 생성 (YYYYMMDD + 임의의 12자리 숫자)
-    unique_no_suffix = ''.join([str(secrets.randbelow(10)) for _ in range(12)])
-    institution_transaction_unique_no = f"{transmission_date}{unique_no_suffix}"
+    if institution_transaction_unique_no is None:
+        unique_no_suffix = ''.join([str(secrets.randbelow(10)) for _ in range(12)])
+        institution_transaction_unique_no = f"{transmission_date}{unique_no_suffix}"
     
     # API 서비스 코드 (API 이름과 동일하게 설정)
     api_service_code = api_name
@@ -0,0 +1,58 @@
+# bulk_upsert.py
+# 여러 행을 유니크 키 기준으로 한 번에 추가/갱신 (MariaDB: INSERT ... ON DUPLICATE KEY UPDATE, SQLite: ON CONFLICT DO UPDATE)
+import os
+
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import mysql, sqlite
+
+# 한 번의 INSERT 문에 넣을 최대 행 수
+UPSERT_CHUNK_SIZE = int(os.getenv("UPSERT_CHUNK_SIZE", "1000"))
+
+
+def chunked(items, size=UPSERT_CHUNK_SIZE):
+    """목록을 size 개씩 나눕니다."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def build_upsert(db: Session, table, rows, key_columns, update_columns, update_values=None):
+    """
+    DB 종류에 맞는 upsert 문을 만듭니다.
+
+    Args:
+        db (Session): 데이터베이스 세션 (DB 종류 확인용)
+        table: 대상 테이블 (models.X.__table__)
+        rows (list): 추가할 행 목록 (dict)
+        key_columns (list): 유니크 키 컬럼 이름 (SQLite ON CONFLICT 대상)
+        update_columns (list): 이미 있는 행에서 추가하려던 값으로 바꿀 컬럼 이름
+        update_values (dict, optional): 이미 있는 행에서 직접 지정한 식으로 갱신할 컬럼
+            (컬럼 이름 -> SQL 식, 예: 기존 값에 변화량 더하기 table.c.X + 1)
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("mysql", "mariadb"):
+        statement = mysql.insert(table).values(rows)
+        return statement.on_duplicate_key_update(
+            {**{column: statement.inserted[column] for column in update_columns}, **(update_values or {})}
+        )
+    if dialect == "sqlite":
+        statement = sqlite.insert(table).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={**{column: statement.excluded[column] for column in update_columns}, **(update_values or {})}
+        )
+    raise NotImplementedError(f"upsert를 지원하지 않는 DB: {dialect}")
+
+
+def upsert_rows(db: Session, table, rows, key_columns, update_columns):
+    """
+    행 목록을 한 번의 upsert 문으로 추가/갱신합니다. (커밋은 호출하는 쪽에서)
+    같은 키가 여러 번 나오면 마지막 행만 사용합니다.
+
+    Returns:
+        int: 실제로 보낸 행 수
+    """
+    unique_rows = {tuple(row[column] for column in key_columns): row for row in rows}
+    if not unique_rows:
+        return 0
+    db.execute(build_upsert(db, table, list(unique_rows.values()), key_columns, update_columns))
+    return len(unique_rows)
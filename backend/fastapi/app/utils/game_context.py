@@ -0,0 +1,364 @@
+# game_context.py
+# 날짜별 팀 경기 정보 (상대팀, 홈/원정, 득점, 결과, 시리즈 내 경기 순서/승패/결과, 취소 여부)
+# - 경기 로그 저장 파이프라인에서 하루 한 번 계산해 team_game_context 테이블에 저장합니다.
+# - 적립 처리, 보고서, 경기 결과 조회는 같은 GameSchedule/GameLog 조회를 반복하지 않고 이 정보를 읽습니다.
+# - 최근 날짜는 프로세스 안 LRU 캐시에 보관합니다.
+import os
+import sys
+import time
+import logging
+import argparse
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+# 모듈 import를 위한 경로 설정 (스크립트로 직접 실행하는 경우)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import models
+from utils.bulk_upsert import upsert_rows
+
+logger = logging.getLogger(__name__)
+
+# 캐시에 보관할 최대 날짜 수
+GAME_CONTEXT_CACHE_SIZE = int(os.getenv("GAME_CONTEXT_CACHE_SIZE", "64"))
+# 캐시 유지 시간(초). 다른 프로세스(백필 스크립트 등)에서 다시 계산한 경우를 위한 안전장치
+GAME_CONTEXT_TTL = int(os.getenv("GAME_CONTEXT_TTL", "600"))
+# 시리즈 내 경기 순서를 계산할 때 거슬러 올라가 볼 일수
+SERIES_LOOKBACK_DAYS = 6
+# 시리즈 결과(스윕, 위닝시리즈 등)를 정하는 시리즈 경기 수 (3연전)
+SERIES_LENGTH = 3
+SERIES_OUTCOME_SWEEP = "스윕"
+
+# 기록 유형 ID -> 경기 결과 (승리, 패배, 무승부)
+RESULT_RECORD_TYPES = {1: "승리", 2: "패배", 3: "무승부"}
+# 득점 기록 유형 ID
+RUN_RECORD_TYPE_ID = 6
+
+RESULT_CANCELLED = "취소"
+
+CONTEXT_COLUMNS = [
+    "DATE", "TEAM_ID", "OPPONENT_TEAM_ID", "GAME_SCHEDULE_KEY", "IS_HOME",
+    "RUNS", "OPPONENT_RUNS", "RESULT", "SERIES_INDEX", "CANCELLED",
+    "SERIES_WINS", "SERIES_LOSSES", "SERIES_OUTCOME"
+]
+
+
+class GameContext:
+    """한 팀의 하루 경기 정보 (세션과 무관한 읽기 전용 값)"""
+
+    __slots__ = CONTEXT_COLUMNS
+
+    def __init__(self, **values):
+        for column in CONTEXT_COLUMNS:
+            setattr(self, column, values.get(column))
+
+
+_lock = threading.Lock()
+_version = 0
+_entries = OrderedDict()   # 날짜 -> (만든 시각, {팀 ID: GameContext})
+
+
+def invalidate_game_context(game_date=None):
+    """경기 정보를 다시 계산했으면 호출해 캐시를 비웁니다. (날짜를 주면 해당 날짜만)"""
+    global _version
+    with _lock:
+        _version += 1
+        if game_date is None:
+            _entries.clear()
+        else:
+            _entries.pop(game_date, None)
+
+
+def _opponent_of(schedule, team_id):
+    return schedule.AWAY_TEAM_ID if schedule.HOME_TEAM_ID == team_id else schedule.HOME_TEAM_ID
+
+
+def _game_result(logs, team_id, opponent_team_id):
+    """
+    한 날짜의 기록으로 팀의 경기 결과를 정합니다.
+    경기 결과 기록이 있으면 그대로, 없으면 득점 비교, 양 팀 모두 기록이 없으면 취소
+
+    Args:
+        logs (tuple): (기록이 있는 팀, {팀 ID: 결과 기록}, {팀 ID: 득점}), 기록이 없는 날짜는 None
+    """
+    logged_teams, logged_results, runs = logs or (set(), {}, {})
+    if team_id not in logged_teams and opponent_team_id not in logged_teams:
+        return RESULT_CANCELLED
+    if team_id in logged_results:
+        return logged_results[team_id]
+
+    team_runs = runs.get(team_id, 0)
+    opponent_runs = runs.get(opponent_team_id, 0)
+    if team_runs > opponent_runs:
+        return "승리"
+    if team_runs < opponent_runs:
+        return "패배"
+    return "무승부"
+
+
+def _series_outcome(series_index, series_wins, series_losses):
+    """3연전의 마지막 경기에서 시리즈 결과를 정합니다. (그 외 경기는 None)"""
+    if series_index != SERIES_LENGTH:
+        return None
+    if series_wins == SERIES_LENGTH:
+        return SERIES_OUTCOME_SWEEP
+    if series_losses == SERIES_LENGTH:
+        return "스윕패"
+    if series_wins > series_losses:
+        return "위닝시리즈"
+    if series_wins < series_losses:
+        return "루징시리즈"
+    return "동률"
+
+
+def compute_game_context(db: Session, game_date):
+    """
+    game_schedule과 game_log에서 해당 날짜의 팀별 경기 정보를 계산합니다. (저장하지 않음)
+    같은 날 한 팀의 경기가 여러 개면 첫 번째 일정만 사용합니다. (game_log도 날짜/팀 단위)
+
+    Args:
+        db (Session): 데이터베이스 세션
+        game_date (date): 경기 날짜
+
+    Returns:
+        list: team_game_context 행 목록 (dict)
+    """
+    schedules = db.query(models.GameSchedule).filter(
+        models.GameSchedule.DATE == game_date
+    ).order_by(models.GameSchedule.GAME_SCHEDULE_KEY).all()
+    if not schedules:
+        return []
+
+    team_schedules = {}
+    for schedule in schedules:
+        team_schedules.setdefault(schedule.HOME_TEAM_ID, schedule)
+        team_schedules.setdefault(schedule.AWAY_TEAM_ID, schedule)
+    team_ids = list(team_schedules)
+
+    # 시리즈 계산 기간 (이전 일정과 기록을 함께 조회)
+    window_start = game_date - timedelta(days=SERIES_LOOKBACK_DAYS)
+
+    # 날짜/팀별 경기 결과/득점 기록과 기록 존재 여부 (한 번의 조회)
+    # 같은 시리즈의 상대팀은 오늘도 같은 상대이므로 오늘 경기가 있는 팀의 기록만 읽으면 됨
+    day_logs = {}  # 날짜 -> (기록이 있는 팀, {팀 ID: 결과 기록}, {팀 ID: 득점})
+    for log_date, team_id, record_type_id, count in db.query(
+        models.GameLog.DATE, models.GameLog.TEAM_ID, models.GameLog.RECORD_TYPE_ID, models.GameLog.COUNT
+    ).filter(
+        models.GameLog.DATE >= window_start,
+        models.GameLog.DATE <= game_date,
+        models.GameLog.TEAM_ID.in_(team_ids)
+    ).all():
+        logged_teams, logged_results, runs = day_logs.setdefault(log_date, (set(), {}, {}))
+        logged_teams.add(team_id)
+        if record_type_id in RESULT_RECORD_TYPES:
+            logged_results[team_id] = RESULT_RECORD_TYPES[record_type_id]
+        elif record_type_id == RUN_RECORD_TYPE_ID:
+            runs[team_id] = count or 0
+
+    # 시리즈 내 경기 순서 계산용 이전 일정 (날짜 내림차순)
+    previous_schedules = db.query(models.GameSchedule).filter(
+        models.GameSchedule.DATE >= window_start,
+        models.GameSchedule.DATE < game_date,
+        (models.GameSchedule.HOME_TEAM_ID.in_(team_ids)) | (models.GameSchedule.AWAY_TEAM_ID.in_(team_ids))
+    ).order_by(models.GameSchedule.DATE.desc(), models.GameSchedule.GAME_SCHEDULE_KEY).all()
+
+    previous_opponents = {}  # 팀 ID -> {날짜: 상대팀 ID}
+    for schedule in previous_schedules:
+        for team_id in (schedule.HOME_TEAM_ID, schedule.AWAY_TEAM_ID):
+            previous_opponents.setdefault(team_id, {}).setdefault(schedule.DATE, _opponent_of(schedule, team_id))
+
+    rows = []
+    for team_id, schedule in team_schedules.items():
+        opponent_team_id = _opponent_of(schedule, team_id)
+        runs = day_logs.get(game_date, (set(), {}, {}))[2]
+        result = _game_result(day_logs.get(game_date), team_id, opponent_team_id)
+
+        # 전날부터 하루씩 거슬러 올라가며 같은 상대와 연속으로 잡힌 경기 수를 셈
+        # (같은 상대와 3연전이 연달아 잡히면 3경기마다 새 시리즈로 봄)
+        consecutive_games = 1
+        opponents_by_date = previous_opponents.get(team_id, {})
+        while opponents_by_date.get(game_date - timedelta(days=consecutive_games)) == opponent_team_id:
+            consecutive_games += 1
+        series_index = (consecutive_games - 1) % SERIES_LENGTH + 1
+
+        # 이번 시리즈의 이전 경기 결과까지 포함한 승/패
+        series_results = [result] + [
+            _game_result(day_logs.get(game_date - timedelta(days=days_ago)), team_id, opponent_team_id)
+            for days_ago in range(1, series_index)
+        ]
+        series_wins = series_results.count("승리")
+        series_losses = series_results.count("패배")
+
+        rows.append({
+            "DATE": game_date,
+            "TEAM_ID": team_id,
+            "OPPONENT_TEAM_ID": opponent_team_id,
+            "GAME_SCHEDULE_KEY": schedule.GAME_SCHEDULE_KEY,
+            "IS_HOME": schedule.HOME_TEAM_ID == team_id,
+            "RUNS": runs.get(team_id, 0),
+            "OPPONENT_RUNS": runs.get(opponent_team_id, 0),
+            "RESULT": result,
+            "SERIES_INDEX": series_index,
+            "CANCELLED": result == RESULT_CANCELLED,
+            "SERIES_WINS": series_wins,
+            "SERIES_LOSSES": series_losses,
+            "SERIES_OUTCOME": _series_outcome(series_index, series_wins, series_losses)
+        })
+
+    return rows
+
+
+def build_game_context(db: Session, game_date):
+    """
+    해당 날짜의 팀별 경기 정보를 계산해 team_game_context 테이블에 저장(갱신)하고 커밋합니다.
+    경기 로그 저장 파이프라인에서 날짜마다 한 번 호출합니다.
+
+    Returns:
+        int: 저장한 팀 수
+    """
+    rows = compute_game_context(db, game_date)
+    now = datetime.now()
+    for row in rows:
+        row["updated_at"] = now
+
+    # 일정이 바뀌어 더 이상 경기가 없는 팀의 행은 삭제
+    stale_query = db.query(models.TeamGameContext).filter(models.TeamGameContext.DATE == game_date)
+    if rows:
+        stale_query = stale_query.filter(models.TeamGameContext.TEAM_ID.notin_([row["TEAM_ID"] for row in rows]))
+    stale_query.delete(synchronize_session=False)
+
+    count = upsert_rows(
+        db, models.TeamGameContext.__table__, rows,
+        ["DATE", "TEAM_ID"], CONTEXT_COLUMNS[2:] + ["updated_at"]
+    )
+    db.commit()
+    invalidate_game_context(game_date)
+
+    logger.info(f"[{game_date}] 팀 경기 정보 저장: {count}개 팀")
+    return count
+
+
+def get_game_context(db: Session, game_date):
+    """
+    해당 날짜의 팀별 경기 정보를 캐시에서 가져오고, 없으면 테이블에서 읽습니다.
+    아직 계산되지 않은 날짜는 원본 테이블에서 계산합니다. (저장하지 않음)
+
+    Returns:
+        dict: {팀 ID: GameContext} (경기가 없는 팀은 포함되지 않음)
+    """
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(game_date)
+        if entry is not None and now - entry[0] < GAME_CONTEXT_TTL:
+            _entries.move_to_end(game_date)
+            return entry[1]
+        version = _version
+
+    stored = db.query(models.TeamGameContext).filter(models.TeamGameContext.DATE == game_date).all()
+    if stored:
+        contexts = {
+            row.TEAM_ID: GameContext(**{column: getattr(row, column) for column in CONTEXT_COLUMNS})
+            for row in stored
+        }
+    else:
+        contexts = {row["TEAM_ID"]: GameContext(**row) for row in compute_game_context(db, game_date)}
+
+    with _lock:
+        # 읽는 동안 다시 계산되었으면 오래된 결과를 캐시에 넣지 않음
+        if version == _version:
+            _entries[game_date] = (now, contexts)
+            _entries.move_to_end(game_date)
+            while len(_entries) > GAME_CONTEXT_CACHE_SIZE:
+                _entries.popitem(last=False)
+
+    return contexts
+
+
+def get_team_game_contexts(db: Session, team_id: int, end_date, start_date=None):
+    """
+    팀의 기간 내 경기 정보를 날짜 내림차순으로 반환합니다.
+    저장되지 않은 날짜(백필 전 등)는 get_game_context로 채웁니다.
+
+    Returns:
+        list: GameContext 목록
+    """
+    stored_query = db.query(models.TeamGameContext).filter(
+        models.TeamGameContext.TEAM_ID == team_id,
+        models.TeamGameContext.DATE <= end_date
+    )
+    schedule_query = db.query(models.GameSchedule.DATE).filter(
+        (models.GameSchedule.HOME_TEAM_ID == team_id) | (models.GameSchedule.AWAY_TEAM_ID == team_id),
+        models.GameSchedule.DATE <= end_date
+    )
+    if start_date is not None:
+        stored_query = stored_query.filter(models.TeamGameContext.DATE >= start_date)
+        schedule_query = schedule_query.filter(models.GameSchedule.DATE >= start_date)
+
+    contexts = {
+        row.DATE: GameContext(**{column: getattr(row, column) for column in CONTEXT_COLUMNS})
+        for row in stored_query.all()
+    }
+    for (game_date,) in schedule_query.distinct().all():
+        if game_date not in contexts:
+            context = get_game_context(db, game_date).get(team_id)
+            if context is not None:
+                contexts[game_date] = context
+
+    return [contexts[game_date] for game_date in sorted(contexts, reverse=True)]
+
+
+def count_team_results(db: Session, team_id: int, start_date, end_date):
+    """
+    팀의 기간 내 경기 결과별 횟수를 셉니다.
+
+    Returns:
+        dict: {"승리": n, "패배": n, "무승부": n, "취소": n}
+    """
+    counts = {"승리": 0, "패배": 0, "무승부": 0, RESULT_CANCELLED: 0}
+    game_date = start_date
+    while game_date <= end_date:
+        context = get_game_context(db, game_date).get(team_id)
+        if context is not None:
+            counts[context.RESULT] = counts.get(context.RESULT, 0) + 1
+        game_date += timedelta(days=1)
+    return counts
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='날짜별 팀 경기 정보를 계산해 저장합니다.')
+    parser.add_argument('--date', type=str, help='계산할 날짜 (YYYY-MM-DD 형식, 기본값: 어제)')
+    parser.add_argument('--start', type=str, help='백필 시작 날짜 (YYYY-MM-DD 형식, --end와 함께 사용)')
+    parser.add_argument('--end', type=str, help='백필 종료 날짜 (YYYY-MM-DD 형식)')
+    args = parser.parse_args()
+
+    if args.start:
+        start_date = datetime.strptime(args.start, '%Y-%m-%d').date()
+        end_date = datetime.strptime(args.end, '%Y-%m-%d').date() if args.end else datetime.now().date() - timedelta(days=1)
+    else:
+        start_date = end_date = (
+            datetime.strptime(args.date, '%Y-%m-%d').date() if args.date else datetime.now().date() - timedelta(days=1)
+        )
+
+    from database import SessionLocal
+    db = SessionLocal()
+    try:
+        game_date = start_date
+        total = 0
+        while game_date <= end_date:
+            total += build_game_context(db, game_date)
+            game_date += timedelta(days=1)
+        logger.info(f"팀 경기 정보 계산 완료: {start_date} ~ {end_date}, {total}건")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
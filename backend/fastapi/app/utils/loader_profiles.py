@@ -0,0 +1,105 @@
+# utils/loader_profiles.py
+import os
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, joinedload, selectinload, raiseload
+
+import models
+
+logger = logging.getLogger(__name__)
+
+# 지연 로딩 점검 모드
+# - off: 점검하지 않음 (기본값)
+# - profile: 로딩 프로필을 적용한 조회에서 프로필에 없는 관계를 지연 로딩하면 예외 발생
+# - all: 모든 ORM 조회에서 미리 로딩하지 않은 관계를 지연 로딩하면 예외 발생 (테스트/벤치마크용)
+ORM_RAISELOAD = os.getenv("ORM_RAISELOAD", "off").lower()
+
+# 용도별 관계 로딩 프로필 (여러 행을 읽고 행마다 관계를 따라가는 곳에서 사용)
+LOADER_PROFILES = {
+    # 전체 계정 일일 요약: 사용자, 응원팀, 최애 선수, 적금 규칙(규칙 타입/상세 규칙/기록 타입/선수)
+    "account_daily_summary": (
+        joinedload(models.Account.user),
+        joinedload(models.Account.team),
+        joinedload(models.Account.favorite_player),
+        selectinload(models.Account.user_saving_rules).options(
+            joinedload(models.UserSavingRule.saving_rule_type),
+            joinedload(models.UserSavingRule.saving_rule_detail)
+                .joinedload(models.SavingRuleDetail.saving_rule)
+                .joinedload(models.SavingRuleList.record_type),
+            joinedload(models.UserSavingRule.player),
+        ),
+    ),
+    # 사용자 적금 규칙 + 규칙 타입/상세 규칙/기록 타입/선수 타입/선수
+    "user_saving_rule_detail": (
+        joinedload(models.UserSavingRule.saving_rule_type),
+        joinedload(models.UserSavingRule.saving_rule_detail)
+            .joinedload(models.SavingRuleDetail.saving_rule)
+            .joinedload(models.SavingRuleList.record_type),
+        joinedload(models.UserSavingRule.player_type),
+        joinedload(models.UserSavingRule.player),
+    ),
+    # 선수 기록 + 선수/팀/기록 타입
+    "player_record_detail": (
+        joinedload(models.PlayerRecord.player),
+        joinedload(models.PlayerRecord.team),
+        joinedload(models.PlayerRecord.record_type),
+    ),
+    # 팀 경기 기록 + 기록 타입
+    "game_log_with_record_type": (
+        joinedload(models.GameLog.record_type),
+    ),
+}
+
+
+def loader_options(*profile_names):
+    """
+    로딩 프로필 이름들에 해당하는 loader option 목록을 반환합니다.
+
+    Args:
+        *profile_names (str): LOADER_PROFILES 키
+
+    Returns:
+        list: query.options()에 넘길 option 목록
+
+    Raises:
+        KeyError: 등록되지 않은 프로필 이름인 경우
+    """
+    options = []
+    for name in profile_names:
+        if name not in LOADER_PROFILES:
+            raise KeyError(f"등록되지 않은 로딩 프로필: {name}")
+        options.extend(LOADER_PROFILES[name])
+
+    # 프로필에 없는 관계를 지연 로딩하면 예외 (식별자 맵에서 바로 찾을 수 있는 경우는 허용)
+    if ORM_RAISELOAD in ("profile", "all"):
+        options.append(raiseload("*", sql_only=True))
+
+    return options
+
+
+def apply_loader_profile(query, *profile_names):
+    """
+    조회 쿼리에 로딩 프로필을 적용합니다.
+
+    Args:
+        query (Query): 조회 쿼리
+        *profile_names (str): LOADER_PROFILES 키
+
+    Returns:
+        Query: 프로필 option이 적용된 쿼리
+    """
+    return query.options(*loader_options(*profile_names))
+
+
+def _raise_on_lazy_load(orm_execute_state):
+    """ORM_RAISELOAD=all 일 때 모든 ORM 조회에 raiseload('*')를 붙입니다."""
+    if (orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*", sql_only=True))
+
+
+if ORM_RAISELOAD == "all" and not event.contains(Session, "do_orm_execute", _raise_on_lazy_load):
+    event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
+    logger.warning("ORM_RAISELOAD=all: 미리 로딩하지 않은 관계의 지연 로딩은 예외가 발생합니다.")
@@ -0,0 +1,104 @@
+# utils/pagination.py
+import json
+import base64
+from datetime import date, datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+# 다음 페이지 커서를 내려주는 응답 헤더 (응답 본문 형식은 기존 목록 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 한 페이지 기본/최대 건수 (limit 없이 호출해도 전체 이력을 한 번에 내려주지 않음)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(sort_value, row_id):
+    """
+    (정렬 값, ID)를 외부에 노출되지 않는 불투명한 커서 문자열로 만듭니다.
+
+    Args:
+        sort_value (date | datetime): 마지막 행의 정렬 기준 값
+        row_id (int): 마지막 행의 ID
+
+    Returns:
+        str: URL에 그대로 쓸 수 있는 커서 문자열
+    """
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    커서 문자열을 (정렬 값, ID)로 되돌립니다.
+
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않은 경우 (400)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        sort_value = datetime.fromisoformat(value) if "T" in value else date.fromisoformat(value)
+        return sort_value, int(row_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor 값이 올바르지 않습니다."
+        )
+
+
+def keyset_paginate(query, sort_column, id_column, cursor=None, limit=None, since=None, until=None, descending=True):
+    """
+    (정렬 값, ID) 키셋 방식으로 목록을 페이지 단위로 조회합니다.
+    OFFSET 대신 마지막 행 이후 조건을 SQL에 넣으므로 이력이 길어져도 페이지 조회 비용이 일정합니다.
+
+    Args:
+        query (Query): 필터가 적용된 조회 쿼리
+        sort_column (Column): 정렬 기준 칼럼 (날짜 등)
+        id_column (Column): 같은 정렬 값 안에서 순서를 정하는 고유 ID 칼럼
+        cursor (str, optional): 이전 페이지 응답의 다음 커서
+        limit (int, optional): 페이지 크기. None이면 페이지 없이 전체 반환 (기존 동작)
+        since (date, optional): 정렬 값 하한 (포함)
+        until (date, optional): 정렬 값 상한 (포함)
+        descending (bool, optional): 최신순 정렬 여부. 기본값은 True.
+
+    Returns:
+        tuple: (행 목록, 다음 페이지 커서 또는 None)
+    """
+    if since is not None:
+        query = query.filter(sort_column >= since)
+    if until is not None:
+        query = query.filter(sort_column <= until)
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        if descending:
+            query = query.filter(or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id)
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > row_id)
+            ))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    if limit is None:
+        return query.all(), None
+
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
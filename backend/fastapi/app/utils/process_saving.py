@@ -17,6 +17,8 @@ import sys
 sys.path.append(project_root)
 import models
 from database import engine
+from utils.saving_detail import build_saving_details
+from utils.game_context import get_game_context, SERIES_OUTCOME_SWEEP
 import logging
 
 logging.basicConfig(
@@ -98,12 +100,24 @@ def process_savings_for_date(game_date=None, session=None):
             
             player_stats[record.PLAYER_ID]['records'][record.RECORD_TYPE_ID] = record.COUNT
         
+        # 2.1. 팀별 경기 정보 (상대팀, 결과, 시리즈 결과)
+        game_context = get_game_context(session, game_date)
+        
+        # 스윕한 팀 (경기 로그 저장 시 팀별로 한 번 계산한 시리즈 결과)
+        team_sweeps = {
+            team_id: 1 for team_id, team_game in game_context.items()
+            if team_game.SERIES_OUTCOME == SERIES_OUTCOME_SWEEP
+        }
+        
         # 3. 모든 계정 조회
         accounts = session.query(models.Account).all()
         
         # 계정별 일일 총액을 저장할 딕셔너리
         account_daily_totals = {}
 
+        # 새로 적립한 (DailySaving, 사용자 규칙) 목록 (조회용 상세 테이블 작성용)
+        saved_rules = []
+
         # 해당 날짜에 이미 처리된 규칙 목록 조회 (중복 방지용)
         existing_savings = session.query(
             models.DailySaving.ACCOUNT_ID, 
@@ -188,46 +202,8 @@ def process_savings_for_date(game_date=None, session=None):
                     
                     # 스윕 규칙 처리 (기록 유형 ID가 7인 경우, 스윕)
                     if record_type_id == 7:  # 스윕 기록 처리
-                        # 최근 3일간의 날짜 계산
-                        three_days_ago = game_date - timedelta(days=2)  # 오늘 포함 3일
-                        
-                        # 최근 3일간의 게임 일정 조회
-                        recent_games = session.query(models.GameSchedule).filter(
-                            models.GameSchedule.DATE >= three_days_ago,
-                            models.GameSchedule.DATE <= game_date,
-                            ((models.GameSchedule.HOME_TEAM_ID == team_id) | 
-                             (models.GameSchedule.AWAY_TEAM_ID == team_id))
-                        ).order_by(models.GameSchedule.DATE).all()
-                        
-                        # 최근 3일간의 승리 기록 조회 (기록 유형 ID가 1인 경우, 승리)
-                        recent_wins = session.query(models.GameLog).filter(
-                            models.GameLog.DATE >= three_days_ago,
-                            models.GameLog.DATE <= game_date,
-                            models.GameLog.TEAM_ID == team_id,
-                            models.GameLog.RECORD_TYPE_ID == 1  # 승리 기록 유형
-                        ).order_by(models.GameLog.DATE).all()
-                        
-                        # 스윕 확인
-                        sweep_count = 0
-                        
-                        # 최근 3경기가 있는지 확인
-                        if len(recent_games) >= 3:
-                            # 경기 상대팀 확인
-                            opponents = []
-                            for game in recent_games:
-                                if game.HOME_TEAM_ID == team_id:
-                                    opponents.append(game.AWAY_TEAM_ID)
-                                else:
-                                    opponents.append(game.HOME_TEAM_ID)
-                            
-                            # 최근 3경기의 상대팀이 모두 같은지 확인
-                            if len(set(opponents[:3])) == 1:  # 첫 3개의 상대팀이 동일한지 확인
-                                # 최근 3일간 이 팀의 승리 횟수 확인
-                                if len(recent_wins) >= 3:
-                                    # 동일한 상대에 대한 3연승 확인
-                                    # 여기서는 단순화를 위해 3일 연속 승리가 있으면 스윕으로 간주
-                                    sweep_count = 1
-                                    print(f"스윕 감지: 팀 {team_id}가 최근 3일간 동일한 상대팀 {opponents[0]}에 대해 연승")
+                        # 스윕 확인 (3연전 전승)
+                        sweep_count = team_sweeps.get(team_id, 0)
                         
                         # 스윕이 확인되면 적립금 처리
                         if sweep_count > 0:
@@ -266,6 +242,7 @@ def process_savings_for_date(game_date=None, session=None):
                                 created_at=datetime.now()
                             )
                             session.add(daily_saving)
+                            saved_rules.append((daily_saving, rule))
                             
                             # 처리된 규칙 집합에 추가 (중복 방지)
                             processed_rules.add(rule_key)
@@ -323,6 +300,7 @@ def process_savings_for_date(game_date=None, session=None):
                             created_at=datetime.now()
                         )
                         session.add(daily_saving)
+                        saved_rules.append((daily_saving, rule))
                         
                         # 처리된 규칙 집합에 추가 (중복 방지)
                         processed_rules.add(rule_key)
@@ -347,19 +325,9 @@ def process_savings_for_date(game_date=None, session=None):
                 # 상대팀 규칙: 상대 팀의 기록에 따라 적립
                 elif rule_type.SAVING_RULE_TYPE_NAME == "상대팀":
                     team_id = account.TEAM_ID
-                    # 해당 날짜에 account의 팀이 참여한 경기 일정에서 실제 상대팀만 추출
-                    game_schedules = session.query(models.GameSchedule).filter(
-                        models.GameSchedule.DATE == game_date,
-                        (models.GameSchedule.HOME_TEAM_ID == team_id) | (models.GameSchedule.AWAY_TEAM_ID == team_id)
-                    ).all()
-                    opposing_teams = []
-                    for game in game_schedules:
-                        if game.HOME_TEAM_ID == team_id:
-                            opposing_team_id = game.AWAY_TEAM_ID
-                        else:
-                            opposing_team_id = game.HOME_TEAM_ID
-                        if opposing_team_id not in opposing_teams:
-                            opposing_teams.append(opposing_team_id)
+                    # 해당 날짜에 account의 팀이 참여한 경기의 실제 상대팀 (팀별 경기 정보)
+                    team_game = game_context.get(team_id)
+                    opposing_teams = [team_game.OPPONENT_TEAM_ID] if team_game else []
                     
                     for opposing_team_id in opposing_teams:
                         if opposing_team_id in team_stats and record_type_id in team_stats[opposing_team_id] and team_stats[opposing_team_id][record_type_id] > 0:
@@ -401,6 +369,7 @@ def process_savings_for_date(game_date=None, session=None):
                                 created_at=datetime.now()
                             )
                             session.add(daily_saving)
+                            saved_rules.append((daily_saving, rule))
                             
                             # 처리된 규칙 집합에 추가 (중복 방지)
                             processed_rules.add(rule_key)
@@ -503,6 +472,7 @@ def process_savings_for_date(game_date=None, session=None):
                         created_at=datetime.now()
                     )
                     session.add(daily_saving)
+                    saved_rules.append((daily_saving, rule))
                     
                     # 처리된 규칙 집합에 추가 (중복 방지)
                     processed_rules.add(rule_key)
@@ -535,15 +505,33 @@ def process_savings_for_date(game_date=None, session=None):
                 savings_count += account_savings_count
                 print(f"계정 {account.ACCOUNT_ID} 총 적립액: {account_total_saved}원 ({account_savings_count}건)")
 
-        # 4. 계정별 일일 총액을 DailyTransfer에 한 번씩만 저장
+        # 4. 적립 내역별 조회용 상세 행 저장 (규칙/기록/선수 이름을 미리 기록)
+        build_saving_details(session, saved_rules)
+
+        # 5. 계정별 일일 총액을 DailyTransfer에 한 번씩만 저장
+        existing_transfers = {
+            transfer.ACCOUNT_ID: transfer for transfer in session.query(models.DailyTransfer).filter(
+                models.DailyTransfer.DATE == game_date
+            ).all()
+        }
         for account_id, total_amount in account_daily_totals.items():
+            # (계정, 날짜)당 이체 원장은 하나 (멱등성 키 중복 방지)
+            existing_transfer = existing_transfers.get(account_id)
+            if existing_transfer is not None:
+                if existing_transfer.STATUS == models.DailyTransfer.STATUS_PENDING:
+                    existing_transfer.AMOUNT += total_amount
+                else:
+                    logger.warning(f"계정 {account_id}: {game_date} 이체가 이미 {existing_transfer.STATUS} 상태라 {total_amount}원을 추가하지 않습니다.")
+                continue
             # DailyTransfer에 하루에 한 번만 총액 저장
             daily_transfer = models.DailyTransfer(
                 ACCOUNT_ID=account_id,
                 DATE=game_date,
                 AMOUNT=total_amount,
                 created_at=datetime.now(),
-                TEXT="출금예정!!"
+                TEXT="출금예정!!",
+                STATUS=models.DailyTransfer.STATUS_PENDING,
+                IDEMPOTENCY_KEY=models.DailyTransfer.make_idempotency_key(account_id, game_date)
             )
             session.add(daily_transfer)
         
@@ -638,12 +626,15 @@ def clear_existing_savings(game_date=None, session=None):
            session.delete(saving)
            deleted_count += 1
        
-       # DailyTransfer 테이블의 해당 날짜 레코드도 삭제
+       # DailyTransfer 테이블의 해당 날짜 레코드도 삭제 (이미 이체가 끝난 건은 원장 기록으로 남김)
        daily_transfers = session.query(models.DailyTransfer).filter(
            models.DailyTransfer.DATE == game_date
        ).all()
        
        for transfer in daily_transfers:
+           if transfer.STATUS == models.DailyTransfer.STATUS_SUCCEEDED:
+               print(f"계정 {transfer.ACCOUNT_ID}: {game_date} 이체가 이미 완료되어 DailyTransfer를 삭제하지 않습니다.")
+               continue
            session.delete(transfer)
        
        # 변경 사항 커밋
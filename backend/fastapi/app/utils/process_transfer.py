@@ -35,14 +35,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def process_actual_transfers(db, date_param=None):
+# 한 번에 커밋할 이체 건수 (배치마다 상태를 기록해 중단 후 재시작해도 완료된 이체를 다시 보내지 않음)
+TRANSFER_BATCH_SIZE = int(os.getenv("TRANSFER_BATCH_SIZE", "20"))
+# 배치 안에서 동시에 보낼 이체 수 (금융 API 호출은 동기 HTTP 이므로 작업 스레드에서 실행)
+TRANSFER_CONCURRENCY = int(os.getenv("TRANSFER_CONCURRENCY", "4"))
+
+
+def _extract_transaction_no(transfer_result):
+    """금융 API 이체 응답(REC)에서 거래고유번호(입금 계좌 쪽)를 꺼냅니다."""
+    if isinstance(transfer_result, list):
+        transfer_result = transfer_result[0] if transfer_result else {}
+    if isinstance(transfer_result, dict):
+        return transfer_result.get("transactionUniqueNo")
+    return None
+
+
+def _send_transfer(user_key, source_account, account_num, amount):
+    """
+    작업 스레드에서 이체 API를 호출합니다. 기관거래고유번호는 시도마다 새로 만듭니다.
+    (금융 API는 이미 사용한 번호를 거절하므로 원장의 IDEMPOTENCY_KEY 는 로컬 중복 방지에만 사용)
+    """
+    from router.user.user_ssafy_api_utils import transfer_money
+    return asyncio.run(transfer_money(
+        user_key=user_key,
+        withdrawal_account=source_account,  # 출금 계좌 (입출금 계좌)
+        deposit_account=account_num,        # 입금 계좌 (적금 계좌)
+        amount=amount,
+        llm_text="야금야금 출금"  # 트랜잭션 메시지
+    ))
+
+
+def _find_completed_transfer(user_key, source_account, account_num, amount, transfer_date, claimed_numbers):
+    """
+    작업 스레드에서 적금 계좌의 입금 내역을 조회해, 이전 시도에서 응답을 받지 못했지만
+    은행에서는 처리된 이체가 있는지 확인합니다.
+    적립 날짜 이후 출금 계좌에서 같은 금액으로 들어온 입금 중 다른 이체 건에 아직 연결되지 않은 것을 찾습니다.
+
+    Returns:
+        str: 처리된 이체의 거래고유번호 (없으면 None)
+    """
+    from router.user.user_ssafy_api_utils import get_transaction_history, TRANSFER_DEPOSIT_SUMMARY
+    history = asyncio.run(get_transaction_history(
+        user_key,
+        account_num,
+        transfer_date.strftime("%Y%m%d"),
+        datetime.now().strftime("%Y%m%d"),
+        transaction_type="M",
+        order_by_type="ASC"
+    ))
+    items = history.get("list", []) if isinstance(history, dict) else history or []
+    for item in items:
+        if (item.get("transactionUniqueNo") not in claimed_numbers
+                and item.get("transactionAccountNo") == source_account
+                and str(item.get("transactionBalance")) == str(amount)
+                and item.get("transactionSummary") == TRANSFER_DEPOSIT_SUMMARY):
+            return item.get("transactionUniqueNo")
+    return None
+
+
+async def process_actual_transfers(db, date_param=None, resume=False, batch_size=TRANSFER_BATCH_SIZE):
     """
     특정 날짜(기본값: 어제)의 DailyTransfer 내역을 기준으로 실제 이체를 처리합니다.
     이체 처리 후 바로 daily_balances 테이블 업데이트와 이자 계산도 수행합니다.
     
+    이체 건마다 PENDING → IN_FLIGHT → SUCCEEDED/FAILED 상태를 기록하고 batch_size 건마다 커밋합니다.
+    배치 안에서는 최대 TRANSFER_CONCURRENCY 건을 동시에 보냅니다.
+    금융 API는 같은 기관거래고유번호의 재요청을 거절하므로 시도마다 새 번호를 보내고,
+    이전에 시도한(IN_FLIGHT/FAILED) 건은 다시 보내기 전에 적금 계좌 입금 내역으로 이미 처리됐는지 확인합니다.
+    
     Args:
         db (Session): 데이터베이스 세션
         date_param (date, optional): 처리할 날짜. 기본값은 어제.
+        resume (bool, optional): True면 PENDING 외에 중단된(IN_FLIGHT)/실패한(FAILED) 이체도 다시 시도. 기본값은 False.
+        batch_size (int, optional): 한 번에 커밋할 이체 건수. 기본값은 TRANSFER_BATCH_SIZE.
     
     Returns:
         dict: 처리 결과 요약 정보
@@ -51,7 +116,7 @@ async def process_actual_transfers(db, date_param=None):
     if date_param is None:
         date_param = datetime.now().date() - timedelta(days=1)
     
-    logger.info(f"[{date_param}] DailyTransfer 내역 기반 실제 이체 처리 시작...")
+    logger.info(f"[{date_param}] DailyTransfer 내역 기반 실제 이체 처리 시작... (재시도 모드: {resume})")
     
     # 처리 결과 요약용 변수
     total_transferred = 0
@@ -59,94 +124,166 @@ async def process_actual_transfers(db, date_param=None):
     skipped_accounts = 0
     failed_accounts = 0
     
+    target_statuses = [models.DailyTransfer.STATUS_PENDING]
+    if resume:
+        target_statuses += [models.DailyTransfer.STATUS_IN_FLIGHT, models.DailyTransfer.STATUS_FAILED]
+    
     try:
-        # 해당 날짜의 DailyTransfer 내역 조회
+        # 해당 날짜의 미완료 DailyTransfer 내역 조회 (이미 SUCCEEDED 인 건은 절대 다시 보내지 않음)
         daily_transfers = db.query(models.DailyTransfer).filter(
-            models.DailyTransfer.DATE == date_param
-        ).all()
+            models.DailyTransfer.DATE == date_param,
+            models.DailyTransfer.STATUS.in_(target_statuses)
+        ).order_by(models.DailyTransfer.DAILY_TRANSFER_ID).all()
         
-        logger.info(f"총 {len(daily_transfers)}개 계정의 이체 내역이 있습니다.")
+        already_succeeded = db.query(func.count(models.DailyTransfer.DAILY_TRANSFER_ID)).filter(
+            models.DailyTransfer.DATE == date_param,
+            models.DailyTransfer.STATUS == models.DailyTransfer.STATUS_SUCCEEDED
+        ).scalar() or 0
         
-        # 각 계정별로 이체 처리
-        for daily_transfer in daily_transfers:
-            try:
-                # 계정 정보 조회
-                account = db.query(models.Account).filter(
-                    models.Account.ACCOUNT_ID == daily_transfer.ACCOUNT_ID
-                ).first()
+        logger.info(f"총 {len(daily_transfers)}개 계정의 이체 대상이 있습니다. (이미 완료: {already_succeeded}건)")
+        
+        semaphore = asyncio.Semaphore(max(1, TRANSFER_CONCURRENCY))
+        
+        async def run_transfer(transfer_args, transfer_date, retried, claimed_numbers):
+            """
+            이체 한 건 처리 (이전에 시도한 건은 은행 처리 여부를 먼저 확인). 결과는 호출한 쪽에서 반영
+            작업 스레드에서는 세션을 쓰지 않도록 ORM 객체 대신 값만 넘김
+            """
+            async with semaphore:
+                try:
+                    if retried:
+                        bank_transaction_no = await asyncio.to_thread(
+                            _find_completed_transfer, *transfer_args, transfer_date, claimed_numbers
+                        )
+                        if bank_transaction_no:
+                            return "recovered", bank_transaction_no
+                except Exception as e:
+                    # 처리 여부를 모르는 채로 다시 보내면 중복 출금될 수 있으므로 이번에는 보내지 않음
+                    return "unknown", f"이체 여부 확인 실패: {str(e)}"
                 
+                try:
+                    transfer_result = await asyncio.to_thread(_send_transfer, *transfer_args)
+                    return "sent", _extract_transaction_no(transfer_result)
+                except Exception as e:
+                    return "failed", str(e)
+        
+        for batch_start in range(0, len(daily_transfers), batch_size):
+            batch = daily_transfers[batch_start:batch_start + batch_size]
+            account_ids = [daily_transfer.ACCOUNT_ID for daily_transfer in batch]
+            
+            # 배치 단위로 계정/사용자/트랜잭션 메시지를 한 번에 조회
+            accounts = {
+                account.ACCOUNT_ID: account
+                for account in db.query(models.Account).filter(models.Account.ACCOUNT_ID.in_(account_ids)).all()
+            }
+            users = {
+                user.USER_ID: user
+                for user in db.query(models.User).filter(
+                    models.User.USER_ID.in_([account.USER_ID for account in accounts.values()])
+                ).all()
+            }
+            messages = {
+                message.ACCOUNT_ID: message
+                for message in db.query(models.TransactionMessage).filter(
+                    models.TransactionMessage.ACCOUNT_ID.in_(account_ids),
+                    models.TransactionMessage.TRANSACTION_DATE == date_param
+                ).all()
+            }
+            # 다른 이체 건에 이미 연결된 거래고유번호 (처리 여부 확인 시 제외)
+            claimed_numbers = {}
+            for account_id, bank_transaction_no in db.query(
+                models.DailyTransfer.ACCOUNT_ID, models.DailyTransfer.BANK_TRANSACTION_NO
+            ).filter(
+                models.DailyTransfer.ACCOUNT_ID.in_(account_ids),
+                models.DailyTransfer.STATUS == models.DailyTransfer.STATUS_SUCCEEDED,
+                models.DailyTransfer.BANK_TRANSACTION_NO.isnot(None)
+            ).all():
+                claimed_numbers.setdefault(account_id, set()).add(bank_transaction_no)
+            
+            # 1. 금융 API 호출 전에 IN_FLIGHT 상태를 먼저 커밋
+            retried = set()
+            for daily_transfer in batch:
+                if not daily_transfer.IDEMPOTENCY_KEY:
+                    daily_transfer.IDEMPOTENCY_KEY = models.DailyTransfer.make_idempotency_key(
+                        daily_transfer.ACCOUNT_ID, daily_transfer.DATE
+                    )
+                if daily_transfer.ATTEMPTS:
+                    retried.add(daily_transfer.DAILY_TRANSFER_ID)
+                daily_transfer.STATUS = models.DailyTransfer.STATUS_IN_FLIGHT
+                daily_transfer.ATTEMPTS = (daily_transfer.ATTEMPTS or 0) + 1
+                daily_transfer.LAST_ERROR = None
+            db.commit()
+            
+            # 2. 이체 처리 (금융 API 호출만 동시에 실행하고, DB 반영은 이 루프에서 순서대로)
+            tasks = []
+            for daily_transfer in batch:
+                account = accounts.get(daily_transfer.ACCOUNT_ID)
                 if not account:
                     logger.warning(f"계정 ID {daily_transfer.ACCOUNT_ID}를 찾을 수 없습니다. 이체를 건너뜁니다.")
+                    daily_transfer.STATUS = models.DailyTransfer.STATUS_FAILED
+                    daily_transfer.LAST_ERROR = "계정을 찾을 수 없음"
                     skipped_accounts += 1
                     continue
                 
-                # 사용자 정보 조회
-                user = db.query(models.User).filter(
-                    models.User.USER_ID == account.USER_ID
-                ).first()
-                
+                user = users.get(account.USER_ID)
                 if not user:
                     logger.warning(f"계정 ID {daily_transfer.ACCOUNT_ID}의 사용자 정보를 찾을 수 없습니다. 이체를 건너뜁니다.")
+                    daily_transfer.STATUS = models.DailyTransfer.STATUS_FAILED
+                    daily_transfer.LAST_ERROR = "사용자 정보를 찾을 수 없음"
                     skipped_accounts += 1
                     continue
                 
-                # 트랜잭션 메시지 조회
-                transaction_message = db.query(models.TransactionMessage).filter(
-                    models.TransactionMessage.ACCOUNT_ID == account.ACCOUNT_ID,
-                    models.TransactionMessage.TRANSACTION_DATE == date_param
-                ).first()
-                
+                logger.info(f"계정 ID {account.ACCOUNT_ID}: {daily_transfer.AMOUNT}원 이체 시작 (출금계좌: {account.SOURCE_ACCOUNT}, 입금계좌: {account.ACCOUNT_NUM}, 시도: {daily_transfer.ATTEMPTS}회)")
+                tasks.append((daily_transfer, account, run_transfer(
+                    (user.USER_KEY, account.SOURCE_ACCOUNT, account.ACCOUNT_NUM, daily_transfer.AMOUNT),
+                    daily_transfer.DATE,
+                    daily_transfer.DAILY_TRANSFER_ID in retried,
+                    claimed_numbers.get(account.ACCOUNT_ID, set())
+                )))
+            
+            results = await asyncio.gather(*(task for _, _, task in tasks))
+            
+            for (daily_transfer, account, _), (outcome, detail) in zip(tasks, results):
                 # 메시지가 없으면 기본 메시지 사용
                 llm_text = "야금야금 출금"
+                transaction_message = messages.get(account.ACCOUNT_ID)
                 if transaction_message and transaction_message.MESSAGE:
                     llm_text = transaction_message.MESSAGE
                 
-                # 이체 처리
-                try:
-                    # 금융 API를 통한 이체 처리
-                    from router.user.user_ssafy_api_utils import transfer_money
-                    
-                    saving_amount = daily_transfer.AMOUNT
-                    
-                    logger.info(f"계정 ID {account.ACCOUNT_ID}: {saving_amount}원 이체 시작 (출금계좌: {account.SOURCE_ACCOUNT}, 입금계좌: {account.ACCOUNT_NUM})")
-                    
-                    transfer_result = await transfer_money(
-                        user_key=user.USER_KEY,
-                        withdrawal_account=account.SOURCE_ACCOUNT,  # 출금 계좌 (입출금 계좌)
-                        deposit_account=account.ACCOUNT_NUM,        # 입금 계좌 (적금 계좌)
-                        amount=saving_amount,
-                        llm_text="야금야금 출금"  # 트랜잭션 메시지
-                    )
-                    
-                    # 이체 성공 시 계정 잔액 업데이트
+                saving_amount = daily_transfer.AMOUNT
+                
+                if outcome in ("sent", "recovered"):
+                    # 이체 성공 시 계정 잔액 업데이트 (SUCCEEDED 상태와 같은 커밋에 반영)
                     account.TOTAL_AMOUNT += saving_amount
                     
                     daily_transfer.TEXT = llm_text
-
+                    daily_transfer.STATUS = models.DailyTransfer.STATUS_SUCCEEDED
+                    daily_transfer.BANK_TRANSACTION_NO = detail
+                    
                     total_transferred += saving_amount
                     processed_accounts += 1
                     
-                    logger.info(f"계정 ID {account.ACCOUNT_ID}: {saving_amount}원 이체 성공")
-                    
-                except Exception as e:
-                    logger.error(f"계정 ID {account.ACCOUNT_ID} 이체 처리 중 오류: {str(e)}")
+                    if outcome == "recovered":
+                        logger.info(f"계정 ID {account.ACCOUNT_ID}: 이전 시도에서 이미 처리된 이체 확인 (거래고유번호 {detail}), 다시 보내지 않음")
+                    else:
+                        logger.info(f"계정 ID {account.ACCOUNT_ID}: {saving_amount}원 이체 성공")
+                else:
+                    logger.error(f"계정 ID {account.ACCOUNT_ID} 이체 처리 중 오류: {detail}")
+                    daily_transfer.STATUS = models.DailyTransfer.STATUS_FAILED
+                    daily_transfer.LAST_ERROR = detail[:255]
                     failed_accounts += 1
-                    continue
-                    
-            except Exception as e:
-                logger.error(f"계정 ID {daily_transfer.ACCOUNT_ID} 처리 중 오류: {str(e)}")
-                failed_accounts += 1
-                continue
-        
-        # 변경사항 커밋
-        db.commit()
+            
+            # 3. 배치 결과 커밋
+            db.commit()
+            logger.info(f"[{date_param}] 이체 진행: {min(batch_start + batch_size, len(daily_transfers))}/{len(daily_transfers)}건 커밋")
         
         transfer_summary = {
             "date": date_param,
             "total_transferred": total_transferred,
             "processed_accounts": processed_accounts,
             "skipped_accounts": skipped_accounts,
-            "failed_accounts": failed_accounts
+            "failed_accounts": failed_accounts,
+            "already_succeeded": already_succeeded
         }
         
         logger.info(f"[{date_param}] 이체 처리 완료: {processed_accounts}개 계정 성공, {skipped_accounts}개 건너뜀, {failed_accounts}개 실패, 총 {total_transferred}원 이체")
@@ -175,7 +312,7 @@ async def process_actual_transfers(db, date_param=None):
         logger.error(f"이체 처리 중 오류 발생: {str(e)}")
         raise
 
-async def process_transfers_for_range(start_date=None, end_date=None, db_session=None):
+async def process_transfers_for_range(start_date=None, end_date=None, db_session=None, resume=False):
     """
     지정된 날짜 범위의 daily_saving 내역에 대해 이체, 잔액 업데이트, 이자 계산을 처리합니다.
     
@@ -183,6 +320,7 @@ async def process_transfers_for_range(start_date=None, end_date=None, db_session
         start_date (date, optional): 시작 날짜. 기본값은 어제.
         end_date (date, optional): 종료 날짜. 기본값은 어제.
         db_session (Session, optional): 데이터베이스 세션. None이면 새 세션 생성.
+        resume (bool, optional): 중단/실패한 이체도 다시 시도할지 여부. 기본값은 False.
     
     Returns:
         list: 각 날짜별 처리 결과 요약 정보
@@ -205,7 +343,7 @@ async def process_transfers_for_range(start_date=None, end_date=None, db_session
         current_date = start_date
         while current_date <= end_date:
             logger.info(f"날짜 {current_date} 처리 시작")
-            result = await process_actual_transfers(db_session, current_date)
+            result = await process_actual_transfers(db_session, current_date, resume=resume)
             results.append(result)
             current_date += timedelta(days=1)
             
@@ -219,6 +357,7 @@ async def main():
     parser.add_argument('--date', type=str, help='처리할 날짜 (YYYY-MM-DD 형식, 기본값: 어제)')
     parser.add_argument('--start-date', type=str, help='처리 시작 날짜 (YYYY-MM-DD 형식)')
     parser.add_argument('--end-date', type=str, help='처리 종료 날짜 (YYYY-MM-DD 형식)')
+    parser.add_argument('--resume', action='store_true', help='중단(IN_FLIGHT)/실패(FAILED)한 이체까지 다시 시도 (완료된 이체는 제외)')
     
     args = parser.parse_args()
     
@@ -231,7 +370,7 @@ async def main():
             # 특정 날짜 처리
             try:
                 process_date = datetime.strptime(args.date, '%Y-%m-%d').date()
-                await process_actual_transfers(db, process_date)
+                await process_actual_transfers(db, process_date, resume=args.resume)
             except ValueError:
                 logger.error("날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력하세요.")
         elif args.start_date and args.end_date:
@@ -239,13 +378,13 @@ async def main():
             try:
                 start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date()
                 end_date = datetime.strptime(args.end_date, '%Y-%m-%d').date()
-                await process_transfers_for_range(start_date, end_date, db)
+                await process_transfers_for_range(start_date, end_date, db, resume=args.resume)
             except ValueError:
                 logger.error("날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력하세요.")
         else:
             # 기본값: 어제 날짜 처리
             yesterday = datetime.now().date() - timedelta(days=1)
-            await process_actual_transfers(db, yesterday)
+            await process_actual_transfers(db, yesterday, resume=args.resume)
     finally:
         db.close()
 
@@ -0,0 +1,385 @@
+# utils/request_metrics.py
+import os
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# 느린 요청 로그 파일 경로 (기본값은 실행 위치와 관계없이 app/slow_request.log)
+SLOW_REQUEST_LOG = os.getenv(
+    "SLOW_REQUEST_LOG",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "slow_request.log")
+)
+
+# 느린 요청 전용 로거 (파일 핸들러는 첫 느린 요청을 기록할 때 연결)
+slow_logger = logging.getLogger("slow_request")
+slow_logger.setLevel(logging.INFO)
+_slow_handler_lock = threading.Lock()
+
+# 느린 요청 판단 기준 (.env 로 조정 가능)
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+SLOW_REQUEST_SQL_COUNT = int(os.getenv("SLOW_REQUEST_SQL_COUNT", "50"))
+
+# 히스토그램 버킷 (지연 시간: 초, SQL 개수: 건)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# 라우트에 매칭되지 않은 요청(404 등)은 하나의 라벨로 묶어 라벨 수 폭증 방지
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class RequestStats:
+    """하나의 HTTP 요청 동안 누적되는 DB/외부 HTTP 지표"""
+
+    def __init__(self):
+        self.sql_count = 0
+        self.db_time = 0.0
+        self.http_count = 0
+        self.http_time = 0.0
+
+
+# 현재 처리 중인 요청의 지표 (요청 밖에서 실행되는 스케줄러 작업은 None)
+_current_stats: ContextVar = ContextVar("request_stats", default=None)
+
+
+class _Histogram:
+    """누적 버킷 방식의 간단한 히스토그램"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+
+class _RouteMetrics:
+    """라우트 단위로 집계되는 지표 묶음"""
+
+    def __init__(self):
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.sql_count = _Histogram(SQL_COUNT_BUCKETS)
+        self.db_time = 0.0
+        self.http_time = 0.0
+        self.status_counts = {}
+        self.slow_count = 0
+
+
+# (method, route) -> _RouteMetrics
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def get_current_stats():
+    """현재 요청의 RequestStats를 반환합니다. 요청 밖이면 None."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_http():
+    """
+    외부 HTTP 호출 구간을 감싸 현재 요청의 외부 HTTP 소요 시간에 더합니다.
+
+    사용 예:
+        with track_http():
+            response = requests.post(...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.http_count += 1
+            stats.http_time += time.perf_counter() - start
+
+
+@contextmanager
+def measure_block():
+    """
+    요청 밖(배치 작업, 벤치마크 등)에서 특정 구간의 SQL 실행 수/DB 시간/외부 HTTP 시간을 측정합니다.
+
+    사용 예:
+        with measure_block() as stats:
+            process_savings_for_date(game_date)
+        print(stats.sql_count, stats.db_time)
+    """
+    stats = RequestStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.sql_count += 1
+        stats.db_time += elapsed
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None:
+        start_times = conn.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
+
+
+def instrument_engine(engine):
+    """
+    SQLAlchemy 엔진에 SQL 실행 횟수/시간 측정 리스너를 등록합니다.
+
+    Args:
+        engine (Engine): 측정할 SQLAlchemy 엔진
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _get_slow_logger():
+    """느린 요청 로거를 반환합니다. 처음 호출될 때 SLOW_REQUEST_LOG 파일 핸들러를 연결합니다."""
+    if not slow_logger.handlers:
+        with _slow_handler_lock:
+            if not slow_logger.handlers:
+                os.makedirs(os.path.dirname(SLOW_REQUEST_LOG) or ".", exist_ok=True)
+                handler = logging.FileHandler(SLOW_REQUEST_LOG, encoding="utf-8", delay=True)
+                handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+                slow_logger.addHandler(handler)
+    return slow_logger
+
+
+def _resolve_route(scope):
+    """
+    요청 스코프에서 라우트 템플릿(/api/account/{account_id} 등)을 추출합니다.
+    최근 FastAPI는 include_router의 prefix를 라우트 경로에 합치지 않으므로, 요청 경로 중 라우트 패턴과
+    일치하는 뒷부분을 뺀 앞부분을 prefix로 붙입니다. 마운트된 앱은 마운트 경로(root_path)도 붙입니다.
+    """
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None) or getattr(route, "path", None)
+    if not path_format:
+        return UNMATCHED_ROUTE
+
+    root_path = scope.get("root_path", "")
+    path = scope.get("path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+
+    prefix = ""
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is not None and not path_regex.match(path):
+        for index in range(1, len(path)):
+            if path[index] == "/" and path_regex.match(path[index:]):
+                prefix = path[:index]
+                break
+
+    return root_path + prefix + path_format
+
+
+def record_request(method, route, status_code, elapsed, stats):
+    """
+    완료된 요청의 지표를 라우트별 히스토그램에 반영하고, 기준을 넘으면 느린 요청 로그를 남깁니다.
+
+    Args:
+        method (str): HTTP 메서드
+        route (str): 라우트 템플릿
+        status_code (int): 응답 상태 코드
+        elapsed (float): 총 처리 시간(초)
+        stats (RequestStats): 요청 동안 누적된 DB/HTTP 지표
+    """
+    elapsed_ms = elapsed * 1000
+    is_slow = elapsed_ms >= SLOW_REQUEST_MS or stats.sql_count >= SLOW_REQUEST_SQL_COUNT
+
+    with _registry_lock:
+        metrics = _registry.get((method, route))
+        if metrics is None:
+            metrics = _registry[(method, route)] = _RouteMetrics()
+        metrics.latency.observe(elapsed)
+        metrics.sql_count.observe(stats.sql_count)
+        metrics.db_time += stats.db_time
+        metrics.http_time += stats.http_time
+        metrics.status_counts[status_code] = metrics.status_counts.get(status_code, 0) + 1
+        if is_slow:
+            metrics.slow_count += 1
+
+    if is_slow:
+        _get_slow_logger().info(
+            f"{method} {route} status={status_code} total={elapsed_ms:.1f}ms "
+            f"db={stats.db_time * 1000:.1f}ms sql={stats.sql_count} "
+            f"http={stats.http_time * 1000:.1f}ms ({stats.http_count}건)"
+        )
+
+
+class RequestMetricsMiddleware:
+    """
+    요청마다 라우트 템플릿, 총 지연 시간, DB 시간, SQL 실행 수, 외부 HTTP 시간을 측정하는 ASGI 미들웨어
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        status_holder = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_stats.reset(token)
+            try:
+                record_request(scope["method"], _resolve_route(scope), status_holder["status"], elapsed, stats)
+            except Exception as e:
+                logger.error(f"요청 지표 기록 중 오류: {str(e)}")
+
+
+def _format_labels(method, route, **extra):
+    labels = {"method": method, "route": route, **extra}
+    parts = []
+    for key, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        parts.append(f'{key}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _render_histogram(lines, name, method, route, histogram):
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        lines.append(f"{name}_bucket{_format_labels(method, route, le=bound)} {count}")
+    lines.append(f"{name}_bucket{_format_labels(method, route, le='+Inf')} {histogram.total}")
+    lines.append(f"{name}_sum{_format_labels(method, route)} {histogram.sum}")
+    lines.append(f"{name}_count{_format_labels(method, route)} {histogram.total}")
+
+
+def render_prometheus():
+    """
+    라우트별 지표를 Prometheus text exposition 형식으로 반환합니다.
+
+    Returns:
+        str: Prometheus text 형식 문자열
+    """
+    with _registry_lock:
+        snapshot = sorted(_registry.items())
+
+        lines = [
+            "# HELP yagum_http_request_duration_seconds 라우트별 요청 처리 시간",
+            "# TYPE yagum_http_request_duration_seconds histogram",
+        ]
+        for (method, route), metrics in snapshot:
+            _render_histogram(lines, "yagum_http_request_duration_seconds", method, route, metrics.latency)
+
+        lines += [
+            "# HELP yagum_http_request_sql_queries 라우트별 요청당 SQL 실행 수",
+            "# TYPE yagum_http_request_sql_queries histogram",
+        ]
+        for (method, route), metrics in snapshot:
+            _render_histogram(lines, "yagum_http_request_sql_queries", method, route, metrics.sql_count)
+
+        lines += [
+            "# HELP yagum_http_request_db_seconds_total 라우트별 누적 DB 시간",
+            "# TYPE yagum_http_request_db_seconds_total counter",
+        ]
+        for (method, route), metrics in snapshot:
+            lines.append(f"yagum_http_request_db_seconds_total{_format_labels(method, route)} {metrics.db_time}")
+
+        lines += [
+            "# HELP yagum_http_request_outbound_seconds_total 라우트별 누적 외부 HTTP 시간",
+            "# TYPE yagum_http_request_outbound_seconds_total counter",
+        ]
+        for (method, route), metrics in snapshot:
+            lines.append(f"yagum_http_request_outbound_seconds_total{_format_labels(method, route)} {metrics.http_time}")
+
+        lines += [
+            "# HELP yagum_http_requests_total 라우트/상태 코드별 요청 수",
+            "# TYPE yagum_http_requests_total counter",
+        ]
+        for (method, route), metrics in snapshot:
+            for status_code, count in sorted(metrics.status_counts.items()):
+                lines.append(f"yagum_http_requests_total{_format_labels(method, route, status=status_code)} {count}")
+
+        lines += [
+            "# HELP yagum_http_slow_requests_total 느린 요청 기준을 넘은 요청 수",
+            "# TYPE yagum_http_slow_requests_total counter",
+        ]
+        for (method, route), metrics in snapshot:
+            lines.append(f"yagum_http_slow_requests_total{_format_labels(method, route)} {metrics.slow_count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def get_slow_endpoint_report(limit=20):
+    """
+    평균 지연 시간 기준으로 느린 엔드포인트 목록을 반환합니다.
+    요청당 평균/최대 SQL 수를 함께 보여주어 N+1 쿼리 회귀를 찾는 데 사용합니다.
+
+    Args:
+        limit (int, optional): 반환할 최대 엔드포인트 수. 기본값은 20.
+
+    Returns:
+        list: 엔드포인트별 요약 정보
+    """
+    report = []
+    with _registry_lock:
+        for (method, route), metrics in _registry.items():
+            total = metrics.latency.total
+            if total == 0:
+                continue
+            report.append({
+                "method": method,
+                "route": route,
+                "requests": total,
+                "avg_ms": round(metrics.latency.sum / total * 1000, 2),
+                "max_ms": round(metrics.latency.max * 1000, 2),
+                "avg_db_ms": round(metrics.db_time / total * 1000, 2),
+                "avg_http_ms": round(metrics.http_time / total * 1000, 2),
+                "avg_sql_count": round(metrics.sql_count.sum / total, 2),
+                "max_sql_count": int(metrics.sql_count.max),
+                "slow_requests": metrics.slow_count
+            })
+
+    report.sort(key=lambda item: item["avg_ms"], reverse=True)
+    return report[:limit]
+
+
+def reset_metrics():
+    """수집된 라우트별 지표를 모두 초기화합니다."""
+    with _registry_lock:
+        _registry.clear()
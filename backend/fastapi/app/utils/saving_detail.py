@@ -0,0 +1,182 @@
+# saving_detail.py
+import os
+import logging
+import argparse
+from datetime import datetime
+from sqlalchemy.orm import sessionmaker
+
+# 현재 스크립트 위치 기준으로 절대 경로 구성
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+
+# 데이터베이스 연결
+from dotenv import load_dotenv
+load_dotenv()
+
+# 모듈 import를 위한 경로 설정
+import sys
+sys.path.append(project_root)
+import models
+from database import engine
+
+logger = logging.getLogger(__name__)
+
+# 백필 시 한 번에 커밋할 적립 내역 수
+BACKFILL_BATCH_SIZE = 1000
+
+
+def build_saving_details(session, saved_rules):
+    """
+    새로 적립된 DailySaving 마다 조회용 DailySavingDetail 행을 만듭니다.
+    규칙 타입/상세 규칙/기록 타입/선수 이름은 건별 조회 대신 한 번씩 묶어서 조회합니다.
+
+    Args:
+        session (Session): 데이터베이스 세션
+        saved_rules (list): (DailySaving, UserSavingRule 또는 None) 목록
+
+    Returns:
+        int: 생성한 상세 행 수
+    """
+    if not saved_rules:
+        return 0
+
+    type_ids = {saving.SAVING_RULED_TYPE_ID for saving, _ in saved_rules}
+    detail_ids = {saving.SAVING_RULED_DETAIL_ID for saving, _ in saved_rules}
+    player_ids = {rule.PLAYER_ID for _, rule in saved_rules if rule is not None and rule.PLAYER_ID}
+
+    type_names = {
+        row.SAVING_RULE_TYPE_ID: row.SAVING_RULE_TYPE_NAME
+        for row in session.query(
+            models.SavingRuleType.SAVING_RULE_TYPE_ID,
+            models.SavingRuleType.SAVING_RULE_TYPE_NAME
+        ).filter(models.SavingRuleType.SAVING_RULE_TYPE_ID.in_(type_ids)).all()
+    }
+
+    # 상세 규칙 → 규칙 → 기록 타입을 한 번에 조인
+    rule_details = {
+        row.SAVING_RULE_DETAIL_ID: row
+        for row in session.query(
+            models.SavingRuleDetail.SAVING_RULE_DETAIL_ID,
+            models.SavingRuleDetail.RULE_DESCRIPTION,
+            models.RecordType.RECORD_NAME
+        ).outerjoin(
+            models.SavingRuleList,
+            models.SavingRuleList.SAVING_RULE_ID == models.SavingRuleDetail.SAVING_RULE_ID
+        ).outerjoin(
+            models.RecordType,
+            models.RecordType.RECORD_TYPE_ID == models.SavingRuleList.RECORD_TYPE_ID
+        ).filter(models.SavingRuleDetail.SAVING_RULE_DETAIL_ID.in_(detail_ids)).all()
+    }
+
+    player_names = {}
+    if player_ids:
+        player_names = {
+            row.PLAYER_ID: row.PLAYER_NAME
+            for row in session.query(models.Player.PLAYER_ID, models.Player.PLAYER_NAME).filter(
+                models.Player.PLAYER_ID.in_(player_ids)
+            ).all()
+        }
+
+    for saving, rule in saved_rules:
+        rule_detail = rule_details.get(saving.SAVING_RULED_DETAIL_ID)
+        rule_description = rule_detail.RULE_DESCRIPTION if rule_detail and rule_detail.RULE_DESCRIPTION else "알 수 없는 규칙"
+
+        player_id = rule.PLAYER_ID if rule is not None else None
+        player_name = player_names.get(player_id) if player_id else None
+
+        # 선수 이름을 규칙 설명에 포함
+        if player_name and "이(가)" in rule_description:
+            rule_description = rule_description.replace("이(가)", f"{player_name}이(가)")
+
+        session.add(models.DailySavingDetail(
+            daily_saving=saving,
+            ACCOUNT_ID=saving.ACCOUNT_ID,
+            DATE=saving.DATE,
+            SAVING_RULE_TYPE_ID=saving.SAVING_RULED_TYPE_ID,
+            SAVING_RULE_DETAIL_ID=saving.SAVING_RULED_DETAIL_ID,
+            RULE_TYPE_NAME=type_names.get(saving.SAVING_RULED_TYPE_ID),
+            RECORD_NAME=rule_detail.RECORD_NAME if rule_detail else None,
+            RULE_DESCRIPTION=rule_description,
+            PLAYER_ID=player_id,
+            PLAYER_NAME=player_name,
+            UNIT_AMOUNT=rule.USER_SAVING_RULED_AMOUNT if rule is not None else None,
+            COUNT=saving.COUNT,
+            DAILY_SAVING_AMOUNT=saving.DAILY_SAVING_AMOUNT
+        ))
+
+    return len(saved_rules)
+
+
+def backfill_saving_details(session, start_date=None, end_date=None):
+    """
+    조회용 상세 행이 없는 기존 DailySaving 에 대해 DailySavingDetail 을 채웁니다.
+    적립 당시 규칙 정보가 없으므로 (계정, 상세 규칙)에 해당하는 현재 사용자 규칙을 사용합니다.
+
+    Args:
+        session (Session): 데이터베이스 세션
+        start_date (date, optional): 시작 날짜
+        end_date (date, optional): 종료 날짜
+
+    Returns:
+        int: 생성한 상세 행 수
+    """
+    query = session.query(models.DailySaving).outerjoin(
+        models.DailySavingDetail,
+        models.DailySavingDetail.DAILY_SAVING_ID == models.DailySaving.DAILY_SAVING_ID
+    ).filter(models.DailySavingDetail.DAILY_SAVING_DETAIL_ID.is_(None))
+
+    if start_date:
+        query = query.filter(models.DailySaving.DATE >= start_date)
+    if end_date:
+        query = query.filter(models.DailySaving.DATE <= end_date)
+
+    savings = query.order_by(models.DailySaving.DAILY_SAVING_ID).all()
+    logger.info(f"상세 행이 없는 적립 내역: {len(savings)}건")
+
+    total = 0
+    for batch_start in range(0, len(savings), BACKFILL_BATCH_SIZE):
+        batch = savings[batch_start:batch_start + BACKFILL_BATCH_SIZE]
+        account_ids = {saving.ACCOUNT_ID for saving in batch}
+
+        # (계정, 상세 규칙) → 첫 번째 사용자 규칙
+        user_rules = {}
+        for rule in session.query(models.UserSavingRule).filter(
+            models.UserSavingRule.ACCOUNT_ID.in_(account_ids)
+        ).order_by(models.UserSavingRule.USER_SAVING_RULED_ID).all():
+            user_rules.setdefault((rule.ACCOUNT_ID, rule.SAVING_RULE_DETAIL_ID), rule)
+
+        total += build_saving_details(
+            session,
+            [(saving, user_rules.get((saving.ACCOUNT_ID, saving.SAVING_RULED_DETAIL_ID))) for saving in batch]
+        )
+        session.commit()
+        logger.info(f"상세 행 백필 진행: {total}/{len(savings)}건")
+
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='일일 적금 상세 조회 테이블(daily_saving_detail) 백필')
+    parser.add_argument('--start-date', type=str, help='시작 날짜 (YYYY-MM-DD 형식)')
+    parser.add_argument('--end-date', type=str, help='종료 날짜 (YYYY-MM-DD 형식)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    start_date = datetime.strptime(args.start_date, '%Y-%m-%d').date() if args.start_date else None
+    end_date = datetime.strptime(args.end_date, '%Y-%m-%d').date() if args.end_date else None
+
+    # 테이블이 없으면 생성
+    models.DailySavingDetail.__table__.create(bind=engine, checkfirst=True)
+
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        created = backfill_saving_details(session, start_date, end_date)
+        print(f"daily_saving_detail 백필 완료: {created}건")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
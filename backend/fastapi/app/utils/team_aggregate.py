@@ -0,0 +1,185 @@
+# team_aggregate.py
+# 팀별 집계(계정 수, 총 적금액, 일일 적립 총액) 조회 및 원본 테이블과의 대조/재계산
+# 집계 갱신은 models.maintain_team_aggregates (flush 시점)에서 처리
+import os
+import sys
+import logging
+import argparse
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+# 모듈 import를 위한 경로 설정 (스크립트로 직접 실행하는 경우)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import models
+
+logger = logging.getLogger(__name__)
+
+
+def get_team_account_summary(db: Session, team_id: int):
+    """
+    팀의 계정 수와 총 적금액을 집계 테이블에서 조회합니다.
+    집계 행이 없으면 원본 테이블에서 계산합니다.
+
+    Returns:
+        tuple: (계정 수, 총 적금액)
+    """
+    summary = db.query(models.TeamAccountSummary).filter(
+        models.TeamAccountSummary.TEAM_ID == team_id
+    ).first()
+    if summary:
+        return summary.ACCOUNT_COUNT, summary.TOTAL_AMOUNT
+
+    account_count, total_amount = db.query(
+        func.count(models.Account.ACCOUNT_ID),
+        func.coalesce(func.sum(models.Account.TOTAL_AMOUNT), 0)
+    ).filter(models.Account.TEAM_ID == team_id).one()
+    return account_count, total_amount
+
+
+def get_team_daily_saving_total(db: Session, team_id: int, saving_date):
+    """
+    팀의 해당 날짜 적립 총액을 집계 테이블에서 조회합니다.
+    집계 행이 없으면 원본 테이블에서 계산합니다.
+    """
+    total = db.query(models.TeamDailySavingTotal.SAVING_AMOUNT).filter(
+        models.TeamDailySavingTotal.TEAM_ID == team_id,
+        models.TeamDailySavingTotal.DATE == saving_date
+    ).scalar()
+    if total is not None:
+        return total
+
+    return db.query(func.coalesce(func.sum(models.DailySaving.DAILY_SAVING_AMOUNT), 0)).join(
+        models.Account, models.Account.ACCOUNT_ID == models.DailySaving.ACCOUNT_ID
+    ).filter(
+        models.Account.TEAM_ID == team_id,
+        models.DailySaving.DATE == saving_date
+    ).scalar()
+
+
+def compute_team_account_summaries(db: Session):
+    """원본 account 테이블 기준 팀별 (계정 수, 총 적금액)"""
+    rows = db.query(
+        models.Team.TEAM_ID,
+        func.count(models.Account.ACCOUNT_ID),
+        func.coalesce(func.sum(models.Account.TOTAL_AMOUNT), 0)
+    ).outerjoin(
+        models.Account, models.Account.TEAM_ID == models.Team.TEAM_ID
+    ).group_by(models.Team.TEAM_ID).all()
+    return {team_id: (account_count, total_amount) for team_id, account_count, total_amount in rows}
+
+
+def compute_team_daily_saving_totals(db: Session, saving_date=None):
+    """원본 daily_saving 테이블 기준 (팀, 날짜)별 적립 총액 (saving_date가 있으면 해당 날짜만)"""
+    query = db.query(
+        models.Account.TEAM_ID,
+        models.DailySaving.DATE,
+        func.sum(models.DailySaving.DAILY_SAVING_AMOUNT)
+    ).join(
+        models.Account, models.Account.ACCOUNT_ID == models.DailySaving.ACCOUNT_ID
+    ).filter(models.DailySaving.DATE.isnot(None))
+    if saving_date is not None:
+        query = query.filter(models.DailySaving.DATE == saving_date)
+    rows = query.group_by(models.Account.TEAM_ID, models.DailySaving.DATE).all()
+    return {(team_id, row_date): amount or 0 for team_id, row_date, amount in rows}
+
+
+def reconcile_team_aggregates(db: Session, saving_date=None, fix: bool = False):
+    """
+    집계 테이블을 원본 테이블(account, daily_saving)과 대조합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        saving_date (date, optional): 일일 적립 총액을 대조할 날짜. 없으면 전체 날짜
+        fix (bool): True면 다른 값을 원본 기준으로 고쳐서 커밋
+
+    Returns:
+        dict: 대조 결과 ({"checked": ..., "mismatches": [...], "fixed": bool})
+    """
+    mismatches = []
+
+    expected_summaries = compute_team_account_summaries(db)
+    stored_summaries = {row.TEAM_ID: row for row in db.query(models.TeamAccountSummary).all()}
+    for team_id, (account_count, total_amount) in expected_summaries.items():
+        stored = stored_summaries.get(team_id)
+        stored_values = (stored.ACCOUNT_COUNT, stored.TOTAL_AMOUNT) if stored else None
+        if stored_values != (account_count, total_amount):
+            mismatches.append({
+                "table": "team_account_summary",
+                "team_id": team_id,
+                "stored": stored_values,
+                "expected": (account_count, total_amount)
+            })
+            if fix:
+                if stored:
+                    stored.ACCOUNT_COUNT = account_count
+                    stored.TOTAL_AMOUNT = total_amount
+                else:
+                    db.add(models.TeamAccountSummary(
+                        TEAM_ID=team_id, ACCOUNT_COUNT=account_count, TOTAL_AMOUNT=total_amount
+                    ))
+
+    expected_savings = compute_team_daily_saving_totals(db, saving_date)
+    saving_query = db.query(models.TeamDailySavingTotal)
+    if saving_date is not None:
+        saving_query = saving_query.filter(models.TeamDailySavingTotal.DATE == saving_date)
+    stored_savings = {(row.TEAM_ID, row.DATE): row for row in saving_query.all()}
+    for key in set(expected_savings) | set(stored_savings):
+        expected = expected_savings.get(key, 0)
+        stored = stored_savings.get(key)
+        if (stored.SAVING_AMOUNT if stored else 0) != expected:
+            mismatches.append({
+                "table": "team_daily_saving_total",
+                "team_id": key[0],
+                "date": key[1].isoformat(),
+                "stored": stored.SAVING_AMOUNT if stored else None,
+                "expected": expected
+            })
+            if fix:
+                if stored:
+                    stored.SAVING_AMOUNT = expected
+                else:
+                    db.add(models.TeamDailySavingTotal(TEAM_ID=key[0], DATE=key[1], SAVING_AMOUNT=expected))
+
+    if fix and mismatches:
+        db.commit()
+
+    return {
+        "checked": len(expected_summaries) + len(set(expected_savings) | set(stored_savings)),
+        "mismatches": mismatches,
+        "fixed": fix and bool(mismatches)
+    }
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='팀별 집계 테이블을 원본 테이블과 대조합니다.')
+    parser.add_argument('--date', type=str, help='일일 적립 총액을 대조할 날짜 (YYYY-MM-DD 형식, 기본값: 전체)')
+    parser.add_argument('--fix', action='store_true', help='다른 값을 원본 기준으로 고쳐서 저장')
+    args = parser.parse_args()
+
+    saving_date = datetime.strptime(args.date, '%Y-%m-%d').date() if args.date else None
+
+    from database import SessionLocal
+    db = SessionLocal()
+    try:
+        result = reconcile_team_aggregates(db, saving_date=saving_date, fix=args.fix)
+        for mismatch in result["mismatches"]:
+            logger.warning(f"집계 불일치: {mismatch}")
+        logger.info(
+            f"팀 집계 대조 완료: {result['checked']}건 확인, 불일치 {len(result['mismatches'])}건"
+            + (" (수정됨)" if result["fixed"] else "")
+        )
+        return 1 if result["mismatches"] and not result["fixed"] else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+# team_ranking.py
+# 팀 순위표 (/api/game/team/ranking)
+# - 순위는 하루 한 번 바뀌므로 순위 저장 작업(update_daily_rank)에서 직전 순위/순위 변동까지 계산해 team_ranking 테이블에 저장합니다.
+# - 조회는 직렬화된 응답을 메모리에 보관하고 버전과 ETag로 재검증합니다.
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+# 모듈 import를 위한 경로 설정 (스크립트로 직접 실행하는 경우)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import models
+from utils.bulk_upsert import upsert_rows
+
+logger = logging.getLogger(__name__)
+
+# 캐시 유지 시간(초). 다른 프로세스에서 순위표를 다시 계산한 경우를 위한 안전장치
+TEAM_RANKING_CACHE_TTL = int(os.getenv("TEAM_RANKING_CACHE_TTL", "300"))
+# (skip, limit)별 응답 최대 보관 수
+TEAM_RANKING_MAX_ENTRIES = 32
+
+RANKING_COLUMNS = [
+    "RANK", "BEFORE_RANK", "RANK_CHANGE", "TEAM_ID", "TEAM_NAME",
+    "TOTAL_WIN", "TOTAL_LOSE", "TOTAL_DRAW", "WIN_RATE"
+]
+
+
+class TeamRankingEntry:
+    """직렬화된 순위표 응답 (본문 바이트, ETag, 버전)"""
+
+    def __init__(self, records, body, etag, version, rank_date):
+        self.records = records
+        self.body = body
+        self.etag = etag
+        self.version = version
+        self.rank_date = rank_date
+        self.created = time.monotonic()
+
+
+_lock = threading.Lock()
+_generation = 0
+_entries = OrderedDict()   # (skip, limit) -> TeamRankingEntry
+
+
+def invalidate_team_ranking():
+    """순위표를 다시 계산했으면 호출해 캐시를 비웁니다."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
+
+
+def compute_team_ranking_rows(db: Session):
+    """
+    팀 테이블과 team_rating 테이블로 팀별 순위표 행을 계산합니다. (저장하지 않음)
+    가장 최근 순위 날짜의 순위와 그 직전 날짜의 순위를 함께 사용합니다.
+
+    Returns:
+        tuple: (team_ranking 행 목록, 순위 기준 날짜)
+    """
+    teams = db.query(models.Team).all()
+
+    # 가장 최근 날짜와 직전 날짜의 팀 순위 정보 조회
+    latest_date = db.query(func.max(models.TeamRating.DATE)).filter(
+        models.TeamRating.DATE <= datetime.now().date()
+    ).scalar()
+
+    team_rankings = {}
+    before_rankings = {}
+    if latest_date:
+        team_rankings = dict(db.query(models.TeamRating.TEAM_ID, models.TeamRating.DAILY_RANKING).filter(
+            models.TeamRating.DATE == latest_date
+        ).all())
+
+        before_date = db.query(func.max(models.TeamRating.DATE)).filter(
+            models.TeamRating.DATE < latest_date
+        ).scalar()
+        if before_date:
+            before_rankings = dict(db.query(models.TeamRating.TEAM_ID, models.TeamRating.DAILY_RANKING).filter(
+                models.TeamRating.DATE == before_date
+            ).all())
+
+    rows = []
+    for team in teams:
+        total_win = team.TOTAL_WIN or 0
+        total_lose = team.TOTAL_LOSE or 0
+        total_draw = team.TOTAL_DRAW or 0
+        total_games = total_win + total_lose + total_draw
+        win_rate = total_win / total_games * 100 if total_games > 0 else 0
+
+        # 팀 순위 (없을 경우 0), 직전 순위 (없을 경우 None)
+        rank = team_rankings.get(team.TEAM_ID) or 0
+        before_rank = before_rankings.get(team.TEAM_ID)
+        rank_change = before_rank - rank if rank and before_rank else None
+
+        rows.append({
+            "TEAM_ID": team.TEAM_ID,
+            "RANK": rank,
+            "BEFORE_RANK": before_rank,
+            "RANK_CHANGE": rank_change,
+            "TOTAL_WIN": total_win,
+            "TOTAL_LOSE": total_lose,
+            "TOTAL_DRAW": total_draw,
+            "WIN_RATE": round(win_rate, 2),
+            "RANK_DATE": latest_date
+        })
+
+    return rows, latest_date
+
+
+def refresh_team_ranking(db: Session):
+    """
+    순위표를 다시 계산해 team_ranking 테이블에 저장하고 커밋한 뒤 캐시를 비웁니다.
+    순위 저장 작업(update_daily_rank)에서 호출합니다.
+
+    Returns:
+        int: 새 순위표 버전
+    """
+    rows, rank_date = compute_team_ranking_rows(db)
+    version = (db.query(func.max(models.TeamRanking.VERSION)).scalar() or 0) + 1
+    now = datetime.now()
+    for row in rows:
+        row["VERSION"] = version
+        row["updated_at"] = now
+
+    db.query(models.TeamRanking).filter(
+        models.TeamRanking.TEAM_ID.notin_([row["TEAM_ID"] for row in rows])
+    ).delete(synchronize_session=False)
+    upsert_rows(
+        db, models.TeamRanking.__table__, rows, ["TEAM_ID"],
+        [column for column in rows[0] if column != "TEAM_ID"] if rows else []
+    )
+    db.commit()
+    invalidate_team_ranking()
+
+    logger.info(f"팀 순위표 갱신: 기준 날짜 {rank_date}, 버전 {version}")
+    return version
+
+
+def _load_stored_ranking(db: Session):
+    """저장된 순위표를 팀 이름과 함께 읽습니다. (TEAM_ID 순)"""
+    return db.query(models.TeamRanking, models.Team.TEAM_NAME).join(
+        models.Team, models.Team.TEAM_ID == models.TeamRanking.TEAM_ID
+    ).order_by(models.TeamRanking.TEAM_ID).all()
+
+
+def get_team_ranking(db: Session, skip: int = 0, limit: int = 100):
+    """
+    순위표 응답을 캐시에서 가져오고, 없으면 저장된 순위표로 만들어 캐시에 저장합니다.
+    저장된 순위표가 없으면(배포 직후 등) 한 번 계산해 저장합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        skip (int): 건너뛸 팀 수 (팀 ID 순)
+        limit (int): 최대 팀 수
+
+    Returns:
+        TeamRankingEntry: 순위순으로 정렬한 응답 본문, ETag, 버전
+    """
+    key = (skip, limit)
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and now - entry.created < TEAM_RANKING_CACHE_TTL:
+            _entries.move_to_end(key)
+            return entry
+        generation = _generation
+
+    stored = _load_stored_ranking(db)
+    if not stored:
+        refresh_team_ranking(db)
+        with _lock:
+            generation = _generation
+        stored = _load_stored_ranking(db)
+
+    records = []
+    for ranking, team_name in stored[skip:skip + limit]:
+        record = {column: getattr(ranking, column) for column in RANKING_COLUMNS if column != "TEAM_NAME"}
+        record["TEAM_NAME"] = team_name
+        records.append({column: record[column] for column in RANKING_COLUMNS})
+
+    # team_rating 기준 순위로 정렬
+    records.sort(key=lambda record: record["RANK"])
+
+    version = max((ranking.VERSION for ranking, _ in stored), default=0)
+    rank_date = stored[0][0].RANK_DATE if stored else None
+    body = json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = f'W/"{version}-{hashlib.md5(body).hexdigest()}"'
+    entry = TeamRankingEntry(records, body, etag, version, rank_date)
+
+    with _lock:
+        # 만드는 동안 다시 계산되었으면 오래된 결과를 캐시에 넣지 않음
+        if generation == _generation:
+            _entries[key] = entry
+            _entries.move_to_end(key)
+            while len(_entries) > TEAM_RANKING_MAX_ENTRIES:
+                _entries.popitem(last=False)
+
+    return entry
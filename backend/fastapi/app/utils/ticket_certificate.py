@@ -4,8 +4,11 @@ import os
 import json
 import re
 import cv2
+import numpy as np
 import pyzbar.pyzbar as pyzbar
 
+from utils.request_metrics import track_http
+
 # .env 파일로부터 환경변수 로드
 load_dotenv()
 X_OCR_SECRET = os.getenv("X_OCR_SECRET")
@@ -20,88 +23,179 @@ HEADERS = {
     # "Content-Type": "application/json"  # 요청 데이터의 형식(application/json | multipart/form-data)
 }
 
-def decode_qr_and_barcodes(image_path):
-    """이미지 파일에서 QR 코드 및 바코드를 인식하고 텍스트를 반환합니다."""
+# 티켓 번호 패턴 (T로 시작하는 10자리 숫자)
+TICKET_NUMBER_PATTERN = re.compile(r'T\d{10}')
+
+def decode_image_bytes(image_bytes):
+    """업로드된 이미지 바이트를 파일로 저장하지 않고 OpenCV 이미지로 디코딩합니다."""
+    buffer = np.frombuffer(image_bytes, dtype=np.uint8)
+    return cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+
+# 디코딩 전 축소할 긴 변 최대 길이 (휴대폰 사진은 대부분 이보다 커서 축소본으로 먼저 시도)
+DECODE_MAX_SIDE = int(os.getenv("OCR_DECODE_MAX_SIDE", "1280"))
+
+# 비용이 낮은 순서의 디코딩 단계 (앞 단계에서 티켓 번호를 찾으면 뒤 단계는 실행하지 않음)
+DECODE_STAGES = ("downscale", "grayscale", "adaptive_threshold", "rotate_crop")
+
+def _pyzbar_decode(gray):
+    """grayscale 이미지에서 QR 코드/바코드를 디코딩하여 중복 없는 데이터 목록을 반환합니다."""
+    results = []
+    seen_data = set()  # 중복 데이터 추적을 위한 set
+    for obj in pyzbar.decode(gray):
+        data = obj.data.decode("utf-8")  # 바이트 데이터를 문자열로 변환
+        if data not in seen_data:  # 중복 데이터 확인
+            seen_data.add(data)
+            results.append(data)
+    return results
+
+def _downscale(image):
+    """긴 변이 DECODE_MAX_SIDE 보다 크면 비율을 유지해 축소합니다."""
+    height, width = image.shape[:2]
+    scale = DECODE_MAX_SIDE / max(height, width)
+    if scale >= 1:
+        return image
+    return cv2.resize(image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+def _adaptive_threshold(gray):
+    """조명이 고르지 않은 사진(그림자, 반사)을 흑백으로 이진화합니다."""
+    blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+    return cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+
+def _rotate_crop_candidates(gray):
+    """회전(90/180/270도)과 부분 영역(상/하/좌/우 절반, 중앙) 후보를 차례로 반환합니다."""
+    for rotate_code in (cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_180, cv2.ROTATE_90_COUNTERCLOCKWISE):
+        yield cv2.rotate(gray, rotate_code)
+
+    height, width = gray.shape[:2]
+    yield gray[:height // 2, :]
+    yield gray[height // 2:, :]
+    yield gray[:, :width // 2]
+    yield gray[:, width // 2:]
+    yield gray[height // 4:height * 3 // 4, width // 4:width * 3 // 4]
+
+def _stage_candidates(image):
+    """(단계 이름, 디코딩할 grayscale 이미지) 후보를 비용이 낮은 순서로 만듭니다."""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    small = _downscale(gray)
+
+    if small is not gray:
+        yield "downscale", small
+    yield "grayscale", gray
+    yield "adaptive_threshold", _adaptive_threshold(small)
+    for candidate in _rotate_crop_candidates(small):
+        yield "rotate_crop", candidate
+
+def decode_ticket_cascade(image):
+    """
+    전처리 단계를 비용이 낮은 순서로 적용하며 QR 코드/바코드를 디코딩하고,
+    티켓 번호 패턴과 일치하는 값을 찾으면 바로 멈춥니다.
+
+    Args:
+        image (ndarray): OpenCV BGR 이미지
+
+    Returns:
+        tuple: (디코딩된 텍스트 또는 None, 성공한 단계 이름 또는 None)
+            티켓 번호 패턴과 일치하는 값이 없으면 처음 디코딩된 데이터를 반환 (기존 동작)
+    """
+    if image is None:
+        return None, None
+
+    fallback = None
+    for stage, candidate in _stage_candidates(image):
+        results = _pyzbar_decode(candidate)
+        if not results:
+            continue
+
+        for data in results:
+            match = TICKET_NUMBER_PATTERN.search(data)
+            if match:
+                return match.group(0), stage
+
+        if fallback is None:
+            fallback = ("\n".join(results), stage)
+
+    return fallback if fallback is not None else (None, None)
+
+def decode_qr_and_barcodes_from_image(image):
+    """OpenCV 이미지에서 QR 코드 및 바코드를 인식하고 텍스트를 반환합니다."""
     try:
-        # 이미지 파일 로드
-        image = cv2.imread(image_path)
+        decoded_text, _ = decode_ticket_cascade(image)
+        return decoded_text
 
-        # 이미지를 grayscale로 변환 (인식 성능 향상)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    except Exception as e:
+        print(f"QR/바코드 디코딩 오류: {e}")
+        return None
 
-        # QR 코드 및 바코드 디코딩
-        decoded_objects = pyzbar.decode(gray)
-        # print(decoded_objects)
+def decode_ticket_cascade_from_bytes(image_bytes):
+    """
+    이미지 바이트에서 전처리 단계별로 QR 코드 및 바코드를 인식합니다. (프로세스 풀 작업 함수)
 
-        if not decoded_objects:
-            return None
+    Returns:
+        tuple: (디코딩된 텍스트 또는 None, 성공한 단계 이름 또는 None)
+    """
+    try:
+        return decode_ticket_cascade(decode_image_bytes(image_bytes))
+    except Exception as e:
+        print(f"QR/바코드 디코딩 오류: {e}")
+        return None, None
 
-        # 디코딩된 정보 출력
-        results = []
-        seen_data = set()  # 중복 데이터 추적을 위한 set
-        for obj in decoded_objects:
-            data = obj.data.decode("utf-8")  # 바이트 데이터를 문자열로 변환
-            if data not in seen_data:  # 중복 데이터 확인
-                seen_data.add(data)
-                results.append(data)
+def decode_qr_and_barcodes(image_path):
+    """이미지 파일에서 QR 코드 및 바코드를 인식하고 텍스트를 반환합니다."""
+    return decode_qr_and_barcodes_from_image(cv2.imread(image_path))
+
+def build_clova_request(image_format):
+    """Clova OCR 요청 메시지(JSON)를 만듭니다."""
+    # 요청 바디 정보 입력
+    return {
+        "version": "V2",  # String, 버전 정보(V1 | V2)
+        "requestId": "test",  # String, 임의의 API 호출 UUID
+        "timestamp": API_TIMESTAMP,  # Integer, 임의의 API 호출 시각(Timestamp)
+        "images": [  # Array, images 세부 정보(이미지 크기: 최대 50MB)
+            {
+                "format": image_format,  # String, 이미지 형식(jpg | png | pdf)
+                "name": "test_image",  # String, 이미지 이름
+            }
+        ],
+    }
+
+def extract_ticket_number(result):
+    """Clova OCR 응답(JSON)에서 티켓 번호를 찾아 반환합니다. 없으면 None"""
+    # OCR 결과에서 텍스트 추출
+    infer_texts = []
+    for image in result.get("images", []):
+        for field in image.get("fields", []):
+            text = field.get("inferText")
+            if text:
+                infer_texts.append(text)
+    
+    ocr_text = " ".join(infer_texts)
 
-        return "\n".join(results)
+    # 정규 표현식으로 패턴 찾기
+    ticket_numbers = TICKET_NUMBER_PATTERN.findall(ocr_text)
 
-    except Exception as e:
-        print(f"QR/바코드 디코딩 오류: {e}")
-        return None
+    if ticket_numbers:
+        return ticket_numbers[0]
+    print("Ticket Number 패턴을 찾을 수 없습니다.")
+    return None
     
 def clova_ocr(image_path):
     """Clova OCR API를 사용하여 이미지에서 텍스트를 추출하고 티켓 번호를 반환합니다."""
     try:
-        # 요청 바디 정보 입력
-        data = {
-            "version": "V2",  # String, 버전 정보(V1 | V2)
-            "requestId": "test",  # String, 임의의 API 호출 UUID
-            "timestamp": API_TIMESTAMP,  # Integer, 임의의 API 호출 시각(Timestamp)
-            # "lang": "ko, en",  # String, OCR 인식 요청 언어 정보(ko | en | ja | zh-CN)
-            "images": [  # Array, images 세부 정보(이미지 크기: 최대 50MB)
-                {
-                    "format": image_path.split(".")[-1],  # String, 이미지 형식(jpg | png | pdf)
-                    "name": "test_image",  # String, 이미지 이름
-                    # "url": "BASE64_ENCODED_IMAGE_URL",  # String, 이미지 URL 주소(images.url | images.data)
-                    # "data": "BASE64_ENCODED_IMAGE_DATA"  # String, Base64 인코딩된 이미지 데이터(images.url | images.data)
-                }
-            ],
-            # "enableTableDetection": False,  # Boolean, 문서 이미지 내 표(Table) 영역 인식 및 구조화된 형태 제공 여부(True | False)
-        }
-
-        files = {
-            "file": open(image_path, "rb"),
-            "message": (None, json.dumps(data), "application/json")
-        }  # 파일과 JSON 데이터를 multipart 형식으로 함께 전송
-
-        # POST 요청으로 API 호출
-        response = requests.post(API_URL, headers=HEADERS, files=files, data=data)
+        data = build_clova_request(image_path.split(".")[-1])
+
+        # 파일과 JSON 데이터를 multipart 형식으로 함께 전송
+        with open(image_path, "rb") as image_file:
+            files = {
+                "file": image_file,
+                "message": (None, json.dumps(data), "application/json")
+            }
+
+            # POST 요청으로 API 호출
+            with track_http():
+                response = requests.post(API_URL, headers=HEADERS, files=files, data=data)
         response.raise_for_status()  # HTTP 오류 발생 시 예외 발생
         
-        # 결과 출력 (JSON 형식)
-        result = response.json()
-
-        # OCR 결과에서 텍스트 추출
-        infer_texts = []
-        for image in result.get("images", []):
-            for field in image.get("fields", []):
-                text = field.get("inferText")
-                if text:
-                    infer_texts.append(text)
-        
-        ocr_text = " ".join(infer_texts)
-
-        # 정규 표현식으로 패턴 찾기
-        ticket_numbers = re.findall(r'T\d{10}', ocr_text)  # 티켓 번호 추출 (T로 시작하는 10자리 숫자)
-
-        # 결과 출력
-        if ticket_numbers:
-            return ticket_numbers[0]
-        else:
-            print("Ticket Number 패턴을 찾을 수 없습니다.")
-            return None
+        return extract_ticket_number(response.json())
 
     except requests.exceptions.RequestException as e:
         print(f"Clova OCR API 호출 오류: {e}")
@@ -113,10 +207,10 @@ def clova_ocr(image_path):
 def main():
     image_path = "image/" + input("이미지 파일 이름을 입력하세요 (예시: ticket.jpg): ")
 
-    # QR 코드 및 바코드 디코딩 시도
-    decoded_text = decode_qr_and_barcodes(image_path)
+    # QR 코드 및 바코드 디코딩 시도 (전처리 단계별)
+    decoded_text, stage = decode_ticket_cascade(cv2.imread(image_path))
     if decoded_text:
-        print(decoded_text)
+        print(f"{decoded_text} (디코딩 단계: {stage})")
     else:
         # Clova OCR을 통한 티켓 번호 추출
         ticket_number = clova_ocr(image_path)
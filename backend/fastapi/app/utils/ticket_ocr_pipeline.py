@@ -0,0 +1,166 @@
+# utils/ticket_ocr_pipeline.py
+import os
+import json
+import asyncio
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import httpx
+
+from utils.request_metrics import track_http
+from utils.ticket_certificate import (
+    API_URL,
+    HEADERS,
+    build_clova_request,
+    decode_ticket_cascade_from_bytes,
+    extract_ticket_number,
+)
+
+logger = logging.getLogger(__name__)
+
+# QR/바코드 디코딩 프로세스 수 (CPU 작업이라 이벤트 루프 밖 별도 프로세스에서 실행)
+OCR_DECODE_WORKERS = int(os.getenv("OCR_DECODE_WORKERS", "2"))
+# QR/바코드 디코딩 최대 대기 시간(초)
+OCR_DECODE_TIMEOUT = float(os.getenv("OCR_DECODE_TIMEOUT", "10"))
+# Clova OCR 호출 제한 시간(초)
+CLOVA_OCR_TIMEOUT = float(os.getenv("CLOVA_OCR_TIMEOUT", "10"))
+# Clova OCR 동시 연결 수
+CLOVA_OCR_MAX_CONNECTIONS = int(os.getenv("CLOVA_OCR_MAX_CONNECTIONS", "10"))
+
+_lock = threading.Lock()
+_executor = None
+_http_client = None
+
+
+def _get_executor():
+    """QR/바코드 디코딩용 프로세스 풀을 처음 사용할 때 만듭니다."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            # fork 대신 spawn: 스레드(스케줄러, DB 풀)를 가진 서버 프로세스를 복제하지 않음
+            _executor = ProcessPoolExecutor(
+                max_workers=OCR_DECODE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def _get_http_client():
+    """Clova OCR 호출용 연결 풀 HTTP 클라이언트를 처음 사용할 때 만듭니다."""
+    global _http_client
+    with _lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = httpx.AsyncClient(
+                headers=HEADERS,
+                timeout=httpx.Timeout(CLOVA_OCR_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=CLOVA_OCR_MAX_CONNECTIONS,
+                    max_keepalive_connections=CLOVA_OCR_MAX_CONNECTIONS
+                )
+            )
+        return _http_client
+
+
+async def decode_ticket_image(image_bytes):
+    """
+    이미지 바이트에서 QR 코드/바코드를 프로세스 풀에서 디코딩합니다.
+    전처리 단계(축소 → grayscale → 적응형 이진화 → 회전/부분 영역)를 차례로 적용하고 티켓 번호를 찾으면 멈춥니다.
+
+    Args:
+        image_bytes (bytes): 업로드된 이미지 바이트
+
+    Returns:
+        str: 디코딩된 텍스트. 인식 실패 또는 디코딩 오류 시 None
+    """
+    global _executor
+    loop = asyncio.get_running_loop()
+    try:
+        decoded_text, stage = await asyncio.wait_for(
+            loop.run_in_executor(_get_executor(), decode_ticket_cascade_from_bytes, image_bytes),
+            timeout=OCR_DECODE_TIMEOUT
+        )
+        if decoded_text:
+            logger.info(f"QR/바코드 디코딩 성공 (단계: {stage})")
+        else:
+            logger.info("QR/바코드 디코딩 실패 (전체 단계)")
+        return decoded_text
+    except asyncio.TimeoutError:
+        logger.warning(f"QR/바코드 디코딩 시간 초과 ({OCR_DECODE_TIMEOUT}초)")
+        return None
+    except BrokenProcessPool:
+        # 작업 프로세스가 비정상 종료된 경우 다음 요청에서 풀을 다시 만듦
+        logger.error("QR/바코드 디코딩 프로세스 풀이 중단되어 다시 생성합니다.")
+        with _lock:
+            _executor = None
+        return None
+    except Exception as e:
+        logger.error(f"QR/바코드 디코딩 오류: {e}")
+        return None
+
+
+async def clova_ocr_async(image_bytes, image_format):
+    """
+    Clova OCR API를 비동기로 호출하여 이미지에서 티켓 번호를 추출합니다.
+
+    Args:
+        image_bytes (bytes): 업로드된 이미지 바이트
+        image_format (str): 이미지 형식 (jpg, png 등)
+
+    Returns:
+        str: 티켓 번호. 인식 실패, 시간 초과 또는 API 오류 시 None
+    """
+    data = build_clova_request(image_format)
+    files = {
+        "file": (f"ticket.{image_format}", image_bytes),
+        "message": (None, json.dumps(data), "application/json")
+    }
+
+    try:
+        with track_http():
+            response = await _get_http_client().post(API_URL, files=files)
+        response.raise_for_status()
+        return extract_ticket_number(response.json())
+    except httpx.TimeoutException:
+        logger.warning(f"Clova OCR API 호출 시간 초과 ({CLOVA_OCR_TIMEOUT}초)")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"Clova OCR API 호출 오류: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Clova OCR 처리 오류: {e}")
+        return None
+
+
+async def read_ticket_number(image_bytes, image_format):
+    """
+    업로드된 티켓 이미지에서 티켓 번호를 읽습니다.
+    QR 코드/바코드를 먼저 디코딩하고, 실패하면 Clova OCR을 호출합니다.
+
+    Args:
+        image_bytes (bytes): 업로드된 이미지 바이트
+        image_format (str): 이미지 형식 (jpg, png 등)
+
+    Returns:
+        str: 티켓 번호. 찾지 못하면 None
+    """
+    ticket_number = await decode_ticket_image(image_bytes)
+    if ticket_number:
+        return ticket_number
+
+    return await clova_ocr_async(image_bytes, image_format)
+
+
+async def shutdown_ticket_ocr():
+    """서버 종료 시 디코딩 프로세스 풀과 HTTP 연결 풀을 정리합니다."""
+    global _executor, _http_client
+    with _lock:
+        executor, _executor = _executor, None
+        http_client, _http_client = _http_client, None
+
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+    if http_client is not None:
+        await http_client.aclose()
@@ -129,26 +129,40 @@ async def calculate_daily_interest(db, date_param=None):
     total_interest = 0
     
     try:
+        # 해당 날짜에 잔액 기록이 있는 모든 계정 ID
+        account_ids = {
+            row.ACCOUNT_ID for row in db.query(models.DailyBalances.ACCOUNT_ID).filter(
+                models.DailyBalances.DATE == date_param
+            ).all()
+        }
+        
+        # 이자율 조회 (기본 이자율 + 우대 이자율 스냅샷, 바뀐 계정만 다시 계산해 아래 커밋에서 함께 저장)
+        from router.mission import mission_crud
+        interest_snapshots = mission_crud.get_account_interest_snapshots(db, account_ids)
+        
         # 해당 날짜에 잔액 기록이 있는 모든 계정 조회
         daily_balances = db.query(models.DailyBalances).filter(
             models.DailyBalances.DATE == date_param
         ).all()
         
+        # 전날 잔액 기록을 한 번에 조회
+        previous_balances = {
+            balance.ACCOUNT_ID: balance
+            for balance in db.query(models.DailyBalances).filter(
+                models.DailyBalances.ACCOUNT_ID.in_(account_ids),
+                models.DailyBalances.DATE == previous_date
+            ).all()
+        } if account_ids else {}
+        
         for daily_balance in daily_balances:
-            # 계정 정보 조회
-            account = db.query(models.Account).filter(
-                models.Account.ACCOUNT_ID == daily_balance.ACCOUNT_ID
-            ).first()
+            snapshot = interest_snapshots.get(daily_balance.ACCOUNT_ID)
             
-            if not account:
+            if not snapshot:
                 logger.warning(f"계정 ID {daily_balance.ACCOUNT_ID}를 찾을 수 없습니다.")
                 continue
             
-            # 전날의 잔액 기록 조회
-            previous_balance = db.query(models.DailyBalances).filter(
-                models.DailyBalances.ACCOUNT_ID == daily_balance.ACCOUNT_ID,
-                models.DailyBalances.DATE == previous_date
-            ).first()
+            # 전날의 잔액 기록
+            previous_balance = previous_balances.get(daily_balance.ACCOUNT_ID)
             
             # 전날 기록이 없으면 이자는 0으로 설정
             if not previous_balance:
@@ -157,11 +171,7 @@ async def calculate_daily_interest(db, date_param=None):
                 processed_accounts += 1
                 continue
             
-            # 이자율 조회 (실제 이자율은 계정 정보와 미션 달성에 따라 계산)
-            # 기본 이자율 + 우대 이자율 계산
-            from router.mission import mission_crud
-            interest_details = mission_crud.calculate_account_interest_details(db, account.ACCOUNT_ID)
-            total_interest_rate = interest_details['total_interest_rate']
+            total_interest_rate = snapshot.TOTAL_INTEREST_RATE
             
             # 일일 이자 계산 (연이율 / 365 * 전날 잔액)
             daily_interest_rate = total_interest_rate / 100 / 365
@@ -19,6 +19,8 @@ load_dotenv()
 
 import models
 from database import engine
+from utils.bulk_upsert import chunked, upsert_rows
+from utils.team_ranking import refresh_team_ranking
 
 # 팀 이름 매핑
 TEAM_NAME_MAPPING = {
@@ -35,9 +37,79 @@ TEAM_NAME_MAPPING = {
     '키움': '키움 히어로즈'
 }
 
+# 순위 파일의 팀 이름 -> 팀 ID (처음 사용할 때 팀 테이블을 한 번 읽어서 채움)
+_team_id_map = None
+
+def get_team_id_map(session, refresh=False):
+    """
+    순위 파일의 팀 이름(TEAM_NAME_MAPPING의 키)을 팀 ID로 바꾸는 딕셔너리를 반환합니다.
+    
+    Args:
+        session (Session): 데이터베이스 세션
+        refresh (bool): True면 팀 테이블을 다시 읽음
+    
+    Returns:
+        dict: {순위 파일 팀 이름: 팀 ID}
+    """
+    global _team_id_map
+    if _team_id_map is None or refresh:
+        team_ids = {team_name: team_id for team_id, team_name in session.query(models.Team.TEAM_ID, models.Team.TEAM_NAME).all()}
+        _team_id_map = {
+            short_name: team_ids[full_team_name]
+            for short_name, full_team_name in TEAM_NAME_MAPPING.items()
+            if full_team_name in team_ids
+        }
+    return _team_id_map
+
+def parse_rank_date(file_path):
+    """파일명에서 날짜 추출 (예: 20250325-rank.csv)"""
+    date_str = os.path.basename(file_path).split('-rank')[0]
+    return datetime.strptime(date_str, '%Y%m%d').date()
+
+def read_rank_rows(file_path, team_id_map):
+    """
+    일일 순위 CSV 파일을 읽어 team_rating 행 목록을 만듭니다.
+    순위는 파일의 행 순서 (1부터 시작)
+    
+    Returns:
+        list: [{"TEAM_ID", "DAILY_RANKING", "DATE"}, ...]
+    """
+    rank_date = parse_rank_date(file_path)
+    rows = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # 헤더 건너뛰기 (있는 경우)
+        
+        for row_index, row in enumerate(reader, 1):
+            # 팀 이름 (첫 번째 열) 추출
+            team_name = row[0].strip()
+            
+            if team_name not in TEAM_NAME_MAPPING:
+                print(f"알 수 없는 팀명: {team_name}")
+                print("현재 매핑된 팀명:", list(TEAM_NAME_MAPPING.keys()))
+                continue
+            
+            if team_name not in team_id_map:
+                print(f"데이터베이스에서 팀을 찾을 수 없음: {TEAM_NAME_MAPPING[team_name]}")
+                continue
+            
+            rows.append({
+                "TEAM_ID": team_id_map[team_name],
+                "DAILY_RANKING": row_index,
+                "DATE": rank_date
+            })
+    return rows
+
+def save_rank_rows(session, rows):
+    """team_rating 행들을 (팀, 날짜) 기준으로 UPSERT_CHUNK_SIZE 건씩 한 번에 추가/갱신합니다. (커밋은 호출하는 쪽에서)"""
+    saved = 0
+    for chunk in chunked(rows):
+        saved += upsert_rows(session, models.TeamRating.__table__, chunk, ["TEAM_ID", "DATE"], ["DAILY_RANKING"])
+    return saved
+
 def process_daily_rank_file(file_path):
     """
-    일일 순위 CSV 파일을 처리하고 데이터베이스에 저장
+    일일 순위 CSV 파일을 처리하고 데이터베이스에 저장 (해당 날짜의 모든 팀을 한 번에 upsert)
     
     Args:
         file_path (str): 일일 순위 CSV 파일 경로
@@ -50,76 +122,83 @@ def process_daily_rank_file(file_path):
     session = Session()
     
     try:
-        # 파일명에서 날짜 추출 (예: 20250325-rank.csv)
         filename = os.path.basename(file_path)
-        date_str = filename.split('-rank')[0]
-        rank_date = datetime.strptime(date_str, '%Y%m%d').date()
+        rank_date = parse_rank_date(file_path)
         
-        # CSV 파일 읽기
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            next(reader, None)  # 헤더 건너뛰기 (있는 경우)
-            
-            # 결과 저장용 변수
-            processed_records = 0
-            
-            # 각 행 처리
-            for row_index, row in enumerate(reader, 1):
-                # 팀 이름 (첫 번째 열) 추출
-                team_name = row[0].strip()
-                
-                # 전체 팀 이름으로 변환
-                if team_name not in TEAM_NAME_MAPPING:
-                    print(f"알 수 없는 팀명: {team_name}")
-                    print("현재 매핑된 팀명:", list(TEAM_NAME_MAPPING.keys()))
-                    continue
-                
-                full_team_name = TEAM_NAME_MAPPING[team_name]
-                
-                # 데이터베이스에서 해당 팀 찾기
-                team = session.query(models.Team).filter(
-                    models.Team.TEAM_NAME == full_team_name
-                ).first()
-                
-                if not team:
-                    print(f"데이터베이스에서 팀을 찾을 수 없음: {full_team_name}")
-                    continue
-                
-                # 이미 해당 날짜의 순위가 있는지 확인
-                existing_rating = session.query(models.TeamRating).filter(
-                    models.TeamRating.TEAM_ID == team.TEAM_ID,
-                    models.TeamRating.DATE == rank_date
-                ).first()
-                
-                # 순위 정보 (1부터 시작하는 인덱스)
-                daily_ranking = row_index
-                
-                if existing_rating:
-                    # 기존 레코드 업데이트
-                    existing_rating.DAILY_RANKING = daily_ranking
-                    print(f"팀 {full_team_name}의 {rank_date} 순위 업데이트: {daily_ranking}위")
-                else:
-                    # 새 레코드 생성
-                    team_rating = models.TeamRating(
-                        TEAM_ID=team.TEAM_ID,
-                        DAILY_RANKING=daily_ranking,
-                        DATE=rank_date
-                    )
-                    session.add(team_rating)
-                    print(f"팀 {full_team_name}의 {rank_date} 순위 새로 생성: {daily_ranking}위")
-                
-                processed_records += 1
-            
-            # 변경사항 커밋
-            session.commit()
-            
-            print(f"{filename} 파일 처리 완료: {processed_records}개 팀 순위 저장")
-            
-            return {
-                "filename": filename,
-                "date": rank_date,
-                "processed_records": processed_records
-            }
+        rows = read_rank_rows(file_path, get_team_id_map(session))
+        processed_records = save_rank_rows(session, rows)
+        
+        # 변경사항 커밋
+        session.commit()
+        
+        print(f"{filename} 파일 처리 완료: {processed_records}개 팀 순위 저장")
+        
+        # 순위표(/api/game/team/ranking) 다시 계산
+        version = refresh_team_ranking(session)
+        print(f"팀 순위표 갱신 완료: 버전 {version}")
+        
+        return {
+            "filename": filename,
+            "date": rank_date,
+            "processed_records": processed_records
+        }
+    
+    except Exception as e:
+        session.rollback()
+        print(f"오류 발생: {str(e)}")
+        raise
+    
+    finally:
+        session.close()
+
+def backfill_rank_files(data_folder, start_date=None, end_date=None):
+    """
+    폴더의 모든 순위 파일(기간 지정 가능)을 한 번에 읽어 저장 (시즌 전체 재적재용)
+    
+    Args:
+        data_folder (str): 순위 파일이 있는 폴더 경로
+        start_date (date, optional): 시작 날짜
+        end_date (date, optional): 종료 날짜
+    
+    Returns:
+        dict: 처리 결과 정보
+    """
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    
+    try:
+        team_id_map = get_team_id_map(session)
+        
+        rank_files = []
+        for filename in sorted(os.listdir(data_folder)):
+            if not filename.endswith('-rank.csv'):
+                continue
+            try:
+                rank_date = parse_rank_date(filename)
+            except ValueError:
+                print(f"날짜를 알 수 없는 파일 건너뜀: {filename}")
+                continue
+            if (start_date and rank_date < start_date) or (end_date and rank_date > end_date):
+                continue
+            rank_files.append(os.path.join(data_folder, filename))
+        
+        rows = []
+        for file_path in rank_files:
+            rows.extend(read_rank_rows(file_path, team_id_map))
+        
+        processed_records = save_rank_rows(session, rows)
+        session.commit()
+        
+        print(f"순위 파일 {len(rank_files)}개 처리 완료: {processed_records}개 팀 순위 저장")
+        
+        # 순위표(/api/game/team/ranking) 다시 계산
+        version = refresh_team_ranking(session)
+        print(f"팀 순위표 갱신 완료: 버전 {version}")
+        
+        return {
+            "files": len(rank_files),
+            "processed_records": processed_records
+        }
     
     except Exception as e:
         session.rollback()
@@ -153,10 +232,24 @@ def main():
     # 인자 파서 설정
     parser = argparse.ArgumentParser(description='일일 팀 순위 데이터베이스 업데이트')
     parser.add_argument('--date', type=str, help='YYYYMMDD 형식의 날짜 (미입력 시 전일)', default=None)
+    parser.add_argument('--backfill', action='store_true', help='폴더의 모든 순위 파일을 한 번에 저장 (--start/--end로 기간 지정)')
+    parser.add_argument('--start', type=str, help='백필 시작 날짜 (YYYYMMDD)', default=None)
+    parser.add_argument('--end', type=str, help='백필 종료 날짜 (YYYYMMDD)', default=None)
     
     # 인자 파싱
     args = parser.parse_args()
     
+    # 백필 모드
+    if args.backfill:
+        try:
+            start_date = datetime.strptime(args.start, '%Y%m%d').date() if args.start else None
+            end_date = datetime.strptime(args.end, '%Y%m%d').date() if args.end else None
+        except ValueError:
+            print("날짜 형식은 YYYYMMDD여야 합니다.")
+            return
+        backfill_rank_files(data_folder, start_date, end_date)
+        return
+    
     # 날짜 설정
     if args.date:
         # 사용자가 날짜 입력한 경우
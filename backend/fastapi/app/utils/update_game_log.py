@@ -26,6 +26,8 @@ sys.path.append(project_root)
 # models 모듈 import
 import models
 from database import engine
+from utils.game_context import build_game_context
+from utils.team_ranking import refresh_team_ranking
 # 데이터베이스 연결 설정
 Session = sessionmaker(bind=engine)
 session = Session()
@@ -166,6 +168,11 @@ async def update_team_victory_missions(db_session):
     if accounts_to_recalculate:
         logger.info(f"{len(accounts_to_recalculate)}개 계정의 이자 소급 재계산 실행")
         
+        # 미션 카운트가 바뀐 계정의 이자율 스냅샷을 한 번에 다시 계산
+        from router.mission import mission_crud
+        mission_crud.get_account_interest_snapshots(db_session, accounts_to_recalculate)
+        db_session.commit()
+        
         for account_id in accounts_to_recalculate:
             await recalculate_interest_history(db_session, account_id)
         
@@ -197,6 +204,8 @@ def process_json_game_logs(json_dir="baseball_data/json_data"):
     logger.info(f"처리할 JSON 파일 수: {len(json_files)}")
     
     total_records = 0
+    # 기록을 저장한 날짜 (팀 경기 정보 계산용)
+    processed_dates = set()
     
     for json_file in json_files:
         file_path = os.path.join(json_dir_path, json_file)
@@ -305,6 +314,7 @@ def process_json_game_logs(json_dir="baseball_data/json_data"):
                 
                 # 변경사항 커밋
                 session.commit()
+                processed_dates.add(record_date)
             
         except Exception as e:
             session.rollback()
@@ -312,6 +322,22 @@ def process_json_game_logs(json_dir="baseball_data/json_data"):
     
     logger.info(f"총 {total_records}개의 기록이 처리되었습니다.")
     
+    # 기록이 저장된 날짜마다 팀 경기 정보(상대팀, 결과, 시리즈 등)를 한 번 계산해 저장
+    for record_date in sorted(processed_dates):
+        try:
+            build_game_context(session, record_date)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[{record_date}] 팀 경기 정보 계산 중 오류 발생: {str(e)}")
+    
+    # 팀 승/패/무 합계가 바뀌었으므로 순위표(/api/game/team/ranking) 다시 계산
+    if processed_dates:
+        try:
+            refresh_team_ranking(session)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"팀 순위표 갱신 중 오류 발생: {str(e)}")
+    
     # 팀 승리 미션 업데이트 실행
     try:
         logger.info("팀 승리 관련 미션 업데이트 시작...")
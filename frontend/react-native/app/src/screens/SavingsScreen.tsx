@@ -703,7 +703,10 @@ const SavingsScreen = () => {
     // 적립 금액 데이터 가져오기
     let transfersData: { [date: string]: number } = {};
     try {
-      const transfersResponse = await api.get('/api/account/transfers_log');
+      // 기본 페이지는 100건이므로 시즌 전체를 한 번에 받도록 최대 건수 지정
+      const transfersResponse = await api.get('/api/account/transfers_log', {
+        params: { limit: 500 }
+      });
       transfersData = transfersResponse.data.reduce((acc: { [date: string]: number }, transfer: any) => {
         acc[transfer.DATE] = transfer.AMOUNT;
         return acc;
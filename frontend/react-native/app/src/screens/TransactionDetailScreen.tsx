@@ -388,7 +388,9 @@ const TransactionDetailScreen = () => {
         );
 
         // 거래 내역 조회해서 TEXT 필드 가져오기
-        const transferResponse = await api.get('/api/account/transfers_log');
+        const transferResponse = await api.get('/api/account/transfers_log', {
+          params: { since: params.id, until: params.id }
+        });
         const transfer = transferResponse.data.find((item: any) => item.DATE === params.id);
         const description = transfer?.TEXT || "";
 